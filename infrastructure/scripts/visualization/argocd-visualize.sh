@@ -13,23 +13,24 @@ NC='\033[0m' # No Color
 
 # Logging functions
 log_info() {
-    echo -e "${BLUE}[INFO]${NC} $1"
+    echo -e "${BLUE}[INFO]${NC} $1" >&2
 }
 
 log_success() {
-    echo -e "${GREEN}[SUCCESS]${NC} $1"
+    echo -e "${GREEN}[SUCCESS]${NC} $1" >&2
 }
 
 log_warn() {
-    echo -e "${YELLOW}[WARN]${NC} $1"
+    echo -e "${YELLOW}[WARN]${NC} $1" >&2
 }
 
 log_error() {
-    echo -e "${RED}[ERROR]${NC} $1"
+    echo -e "${RED}[ERROR]${NC} $1" >&2
 }
 
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+source "${SCRIPT_DIR}/stage-timing.sh"
 OUTPUT_DIR="${SCRIPT_DIR}/../../docs/diagrams/gitops"
 KUBERNETES_DIR="${SCRIPT_DIR}/../../kubernetes"
 
@@ -39,6 +40,9 @@ NAMESPACE="argocd"
 FORMAT="png"
 OPEN_BROWSER=false
 USE_LIVE_CLUSTER=true
+SNAPSHOT=""
+RECORD=""
+APPS_SNAPSHOT=""
 
 # Parse command line arguments
 usage() {
@@ -53,6 +57,8 @@ usage() {
     echo "  -o, --open               Open generated diagrams in browser"
     echo "  --live-cluster           Use live cluster data (default)"
     echo "  --manifests-only         Use manifest files only"
+    echo "  --snapshot FILE          Use a recorded Application List (JSON) instead of the cluster"
+    echo "  --record FILE            Save the live Application List for later --snapshot runs"
     echo "  --output-dir DIR         Output directory for diagrams"
     echo "  --help, -h              Show this help message"
     echo ""
@@ -60,6 +66,7 @@ usage() {
     echo "  $0                       # Visualize local ArgoCD from live cluster"
     echo "  $0 -e prod --manifests-only # Visualize prod ArgoCD from manifests"
     echo "  $0 -f svg -o             # Generate SVG and open in browser"
+    echo "  $0 --snapshot apps.json  # Offline, from a recorded snapshot"
 }
 
 while [[ $# -gt 0 ]]; do
@@ -88,6 +95,15 @@ while [[ $# -gt 0 ]]; do
             USE_LIVE_CLUSTER=false
             shift
             ;;
+        --snapshot)
+            SNAPSHOT="$2"
+            USE_LIVE_CLUSTER=false
+            shift 2
+            ;;
+        --record)
+            RECORD="$2"
+            shift 2
+            ;;
         --output-dir)
             OUTPUT_DIR="$2"
             shift 2
@@ -110,7 +126,7 @@ check_prerequisites() {
 
     local missing_tools=()
 
-    if ! command -v kubectl &> /dev/null; then
+    if [[ "$USE_LIVE_CLUSTER" == true ]] && ! command -v kubectl &> /dev/null; then
         missing_tools+=("kubectl")
     fi
 
@@ -142,25 +158,21 @@ validate_argocd_access() {
     if [[ "$USE_LIVE_CLUSTER" == true ]]; then
         log_info "Validating ArgoCD access..."
         
-        if ! kubectl cluster-info &> /dev/null; then
-            log_error "Cannot access Kubernetes cluster"
+        # One round-trip answers both "is the cluster reachable" and "does the namespace exist";
+        # the application list call itself reports anything else
+        local error
+        if ! error=$(kubectl get namespace "$NAMESPACE" -o name 2>&1 >/dev/null); then
+            log_error "Cannot access ArgoCD namespace '$NAMESPACE': $error"
             exit 1
         fi
         
-        # Check if ArgoCD namespace exists
-        if ! kubectl get namespace "$NAMESPACE" &> /dev/null; then
-            log_error "ArgoCD namespace '$NAMESPACE' not found"
-            log_info "Available namespaces:"
-            kubectl get namespaces -o name | sed 's/namespace\//  - /'
+        log_success "ArgoCD access validated"
+    elif [[ -n "$SNAPSHOT" ]]; then
+        if [[ ! -f "$SNAPSHOT" ]]; then
+            log_error "Snapshot not found: $SNAPSHOT"
             exit 1
         fi
-        
-        # Check if ArgoCD is running
-        if ! kubectl get pods -n "$NAMESPACE" -l app.kubernetes.io/name=argocd-server &> /dev/null; then
-            log_warn "ArgoCD server pods not found in namespace '$NAMESPACE'"
-        fi
-        
-        log_success "ArgoCD access validated"
+        log_info "Using recorded snapshot for ArgoCD visualization: $SNAPSHOT"
     else
         log_info "Using manifest files for ArgoCD visualization"
     fi
@@ -175,232 +187,20 @@ generate_app_dependency_graph() {
     # Create output directory
     mkdir -p "$OUTPUT_DIR"
     
-    # Create Python script for ArgoCD visualization
-    local python_script="${OUTPUT_DIR}/generate_argocd_graph.py"
-    
-    cat > "$python_script" << 'EOF'
-#!/usr/bin/env python3
-"""
-ArgoCD Application Dependency Visualization
-"""
-
-import json
-import subprocess
-import sys
-from pathlib import Path
-
-try:
-    from diagrams import Diagram, Node, Cluster, Edge
-    from diagrams.k8s.clusterconfig import Namespace
-    from diagrams.onprem.gitops import ArgoCD
-    from diagrams.programming.flowchart import StartEnd, Decision, Action
-    from diagrams.onprem.vcs import Git
-    from diagrams.k8s.compute import Deployment
-    from diagrams.k8s.network import Service
-except ImportError as e:
-    print(f"Error importing diagrams library: {e}")
-    print("Install with: pip3 install diagrams")
-    sys.exit(1)
-
-def get_argocd_applications(namespace, use_live_cluster):
-    """Get ArgoCD applications from cluster or manifests"""
-    applications = []
-    
-    if use_live_cluster:
-        try:
-            # Get applications using kubectl
-            result = subprocess.run([
-                'kubectl', 'get', 'applications', '-n', namespace, '-o', 'json'
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                applications = data.get('items', [])
-            else:
-                print(f"Failed to get applications: {result.stderr}")
-        except Exception as e:
-            print(f"Error getting applications: {e}")
-    else:
-        # Parse manifest files for ArgoCD applications
-        print("Parsing ArgoCD applications from manifests...")
-        # This would parse YAML files in the gitops directory
-        
-    return applications
-
-def analyze_app_dependencies(applications):
-    """Analyze dependencies between ArgoCD applications"""
-    dependencies = {}
-    
-    for app in applications:
-        app_name = app['metadata']['name']
-        spec = app.get('spec', {})
-        
-        # Extract source information
-        source = spec.get('source', {})
-        repo_url = source.get('repoURL', '')
-        path = source.get('path', '')
-        target_revision = source.get('targetRevision', 'HEAD')
-        
-        # Extract destination
-        destination = spec.get('destination', {})
-        dest_namespace = destination.get('namespace', 'default')
-        dest_server = destination.get('server', '')
-        
-        dependencies[app_name] = {
-            'repo': repo_url,
-            'path': path,
-            'revision': target_revision,
-            'namespace': dest_namespace,
-            'server': dest_server,
-            'sync_policy': spec.get('syncPolicy', {}),
-            'status': app.get('status', {})
-        }
-    
-    return dependencies
-
-def generate_gitops_flow_diagram(output_dir, environment, format_type, dependencies):
-    """Generate GitOps workflow diagram"""
-    output_file = f"argocd-{environment}-gitops-flow"
-    
-    with Diagram(
-        f"GitOps Workflow - {environment.title()}",
-        filename=f"{output_dir}/{output_file}",
-        format=format_type,
-        show=False,
-        direction="LR"
-    ):
-        # Git repository
-        git_repo = Git("Git Repository\n(Source of Truth)")
-        
-        # ArgoCD components
-        with Cluster("ArgoCD"):
-            argocd_server = ArgoCD("ArgoCD Server")
-            app_controller = Node("Application Controller")
-        
-        # Kubernetes cluster
-        with Cluster("Kubernetes Cluster"):
-            namespaces = {}
-            for app_name, info in dependencies.items():
-                ns_name = info['namespace']
-                if ns_name not in namespaces:
-                    namespaces[ns_name] = Cluster(f"Namespace: {ns_name}")
-                
-                with namespaces[ns_name]:
-                    Deployment(f"App: {app_name}")
-        
-        # Workflow connections
-        git_repo >> argocd_server
-        argocd_server >> app_controller
-        
-        for ns_cluster in namespaces.values():
-            app_controller >> ns_cluster
-
-def generate_app_status_diagram(output_dir, environment, format_type, dependencies):
-    """Generate application status overview"""
-    output_file = f"argocd-{environment}-app-status"
-    
-    with Diagram(
-        f"ArgoCD Applications Status - {environment.title()}",
-        filename=f"{output_dir}/{output_file}",
-        format=format_type,
-        show=False,
-        direction="TB"
-    ):
-        # Group applications by sync status
-        synced_apps = []
-        out_of_sync_apps = []
-        unknown_apps = []
-        
-        for app_name, info in dependencies.items():
-            sync_status = info['status'].get('sync', {}).get('status', 'Unknown')
-            health_status = info['status'].get('health', {}).get('status', 'Unknown')
-            
-            if sync_status == 'Synced':
-                synced_apps.append((app_name, health_status))
-            elif sync_status == 'OutOfSync':
-                out_of_sync_apps.append((app_name, health_status))
-            else:
-                unknown_apps.append((app_name, health_status))
-        
-        # Create clusters for each status
-        if synced_apps:
-            with Cluster("✅ Synced Applications"):
-                for app_name, health in synced_apps:
-                    color = "green" if health == "Healthy" else "orange"
-                    ArgoCD(f"{app_name}\n({health})")
-        
-        if out_of_sync_apps:
-            with Cluster("⚠️ Out of Sync Applications"):
-                for app_name, health in out_of_sync_apps:
-                    ArgoCD(f"{app_name}\n({health})")
-        
-        if unknown_apps:
-            with Cluster("❓ Unknown Status Applications"):
-                for app_name, health in unknown_apps:
-                    ArgoCD(f"{app_name}\n({health})")
-
-def main():
-    if len(sys.argv) < 5:
-        print("Usage: python3 generate_argocd_graph.py <namespace> <environment> <output_dir> <format> <use_live_cluster>")
-        sys.exit(1)
-    
-    namespace = sys.argv[1]
-    environment = sys.argv[2]
-    output_dir = sys.argv[3]
-    format_type = sys.argv[4]
-    use_live_cluster = sys.argv[5].lower() == 'true'
-    
-    # Ensure output directory exists
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-    
-    print(f"Getting ArgoCD applications from namespace {namespace}...")
-    applications = get_argocd_applications(namespace, use_live_cluster)
-    print(f"Found {len(applications)} ArgoCD applications")
-    
-    if not applications:
-        print("No ArgoCD applications found. Creating example diagram...")
-        dependencies = {
-            'ml-platform-local': {
-                'repo': 'https://github.com/example/ml-platform',
-                'path': 'kubernetes/overlays/local',
-                'revision': 'HEAD',
-                'namespace': 'ml-platform',
-                'status': {'sync': {'status': 'Synced'}, 'health': {'status': 'Healthy'}}
-            },
-            'monitoring': {
-                'repo': 'https://github.com/example/ml-platform',
-                'path': 'kubernetes/base/monitoring',
-                'revision': 'HEAD',
-                'namespace': 'monitoring',
-                'status': {'sync': {'status': 'Synced'}, 'health': {'status': 'Healthy'}}
-            }
-        }
-    else:
-        dependencies = analyze_app_dependencies(applications)
-    
-    # Generate GitOps workflow diagram
-    print("Generating GitOps workflow diagram...")
-    generate_gitops_flow_diagram(output_dir, environment, format_type, dependencies)
-    
-    # Generate application status diagram
-    print("Generating application status diagram...")
-    generate_app_status_diagram(output_dir, environment, format_type, dependencies)
-    
-    print(f"ArgoCD diagrams generated in {output_dir}/")
-
-if __name__ == "__main__":
-    main()
-EOF
-
-    # Make Python script executable
-    chmod +x "$python_script"
-    
-    # Run the Python script
+    # Rendered by argocd_diagrams.py; with a warm render pool listening (MCP server or
+    # `diagram_pool.py serve`) the job runs in an already-initialized worker
     log_info "Running ArgoCD visualization generation..."
-    python3 "$python_script" "$NAMESPACE" "$ENVIRONMENT" "$OUTPUT_DIR" "$FORMAT" "$USE_LIVE_CLUSTER"
-    
-    # Clean up the generated Python script
-    rm "$python_script"
+    # Live mode fetches every Application/ApplicationSet in one list call and records it to
+    # APPS_SNAPSHOT, which the overview then reads instead of listing them again
+    python3 "${SCRIPT_DIR}/diagram_pool.py" render argocd \
+        namespace="$NAMESPACE" \
+        environment="$ENVIRONMENT" \
+        output_dir="$OUTPUT_DIR" \
+        format="$FORMAT" \
+        use_live_cluster="$USE_LIVE_CLUSTER" \
+        manifests_dir="${KUBERNETES_DIR}/base/gitops" \
+        ${SNAPSHOT:+snapshot="$SNAPSHOT"} \
+        ${APPS_SNAPSHOT:+record="$APPS_SNAPSHOT"}
     
     # Return generated files
     local generated_files=()
@@ -412,6 +212,7 @@ EOF
     
     if [ ${#generated_files[@]} -gt 0 ]; then
         log_success "ArgoCD visualizations generated"
+        record_output "${generated_files[@]}"
         printf '%s\n' "${generated_files[@]}"
     else
         log_error "Failed to generate ArgoCD visualizations"
@@ -419,6 +220,16 @@ EOF
     fi
 }
 
+# Sync plan table (stage, wave, status per application) from a snapshot or manifest directory
+write_sync_plan() {
+    local source="$1"
+    
+    if [[ -e "$source" ]] && python3 "${SCRIPT_DIR}/argocd_apps.py" --source "$source" -n "$NAMESPACE" --format markdown 2>/dev/null; then
+        return 0
+    fi
+    echo "No applications found"
+}
+
 # Generate ArgoCD configuration overview
 generate_argocd_overview() {
     local output_file="${OUTPUT_DIR}/argocd-${ENVIRONMENT}-overview.md"
@@ -444,10 +255,9 @@ EOF
         echo '```' >> "$output_file"
         
         echo "" >> "$output_file"
-        echo "### ArgoCD Applications" >> "$output_file"
-        echo '```' >> "$output_file"
-        kubectl get applications -n "$NAMESPACE" 2>/dev/null | head -20 >> "$output_file" || echo "No applications found" >> "$output_file"
-        echo '```' >> "$output_file"
+        echo "### ArgoCD Applications (sync order)" >> "$output_file"
+        echo "" >> "$output_file"
+        write_sync_plan "$APPS_SNAPSHOT" >> "$output_file"
         
         echo "" >> "$output_file"
         echo "### Application Projects" >> "$output_file"
@@ -455,6 +265,11 @@ EOF
         kubectl get appprojects -n "$NAMESPACE" 2>/dev/null | head -10 >> "$output_file" || echo "No projects found" >> "$output_file"
         echo '```' >> "$output_file"
     else
+        echo "### Applications (sync order)" >> "$output_file"
+        echo "" >> "$output_file"
+        write_sync_plan "${SNAPSHOT:-${KUBERNETES_DIR}/base/gitops}" >> "$output_file"
+        echo "" >> "$output_file"
+        
         echo "### Configuration Files" >> "$output_file"
         
         # List ArgoCD configuration files
@@ -556,6 +371,7 @@ kubectl port-forward -n ${NAMESPACE} svc/argocd-server 8080:443
 EOF
 
     log_success "ArgoCD overview generated: $output_file"
+    record_output "$output_file"
     echo "$output_file"
 }
 
@@ -591,16 +407,26 @@ open_files() {
 main() {
     log_info "Starting ArgoCD GitOps visualization for environment: $ENVIRONMENT"
     
-    check_prerequisites
-    validate_argocd_access
+    run_stage prerequisites check_prerequisites
+    run_stage validate validate_argocd_access
     
     # Create output directory
     mkdir -p "$OUTPUT_DIR"
     
+    # Where the live application list is recorded for the overview (and --record)
+    if [[ "$USE_LIVE_CLUSTER" == true ]]; then
+        if [[ -n "$RECORD" ]]; then
+            APPS_SNAPSHOT="$RECORD"
+        else
+            APPS_SNAPSHOT="$(mktemp "${TMPDIR:-/tmp}/argocd-${ENVIRONMENT}-apps.XXXXXX")"
+            trap 'rm -f "$APPS_SNAPSHOT"' EXIT
+        fi
+    fi
+    
     local generated_files=()
     
-    # Install Python diagrams library if needed
-    if ! python3 -c "import diagrams" &> /dev/null; then
+    # Install Python diagrams library if needed (a running render pool already has it)
+    if [[ ! -S "${ML_PLATFORM_VIZ_RENDER_SOCKET:-}" ]] && ! python3 -c "import diagrams" &> /dev/null; then
         log_info "Installing Python diagrams library..."
         pip3 install diagrams graphviz --user || {
             log_error "Failed to install diagrams library"
@@ -609,12 +435,12 @@ main() {
     fi
     
     # Generate ArgoCD application dependency graphs
-    if readarray -t diagram_files < <(generate_app_dependency_graph); then
+    if readarray -t diagram_files < <(run_stage diagrams_as_code generate_app_dependency_graph); then
         generated_files+=("${diagram_files[@]}")
     fi
     
     # Generate ArgoCD overview documentation
-    if overview_file=$(generate_argocd_overview); then
+    if overview_file=$(run_stage overview generate_argocd_overview); then
         generated_files+=("$overview_file")
     fi
     
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+ArgoCD application collector and sync-wave dependency graph
+Fetches every Application and ApplicationSet with a single list call (or reads a recorded List
+snapshot, or the gitops manifests), keeps a slim record per object, and orders them into a DAG:
+an owner (ApplicationSet or app-of-apps parent) comes before its children, and among siblings
+each sync wave waits for the wave before it.
+"""
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from k8s_inventory import iter_list_items
+from k8s_manifests import parse_documents
+
+APP_KINDS = ('Application', 'ApplicationSet')
+# Resource type -> API path in the ArgoCD namespace, used with an API server URL (kubectl proxy)
+RESOURCE_PATHS = {
+    'Application': '/apis/argoproj.io/v1alpha1/namespaces/{namespace}/applications',
+    'ApplicationSet': '/apis/argoproj.io/v1alpha1/namespaces/{namespace}/applicationsets',
+}
+KUBECTL_TYPES = 'applications.argoproj.io,applicationsets.argoproj.io'
+KUBECTL_APPLICATION_TYPE = 'applications.argoproj.io'
+# kubectl's error for a resource type the API server does not serve (its CRD is not installed)
+KUBECTL_MISSING_TYPE = "doesn't have a resource type"
+SYNC_WAVE_ANNOTATION = 'argocd.argoproj.io/sync-wave'
+# Labels through which an app-of-apps parent tracks the Application objects it manages
+INSTANCE_LABELS = ('argocd.argoproj.io/instance', 'app.kubernetes.io/instance')
+
+
+def node_id(kind, name):
+    return f"{kind}/{name}"
+
+
+def sync_wave(annotations):
+    """The object's sync wave; ArgoCD treats a missing or non-numeric one as 0"""
+    try:
+        return int(str((annotations or {}).get(SYNC_WAVE_ANNOTATION, 0)).strip())
+    except ValueError:
+        return 0
+
+
+def app_record(item):
+    """The fields the graph and the diagrams use, dropping status.resources, managedFields and the like"""
+    kind = item.get('kind') or 'Application'
+    metadata = item.get('metadata') or {}
+    spec = item.get('spec') or {}
+    status = item.get('status') or {}
+
+    annotations = metadata.get('annotations') or {}
+    if kind == 'ApplicationSet':
+        # An ApplicationSet stands for the Applications it generates: describe its template
+        template = spec.get('template') or {}
+        if SYNC_WAVE_ANNOTATION not in annotations:
+            annotations = (template.get('metadata') or {}).get('annotations') or {}
+        spec = template.get('spec') or {}
+
+    sources = spec.get('sources') or [spec.get('source') or {}]
+    destination = spec.get('destination') or {}
+    owner = next(
+        (ref.get('name') for ref in metadata.get('ownerReferences') or [] if ref.get('kind') == 'ApplicationSet'),
+        None
+    )
+    labels = metadata.get('labels') or {}
+
+    return {
+        "kind": kind,
+        "name": metadata.get('name', ''),
+        "namespace": metadata.get('namespace', ''),
+        "project": spec.get('project', 'default'),
+        "wave": sync_wave(annotations),
+        "owner": owner,
+        "instance": next((labels[label] for label in INSTANCE_LABELS if labels.get(label)), None),
+        "repo": sources[0].get('repoURL', ''),
+        "path": sources[0].get('path') or sources[0].get('chart', ''),
+        "revision": sources[0].get('targetRevision', 'HEAD'),
+        "sources": len(sources),
+        "destination_namespace": destination.get('namespace', 'default'),
+        "server": destination.get('server') or destination.get('name', ''),
+        "automated": bool((spec.get('syncPolicy') or {}).get('automated')),
+        "sync": (status.get('sync') or {}).get('status', 'Unknown'),
+        "health": (status.get('health') or {}).get('status', 'Unknown'),
+    }
+
+
+class ArgoCDCollector:
+    """All Applications/ApplicationSets from one kubectl list call, an API server URL, a snapshot or manifests"""
+
+    def __init__(self, source=None, namespace='argocd', context=None, record=None, timeout=60):
+        self.source = source
+        self.namespace = namespace
+        self.context = context
+        self.record = Path(record) if record else None
+        self.timeout = timeout
+        self.calls = 0
+
+    def items(self):
+        """Raw Application/ApplicationSet objects from the configured source"""
+        if self.source and self.source.startswith(('http://', 'https://')):
+            yield from self._api_items()
+        elif self.source and Path(self.source).is_dir():
+            yield from self._manifest_items(Path(self.source))
+        elif self.source:
+            with open(self.source, 'r', encoding='utf-8') as f:
+                yield from iter_list_items(f)
+        else:
+            yield from self._kubectl_items()
+
+    def _kubectl_items(self):
+        # Both kinds in a single request; kubectl merges them into one List
+        try:
+            yield from self._kubectl_get(KUBECTL_TYPES)
+        except RuntimeError as e:
+            # kubectl resolves the types before listing anything, so nothing was yielded yet
+            if KUBECTL_MISSING_TYPE not in str(e):
+                raise
+            # ApplicationSet controller (and its CRD) not installed
+            yield from self._kubectl_get(KUBECTL_APPLICATION_TYPE)
+
+    def _kubectl_get(self, types):
+        self.calls += 1
+        cmd = ['kubectl', 'get', types, '-n', self.namespace, '-o', 'json']
+        if self.context:
+            cmd += ['--context', self.context]
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        try:
+            yield from iter_list_items(process.stdout)
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            if process.wait() != 0:
+                raise RuntimeError(f"kubectl get {types} exited with {process.returncode}: {stderr.strip()}")
+
+    def _api_items(self):
+        for kind, path in RESOURCE_PATHS.items():
+            self.calls += 1
+            url = self.source.rstrip('/') + path.format(namespace=self.namespace)
+            try:
+                response = urllib.request.urlopen(url, timeout=self.timeout)
+            except urllib.error.HTTPError as e:
+                if e.code == 404 and kind == 'ApplicationSet':
+                    continue  # ApplicationSet controller (and its CRD) not installed
+                raise
+            with response:
+                for item in iter_list_items(io.TextIOWrapper(response, encoding='utf-8')):
+                    # Items of a typed List carry no kind of their own
+                    item.setdefault('kind', kind)
+                    yield item
+
+    def _manifest_items(self, directory):
+        for path in sorted(directory.rglob('*.y*ml')):
+            with open(path, 'r', encoding='utf-8') as f:
+                for doc in parse_documents(f.read()):
+                    if doc.get('kind') in APP_KINDS:
+                        yield doc
+
+    def collect(self):
+        """Slim records of every Application and ApplicationSet, in source order
+
+        With record set, the objects are also written out as a List snapshot
+        that can be passed back as source to work offline.
+        """
+        raw = [] if self.record is not None else None
+        records = []
+        for item in self.items():
+            if item.get('kind', 'Application') not in APP_KINDS:
+                continue
+            if raw is not None:
+                raw.append(item)
+            records.append(app_record(item))
+
+        if raw is not None:
+            self.record.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.record, 'w', encoding='utf-8') as f:
+                json.dump({"apiVersion": "v1", "kind": "List", "items": raw}, f)
+        return records
+
+
+class AppGraph:
+    """Applications and ApplicationSets ordered by ownership and sync wave
+
+    Sibling apps (same owner) are grouped by wave; every app depends on all
+    siblings in the nearest lower wave. Those predecessor lists are shared
+    per wave rather than copied per app, so the index stays linear in the
+    number of apps even when a wave holds hundreds of them.
+    """
+
+    def __init__(self, records):
+        self.nodes = {}
+        for record in records:
+            self.nodes[node_id(record['kind'], record['name'])] = record
+
+        # child -> owner and owner -> children
+        self.parent = {}
+        self.children = {}
+        for key, record in self.nodes.items():
+            parent = self._owner_of(key, record)
+            if parent is not None:
+                self.parent[key] = parent
+                self.children.setdefault(parent, []).append(key)
+
+        # owner (None for top level) -> [(wave, [members])] in ascending wave order
+        self.waves = {}
+        groups = {}
+        for key, record in self.nodes.items():
+            groups.setdefault(self.parent.get(key), {}).setdefault(record['wave'], []).append(key)
+        for group, by_wave in groups.items():
+            self.waves[group] = sorted(by_wave.items())
+
+        # Adjacency index for wave ordering: app -> previous / next wave's members (shared lists)
+        self.wave_predecessors = {}
+        self.wave_successors = {}
+        self.wave_index = {}
+        for ordered in self.waves.values():
+            for i, (_, members) in enumerate(ordered):
+                before = ordered[i - 1][1] if i else []
+                after = ordered[i + 1][1] if i + 1 < len(ordered) else []
+                for key in members:
+                    self.wave_predecessors[key] = before
+                    self.wave_successors[key] = after
+                    self.wave_index[key] = i
+
+        self._levels = None
+
+    def _owner_of(self, key, record):
+        if record['owner'] and node_id('ApplicationSet', record['owner']) in self.nodes:
+            return node_id('ApplicationSet', record['owner'])
+        instance = record['instance']
+        if instance and node_id('Application', instance) in self.nodes and node_id('Application', instance) != key:
+            return node_id('Application', instance)
+        return None
+
+    def predecessors(self, key):
+        """Everything that has to be synced before key"""
+        if key in self.parent:
+            yield self.parent[key]
+        yield from self.wave_predecessors.get(key, ())
+
+    def successors(self, key):
+        yield from self.children.get(key, ())
+        yield from self.wave_successors.get(key, ())
+
+    def edge_count(self):
+        wave_edges = sum(
+            len(ordered[i - 1][1]) * len(ordered[i][1])
+            for ordered in self.waves.values() for i in range(1, len(ordered))
+        )
+        return len(self.parent) + wave_edges
+
+    def levels(self):
+        """Sync stage of every node: its owner's stage + 1, plus its wave's position among its siblings"""
+        if self._levels is None:
+            levels = {}
+            for key in self.nodes:
+                # Walk up to the nearest owner with a known stage, then fill in the chain on the way down;
+                # an ownership cycle (malformed labels) is treated as top level
+                chain = []
+                node = key
+                while node is not None and node not in levels and node not in chain:
+                    chain.append(node)
+                    node = self.parent.get(node)
+                base = levels[node] + 1 if node in levels else 0
+                for member in reversed(chain):
+                    levels[member] = base + self.wave_index[member]
+                    base = levels[member] + 1
+            self._levels = levels
+        return self._levels
+
+    def stages(self):
+        """Nodes grouped by sync stage; everything in a stage can sync concurrently"""
+        stages = {}
+        for key, level in self.levels().items():
+            stages.setdefault(level, []).append(key)
+        return [sorted(stages[level]) for level in sorted(stages)]
+
+    def applications(self):
+        return [record for record in self.nodes.values() if record['kind'] == 'Application']
+
+    def to_json(self):
+        levels = self.levels()
+        return {
+            "nodes": [
+                dict(record, id=key, stage=levels[key], parent=self.parent.get(key),
+                     depends_on=list(self.predecessors(key)))
+                for key, record in self.nodes.items()
+            ],
+            "stages": self.stages(),
+            "edges": self.edge_count(),
+        }
+
+
+def format_markdown(graph):
+    """Sync plan table, one row per app in stage order"""
+    lines = [
+        "| Stage | Wave | Kind | Name | Project | Destination | Sync | Health |",
+        "|-------|------|------|------|---------|-------------|------|--------|",
+    ]
+    for stage, keys in enumerate(graph.stages()):
+        for key in keys:
+            record = graph.nodes[key]
+            lines.append(
+                f"| {stage} | {record['wave']} | {record['kind']} | {record['name']} | {record['project']} | "
+                f"{record['destination_namespace']} | {record['sync']} | {record['health']} |"
+            )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ArgoCD applications and their sync-wave dependency graph")
+    parser.add_argument("--source", help="API server URL (e.g. kubectl proxy), recorded List snapshot (.json) or "
+                                         "directory of Application manifests; defaults to kubectl")
+    parser.add_argument("-n", "--namespace", default="argocd", help="ArgoCD namespace")
+    parser.add_argument("--context", help="kubectl context to query")
+    parser.add_argument("--record", metavar="FILE", help="Save the fetched objects as a List snapshot")
+    parser.add_argument("--format", choices=("json", "markdown"), default="json", help="Output format")
+    args = parser.parse_args()
+
+    collector = ArgoCDCollector(args.source, args.namespace, args.context, args.record)
+    try:
+        graph = AppGraph(collector.collect())
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Unable to collect ArgoCD applications: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == 'markdown':
+        print(format_markdown(graph))
+    else:
+        print(json.dumps(dict(graph.to_json(), list_calls=collector.calls), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+ArgoCD Application Dependency Visualization
+"""
+
+import sys
+from pathlib import Path
+
+from argocd_apps import AppGraph, ArgoCDCollector
+
+# Imported once per process; diagram_pool workers load this module before taking jobs
+try:
+    from diagrams import Diagram, Node, Cluster, Edge
+    from diagrams.onprem.gitops import ArgoCD
+    from diagrams.onprem.vcs import Git
+    from diagrams.k8s.compute import Deployment
+except ImportError as e:
+    Diagram = None
+    DIAGRAMS_IMPORT_ERROR = e
+
+# Shown when no applications are found
+EXAMPLE_APPLICATIONS = [
+    {
+        "kind": "Application", "name": "monitoring", "namespace": "argocd", "project": "default",
+        "wave": 1, "owner": None, "instance": None,
+        "repo": "https://github.com/example/ml-platform", "path": "kubernetes/base/monitoring",
+        "revision": "HEAD", "sources": 1, "destination_namespace": "monitoring",
+        "server": "https://kubernetes.default.svc", "automated": True, "sync": "Synced", "health": "Healthy"
+    },
+    {
+        "kind": "Application", "name": "ml-platform-local", "namespace": "argocd", "project": "default",
+        "wave": 2, "owner": None, "instance": None,
+        "repo": "https://github.com/example/ml-platform", "path": "kubernetes/overlays/local",
+        "revision": "HEAD", "sources": 1, "destination_namespace": "ml-platform",
+        "server": "https://kubernetes.default.svc", "automated": True, "sync": "Synced", "health": "Healthy"
+    }
+]
+
+
+def require_diagrams():
+    if Diagram is None:
+        raise RuntimeError(f"Error importing diagrams library: {DIAGRAMS_IMPORT_ERROR}\n"
+                           "Install with: pip3 install diagrams")
+
+
+def get_argocd_applications(namespace, use_live_cluster, snapshot=None, manifests_dir=None, record=None):
+    """Application/ApplicationSet records from a snapshot, the live cluster (one list call) or the manifests"""
+    if snapshot:
+        source = snapshot
+    elif use_live_cluster:
+        source = None
+    elif manifests_dir and Path(manifests_dir).is_dir():
+        print("Parsing ArgoCD applications from manifests...")
+        source = manifests_dir
+    else:
+        return []
+
+    try:
+        return ArgoCDCollector(source, namespace, record=record).collect()
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Error getting applications: {e}")
+        return []
+
+
+def generate_gitops_flow_diagram(output_dir, environment, format_type, graph):
+    """Generate GitOps workflow diagram"""
+    output_file = f"argocd-{environment}-gitops-flow"
+
+    with Diagram(
+        f"GitOps Workflow - {environment.title()}",
+        filename=f"{output_dir}/{output_file}",
+        outformat=format_type,
+        show=False,
+        direction="LR"
+    ):
+        # Git repository
+        git_repo = Git("Git Repository\n(Source of Truth)")
+
+        # ArgoCD components
+        with Cluster("ArgoCD"):
+            argocd_server = ArgoCD("ArgoCD Server")
+            app_controller = Node("Application Controller")
+
+        # Kubernetes cluster
+        with Cluster("Kubernetes Cluster"):
+            namespaces = {}
+            for app in graph.applications():
+                ns_name = app['destination_namespace']
+                if ns_name not in namespaces:
+                    namespaces[ns_name] = Cluster(f"Namespace: {ns_name}")
+
+                with namespaces[ns_name]:
+                    Deployment(f"App: {app['name']}")
+
+        # Workflow connections
+        git_repo >> argocd_server
+        argocd_server >> app_controller
+
+        for ns_cluster in namespaces.values():
+            app_controller >> ns_cluster
+
+    return f"{output_dir}/{output_file}.{format_type}"
+
+
+def generate_app_status_diagram(output_dir, environment, format_type, graph):
+    """Generate application status overview"""
+    output_file = f"argocd-{environment}-app-status"
+
+    with Diagram(
+        f"ArgoCD Applications Status - {environment.title()}",
+        filename=f"{output_dir}/{output_file}",
+        outformat=format_type,
+        show=False,
+        direction="TB"
+    ):
+        # Group applications by sync status
+        synced_apps = []
+        out_of_sync_apps = []
+        unknown_apps = []
+
+        for app in graph.applications():
+            app_name = app['name']
+            sync_status = app['sync']
+            health_status = app['health']
+
+            if sync_status == 'Synced':
+                synced_apps.append((app_name, health_status))
+            elif sync_status == 'OutOfSync':
+                out_of_sync_apps.append((app_name, health_status))
+            else:
+                unknown_apps.append((app_name, health_status))
+
+        # Create clusters for each status
+        if synced_apps:
+            with Cluster("✅ Synced Applications"):
+                for app_name, health in synced_apps:
+                    ArgoCD(f"{app_name}\n({health})")
+
+        if out_of_sync_apps:
+            with Cluster("⚠️ Out of Sync Applications"):
+                for app_name, health in out_of_sync_apps:
+                    ArgoCD(f"{app_name}\n({health})")
+
+        if unknown_apps:
+            with Cluster("❓ Unknown Status Applications"):
+                for app_name, health in unknown_apps:
+                    ArgoCD(f"{app_name}\n({health})")
+
+    return f"{output_dir}/{output_file}.{format_type}"
+
+
+def generate_sync_wave_diagram(output_dir, environment, format_type, graph):
+    """Generate the sync-wave dependency graph: owners, their children by wave, and wave barriers"""
+    output_file = f"argocd-{environment}-app-dependencies"
+
+    with Diagram(
+        f"ArgoCD Sync Waves - {environment.title()}",
+        filename=f"{output_dir}/{output_file}",
+        outformat=format_type,
+        show=False,
+        direction="LR"
+    ):
+        nodes = {}
+        barriers = []
+        for group, ordered in graph.waves.items():
+            title = "Top-level applications" if group is None else f"Managed by {group}"
+            with Cluster(title):
+                previous = None
+                for wave, members in ordered:
+                    with Cluster(f"Wave {wave}"):
+                        for key in members:
+                            record = graph.nodes[key]
+                            nodes[key] = ArgoCD(f"{record['name']}\n({record['sync']})")
+                    # One barrier per wave boundary keeps the edge count linear in the number of apps
+                    if previous is not None:
+                        barrier = Node(f"wave {wave}", shape="circle", width="0.3", height="0.3", fontsize="9")
+                        barriers.append((previous, barrier, members))
+                    previous = members
+
+        for previous, barrier, members in barriers:
+            for key in previous:
+                nodes[key] >> Edge(style="dashed") >> barrier
+            for key in members:
+                barrier >> Edge(style="dashed") >> nodes[key]
+
+        for child, parent in graph.parent.items():
+            nodes[parent] >> Edge(label="owns") >> nodes[child]
+
+    return f"{output_dir}/{output_file}.{format_type}"
+
+
+def render(spec):
+    """Render the diagrams described by a spec; returns the files written
+
+    spec: {"namespace", "environment", "output_dir", "format", "use_live_cluster",
+           "snapshot", "manifests_dir", "record"}
+    """
+    require_diagrams()
+    namespace = spec.get('namespace', 'argocd')
+    environment = spec['environment']
+    output_dir = spec['output_dir']
+    format_type = spec.get('format', 'png')
+    use_live_cluster = str(spec.get('use_live_cluster', False)).lower() == 'true'
+
+    # Ensure output directory exists
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    print(f"Getting ArgoCD applications from namespace {namespace}...")
+    applications = get_argocd_applications(
+        namespace, use_live_cluster, spec.get('snapshot'), spec.get('manifests_dir'), spec.get('record')
+    )
+    print(f"Found {len(applications)} ArgoCD applications")
+
+    if not applications:
+        print("No ArgoCD applications found. Creating example diagram...")
+        applications = EXAMPLE_APPLICATIONS
+    graph = AppGraph(applications)
+
+    # Generate GitOps workflow diagram
+    print("Generating GitOps workflow diagram...")
+    files = [generate_gitops_flow_diagram(output_dir, environment, format_type, graph)]
+
+    # Generate application status diagram
+    print("Generating application status diagram...")
+    files.append(generate_app_status_diagram(output_dir, environment, format_type, graph))
+
+    # Generate sync-wave dependency diagram
+    print("Generating sync-wave dependency diagram...")
+    files.append(generate_sync_wave_diagram(output_dir, environment, format_type, graph))
+
+    print(f"ArgoCD diagrams generated in {output_dir}/")
+    return files
+
+
+def main():
+    if len(sys.argv) < 6:
+        print("Usage: python3 argocd_diagrams.py <namespace> <environment> <output_dir> <format> <use_live_cluster>")
+        sys.exit(1)
+
+    try:
+        render({
+            "namespace": sys.argv[1],
+            "environment": sys.argv[2],
+            "output_dir": sys.argv[3],
+            "format": sys.argv[4],
+            "use_live_cluster": sys.argv[5]
+        })
+    except RuntimeError as e:
+        print(str(e))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+visualize_argocd MCP tool plugin
+Runs argocd-visualize.sh through the server's render cache; loaded on the tool's first call
+"""
+
+from render_cache import ARGOCD_INPUTS
+
+
+async def run(server, args, progress=None):
+    """Run ArgoCD visualization"""
+    # Diagrams go to the warm render pool through the inherited socket
+    await server.ensure_render_pool()
+    cmd = [
+        str(server.script_dir / "argocd-visualize.sh"),
+        "-e", args.get('environment', 'local'),
+        "-n", args.get('namespace', 'argocd'),
+        "-f", args.get('format', 'png')
+    ]
+
+    if args.get('use_live_cluster', False):
+        cmd.append('--live-cluster')
+    else:
+        cmd.append('--manifests-only')
+
+    if args.get('open_browser', False):
+        cmd.append('-o')
+
+    result, cache_hit = await server.run_cached_script('visualize_argocd', args, cmd, ARGOCD_INPUTS, progress)
+
+    # Find generated files
+    generated_files = server.list_diagrams("argocd-")
+
+    return server.script_report(
+        f"🔄 ArgoCD visualization completed for {args.get('environment', 'local')} environment\n\n"
+        f"📦 Namespace: {args.get('namespace', 'argocd')}\n",
+        generated_files, result, cache_hit
+    )
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Warm worker pool for diagrams-as-code rendering
+Keeps worker processes with the diagrams node modules already imported and hands them render specs
+in memory, either directly (MCP server) or over a Unix socket (visualization scripts)
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from render_cache import default_cache_dir
+
+# Spec kind -> module with a render(spec) function
+RENDERERS = {
+    'kubernetes': 'k8s_diagrams',
+    'argocd': 'argocd_diagrams',
+}
+SOCKET_ENV = 'ML_PLATFORM_VIZ_RENDER_SOCKET'
+DEFAULT_WORKERS = int(os.environ.get('ML_PLATFORM_VIZ_RENDER_WORKERS', min(4, os.cpu_count() or 2)))
+RENDER_TIMEOUT = 600
+
+
+def default_socket_path():
+    return Path(default_cache_dir()) / 'render.sock'
+
+
+def warm_up():
+    """Worker initializer: import every renderer (and with it the diagrams library) once"""
+    for module in RENDERERS.values():
+        importlib.import_module(module)
+
+
+def render_spec(spec):
+    """Run one render job in this process: {"files", "log"} or {"error", "log"}"""
+    module = RENDERERS.get(spec.get('kind'))
+    if module is None:
+        return {"error": f"Unknown diagram kind: {spec.get('kind')}", "log": ""}
+
+    log = io.StringIO()
+    try:
+        renderer = importlib.import_module(module)
+        if getattr(renderer, 'Diagram', True) is None:
+            # diagrams was missing when this worker started; it may have been installed since
+            importlib.invalidate_caches()
+            renderer = importlib.reload(renderer)
+        with contextlib.redirect_stdout(log):
+            files = renderer.render(spec)
+        return {"files": files, "log": log.getvalue()}
+    except Exception as e:
+        return {"error": str(e), "log": log.getvalue()}
+
+
+class DiagramRenderPool:
+    """Process pool whose workers import the renderers before their first job"""
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self.workers = workers
+        self.stats = {"jobs": 0, "errors": 0}
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn rather than fork: the MCP server forking with threads running is unsafe
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context('spawn'), initializer=warm_up
+                )
+                # Bring every worker up now so the first jobs do not pay for the imports
+                concurrent.futures.wait([self._executor.submit(os.getpid) for _ in range(self.workers)])
+        return self
+
+    def submit(self, spec):
+        """concurrent.futures.Future of render_spec(spec) on a warm worker"""
+        try:
+            future = self.start()._executor.submit(render_spec, spec)
+        except BrokenProcessPool:
+            # A worker died (OOM, killed); replace the whole pool once, after
+            # reaping the remaining workers of the broken one
+            with self._lock:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False, cancel_futures=True)
+                    self._executor = None
+            future = self.start()._executor.submit(render_spec, spec)
+        future.add_done_callback(self._count)
+        return future
+
+    async def render(self, spec):
+        return await asyncio.wrap_future(self.submit(spec))
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _count(self, future):
+        self.stats['jobs'] += 1
+        if future.cancelled() or future.exception() is not None or 'error' in future.result():
+            self.stats['errors'] += 1
+
+
+async def serve_socket(pool, socket_path):
+    """Accept one JSON spec per connection and answer with one JSON result line"""
+    async def handle(reader, writer):
+        try:
+            spec = json.loads(await reader.readline())
+            result = await pool.render(spec)
+        except (ValueError, AttributeError) as e:
+            result = {"error": f"Invalid render spec: {e}", "log": ""}
+        except BrokenProcessPool as e:
+            result = {"error": f"Render worker died: {e}", "log": ""}
+        writer.write((json.dumps(result) + '\n').encode('utf-8'))
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    socket_path = Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()  # left over from a pool that did not shut down cleanly
+    return await asyncio.start_unix_server(handle, path=str(socket_path))
+
+
+def request_render(spec, socket_path=None, timeout=RENDER_TIMEOUT):
+    """Render through a running pool's socket, or in this process when none is listening"""
+    socket_path = socket_path or os.environ.get(SOCKET_ENV)
+    if not socket_path or not hasattr(socket, 'AF_UNIX'):
+        return render_spec(spec)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            # No pool listening: render here, paying the import cost once
+            return render_spec(spec)
+        sock.settimeout(timeout)
+        try:
+            sock.sendall((json.dumps(spec) + '\n').encode('utf-8'))
+            with sock.makefile('r', encoding='utf-8') as response:
+                return json.loads(response.readline())
+        except (OSError, ValueError) as e:
+            return {"error": f"Render pool at {socket_path} failed: {e}", "log": ""}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm diagrams-as-code render pool")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Run a pool listening on a Unix socket")
+    serve_parser.add_argument("--socket", default=str(default_socket_path()), help="Socket path")
+    serve_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Worker processes")
+
+    render_parser = subparsers.add_parser("render", help="Render one spec (through the pool when it is running)")
+    render_parser.add_argument("kind", choices=sorted(RENDERERS), help="Diagram kind")
+    render_parser.add_argument("fields", nargs="*", metavar="KEY=VALUE", help="Spec fields")
+    render_parser.add_argument("--socket", help=f"Socket path (default: ${SOCKET_ENV})")
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        pool = DiagramRenderPool(args.workers).start()
+
+        async def run():
+            server = await serve_socket(pool, args.socket)
+            print(f"Render pool with {pool.workers} warm worker(s) listening on {args.socket}", file=sys.stderr)
+            async with server:
+                await server.serve_forever()
+
+        try:
+            asyncio.run(run())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            pool.close()
+            Path(args.socket).unlink(missing_ok=True)
+        return
+
+    spec = {"kind": args.kind}
+    for field in args.fields:
+        key, sep, value = field.partition('=')
+        if not sep:
+            parser.error(f"expected KEY=VALUE, got '{field}'")
+        # Workers run in the pool's working directory, not the caller's
+        spec[key] = os.path.abspath(value) if key.endswith('_dir') else value
+
+    result = request_render(spec, args.socket)
+    # Keep stdout for the caller's own file list
+    sys.stderr.write(result.get('log', ''))
+    if 'error' in result:
+        print(result['error'], file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Single-layout Graphviz rendering
+Lays a DOT graph out once and writes every requested format from that one layout
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+SUPPORTED_FORMATS = ('png', 'svg', 'pdf', 'xdot', 'json')
+
+
+def output_args(outputs):
+    """-T<format> -o <path> pairs for one Graphviz invocation"""
+    args = []
+    for format_type, path in outputs:
+        args += [f'-T{format_type}', '-o', str(path)]
+    return args
+
+
+def group_outputs(outputs, format_options=None):
+    """Outputs grouped by their render options, preserving request order"""
+    format_options = format_options or {}
+    groups = {}
+    for format_type, path in outputs:
+        groups.setdefault(tuple(format_options.get(format_type, ())), []).append((format_type, path))
+    return list(groups.items())
+
+
+def render(source, outputs, format_options=None, engine='dot'):
+    """Render source (a DOT file) to each (format, path) in outputs with a single layout pass
+
+    format_options maps a format to extra render-time arguments (e.g. a PNG
+    resolution) that must not change the layout of the other formats.
+
+    When every output shares the same render options, one Graphviz call emits
+    them all. Otherwise the graph is laid out once to xdot and each option
+    group is drawn from those positions with `neato -n2`, which skips layout.
+    """
+    groups = group_outputs(outputs, format_options)
+    if len(groups) == 1:
+        options, group = groups[0]
+        subprocess.run([engine, *options, *output_args(group), str(source)], check=True)
+        return
+
+    fd, layout_file = tempfile.mkstemp(prefix='layout-', suffix='.xdot')
+    os.close(fd)
+    try:
+        subprocess.run([engine, '-Txdot', '-o', layout_file, str(source)], check=True)
+        for options, group in groups:
+            subprocess.run(['neato', '-n2', *options, *output_args(group), layout_file], check=True)
+    finally:
+        os.unlink(layout_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a DOT graph to several formats from one layout")
+    parser.add_argument("source", help="DOT file to render")
+    parser.add_argument("-o", "--output", action="append", default=[], metavar="FORMAT:PATH",
+                        help="Output to write, e.g. png:graph.png (repeatable)")
+    parser.add_argument("--png-dpi", type=int, help="Resolution of PNG output")
+    args = parser.parse_args()
+
+    outputs = []
+    for spec in args.output:
+        format_type, sep, path = spec.partition(':')
+        if not sep or format_type not in SUPPORTED_FORMATS:
+            print(f"Unsupported output: {spec} (expected FORMAT:PATH with FORMAT in "
+                  f"{', '.join(SUPPORTED_FORMATS)})", file=sys.stderr)
+            sys.exit(1)
+        outputs.append((format_type, path))
+    if not outputs:
+        parser.error("at least one --output is required")
+
+    format_options = {'png': (f'-Gdpi={args.png_dpi}',)} if args.png_dpi else None
+    try:
+        render(args.source, outputs, format_options)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Graphviz rendering failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Streaming DOT styler for `terraform graph` output
+Colors each node by resource type in a single pass, declaring every node's style exactly once
+"""
+
+import re
+import sys
+
+# Graph/node/edge defaults for the enhanced visualization
+GRAPH_HEADER = '''digraph {
+    // Graph attributes
+    bgcolor="white";
+    rankdir="TB";
+    splines="ortho";
+    nodesep="0.8";
+    ranksep="1.2";
+    fontname="Arial";
+    fontsize="14";
+
+    // Default node style
+    node [
+        shape="box",
+        style="rounded,filled",
+        fillcolor="lightblue",
+        fontname="Arial",
+        fontsize="12",
+        margin="0.2,0.1"
+    ];
+
+    // Default edge style
+    edge [
+        color="gray60",
+        fontname="Arial",
+        fontsize="10",
+        arrowsize="0.8"
+    ];
+
+'''
+
+KIND_COLORS = {
+    'provider': 'lightgreen',
+    'data': 'lightyellow',
+    'resource': 'lightcoral',
+    'module': 'lightpink',
+    'var': 'lightgray',
+    'output': 'lightsteelblue',
+}
+DEFAULT_KIND = 'other'
+DEFAULT_COLOR = 'lightblue'
+
+# First address segment -> node kind; anything else is a managed resource type
+KIND_BY_PREFIX = {
+    'provider': 'provider',
+    'data': 'data',
+    'var': 'var',
+    'local': 'var',
+    'output': 'output',
+    'module': 'module',
+    'root': DEFAULT_KIND,
+    'meta': DEFAULT_KIND,
+}
+
+QUOTED_ID = r'"((?:[^"\\]|\\.)*)"'
+EDGE_PATTERN = re.compile(r'^\s*' + QUOTED_ID + r'\s*->\s*' + QUOTED_ID)
+NODE_PATTERN = re.compile(r'^\s*' + QUOTED_ID + r'\s*(?:\[|;|$)')
+ADDRESS_SUFFIX = re.compile(r'\s+\((?:expand|close)\)$')
+
+
+def node_address(name):
+    """Strip terraform graph decorations: '[root] x.y (expand)' -> 'x.y'"""
+    if name.startswith('[root] '):
+        name = name[7:]
+    return ADDRESS_SUFFIX.sub('', name)
+
+
+def classify(name):
+    """Kind of a terraform graph node (provider, data, resource, module, var, output, other)"""
+    address = node_address(name)
+    if address.startswith('provider'):
+        return 'provider'
+
+    parts = address.split('.')
+    # Walk past module.<name> prefixes to the object the node refers to
+    while len(parts) > 2 and parts[0] == 'module':
+        parts = parts[2:]
+    if len(parts) <= 2 and parts[0] == 'module':
+        return 'module'
+    if len(parts) < 2:
+        return KIND_BY_PREFIX.get(parts[0], DEFAULT_KIND)
+    return KIND_BY_PREFIX.get(parts[0].split('[')[0], 'resource')
+
+
+def parse_dot(lines):
+    """Yield ('edge', src, dst, line), ('node', name, None, line) or ('other', None, None, line)
+
+    Only the body of the outermost digraph is yielded; its opening and closing
+    lines are dropped so callers can wrap the body in their own graph.
+    """
+    depth = 0
+    for line in lines:
+        line = line.rstrip('\n')
+        stripped = line.strip()
+
+        if depth == 0:
+            if stripped.startswith(('digraph', 'strict digraph')) and stripped.endswith('{'):
+                depth = 1
+            continue
+        if stripped == '}' and depth == 1:
+            depth = 0
+            continue
+
+        depth += stripped.count('{') - stripped.count('}')
+
+        match = EDGE_PATTERN.match(line)
+        if match:
+            yield 'edge', match.group(1), match.group(2), line
+            continue
+        match = NODE_PATTERN.match(line)
+        if match:
+            yield 'node', match.group(1), None, line
+            continue
+        yield 'other', None, None, line
+
+
+def read_graph(lines):
+    """Collect nodes (name -> kind) and edges from DOT text"""
+    nodes = {}
+    edges = []
+    for statement, src, dst, _ in parse_dot(lines):
+        if statement == 'edge':
+            for name in (src, dst):
+                if name not in nodes:
+                    nodes[name] = classify(name)
+            edges.append((src, dst))
+        elif statement == 'node' and src not in nodes:
+            nodes[src] = classify(src)
+    return nodes, edges
+
+
+def style_graph(lines, out):
+    """Write the styled graph to out, returning (node_count, edge_count)"""
+    styled = set()
+    edge_count = 0
+
+    def fill(name):
+        styled.add(name)
+        return KIND_COLORS.get(classify(name), DEFAULT_COLOR)
+
+    def declare(name):
+        out.write(f'    "{name}" [fillcolor="{fill(name)}"];\n')
+
+    out.write(GRAPH_HEADER)
+    for statement, src, dst, line in parse_dot(lines):
+        if statement == 'edge':
+            if src not in styled:
+                declare(src)
+            if dst not in styled:
+                declare(dst)
+            out.write(f'    "{src}" -> "{dst}";\n')
+            edge_count += 1
+        elif statement == 'node':
+            line = line.strip()
+            if src not in styled:
+                bracket = line.find('[', len(src) + 2)
+                if bracket == -1:
+                    declare(src)
+                else:
+                    # Fold the color into the node's own attribute list
+                    line = f'{line[:bracket + 1]}fillcolor="{fill(src)}", {line[bracket + 1:]}'
+            out.write(f'    {line}\n')
+        elif line.strip():
+            out.write(f'    {line.strip()}\n')
+    out.write('}\n')
+
+    return len(styled), edge_count
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python3 dot_styler.py <input.dot|-> <output.dot|->")
+        sys.exit(1)
+
+    source = sys.stdin if sys.argv[1] == '-' else open(sys.argv[1], 'r', encoding='utf-8')
+    target = sys.stdout if sys.argv[2] == '-' else open(sys.argv[2], 'w', encoding='utf-8', buffering=1 << 20)
+    try:
+        node_count, edge_count = style_graph(source, target)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    print(f"Styled {node_count} nodes and {edge_count} edges", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Incremental file-hash index for the infrastructure tree
+Tracks path, mtime, size, content hash and parsed kind so listings, change detection
+and cache keys only cost work for files that actually changed. Directory listings, glob
+matches and digests are kept in derived maps that each refresh updates for the changed
+paths only, so a query does not walk the whole tree.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+
+from render_cache import default_cache_dir, hash_file
+
+# inotify is optional; without it refresh() falls back to an mtime/size scan
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+INDEX_VERSION = 1
+
+DEFAULT_EXCLUDES = frozenset({
+    '.git', '.terraform', '.mypy_cache', '.pytest_cache', '__pycache__', 'node_modules', '.venv', 'venv'
+})
+
+YAML_KIND_PATTERN = re.compile(rb'^kind:\s*["\']?([A-Za-z0-9]+)', re.MULTILINE)
+TF_BLOCK_PATTERN = re.compile(
+    rb'^(resource|data|module|variable|output|locals|provider|terraform)\b', re.MULTILINE
+)
+PARSED_SUFFIXES = ('.yaml', '.yml', '.tf')
+
+
+def parse_kinds(rel_path, content):
+    """Kubernetes kinds of a YAML file, or top-level block types of a Terraform file"""
+    if rel_path.endswith(('.yaml', '.yml')):
+        kinds = [m.decode('ascii') for m in YAML_KIND_PATTERN.findall(content)]
+        return list(dict.fromkeys(kinds))
+    if rel_path.endswith('.tf'):
+        return sorted({m.decode('ascii') for m in TF_BLOCK_PATTERN.findall(content)})
+    return []
+
+
+def compile_glob(pattern):
+    """Translate a glob with ** support into a regex over '/'-separated relative paths"""
+    regex = ''
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex += '(?:.*/)?'
+            i += 3
+        elif pattern.startswith('**', i):
+            regex += '.*'
+            i += 2
+        elif pattern[i] == '*':
+            regex += '[^/]*'
+            i += 1
+        elif pattern[i] == '?':
+            regex += '[^/]'
+            i += 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return re.compile(regex + r'\Z')
+
+
+class InotifyWatcher:
+    """Collects directories touched since the last drain via Linux inotify"""
+
+    MASK = 0
+
+    def __init__(self):
+        self.inotify = INotify()
+        self.watches = {}
+        if not InotifyWatcher.MASK:
+            InotifyWatcher.MASK = (
+                inotify_flags.CREATE | inotify_flags.DELETE | inotify_flags.MODIFY
+                | inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_FROM | inotify_flags.MOVED_TO
+                | inotify_flags.ATTRIB | inotify_flags.DELETE_SELF
+            )
+
+    def watch(self, path, rel_dir):
+        try:
+            wd = self.inotify.add_watch(str(path), InotifyWatcher.MASK)
+        except OSError:
+            return
+        self.watches[wd] = rel_dir
+
+    def drain(self):
+        """Return the set of dirty directories, or None if events were lost"""
+        dirty = set()
+        for event in self.inotify.read(timeout=0):
+            if event.mask & inotify_flags.Q_OVERFLOW:
+                return None
+            rel_dir = self.watches.get(event.wd)
+            if rel_dir is None:
+                continue
+            if event.mask & inotify_flags.IGNORED:
+                del self.watches[event.wd]
+            dirty.add(rel_dir)
+        return dirty
+
+    def close(self):
+        self.inotify.close()
+
+
+class FileIndex:
+    def __init__(self, root, cache_dir=None, excludes=DEFAULT_EXCLUDES, watch=False):
+        self.root = Path(root).resolve()
+        self.excludes = excludes
+        root_id = hashlib.sha256(str(self.root).encode('utf-8')).hexdigest()[:16]
+        self.index_file = Path(cache_dir or default_cache_dir()) / 'index' / f'{root_id}.json'
+        self.files = {}
+        self.dirs = set()
+        # Directory -> {child name: is_dir}
+        self._children = {}
+        # Glob pattern -> (regex, matching paths), kept current once a pattern was queried
+        self._matches = {}
+        # Tuple of patterns -> (regexes, digest), dropped when a matching path changes
+        self._digests = {}
+        self._lock = threading.Lock()
+        self._scanned = False
+        self._dirty = False
+        self._watcher = InotifyWatcher() if watch and INotify is not None else None
+        self._load()
+
+    def refresh(self):
+        """Bring the index up to date and return the relative paths that changed
+
+        With inotify only dirty directories are rescanned; otherwise every file is
+        stat()ed but only files whose mtime or size moved are re-hashed.
+        """
+        with self._lock:
+            dirty = None
+            if self._watcher is not None and self._scanned:
+                dirty = self._watcher.drain()
+
+            changed = []
+            if dirty is None:
+                seen_dirs = set()
+                seen_files = set()
+                self._scan('', changed, seen_dirs, seen_files)
+                for rel_path in [p for p in self.files if p not in seen_files]:
+                    self._remove_file(rel_path)
+                    changed.append(rel_path)
+                for rel_dir in sorted(self.dirs - seen_dirs):
+                    self._remove_tree(rel_dir, changed)
+            else:
+                for rel_dir in sorted(dirty):
+                    self._rescan_dir(rel_dir, changed)
+
+            self._scanned = True
+            if changed or self._dirty:
+                self._save()
+                self._dirty = False
+            return changed
+
+    # Readers take the lock too: refresh() may run in an executor thread while the
+    # event loop reads, and every result is a snapshot built under the lock
+
+    def entry(self, rel_path):
+        """Index record for a file, or None"""
+        with self._lock:
+            return self.files.get(rel_path)
+
+    def listdir(self, rel_dir):
+        """Immediate children of a directory as sorted (name, is_dir) pairs"""
+        with self._lock:
+            return sorted(self._children.get(rel_dir.strip('/'), {}).items())
+
+    def is_dir(self, rel_dir):
+        with self._lock:
+            return rel_dir.strip('/') in self.dirs
+
+    def files_under(self, rel_dir):
+        """(relative path, record) pairs for every file below a directory"""
+        files = []
+        pending = [rel_dir.strip('/')]
+        with self._lock:
+            while pending:
+                current = pending.pop()
+                for name, is_dir in self._children.get(current, {}).items():
+                    child = f'{current}/{name}' if current else name
+                    if is_dir:
+                        pending.append(child)
+                    else:
+                        files.append((child, self.files[child]))
+        return files
+
+    def match(self, patterns):
+        """Relative paths matching any of the glob patterns"""
+        with self._lock:
+            return self._match(patterns)
+
+    def entries(self, patterns):
+        """(relative path, record) pairs for the files matching the patterns, from one index state"""
+        with self._lock:
+            return [(rel_path, self.files[rel_path]) for rel_path in self._match(patterns)]
+
+    def digest(self, patterns):
+        """Combined content hash of every file matching the patterns"""
+        key = tuple(patterns)
+        with self._lock:
+            cached = self._digests.get(key)
+            if cached is not None:
+                return cached[1]
+
+            digest = hashlib.sha256()
+            for rel_path in self._match(patterns):
+                digest.update(rel_path.encode('utf-8'))
+                digest.update(b'\0')
+                digest.update(self.files[rel_path]['sha256'].encode('ascii'))
+                digest.update(b'\n')
+            self._digests[key] = ([self._matches[pattern][0] for pattern in patterns], digest.hexdigest())
+            return self._digests[key][1]
+
+    def close(self):
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def _match(self, patterns):
+        matched = set()
+        for pattern in patterns:
+            if pattern not in self._matches:
+                regex = compile_glob(pattern)
+                self._matches[pattern] = (regex, {p for p in self.files if regex.match(p)})
+            matched |= self._matches[pattern][1]
+        return sorted(matched)
+
+    def _scan(self, rel_dir, changed, seen_dirs, seen_files):
+        path = self.root / rel_dir if rel_dir else self.root
+        seen_dirs.add(rel_dir)
+        if rel_dir not in self.dirs:
+            self._add_dir(rel_dir)
+        if self._watcher is not None:
+            self._watcher.watch(path, rel_dir)
+
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            return
+
+        for item in entries:
+            if item.name in self.excludes:
+                continue
+            rel_path = f'{rel_dir}/{item.name}' if rel_dir else item.name
+            try:
+                if item.is_dir(follow_symlinks=False):
+                    self._scan(rel_path, changed, seen_dirs, seen_files)
+                elif item.is_file():
+                    seen_files.add(rel_path)
+                    if self._update_file(rel_path, item.stat()):
+                        changed.append(rel_path)
+            except OSError:
+                continue
+
+    def _rescan_dir(self, rel_dir, changed):
+        """Re-sync one directory reported dirty by the watcher"""
+        path = self.root / rel_dir if rel_dir else self.root
+        prefix = f'{rel_dir}/' if rel_dir else ''
+
+        if not path.is_dir():
+            # Directory was removed: drop it and everything below
+            self._remove_tree(rel_dir, changed)
+            return
+
+        present = {}
+        for item in os.scandir(path):
+            if item.name in self.excludes:
+                continue
+            try:
+                present[item.name] = (item.is_dir(follow_symlinks=False), item)
+            except OSError:
+                continue
+
+        # Drop what disappeared (or changed between file and directory) before adding anything
+        for name, is_dir in list(self._children.get(rel_dir, {}).items()):
+            if name in present and present[name][0] == is_dir:
+                continue
+            if is_dir:
+                self._remove_tree(f'{prefix}{name}', changed)
+            else:
+                self._remove_file(f'{prefix}{name}')
+                changed.append(f'{prefix}{name}')
+
+        for name, (is_dir, item) in present.items():
+            rel_path = f'{prefix}{name}'
+            try:
+                if is_dir:
+                    if rel_path not in self.dirs:
+                        # New subtree: index it fully
+                        self._scan(rel_path, changed, set(), set())
+                elif item.is_file():
+                    if self._update_file(rel_path, item.stat()):
+                        changed.append(rel_path)
+            except OSError:
+                continue
+
+    def _add_dir(self, rel_dir):
+        self.dirs.add(rel_dir)
+        self._children.setdefault(rel_dir, {})
+        if rel_dir:
+            parent, _, name = rel_dir.rpartition('/')
+            self._children.setdefault(parent, {})[name] = True
+
+    def _remove_tree(self, rel_dir, changed):
+        """Drop a directory and everything indexed below it"""
+        for name, is_dir in list(self._children.get(rel_dir, {}).items()):
+            child = f'{rel_dir}/{name}' if rel_dir else name
+            if is_dir:
+                self._remove_tree(child, changed)
+            else:
+                self._remove_file(child)
+                changed.append(child)
+        self._children.pop(rel_dir, None)
+        self.dirs.discard(rel_dir)
+        if rel_dir:
+            parent, _, name = rel_dir.rpartition('/')
+            self._children.get(parent, {}).pop(name, None)
+
+    def _remove_file(self, rel_path):
+        del self.files[rel_path]
+        parent, _, name = rel_path.rpartition('/')
+        self._children.get(parent, {}).pop(name, None)
+        for _, paths in self._matches.values():
+            paths.discard(rel_path)
+        self._invalidate(rel_path)
+
+    def _add_file(self, rel_path):
+        parent, _, name = rel_path.rpartition('/')
+        self._children.setdefault(parent, {})[name] = False
+        for regex, paths in self._matches.values():
+            if regex.match(rel_path):
+                paths.add(rel_path)
+
+    def _invalidate(self, rel_path):
+        """Forget cached digests that cover a changed path"""
+        for key, (regexes, _) in list(self._digests.items()):
+            if any(regex.match(rel_path) for regex in regexes):
+                del self._digests[key]
+
+    def _update_file(self, rel_path, stat):
+        current = self.files.get(rel_path)
+        if current is not None and current['mtime_ns'] == stat.st_mtime_ns and current['size'] == stat.st_size:
+            return False
+
+        full_path = self.root / rel_path
+        if rel_path.endswith(PARSED_SUFFIXES):
+            with open(full_path, 'rb') as f:
+                content = f.read()
+            sha256 = hashlib.sha256(content).hexdigest()
+            kinds = parse_kinds(rel_path, content)
+        else:
+            sha256 = hash_file(full_path)
+            kinds = []
+
+        self.files[rel_path] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+            "kinds": kinds
+        }
+        self._dirty = True
+        if current is None:
+            self._add_file(rel_path)
+        # A touch without a content change is not a change for cache keys
+        if current is None or current['sha256'] != sha256:
+            self._invalidate(rel_path)
+            return True
+        return False
+
+    def _load(self):
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != INDEX_VERSION or data.get('root') != str(self.root):
+            return
+        self.files = data.get('files', {})
+        self.dirs = set()
+        for rel_dir in data.get('dirs', []):
+            self._add_dir(rel_dir)
+        for rel_path in self.files:
+            self._add_file(rel_path)
+
+    def _save(self):
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "root": str(self.root),
+                "files": self.files,
+                "dirs": sorted(self.dirs)
+            }, f)
+        os.replace(tmp_file, self.index_file)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 file_index.py <root_dir> [glob ...]")
+        sys.exit(1)
+
+    index = FileIndex(sys.argv[1])
+    changed = index.refresh()
+    print(f"Indexed {len(index.files)} files ({len(changed)} changed since last run)")
+    for rel_path in changed[:50]:
+        print(f"  ~ {rel_path}")
+
+    if len(sys.argv) > 2:
+        patterns = sys.argv[2:]
+        print(f"{len(index.match(patterns))} files match, digest {index.digest(patterns)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Structural diff of Terraform dependency graphs
+Compares two environments, or one environment at two git revisions, by node address and
+block content hash, and renders only the changed part of the graph with its neighbours
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+from dot_styler import GRAPH_HEADER
+from file_index import FileIndex
+from graph_store import GraphStore
+
+DIFF_COLORS = {
+    'added': 'palegreen',
+    'removed': 'lightcoral',
+    'changed': 'gold',
+    'context': 'gray95',
+}
+EDGE_STYLES = {
+    'added': 'color="forestgreen", penwidth=2',
+    'removed': 'color="firebrick", style="dashed", penwidth=2',
+    'context': 'color="gray70"',
+}
+
+
+def parse_side(spec):
+    """'prod' or 'prod@<git revision>' -> (environment, revision or None)"""
+    environment, _, revision = spec.partition('@')
+    return environment, revision or None
+
+
+def resolve_revision(toplevel, revision):
+    """Commit SHA a revision names; anything git would read as an option is rejected"""
+    if not revision or revision.startswith('-'):
+        raise ValueError(f"Invalid revision: {revision!r}")
+    result = subprocess.run(
+        ['git', 'rev-parse', '--verify', '--quiet', '--end-of-options', f'{revision}^{{commit}}'],
+        cwd=toplevel, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise ValueError(f"Unknown revision: {revision}")
+    return result.stdout.strip()
+
+
+def extract_archive(tar, directory):
+    """Extract a tar stream, refusing members that would land outside directory"""
+    if hasattr(tarfile, 'data_filter'):
+        tar.extractall(directory, filter='data')
+        return
+    # Python releases without extraction filters
+    root = Path(directory).resolve()
+    for member in tar:
+        target = (root / member.name).resolve()
+        if not (member.isfile() or member.isdir()) or root not in target.parents:
+            raise tarfile.TarError(f"Refusing to extract {member.name}")
+        tar.extract(member, directory)
+
+
+def load_revision_graph(terraform_dir, environment, revision):
+    """Environment graph as of a git revision
+
+    The Terraform tree at that revision is exported to a scratch directory and
+    composed through a GraphStore, so module subgraphs whose content matches
+    the working tree (or a previous export) come from the subgraph cache.
+    """
+    terraform_dir = Path(terraform_dir).resolve()
+    toplevel = Path(subprocess.run(
+        ['git', 'rev-parse', '--show-toplevel'], cwd=terraform_dir,
+        capture_output=True, text=True, check=True
+    ).stdout.strip())
+    prefix = terraform_dir.relative_to(toplevel).as_posix()
+    commit = resolve_revision(toplevel, revision)
+
+    with tempfile.TemporaryDirectory(prefix='graph-diff-') as scratch:
+        archive = subprocess.Popen(
+            ['git', 'archive', '--format=tar', commit, '--', prefix],
+            cwd=toplevel, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        tar_error = None
+        try:
+            with tarfile.open(fileobj=archive.stdout, mode='r|') as tar:
+                extract_archive(tar, scratch)
+        except tarfile.TarError as e:
+            tar_error = e
+        finally:
+            # Closing the pipe first keeps git from blocking on a stream nobody reads
+            archive.stdout.close()
+        stderr = archive.stderr.read().decode('utf-8', errors='replace')
+        archive.stderr.close()
+        if archive.wait() != 0 or tar_error is not None:
+            raise ValueError(f"Cannot export {prefix} at {revision}: {stderr.strip() or tar_error}")
+
+        export_dir = Path(scratch) / prefix
+        index = FileIndex(export_dir, cache_dir=Path(scratch) / '.index')
+        return GraphStore(export_dir, file_index=index).environment_graph(environment)
+
+
+def diff_graphs(old, new):
+    """Added, removed and changed nodes plus added and removed edges
+
+    Nodes are matched by address and compared by kind and content hash, edges
+    by their endpoint pair; everything is set and dict lookups, so the cost is
+    linear in the size of the two graphs.
+    """
+    old_nodes = old['nodes']
+    new_nodes = new['nodes']
+    old_edges = set(map(tuple, old['edges']))
+    new_edges = set(map(tuple, new['edges']))
+
+    changed = sorted(
+        address for address, info in new_nodes.items()
+        if address in old_nodes and (
+            old_nodes[address].get('kind') != info.get('kind')
+            or old_nodes[address].get('hash') != info.get('hash')
+        )
+    )
+    return {
+        "nodes": {
+            "added": sorted(address for address in new_nodes if address not in old_nodes),
+            "removed": sorted(address for address in old_nodes if address not in new_nodes),
+            "changed": changed
+        },
+        "edges": {
+            "added": sorted(new_edges - old_edges),
+            "removed": sorted(old_edges - new_edges)
+        },
+        "stats": {
+            "old_nodes": len(old_nodes),
+            "new_nodes": len(new_nodes),
+            "old_edges": len(old_edges),
+            "new_edges": len(new_edges)
+        }
+    }
+
+
+def neighbourhood(old, new, diff, depth=1):
+    """Nodes and edges within depth hops of any change, each tagged with its diff status"""
+    status = {}
+    for kind in ('removed', 'added', 'changed'):
+        for address in diff['nodes'][kind]:
+            status[address] = kind
+    edge_status = {edge: 'added' for edge in diff['edges']['added']}
+    edge_status.update({edge: 'removed' for edge in diff['edges']['removed']})
+
+    adjacency = {}
+    for graph in (old, new):
+        for src, dst in graph['edges']:
+            adjacency.setdefault(src, set()).add(dst)
+            adjacency.setdefault(dst, set()).add(src)
+
+    selected = set(status)
+    for src, dst in edge_status:
+        selected.add(src)
+        selected.add(dst)
+    # Providers are linked to every resource they manage; expanding through
+    # them would pull the whole graph into the context
+    frontier = {address for address in selected if not address.startswith('provider.')}
+    for _ in range(depth):
+        frontier = {peer for address in frontier for peer in adjacency.get(address, ())} - selected
+        selected |= frontier
+        frontier = {address for address in frontier if not address.startswith('provider.')}
+
+    nodes = {address: status.get(address, 'context') for address in selected}
+    edges = {}
+    for graph in (old, new):
+        for src, dst in graph['edges']:
+            if src in nodes and dst in nodes:
+                edges[(src, dst)] = edge_status.get((src, dst), 'context')
+    return nodes, edges
+
+
+def write_diff_dot(old, new, diff, out, depth=1):
+    nodes, edges = neighbourhood(old, new, diff, depth)
+    out.write(GRAPH_HEADER)
+    for address in sorted(nodes):
+        status = nodes[address]
+        style = ', style="filled,dashed"' if status == 'removed' else ''
+        out.write(f'    "{address}" [fillcolor="{DIFF_COLORS[status]}"{style}];\n')
+    for (src, dst), status in sorted(edges.items()):
+        out.write(f'    "{src}" -> "{dst}" [{EDGE_STYLES[status]}];\n')
+    out.write('}\n')
+    return len(nodes), len(edges)
+
+
+def format_summary(left, right, diff, limit=50):
+    """Plain-text report of a diff"""
+    lines = [f"Terraform graph diff: {left} -> {right}"]
+    for section, marks in (('nodes', (('added', '+'), ('removed', '-'), ('changed', '~'))),
+                           ('edges', (('added', '+'), ('removed', '-')))):
+        for kind, mark in marks:
+            items = diff[section][kind]
+            lines.append(f"\n{kind.capitalize()} {section} ({len(items)}):")
+            for item in items[:limit]:
+                lines.append(f"  {mark} {item if section == 'nodes' else ' -> '.join(item)}")
+            if len(items) > limit:
+                lines.append(f"  ... {len(items) - limit} more")
+    return '\n'.join(lines)
+
+
+class GraphDiffer:
+    """Loads both sides of a diff through a shared GraphStore"""
+
+    def __init__(self, terraform_dir, store=None):
+        self.terraform_dir = Path(terraform_dir).resolve()
+        self.store = store or GraphStore(self.terraform_dir)
+
+    def load(self, environment, revision=None):
+        if revision is None:
+            return self.store.environment_graph(environment)
+        return load_revision_graph(self.terraform_dir, environment, revision)
+
+    def diff(self, left, right):
+        """(old graph, new graph, diff) for two 'env' or 'env@revision' specs"""
+        old = self.load(*parse_side(left))
+        new = self.load(*parse_side(right))
+        return old, new, diff_graphs(old, new)
+
+
+def main():
+    script_dir = Path(__file__).resolve().parent
+    parser = argparse.ArgumentParser(description="Diff Terraform dependency graphs between environments or revisions")
+    parser.add_argument("left", help="Old side: ENV or ENV@REVISION (e.g. staging, prod@HEAD~3)")
+    parser.add_argument("right", help="New side: ENV or ENV@REVISION")
+    parser.add_argument("--terraform-dir", default=str(script_dir.parent.parent / 'terraform'),
+                        help="Terraform root containing environments/ and modules/")
+    parser.add_argument("--format", choices=("text", "json", "dot"), default="text", help="Output format")
+    parser.add_argument("--context", type=int, default=1, help="Neighbour hops around changes in DOT output")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    started = time.time()
+    try:
+        old, new, diff = GraphDiffer(args.terraform_dir).diff(args.left, args.right)
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        print(f"Graph diff failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        if args.format == 'json':
+            json.dump(dict(diff, left=args.left, right=args.right), out, indent=2)
+            out.write('\n')
+        elif args.format == 'dot':
+            write_diff_dot(old, new, diff, out, args.context)
+        else:
+            out.write(format_summary(args.left, args.right, diff) + '\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Diffed {diff['stats']['old_nodes']} -> {diff['stats']['new_nodes']} nodes "
+          f"in {time.time() - started:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
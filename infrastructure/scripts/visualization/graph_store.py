@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Module-level Terraform graph store
+Caches each module directory's parsed subgraph by the content hash of its .tf files and
+composes environment graphs from those subgraphs, so an edit re-parses only the module it touches
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from file_index import FileIndex
+from hcl_graph import compose, parse_module, to_json, write_dot
+from render_cache import default_cache_dir, hash_file
+
+ENVIRONMENTS = ('local', 'dev', 'staging', 'prod', 'monitoring')
+# Parser changes invalidate every cached subgraph
+PARSER_DIGEST = hash_file(Path(__file__).resolve().parent / 'hcl_graph.py')[:16]
+
+
+class GraphStore:
+    def __init__(self, terraform_dir, file_index=None, cache_dir=None):
+        self.terraform_dir = Path(terraform_dir).resolve()
+        self.file_index = file_index or FileIndex(self.terraform_dir, cache_dir)
+        self.graphs_dir = Path(cache_dir or default_cache_dir()) / 'graphs'
+        self.graphs_dir.mkdir(parents=True, exist_ok=True)
+        self.dir_hashes = {}
+        self.subgraphs = {}  # content hash -> parse_module() result
+        self.environments = {}  # environment -> (module hashes, composed graph)
+        self.stats = {"parsed": 0, "memory_hits": 0, "disk_hits": 0, "composed": 0, "reused": 0}
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Re-sync the file index and recompute per-directory .tf hashes; returns changed directories"""
+        self.file_index.refresh()
+        grouped = {}
+        for rel_path, entry in self.file_index.entries(['**/*.tf']):
+            rel_dir, _, name = rel_path.rpartition('/')
+            grouped.setdefault(rel_dir, []).append((name, entry['sha256']))
+
+        hashes = {}
+        for rel_dir, files in grouped.items():
+            digest = hashlib.sha256(PARSER_DIGEST.encode('ascii'))
+            for name, sha256 in sorted(files):
+                digest.update(f'{name}\0{sha256}\n'.encode('utf-8'))
+            hashes[rel_dir] = digest.hexdigest()
+
+        changed = sorted(
+            rel_dir for rel_dir in set(hashes) | set(self.dir_hashes)
+            if hashes.get(rel_dir) != self.dir_hashes.get(rel_dir)
+        )
+        self.dir_hashes = hashes
+        return changed
+
+    def module_hash(self, module_dir):
+        """Content hash of one module directory, or None when it lies outside the index"""
+        try:
+            rel_dir = Path(module_dir).resolve().relative_to(self.file_index.root).as_posix()
+        except ValueError:
+            return None
+        return self.dir_hashes.get('' if rel_dir == '.' else rel_dir)
+
+    def load_module(self, module_dir):
+        """parse_module() through the in-memory and on-disk subgraph caches"""
+        content_hash = self.module_hash(module_dir)
+        if content_hash is None:
+            self.stats['parsed'] += 1
+            return parse_module(module_dir)
+
+        subgraph = self.subgraphs.get(content_hash)
+        if subgraph is not None:
+            self.stats['memory_hits'] += 1
+            return subgraph
+
+        cache_file = self.graphs_dir / f'{content_hash}.json'
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                subgraph = json.load(f)
+            self.stats['disk_hits'] += 1
+        except (OSError, ValueError):
+            subgraph = parse_module(module_dir)
+            self.stats['parsed'] += 1
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(subgraph, f, separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+
+        self.subgraphs[content_hash] = subgraph
+        return subgraph
+
+    def environment_graph(self, environment, refresh=True):
+        """Composed graph of one environment
+
+        The composition is reused as long as every module directory it
+        instantiated still has the same content hash.
+        """
+        with self._lock:
+            if refresh:
+                self.refresh()
+            env_dir = self.terraform_dir / 'environments' / environment
+            if not env_dir.is_dir():
+                raise FileNotFoundError(f"Environment '{environment}' not found in {env_dir}")
+
+            cached = self.environments.get(environment)
+            if cached is not None and all(
+                self.dir_hashes.get(rel_dir) == content_hash for rel_dir, content_hash in cached[0].items()
+            ):
+                self.stats['reused'] += 1
+                return cached[1]
+
+            graph = compose(env_dir, load_module=self.load_module, base_dir=self.terraform_dir)
+            module_hashes = {}
+            for rel_dir in set(graph['modules'].values()):
+                index_dir = (self.terraform_dir / rel_dir).resolve()
+                try:
+                    key = index_dir.relative_to(self.file_index.root).as_posix()
+                except ValueError:
+                    continue
+                key = '' if key == '.' else key
+                module_hashes[key] = self.dir_hashes.get(key)
+            self.environments[environment] = (module_hashes, graph)
+            self.stats['composed'] += 1
+            return graph
+
+    def environment_graphs(self, environments=ENVIRONMENTS):
+        """Composed graphs of several environments from a single index refresh"""
+        with self._lock:
+            self.refresh()
+        return {
+            environment: self.environment_graph(environment, refresh=False)
+            for environment in environments
+        }
+
+    def affected_environments(self, changed_dirs):
+        """Environments whose last composed graph used any of the changed directories"""
+        changed = set(changed_dirs)
+        return sorted(
+            environment for environment, (module_hashes, _) in self.environments.items()
+            if changed & set(module_hashes)
+        )
+
+    def prune(self):
+        """Delete on-disk subgraphs that no indexed module directory hashes to any more"""
+        live = set(self.dir_hashes.values())
+        removed = 0
+        for cache_file in self.graphs_dir.glob('*.json'):
+            if cache_file.stem not in live:
+                cache_file.unlink()
+                removed += 1
+        return removed
+
+
+def main():
+    script_dir = Path(__file__).resolve().parent
+    parser = argparse.ArgumentParser(description="Compose Terraform environment graphs from cached module subgraphs")
+    parser.add_argument("environments", nargs="*", default=list(ENVIRONMENTS), help="Environments to compose")
+    parser.add_argument("--terraform-dir", default=str(script_dir.parent.parent / 'terraform'),
+                        help="Terraform root containing environments/ and modules/")
+    parser.add_argument("--format", choices=("dot", "json"), default="dot", help="Output format")
+    parser.add_argument("-o", "--output", help="Output file (single environment only; default: stdout)")
+    parser.add_argument("--output-dir", help="Write <environment>.<format> for every environment")
+    parser.add_argument("--prune", action="store_true", help="Remove cached subgraphs of stale module content")
+    args = parser.parse_args()
+
+    if len(args.environments) > 1 and not args.output_dir:
+        parser.error("use --output-dir when composing more than one environment")
+
+    started = time.time()
+    store = GraphStore(args.terraform_dir)
+    try:
+        graphs = store.environment_graphs(args.environments)
+    except FileNotFoundError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+    for environment, graph in graphs.items():
+        if args.output_dir:
+            Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+            path = Path(args.output_dir) / f'{environment}.{args.format}'
+        else:
+            path = args.output
+        out = open(path, 'w', encoding='utf-8', buffering=1 << 20) if path else sys.stdout
+        try:
+            if args.format == 'json':
+                json.dump(to_json(graph), out, indent=2)
+                out.write('\n')
+            else:
+                write_dot(graph, out)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+    if args.prune:
+        store.prune()
+
+    stats = store.stats
+    print(f"Composed {len(graphs)} environment(s) in {time.time() - started:.2f}s: "
+          f"{stats['parsed']} module(s) parsed, {stats['memory_hits'] + stats['disk_hits']} reused from cache",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+Virtualized HTML viewer for large dependency graphs
+Lays the graph out as nested module blocks, ships it as compact JSON and draws it on a canvas,
+touching only what is inside the viewport; module clusters collapse and a token index backs search
+"""
+
+import argparse
+import html
+import json
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from dot_styler import classify, node_address, read_graph
+
+NODE_WIDTH = 220
+NODE_HEIGHT = 30
+GAP_X = 20
+GAP_Y = 30
+PADDING = 20
+HEADER = 26
+ROW_LIMIT = 8  # nodes per row inside one module block
+TOKEN_SPLIT = re.compile(r'[.\-_\[\]"/ ]+')
+SEGMENT_SPLIT = re.compile(r'[.\[\]"/ ]+')
+
+
+def module_of(address):
+    """Module instance an address belongs to ('' for the root module)
+
+    A module call node (module.a.module.b) belongs to its parent (module.a).
+    """
+    parts = address.split('.')
+    prefix = []
+    while len(parts) > 2 and parts[0] == 'module':
+        prefix += parts[:2]
+        parts = parts[2:]
+    return '.'.join(prefix)
+
+
+def parent_module(name):
+    return name.rsplit('.module.', 1)[0] if '.module.' in name else ''
+
+
+def load_graph(path):
+    """(nodes {address: kind}, edges [(src, dst)]) from DOT or hcl_graph JSON"""
+    if str(path).endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        nodes = {node['id']: classify(node['id']) for node in data['nodes']}
+        return nodes, [tuple(edge) for edge in data['edges']]
+
+    source = sys.stdin if str(path) == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        raw_nodes, raw_edges = read_graph(source)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    # terraform graph emits "[root] x (expand)" and "[root] x (close)" for one address
+    addresses = {name: node_address(name) for name in raw_nodes}
+    nodes = {}
+    for name, kind in raw_nodes.items():
+        nodes.setdefault(addresses[name], kind)
+    edges = {
+        (addresses[src], addresses[dst]) for src, dst in raw_edges
+        if addresses[src] != addresses[dst]
+    }
+    return nodes, sorted(edges)
+
+
+def assign_layers(count, edges):
+    """Longest-path layer of each node, dependents above their dependencies; cycles are cut"""
+    outgoing = [[] for _ in range(count)]
+    indegree = [0] * count
+    for src, dst in edges:
+        outgoing[src].append(dst)
+        indegree[dst] += 1
+
+    layers = [0] * count
+    queue = [i for i in range(count) if indegree[i] == 0]
+    visited = 0
+    cursor = 0
+    while True:
+        while queue:
+            node = queue.pop()
+            visited += 1
+            for dst in outgoing[node]:
+                layers[dst] = max(layers[dst], layers[node] + 1)
+                indegree[dst] -= 1
+                if indegree[dst] == 0:
+                    queue.append(dst)
+        if visited == count:
+            return layers
+        # Break a cycle at the first node still waiting on a predecessor
+        while indegree[cursor] <= 0:
+            cursor += 1
+        indegree[cursor] = 0
+        queue.append(cursor)
+
+
+def layout(nodes, edges):
+    """Positions for every node and a box for every module instance
+
+    Each module block holds its own nodes in rows ordered by layer, with
+    child module blocks shelf-packed beneath them; the whole layout is linear
+    in the number of nodes and edges.
+    """
+    addresses = sorted(nodes)
+    ids = {address: i for i, address in enumerate(addresses)}
+    edge_ids = [(ids[src], ids[dst]) for src, dst in edges if src in ids and dst in ids]
+    layers = assign_layers(len(addresses), edge_ids)
+
+    modules = {'': []}
+    for address in addresses:
+        module = module_of(address)
+        while module not in modules:
+            modules[module] = []
+            module = parent_module(module)
+        modules[module_of(address)].append(ids[address])
+    children = {name: [] for name in modules}
+    for name in modules:
+        if name:
+            children[parent_module(name)].append(name)
+
+    sizes = {}
+
+    def measure(name):
+        own = sorted(modules[name], key=lambda i: (layers[i], addresses[i]))
+        columns = min(ROW_LIMIT, len(own)) if own else 0
+        rows = -(-len(own) // ROW_LIMIT) if own else 0
+        own_width = columns * (NODE_WIDTH + GAP_X) - GAP_X if columns else 0
+        own_height = rows * (NODE_HEIGHT + GAP_Y) - GAP_Y if rows else 0
+
+        blocks = [(child, measure(child)) for child in sorted(children[name])]
+        area = sum(w * h for _, (w, h, _, _) in blocks)
+        target = max(own_width, int((area ** 0.5) * 1.5), NODE_WIDTH)
+        placements = []
+        x = y = shelf = width = 0
+        for child, (w, h, _, _) in blocks:
+            if x and x + w > target:
+                x, y = 0, y + shelf + GAP_Y
+                shelf = 0
+            placements.append((child, x, y))
+            x += w + GAP_X
+            shelf = max(shelf, h)
+            width = max(width, x - GAP_X)
+        blocks_height = y + shelf if blocks else 0
+
+        inner_width = max(own_width, width, NODE_WIDTH)
+        inner_height = own_height + (GAP_Y if own and blocks else 0) + blocks_height
+        sizes[name] = (inner_width + 2 * PADDING, inner_height + 2 * PADDING + HEADER, own, placements)
+        return sizes[name]
+
+    measure('')
+    positions = [None] * len(addresses)
+    boxes = {}
+
+    def place(name, left, top):
+        width, height, own, placements = sizes[name]
+        boxes[name] = (left, top, width, height)
+        inner_left = left + PADDING
+        inner_top = top + PADDING + HEADER
+        for i, node in enumerate(own):
+            row, column = divmod(i, ROW_LIMIT)
+            positions[node] = (inner_left + column * (NODE_WIDTH + GAP_X), inner_top + row * (NODE_HEIGHT + GAP_Y))
+        own_rows = -(-len(own) // ROW_LIMIT) if own else 0
+        blocks_top = inner_top + (own_rows * (NODE_HEIGHT + GAP_Y) if own else 0)
+        for child, x, y in placements:
+            place(child, inner_left + x, blocks_top + y)
+
+    place('', 0, 0)
+    return addresses, positions, edge_ids, boxes
+
+
+def build_token_index(addresses):
+    """Sorted (token, node ids) pairs over every address, its dotted segments and their words
+
+    The viewer finds all tokens starting with the query by binary search, so
+    'aws_s3', 's3' and 'module.data_platform' all hit without scanning nodes.
+    """
+    index = {}
+    for i, address in enumerate(addresses):
+        lowered = address.lower()
+        tokens = set(TOKEN_SPLIT.split(lowered)) | set(SEGMENT_SPLIT.split(lowered)) | {lowered}
+        tokens.discard('')
+        for token in tokens:
+            index.setdefault(token, []).append(i)
+    return [[token, sorted(set(ids))] for token, ids in sorted(index.items())]
+
+
+def compact_graph(nodes, edges):
+    """Compact JSON payload: modules, kinds and nodes as arrays, edges as one flat int list"""
+    addresses, positions, edge_ids, boxes = layout(nodes, edges)
+
+    module_names = sorted(boxes, key=lambda name: (name.count('.module.') + (1 if name else 0), name))
+    module_ids = {name: i for i, name in enumerate(module_names)}
+    kinds = sorted({nodes[address] for address in addresses})
+    kind_ids = {kind: i for i, kind in enumerate(kinds)}
+
+    module_rows = []
+    for name in module_names:
+        parent = module_ids[parent_module(name)] if name else -1
+        module_rows.append([name, parent, *boxes[name]])
+
+    node_rows = []
+    for i, address in enumerate(addresses):
+        module = module_of(address)
+        label = address[len(module) + 1:] if module else address
+        node_rows.append([label, kind_ids[nodes[address]], module_ids[module], *positions[i]])
+
+    return {
+        "m": module_rows,
+        "k": kinds,
+        "n": node_rows,
+        "e": [endpoint for edge in edge_ids for endpoint in edge],
+        "t": build_token_index(addresses)
+    }
+
+
+def render_html(payload, title, subtitle):
+    data = json.dumps(payload, separators=(',', ':')).replace('</', '<\\/')
+    return (VIEWER_TEMPLATE
+            .replace('__TITLE__', html.escape(title))
+            .replace('__SUBTITLE__', html.escape(subtitle))
+            .replace('__DATA__', data))
+
+
+VIEWER_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>__TITLE__</title>
+<style>
+    * { box-sizing: border-box; }
+    body { margin: 0; font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; display: flex; flex-direction: column; height: 100vh; }
+    .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 12px 20px; display: flex; align-items: baseline; gap: 20px; }
+    .header h1 { margin: 0; font-size: 1.5em; font-weight: 300; }
+    .header p { margin: 0; opacity: 0.9; }
+    .main { flex: 1; display: flex; min-height: 0; }
+    .sidebar { width: 320px; border-right: 1px solid #ddd; display: flex; flex-direction: column; background: #fafafa; }
+    .sidebar section { padding: 10px 12px; border-bottom: 1px solid #eee; }
+    .sidebar h3 { margin: 0 0 8px 0; font-size: 0.9em; color: #555; text-transform: uppercase; }
+    #search { width: 100%; padding: 6px 8px; border: 1px solid #ccc; border-radius: 4px; }
+    #results, #modules { overflow: auto; font-size: 12px; }
+    #results { max-height: 180px; }
+    #modules { flex: 1; }
+    .item { padding: 2px 4px; cursor: pointer; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+    .item:hover { background: #e8eaf6; }
+    .toggle { display: inline-block; width: 14px; color: #667eea; }
+    button { background: #667eea; color: white; border: none; padding: 5px 10px; border-radius: 4px; cursor: pointer; font-size: 12px; }
+    button:hover { background: #5a6fd8; }
+    #details { font-size: 12px; word-break: break-all; min-height: 60px; }
+    .stats { font-size: 12px; color: #666; }
+    .legend span { display: inline-block; padding: 1px 6px; margin: 2px; border-radius: 3px; font-size: 11px; }
+    #viewport { flex: 1; position: relative; }
+    canvas { position: absolute; inset: 0; width: 100%; height: 100%; cursor: grab; }
+    canvas:active { cursor: grabbing; }
+</style>
+</head>
+<body>
+<div class="header">
+    <h1>__TITLE__</h1>
+    <p>__SUBTITLE__</p>
+</div>
+<div class="main">
+    <div class="sidebar">
+        <section>
+            <input id="search" type="search" placeholder="Search resources, modules, variables..." autocomplete="off">
+            <div id="results"></div>
+        </section>
+        <section>
+            <button id="fit">📐 Fit</button>
+            <button id="collapseAll">➖ Collapse all</button>
+            <button id="expandAll">➕ Expand all</button>
+            <div class="stats" id="stats"></div>
+            <div class="legend" id="legend"></div>
+        </section>
+        <section><h3>Selection</h3><div id="details">Click a node to inspect it</div></section>
+        <section style="flex: 1; display: flex; flex-direction: column; min-height: 0;">
+            <h3>Modules</h3>
+            <div id="modules"></div>
+        </section>
+    </div>
+    <div id="viewport"><canvas id="canvas"></canvas></div>
+</div>
+<script id="graph-data" type="application/json">__DATA__</script>
+<script>
+(function () {
+    const COLORS = { provider: '#90ee90', data: '#ffffe0', resource: '#f08080', module: '#ffb6c1', var: '#d3d3d3', output: '#b0c4de', other: '#add8e6' };
+    const NODE_W = 220, NODE_H = 30, CELL = 512, LABEL_SCALE = 0.35, MAX_EDGES = 30000;
+    const data = JSON.parse(document.getElementById('graph-data').textContent);
+    const modules = data.m, kinds = data.k, nodes = data.n, flatEdges = data.e, tokens = data.t;
+    const edgeCount = flatEdges.length / 2;
+
+    // Adjacency, per-module membership and a uniform grid over node positions
+    const out = nodes.map(() => []), inc = nodes.map(() => []);
+    for (let i = 0; i < flatEdges.length; i += 2) { out[flatEdges[i]].push(flatEdges[i + 1]); inc[flatEdges[i + 1]].push(flatEdges[i]); }
+    const childModules = modules.map(() => []);
+    modules.forEach((m, i) => { if (m[1] >= 0) childModules[m[1]].push(i); });
+    const subtree = modules.map(() => []);  // every node inside a module, nested modules included
+    nodes.forEach((n, i) => { for (let m = n[2]; m >= 0; m = modules[m][1]) subtree[m].push(i); });
+    const memberCount = subtree.map(list => list.length);
+    const grid = new Map();
+    nodes.forEach((n, i) => {
+        const key = Math.floor(n[3] / CELL) + ',' + Math.floor(n[4] / CELL);
+        if (!grid.has(key)) grid.set(key, []);
+        grid.get(key).push(i);
+    });
+
+    const collapsed = new Uint8Array(modules.length);
+    let hiddenBy = new Int32Array(modules.length).fill(-1);  // outermost collapsed ancestor, or -1
+    function recomputeHidden() {
+        hiddenBy = new Int32Array(modules.length).fill(-1);
+        // Parents are listed before their children
+        modules.forEach((m, i) => {
+            const parent = m[1];
+            if (parent >= 0 && hiddenBy[parent] >= 0) hiddenBy[i] = hiddenBy[parent];
+            else if (collapsed[i]) hiddenBy[i] = i;
+        });
+    }
+    // A visible endpoint: a node id, or -(module + 1) for a collapsed cluster
+    function rep(node) { const h = hiddenBy[nodes[node][2]]; return h >= 0 ? -(h + 1) : node; }
+    function center(id) {
+        if (id >= 0) return [nodes[id][3] + NODE_W / 2, nodes[id][4] + NODE_H / 2];
+        const m = modules[-id - 1];
+        return [m[2] + m[4] / 2, m[3] + m[5] / 2];
+    }
+
+    const canvas = document.getElementById('canvas'), ctx = canvas.getContext('2d');
+    let scale = 1, tx = 0, ty = 0, selected = -1, highlighted = new Set(), pending = false;
+
+    function resize() {
+        const ratio = window.devicePixelRatio || 1, rect = canvas.getBoundingClientRect();
+        canvas.width = rect.width * ratio; canvas.height = rect.height * ratio;
+        ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+        redraw();
+    }
+    function redraw() { if (!pending) { pending = true; requestAnimationFrame(draw); } }
+
+    function draw() {
+        pending = false;
+        const w = canvas.clientWidth, h = canvas.clientHeight;
+        ctx.save();
+        ctx.setTransform(window.devicePixelRatio || 1, 0, 0, window.devicePixelRatio || 1, 0, 0);
+        ctx.clearRect(0, 0, w, h);
+        ctx.translate(tx, ty); ctx.scale(scale, scale);
+        const x0 = -tx / scale, y0 = -ty / scale, x1 = x0 + w / scale, y1 = y0 + h / scale;
+        const inView = (x, y, bw, bh) => x + bw >= x0 && x <= x1 && y + bh >= y0 && y <= y1;
+
+        // Module boxes (collapsed ones drawn as a filled block)
+        const visibleClusters = [];
+        ctx.lineWidth = 1 / scale;
+        modules.forEach((m, i) => {
+            if (i === 0 || !inView(m[2], m[3], m[4], m[5])) return;
+            if (hiddenBy[i] >= 0 && hiddenBy[i] !== i) return;
+            if (collapsed[i]) {
+                visibleClusters.push(i);
+                ctx.fillStyle = 'rgba(255, 182, 193, 0.55)'; ctx.fillRect(m[2], m[3], m[4], m[5]);
+            }
+            ctx.strokeStyle = '#999'; ctx.setLineDash([6 / scale, 4 / scale]); ctx.strokeRect(m[2], m[3], m[4], m[5]); ctx.setLineDash([]);
+            if (scale > LABEL_SCALE / 2) {
+                ctx.fillStyle = '#555'; ctx.font = (collapsed[i] ? 'bold ' : '') + '13px Arial';
+                const label = modules[i][0].split('.').slice(-1)[0] + (collapsed[i] ? ' (' + memberCount[i] + ' nodes)' : '');
+                ctx.fillText(label, m[2] + 8, m[3] + 17);
+            }
+        });
+
+        // Nodes from the grid cells overlapping the viewport
+        const visibleNodes = [];
+        for (let cx = Math.floor((x0 - NODE_W) / CELL); cx <= Math.floor(x1 / CELL); cx++) {
+            for (let cy = Math.floor((y0 - NODE_H) / CELL); cy <= Math.floor(y1 / CELL); cy++) {
+                const cell = grid.get(cx + ',' + cy);
+                if (!cell) continue;
+                for (const i of cell) if (hiddenBy[nodes[i][2]] < 0 && inView(nodes[i][3], nodes[i][4], NODE_W, NODE_H)) visibleNodes.push(i);
+            }
+        }
+
+        // Edges touching anything visible, mapped through collapsed clusters and de-duplicated
+        const drawn = new Set();
+        let budget = MAX_EDGES;
+        ctx.lineWidth = 1 / scale;
+        function edge(a, b, hot) {
+            if (a === b || budget <= 0) return;
+            const key = a + '>' + b;
+            if (drawn.has(key)) return;
+            drawn.add(key); budget--;
+            const p = center(a), q = center(b);
+            ctx.strokeStyle = hot ? '#e65100' : 'rgba(120, 120, 120, 0.35)';
+            ctx.lineWidth = (hot ? 2.5 : 1) / scale;
+            ctx.beginPath(); ctx.moveTo(p[0], p[1]); ctx.lineTo(q[0], q[1]); ctx.stroke();
+        }
+        const hotNode = selected;
+        for (const i of visibleNodes) {
+            for (const j of out[i]) edge(i, rep(j), i === hotNode || j === hotNode);
+            for (const j of inc[i]) edge(rep(j), i, i === hotNode || j === hotNode);
+        }
+        for (const m of visibleClusters) {
+            for (const i of subtree[m]) {
+                for (const j of out[i]) edge(-(m + 1), rep(j), false);
+                for (const j of inc[i]) edge(rep(j), -(m + 1), false);
+            }
+        }
+
+        const labels = scale > LABEL_SCALE;
+        ctx.font = '12px Arial'; ctx.textBaseline = 'middle';
+        for (const i of visibleNodes) {
+            const n = nodes[i];
+            ctx.fillStyle = COLORS[kinds[n[1]]] || COLORS.other;
+            ctx.fillRect(n[3], n[4], NODE_W, NODE_H);
+            if (i === selected || highlighted.has(i)) {
+                ctx.strokeStyle = i === selected ? '#e65100' : '#1a237e'; ctx.lineWidth = 3 / scale;
+                ctx.strokeRect(n[3], n[4], NODE_W, NODE_H);
+            }
+            if (labels) {
+                ctx.fillStyle = '#222';
+                ctx.save(); ctx.beginPath(); ctx.rect(n[3], n[4], NODE_W, NODE_H); ctx.clip();
+                ctx.fillText(n[0], n[3] + 6, n[4] + NODE_H / 2);
+                ctx.restore();
+            }
+        }
+        ctx.restore();
+        document.getElementById('stats').textContent =
+            nodes.length + ' nodes, ' + edgeCount + ' edges, ' + (modules.length - 1) + ' modules | drawing ' +
+            visibleNodes.length + ' nodes, ' + drawn.size + ' edges';
+    }
+
+    function address(i) { const m = modules[nodes[i][2]][0]; return m ? m + '.' + nodes[i][0] : nodes[i][0]; }
+    function fit(x, y, w, h) {
+        const cw = canvas.clientWidth, ch = canvas.clientHeight;
+        scale = Math.min(cw / (w + 40), ch / (h + 40), 2);
+        tx = (cw - w * scale) / 2 - x * scale; ty = (ch - h * scale) / 2 - y * scale;
+        redraw();
+    }
+    function fitAll() { const m = modules[0]; fit(m[2], m[3], m[4], m[5]); }
+    function reveal(i) {
+        for (let m = nodes[i][2]; m >= 0; m = modules[m][1]) collapsed[m] = 0;
+        recomputeHidden(); renderModules();
+    }
+    function select(i) {
+        selected = i;
+        if (i < 0) { document.getElementById('details').textContent = 'Click a node to inspect it'; redraw(); return; }
+        reveal(i);
+        const n = nodes[i];
+        scale = Math.max(scale, 0.8);
+        tx = canvas.clientWidth / 2 - (n[3] + NODE_W / 2) * scale; ty = canvas.clientHeight / 2 - (n[4] + NODE_H / 2) * scale;
+        const details = document.getElementById('details');
+        details.innerHTML = '';
+        const lines = [['Address', address(i)], ['Kind', kinds[n[1]]], ['Module', modules[n[2]][0] || '(root)'],
+                       ['Depends on', out[i].length], ['Used by', inc[i].length]];
+        for (const [k, v] of lines) { const div = document.createElement('div'); div.textContent = k + ': ' + v; details.appendChild(div); }
+        redraw();
+    }
+    function nodeAt(px, py) {
+        const x = (px - tx) / scale, y = (py - ty) / scale;
+        const cell = grid.get(Math.floor(x / CELL) + ',' + Math.floor(y / CELL)) || [];
+        const near = [];
+        for (let cx = -1; cx <= 0; cx++) for (let cy = -1; cy <= 0; cy++) {
+            const c = grid.get((Math.floor(x / CELL) + cx) + ',' + (Math.floor(y / CELL) + cy));
+            if (c) near.push(...c);
+        }
+        for (const i of near.concat(cell)) {
+            const n = nodes[i];
+            if (hiddenBy[n[2]] < 0 && x >= n[3] && x <= n[3] + NODE_W && y >= n[4] && y <= n[4] + NODE_H) return i;
+        }
+        return -1;
+    }
+
+    // Search: binary search the sorted token index for the query prefix
+    function search(query) {
+        query = query.trim().toLowerCase();
+        const results = document.getElementById('results');
+        results.innerHTML = ''; highlighted = new Set();
+        if (!query) { redraw(); return; }
+        let lo = 0, hi = tokens.length;
+        while (lo < hi) { const mid = (lo + hi) >> 1; if (tokens[mid][0] < query) lo = mid + 1; else hi = mid; }
+        const matches = new Set();
+        for (let i = lo; i < tokens.length && tokens[i][0].startsWith(query) && matches.size < 500; i++) {
+            for (const id of tokens[i][1]) matches.add(id);
+        }
+        highlighted = matches;
+        const shown = Array.from(matches).slice(0, 100);
+        for (const id of shown) {
+            const div = document.createElement('div');
+            div.className = 'item'; div.textContent = address(id); div.title = address(id);
+            div.onclick = () => select(id);
+            results.appendChild(div);
+        }
+        if (matches.size > shown.length) {
+            const div = document.createElement('div'); div.className = 'stats';
+            div.textContent = '... ' + (matches.size - shown.length) + ' more';
+            results.appendChild(div);
+        }
+        redraw();
+    }
+
+    function renderModules() {
+        const container = document.getElementById('modules');
+        container.innerHTML = '';
+        function add(i, depth) {
+            const div = document.createElement('div');
+            div.className = 'item'; div.style.paddingLeft = (depth * 12 + 4) + 'px';
+            const toggle = document.createElement('span');
+            toggle.className = 'toggle'; toggle.textContent = collapsed[i] ? '▸' : '▾';
+            div.appendChild(toggle);
+            div.appendChild(document.createTextNode(modules[i][0].split('.').slice(-1)[0] + ' (' + memberCount[i] + ')'));
+            div.title = modules[i][0];
+            toggle.onclick = (e) => { e.stopPropagation(); collapsed[i] ^= 1; recomputeHidden(); renderModules(); redraw(); };
+            div.onclick = () => { const m = modules[i]; fit(m[2], m[3], m[4], m[5]); };
+            container.appendChild(div);
+            if (!collapsed[i]) childModules[i].forEach(c => add(c, depth + 1));
+        }
+        childModules[0].forEach(c => add(c, 0));
+    }
+
+    document.getElementById('legend').innerHTML = kinds.map(k => '<span style="background:' + (COLORS[k] || COLORS.other) + '">' + k + '</span>').join('');
+    document.getElementById('search').addEventListener('input', e => search(e.target.value));
+    document.getElementById('fit').onclick = fitAll;
+    document.getElementById('collapseAll').onclick = () => { childModules[0].forEach(i => collapsed[i] = 1); recomputeHidden(); renderModules(); redraw(); };
+    document.getElementById('expandAll').onclick = () => { collapsed.fill(0); recomputeHidden(); renderModules(); redraw(); };
+
+    let dragging = null;
+    canvas.addEventListener('mousedown', e => { dragging = { x: e.clientX, y: e.clientY, tx, ty, moved: false }; });
+    window.addEventListener('mousemove', e => {
+        if (!dragging) return;
+        const dx = e.clientX - dragging.x, dy = e.clientY - dragging.y;
+        if (Math.abs(dx) + Math.abs(dy) > 3) dragging.moved = true;
+        tx = dragging.tx + dx; ty = dragging.ty + dy; redraw();
+    });
+    window.addEventListener('mouseup', e => {
+        if (dragging && !dragging.moved) {
+            const rect = canvas.getBoundingClientRect();
+            select(nodeAt(e.clientX - rect.left, e.clientY - rect.top));
+        }
+        dragging = null;
+    });
+    canvas.addEventListener('wheel', e => {
+        e.preventDefault();
+        const rect = canvas.getBoundingClientRect(), px = e.clientX - rect.left, py = e.clientY - rect.top;
+        const factor = Math.exp(-e.deltaY * 0.0015);
+        const next = Math.min(4, Math.max(0.01, scale * factor));
+        tx = px - (px - tx) * (next / scale); ty = py - (py - ty) * (next / scale); scale = next;
+        redraw();
+    }, { passive: false });
+    window.addEventListener('resize', resize);
+
+    // Large graphs open with every top-level module collapsed
+    if (nodes.length > 2000) childModules[0].forEach(i => collapsed[i] = 1);
+    recomputeHidden();
+    renderModules();
+    resize();
+    fitAll();
+})();
+</script>
+</body>
+</html>
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a virtualized HTML viewer for a dependency graph")
+    parser.add_argument("graph", help="DOT file (terraform graph / hcl_graph / styled) or hcl_graph JSON; - for stdin")
+    parser.add_argument("output", help="HTML file to write")
+    parser.add_argument("--title", default="Terraform Infrastructure", help="Page title")
+    parser.add_argument("--subtitle", help="Line shown under the title (default: generation time)")
+    args = parser.parse_args()
+
+    started = time.time()
+    nodes, edges = load_graph(args.graph)
+    payload = compact_graph(nodes, edges)
+    subtitle = args.subtitle or f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(render_html(payload, args.title, subtitle))
+
+    print(f"Viewer for {len(payload['n'])} nodes, {len(edges)} edges, {len(payload['m']) - 1} modules "
+          f"written to {output} ({output.stat().st_size // 1024} KiB) in {time.time() - started:.2f}s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""
+Static Terraform dependency graph
+Parses HCL directly (no terraform init/graph) and links resources, data sources, modules,
+variables, locals and outputs through their references, following local module sources
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from dot_styler import DEFAULT_COLOR, GRAPH_HEADER, KIND_COLORS, classify
+
+IDENT_START = re.compile(r'[A-Za-z_]')
+IDENT = re.compile(r'[A-Za-z_][A-Za-z0-9_-]*')
+NUMBER = re.compile(r'[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?')
+HEREDOC = re.compile(r'<<(-?)([A-Za-z_][A-Za-z0-9_-]*)[ \t]*\r?\n')
+OPERATORS = ('=>', '==', '!=', '<=', '>=', '&&', '||', '...')
+
+# Module call arguments that are not input variables of the child module
+MODULE_META_ARGS = frozenset({'source', 'version', 'count', 'for_each', 'providers', 'depends_on'})
+# Reference roots that never point at a graph node
+IGNORED_ROOTS = frozenset({'count', 'each', 'path', 'self', 'terraform'})
+
+
+def _scan_template(text, i, terminator):
+    """Walk a quoted string (terminator '"') or heredoc body (terminator None) from i
+
+    Returns the index of the terminator (or end of text) and the (start, end)
+    spans of every ${...} / %{...} interpolation inside it.
+    """
+    n = len(text)
+    spans = []
+    while i < n:
+        c = text[i]
+        if c == '\\' and terminator == '"':
+            i += 2
+            continue
+        if text.startswith(('$${', '%%{'), i):
+            i += 3
+            continue
+        if text.startswith(('${', '%{'), i):
+            start = i + 2
+            i = _skip_expression(text, start)
+            spans.append((start, i))
+            i += 1
+            continue
+        if c == terminator:
+            return i, spans
+        i += 1
+    return n, spans
+
+
+def _skip_expression(text, i):
+    """Index of the '}' closing an interpolation that starts at i"""
+    n = len(text)
+    depth = 0
+    while i < n:
+        c = text[i]
+        if c == '"':
+            i, _ = _scan_template(text, i + 1, '"')
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            if depth == 0:
+                return i
+            depth -= 1
+        i += 1
+    return n
+
+
+def tokenize(text, start=0, end=None, line=1):
+    """Yield (kind, value, line) tokens of HCL source
+
+    Kinds: 'ident', 'number', 'punct', 'newline', 'string' and 'template'. A
+    template is a string containing interpolations: its value is the raw text
+    and the tokens of those interpolations are yielded just before it.
+    """
+    end = len(text) if end is None else end
+    i = start
+    while i < end:
+        c = text[i]
+        if c == '\n':
+            yield 'newline', None, line
+            line += 1
+            i += 1
+        elif c in ' \t\r':
+            i += 1
+        elif c == '#' or text.startswith('//', i):
+            while i < end and text[i] != '\n':
+                i += 1
+        elif text.startswith('/*', i):
+            close = text.find('*/', i + 2, end)
+            close = end if close == -1 else close + 2
+            line += text.count('\n', i, close)
+            i = close
+        elif c == '"':
+            close, spans = _scan_template(text, i + 1, '"')
+            for span_start, span_end in spans:
+                yield from tokenize(text, span_start, span_end, line + text.count('\n', i, span_start))
+            yield 'template' if spans else 'string', text[i + 1:close], line
+            line += text.count('\n', i, close)
+            i = close + 1
+        elif text.startswith('<<', i) and HEREDOC.match(text, i):
+            match = HEREDOC.match(text, i)
+            marker = match.group(2)
+            body_start = match.end()
+            close = re.compile(r'^[ \t]*' + re.escape(marker) + r'[ \t]*\r?$', re.MULTILINE).search(text, body_start, end)
+            body_end = close.start() if close else end
+            _, spans = _scan_template(text[:body_end], body_start, None)
+            for span_start, span_end in spans:
+                yield from tokenize(text, span_start, span_end, line + text.count('\n', i, span_start))
+            yield 'template' if spans else 'string', text[body_start:body_end], line
+            resume = close.end() if close else end
+            line += text.count('\n', i, resume)
+            i = resume
+        elif IDENT_START.match(c):
+            match = IDENT.match(text, i)
+            yield 'ident', match.group(0), line
+            i = match.end()
+        elif c.isdigit():
+            match = NUMBER.match(text, i)
+            yield 'number', match.group(0), line
+            i = match.end()
+        else:
+            for operator in OPERATORS:
+                if text.startswith(operator, i):
+                    yield 'punct', operator, line
+                    i += len(operator)
+                    break
+            else:
+                yield 'punct', c, line
+                i += 1
+
+
+class Block:
+    __slots__ = ('type', 'labels', 'attributes', 'blocks', 'tokens', 'line')
+
+    def __init__(self, block_type, labels, line):
+        self.type = block_type
+        self.labels = labels
+        self.attributes = {}  # name -> expression tokens
+        self.blocks = []
+        self.tokens = []  # every token of the body, nested blocks included
+        self.line = line
+
+
+def parse_body(tokens, pos, block=None):
+    """Parse statements until the closing brace (or end of input); returns (blocks, pos)"""
+    blocks = []
+    n = len(tokens)
+    while pos < n:
+        kind, value, line = tokens[pos]
+        if kind == 'newline' or (kind == 'punct' and value == ','):
+            pos += 1
+            continue
+        if kind == 'punct' and value == '}':
+            return blocks, pos + 1
+        if kind != 'ident':
+            pos += 1
+            continue
+
+        name = value
+        pos += 1
+        if pos < n and tokens[pos][0] == 'punct' and tokens[pos][1] in ('=', ':'):
+            # Attribute: the expression runs to the end of the line outside brackets
+            pos += 1
+            depth = 0
+            expression = []
+            while pos < n:
+                token = tokens[pos]
+                if token[0] == 'punct':
+                    if token[1] in '([{':
+                        depth += 1
+                    elif token[1] in ')]}':
+                        if depth == 0:
+                            break
+                        depth -= 1
+                elif token[0] == 'newline' and depth == 0:
+                    break
+                expression.append(token)
+                pos += 1
+            if block is not None:
+                block.attributes[name] = expression
+                block.tokens += [('ident', name, line), ('punct', '=', line)]
+                block.tokens.extend(expression)
+            continue
+
+        # Nested block: labels, then a braced body
+        labels = []
+        while pos < n and tokens[pos][0] in ('ident', 'string'):
+            labels.append(tokens[pos][1])
+            pos += 1
+        if pos < n and tokens[pos][0] == 'punct' and tokens[pos][1] == '{':
+            child = Block(name, labels, line)
+            _, pos = parse_body(tokens, pos + 1, child)
+            blocks.append(child)
+            if block is not None:
+                block.blocks.append(child)
+                block.tokens += [('ident', name, line)] + [('string', label, line) for label in labels]
+                block.tokens.extend(child.tokens)
+    return blocks, pos
+
+
+def parse_hcl(text):
+    """Top-level blocks of one HCL file"""
+    tokens = list(tokenize(text))
+    blocks, _ = parse_body(tokens, 0)
+    return blocks
+
+
+def traversals(tokens):
+    """Yield the dotted name chains (e.g. ['aws_s3_bucket', 'main', 'arn']) in an expression"""
+    n = len(tokens)
+    for i, (kind, value, _) in enumerate(tokens):
+        if kind != 'ident' or (i and tokens[i - 1][0] == 'punct' and tokens[i - 1][1] == '.'):
+            continue
+        names = [value]
+        j = i + 1
+        while j + 1 < n and tokens[j][0] == 'punct' and tokens[j][1] == '.' and tokens[j + 1][0] == 'ident':
+            names.append(tokens[j + 1][1])
+            j += 2
+        if len(names) > 1:
+            yield names
+
+
+def content_hash(tokens):
+    """Digest of a block body that ignores layout, comments and line numbers"""
+    digest = hashlib.sha256()
+    for kind, value, _ in tokens:
+        if kind != 'newline':
+            digest.update(f'{kind}\0{value}\0'.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def provider_name(resource_type):
+    return resource_type.split('_', 1)[0]
+
+
+def block_address(block):
+    """Module-relative address of a top-level block, or None for blocks that are not graph nodes"""
+    labels = block.labels
+    if block.type == 'resource' and len(labels) >= 2:
+        return f'{labels[0]}.{labels[1]}'
+    if block.type == 'data' and len(labels) >= 2:
+        return f'data.{labels[0]}.{labels[1]}'
+    if block.type == 'module' and labels:
+        return f'module.{labels[0]}'
+    if block.type == 'variable' and labels:
+        return f'var.{labels[0]}'
+    if block.type == 'output' and labels:
+        return f'output.{labels[0]}'
+    if block.type == 'provider' and labels:
+        alias = block.attributes.get('alias')
+        if alias and alias[0][0] == 'string' and alias[0][1]:
+            return f'provider.{labels[0]}.{alias[0][1]}'
+        return f'provider.{labels[0]}'
+    return None
+
+
+def parse_module(module_dir):
+    """Parse every .tf file of one module directory into its module-relative subgraph
+
+    The result is plain JSON data: nodes (each with a content hash of its
+    block, so diffs ignore formatting and line moves), edges between them, module calls
+    (source plus the references feeding each input variable) and the
+    providers its resources use. Edges to a child's outputs are written as
+    module.<name>.output.<output> and resolved when the graph is composed.
+    """
+    module_dir = Path(module_dir)
+    nodes = {}
+    bodies = []  # (address, tokens)
+    calls = {}
+    resources = set()
+
+    for tf_file in sorted(module_dir.glob('*.tf')):
+        with open(tf_file, 'r', encoding='utf-8', errors='replace') as f:
+            blocks = parse_hcl(f.read())
+        for block in blocks:
+            if block.type == 'locals':
+                for name, expression in block.attributes.items():
+                    nodes[f'local.{name}'] = {
+                        "kind": "local", "file": tf_file.name, "line": block.line, "hash": content_hash(expression)
+                    }
+                    bodies.append((f'local.{name}', expression))
+                continue
+
+            address = block_address(block)
+            if address is None:
+                continue
+            nodes[address] = {
+                "kind": block.type, "file": tf_file.name, "line": block.line, "hash": content_hash(block.tokens)
+            }
+            if block.type in ('resource', 'data'):
+                resources.add(address)
+
+            if block.type == 'module':
+                source = block.attributes.get('source') or []
+                inputs = {
+                    name: expression for name, expression in block.attributes.items()
+                    if name not in MODULE_META_ARGS
+                }
+                calls[block.labels[0]] = {
+                    "source": source[0][1] if source and source[0][0] == 'string' else None,
+                    "inputs": inputs
+                }
+                meta_tokens = [
+                    token for name in ('count', 'for_each', 'depends_on')
+                    for token in block.attributes.get(name, [])
+                ]
+                bodies.append((address, meta_tokens))
+            else:
+                bodies.append((address, block.tokens))
+
+    def resolve(names):
+        root = names[0]
+        if root in IGNORED_ROOTS:
+            return None
+        if root == 'var':
+            return f'var.{names[1]}' if f'var.{names[1]}' in nodes else None
+        if root == 'local':
+            return f'local.{names[1]}' if f'local.{names[1]}' in nodes else None
+        if root == 'module':
+            if names[1] not in calls:
+                return None
+            return f'module.{names[1]}.output.{names[2]}' if len(names) > 2 else f'module.{names[1]}'
+        if root == 'data':
+            return f'data.{names[1]}.{names[2]}' if len(names) > 2 and f'data.{names[1]}.{names[2]}' in resources else None
+        address = f'{root}.{names[1]}'
+        return address if address in resources else None
+
+    def dependencies(tokens, own_address=None):
+        found = []
+        for names in traversals(tokens):
+            target = resolve(names)
+            if target is not None and target != own_address and target not in found:
+                found.append(target)
+        return found
+
+    edges = []
+    providers = set()
+    for address, tokens in bodies:
+        for target in dependencies(tokens, address):
+            edges.append([address, target])
+        if nodes[address]['kind'] == 'resource':
+            providers.add(provider_name(address.split('.')[0]))
+        elif nodes[address]['kind'] == 'data':
+            providers.add(provider_name(address.split('.')[1]))
+
+    for name, call in calls.items():
+        call['inputs'] = {
+            variable: dependencies(expression) for variable, expression in sorted(call['inputs'].items())
+        }
+
+    return {
+        "nodes": nodes,
+        "edges": edges,
+        "calls": calls,
+        "providers": sorted(providers)
+    }
+
+
+def is_local_source(source):
+    return bool(source) and source.startswith(('./', '../'))
+
+
+def compose(root_dir, load_module=parse_module, base_dir=None):
+    """Instantiate a root module and every local module it calls into one graph
+
+    load_module(directory) returns a parse_module() result; passing a cached
+    loader lets unchanged modules skip parsing entirely.
+    """
+    root_dir = Path(root_dir).resolve()
+    base_dir = Path(base_dir).resolve() if base_dir else root_dir
+    nodes = {}
+    edges = set()
+    modules = {}
+
+    def relative(path):
+        try:
+            return path.relative_to(base_dir).as_posix()
+        except ValueError:
+            return str(path)
+
+    def instantiate(module_dir, prefix, stack):
+        """Add one module instance; returns its output node addresses by output name"""
+        subgraph = load_module(module_dir)
+        modules[prefix.rstrip('.') or '(root)'] = relative(module_dir)
+
+        for address, info in subgraph['nodes'].items():
+            nodes[prefix + address] = dict(info, module=prefix.rstrip('.'), dir=relative(module_dir))
+
+        child_outputs = {}
+        for name, call in subgraph['calls'].items():
+            child_prefix = f'{prefix}module.{name}.'
+            source = call['source']
+            child_dir = (module_dir / source).resolve() if is_local_source(source) else None
+            if child_dir is None or not child_dir.is_dir() or child_dir in stack:
+                child_outputs[name] = None
+                nodes[f'{prefix}module.{name}']['external'] = source
+                continue
+
+            child_outputs[name] = instantiate(child_dir, child_prefix, stack | {child_dir})
+            for variable, targets in call['inputs'].items():
+                variable_address = f'{child_prefix}var.{variable}'
+                if variable_address not in nodes:
+                    continue
+                for target in targets:
+                    edges.add((variable_address, map_target(prefix, target, child_outputs)))
+
+        for src, dst in subgraph['edges']:
+            edges.add((prefix + src, map_target(prefix, dst, child_outputs)))
+
+        for provider in subgraph['providers']:
+            provider_address = f'provider.{provider}'
+            nodes.setdefault(provider_address, {"kind": "provider", "module": "", "dir": relative(module_dir)})
+            for address, info in subgraph['nodes'].items():
+                if info['kind'] in ('resource', 'data') and _resource_provider(address) == provider:
+                    edges.add((prefix + address, provider_address))
+
+        return {
+            address.split('.', 1)[1]: prefix + address
+            for address, info in subgraph['nodes'].items() if info['kind'] == 'output'
+        }
+
+    def map_target(prefix, target, child_outputs):
+        """Resolve module.<name>.output.<x> to the child's output node, or the module node"""
+        if target.startswith('module.') and '.output.' in target:
+            name, _, output = target[len('module.'):].partition('.output.')
+            outputs = child_outputs.get(name)
+            if outputs and output in outputs:
+                return outputs[output]
+            return f'{prefix}module.{name}'
+        return prefix + target
+
+    instantiate(root_dir, '', frozenset({root_dir}))
+    return {
+        "root": relative(root_dir),
+        "nodes": nodes,
+        "edges": sorted(edge for edge in edges if edge[0] in nodes and edge[1] in nodes),
+        "modules": modules
+    }
+
+
+def _resource_provider(address):
+    parts = address.split('.')
+    return provider_name(parts[1] if parts[0] == 'data' else parts[0])
+
+
+def to_json(graph):
+    return {
+        "root": graph['root'],
+        "modules": graph['modules'],
+        "nodes": [dict(info, id=address) for address, info in sorted(graph['nodes'].items())],
+        "edges": [list(edge) for edge in graph['edges']]
+    }
+
+
+def write_dot(graph, out):
+    """DOT with one nested cluster per module instance and nodes colored by kind"""
+    tree = {}
+    for address, info in graph['nodes'].items():
+        tree.setdefault(info.get('module', ''), []).append(address)
+
+    children = {}
+    for module in tree:
+        for ancestor in _ancestors(module):
+            siblings = children.setdefault(_parent(ancestor), [])
+            if ancestor not in siblings:
+                siblings.append(ancestor)
+
+    def emit(module, indent):
+        pad = '    ' * indent
+        for address in sorted(tree.get(module, [])):
+            label = address[len(module) + 1:] if module else address
+            color = KIND_COLORS.get(classify(address), DEFAULT_COLOR)
+            out.write(f'{pad}"{address}" [label="{label}", fillcolor="{color}"];\n')
+        for child in sorted(children.get(module, [])):
+            out.write(f'{pad}subgraph "cluster_{child}" {{\n')
+            out.write(f'{pad}    label="{child}";\n{pad}    style="rounded,dashed";\n{pad}    color="gray50";\n')
+            emit(child, indent + 1)
+            out.write(f'{pad}}}\n')
+
+    out.write(GRAPH_HEADER)
+    emit('', 1)
+    for src, dst in graph['edges']:
+        out.write(f'    "{src}" -> "{dst}";\n')
+    out.write('}\n')
+
+
+def _parent(module):
+    return module.rsplit('.module.', 1)[0] if '.module.' in module else ''
+
+
+def _ancestors(module):
+    while module:
+        yield module
+        module = _parent(module)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Static Terraform dependency graph (no terraform init)")
+    parser.add_argument("root", help="Root module directory, e.g. terraform/environments/local")
+    parser.add_argument("--format", choices=("dot", "json"), default="dot", help="Output format")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    started = time.time()
+    graph = compose(args.root, base_dir=Path(args.root).resolve().parent.parent)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', buffering=1 << 20)
+    try:
+        if args.format == 'json':
+            json.dump(to_json(graph), out, indent=2)
+            out.write('\n')
+        else:
+            write_dot(graph, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Parsed {len(graph['modules'])} module instances: {len(graph['nodes'])} nodes, "
+          f"{len(graph['edges'])} edges in {time.time() - started:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
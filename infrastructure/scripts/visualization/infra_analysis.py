@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+Rule-based infrastructure analysis
+Checks parsed Terraform blocks and Kubernetes manifests against performance, cost, reliability
+and security rules indexed by resource kind; per-file results are reused until the file changes
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+from file_index import FileIndex
+from graph_store import GraphStore
+from hcl_graph import parse_hcl
+from k8s_manifests import parse_documents, resource_key
+from render_cache import default_cache_dir, hash_file
+
+AREAS = ('security', 'performance', 'cost', 'reliability')
+SEVERITIES = ('critical', 'warning', 'info')
+# Rule changes invalidate every cached per-file result
+RULESET_DIGEST = hash_file(Path(__file__).resolve())[:16]
+
+UNKNOWN = object()
+
+
+class Rule:
+    __slots__ = ('id', 'area', 'severity', 'kinds', 'check')
+
+    def __init__(self, rule_id, area, severity, kinds, check):
+        self.id = rule_id
+        self.area = area
+        self.severity = severity
+        self.kinds = kinds
+        self.check = check
+
+
+RULES = []
+AGGREGATE_RULES = []
+
+
+def rule(rule_id, area, severity, kinds):
+    """Register a per-resource check; it yields one message per problem found
+
+    Kubernetes kinds are manifest kinds (Deployment), Terraform kinds are
+    resource types (aws_ecr_repository) or module:<source> for module calls.
+    """
+    def register(check):
+        RULES.append(Rule(rule_id, area, severity, tuple(kinds), check))
+        return check
+    return register
+
+
+def aggregate_rule(rule_id, area, severity):
+    """Register a cross-resource check over the facts collected from every file in scope"""
+    def register(check):
+        AGGREGATE_RULES.append(Rule(rule_id, area, severity, (), check))
+        return check
+    return register
+
+
+# --- Terraform helpers -------------------------------------------------------
+
+def literal(tokens):
+    """Constant value of a single-token expression, or UNKNOWN"""
+    if not tokens or len(tokens) != 1:
+        return UNKNOWN
+    kind, value, _ = tokens[0]
+    if kind == 'string':
+        return value
+    if kind == 'number':
+        return float(value) if '.' in value or 'e' in value.lower() else int(value)
+    if kind == 'ident' and value in ('true', 'false'):
+        return value == 'true'
+    if kind == 'ident' and value == 'null':
+        return None
+    return UNKNOWN
+
+
+def nested(block, *path):
+    """Blocks reached by following nested block types from block"""
+    blocks = [block]
+    for block_type in path:
+        blocks = [child for parent in blocks for child in parent.blocks if child.type == block_type]
+    return blocks
+
+
+def terraform_kind(block):
+    if block.type == 'resource' and len(block.labels) >= 2:
+        return block.labels[0]
+    if block.type == 'module' and block.labels:
+        source = literal(block.attributes.get('source'))
+        return f'module:{source}' if isinstance(source, str) else None
+    return None
+
+
+def terraform_name(block):
+    if block.type == 'module':
+        return f'module.{block.labels[0]}'
+    return f'{block.labels[0]}.{block.labels[1]}'
+
+
+# --- Kubernetes helpers ------------------------------------------------------
+
+def pod_spec(manifest):
+    spec = manifest.get('spec') or {}
+    if manifest.get('kind') == 'CronJob':
+        spec = ((spec.get('jobTemplate') or {}).get('spec')) or {}
+    return ((spec.get('template') or {}).get('spec')) or {}
+
+
+def containers(manifest):
+    return [c for c in pod_spec(manifest).get('containers') or [] if isinstance(c, dict)]
+
+
+def manifest_name(manifest):
+    namespace, name = resource_key(manifest)
+    return f"{manifest.get('kind')}/{namespace}/{name}"
+
+
+WORKLOAD_KINDS = ('Deployment', 'StatefulSet', 'DaemonSet', 'Job', 'CronJob')
+
+
+# --- Kubernetes rules --------------------------------------------------------
+
+@rule('k8s-resource-requests', 'performance', 'warning', WORKLOAD_KINDS)
+def missing_requests(manifest):
+    for container in containers(manifest):
+        requests = (container.get('resources') or {}).get('requests') or {}
+        if 'cpu' not in requests or 'memory' not in requests:
+            yield f"container '{container.get('name')}' has no CPU/memory requests; the scheduler cannot place it reliably"
+
+
+@rule('k8s-resource-limits', 'cost', 'info', WORKLOAD_KINDS)
+def missing_limits(manifest):
+    for container in containers(manifest):
+        if not (container.get('resources') or {}).get('limits'):
+            yield f"container '{container.get('name')}' has no resource limits"
+
+
+@rule('k8s-readiness-probe', 'reliability', 'warning', ('Deployment', 'StatefulSet'))
+def missing_readiness_probe(manifest):
+    for container in containers(manifest):
+        if 'readinessProbe' not in container:
+            yield f"container '{container.get('name')}' has no readiness probe; traffic may reach it before it is ready"
+
+
+@rule('k8s-image-tag', 'reliability', 'warning', WORKLOAD_KINDS)
+def floating_image_tag(manifest):
+    for container in containers(manifest):
+        image = str(container.get('image', ''))
+        repository = image.rsplit('/', 1)[-1]
+        if '@' not in repository and (':' not in repository or repository.endswith(':latest')):
+            yield f"container '{container.get('name')}' uses floating image '{image}'"
+
+
+@rule('k8s-privileged', 'security', 'critical', WORKLOAD_KINDS)
+def privileged_container(manifest):
+    for container in containers(manifest):
+        if (container.get('securityContext') or {}).get('privileged') is True:
+            yield f"container '{container.get('name')}' runs privileged"
+
+
+@rule('k8s-run-as-non-root', 'security', 'warning', WORKLOAD_KINDS)
+def missing_run_as_non_root(manifest):
+    pod_level = (pod_spec(manifest).get('securityContext') or {}).get('runAsNonRoot')
+    for container in containers(manifest):
+        if pod_level is not True and (container.get('securityContext') or {}).get('runAsNonRoot') is not True:
+            yield f"container '{container.get('name')}' does not set runAsNonRoot"
+
+
+@rule('k8s-pvc-storage-class', 'performance', 'warning', ('PersistentVolumeClaim',))
+def missing_storage_class(manifest):
+    if not (manifest.get('spec') or {}).get('storageClassName'):
+        yield "no storageClassName; the cluster default class decides performance and reclaim behaviour"
+
+
+@rule('k8s-ingress-tls', 'security', 'warning', ('Ingress',))
+def ingress_without_tls(manifest):
+    if not (manifest.get('spec') or {}).get('tls'):
+        yield "ingress serves plain HTTP (no tls section)"
+
+
+@rule('k8s-loadbalancer-service', 'cost', 'info', ('Service',))
+def loadbalancer_service(manifest):
+    if (manifest.get('spec') or {}).get('type') == 'LoadBalancer':
+        yield "LoadBalancer service provisions a dedicated cloud load balancer; consider sharing an ingress"
+
+
+# --- Terraform rules ---------------------------------------------------------
+
+@rule('tf-ecr-scanning', 'security', 'warning', ('aws_ecr_repository',))
+def ecr_without_scanning(block):
+    scans = [literal(config.attributes.get('scan_on_push')) for config in nested(block, 'image_scanning_configuration')]
+    if not scans or False in scans:
+        yield "images are not scanned on push"
+
+
+@rule('tf-ecr-immutable-tags', 'reliability', 'info', ('aws_ecr_repository',))
+def ecr_mutable_tags(block):
+    if literal(block.attributes.get('image_tag_mutability', [('string', 'MUTABLE', 0)])) == 'MUTABLE':
+        yield "image tags are mutable; a redeploy may pull different content"
+
+
+@rule('tf-log-retention', 'cost', 'warning', ('aws_cloudwatch_log_group',))
+def log_group_without_retention(block):
+    if 'retention_in_days' not in block.attributes:
+        yield "log group keeps data forever (no retention_in_days)"
+
+
+@rule('tf-s3-force-destroy', 'reliability', 'warning', ('aws_s3_bucket',))
+def bucket_force_destroy(block):
+    if literal(block.attributes.get('force_destroy')) is True:
+        yield "force_destroy deletes every object when the bucket is destroyed"
+
+
+@rule('tf-open-ingress', 'security', 'critical', ('aws_security_group',))
+def open_security_group(block):
+    for ingress in nested(block, 'ingress'):
+        cidrs = [value for kind, value, _ in ingress.attributes.get('cidr_blocks', []) if kind == 'string']
+        port = literal(ingress.attributes.get('from_port'))
+        # Public HTTP(S) listeners are expected on load balancers
+        if '0.0.0.0/0' in cidrs and port not in (80, 443):
+            yield f"ingress on port {port if port is not UNKNOWN else '?'} is open to 0.0.0.0/0"
+
+
+@rule('tf-eks-public-endpoint', 'security', 'warning', ('aws_eks_cluster', 'module:terraform-aws-modules/eks/aws'))
+def public_cluster_endpoint(block):
+    if block.type == 'module':
+        public = literal(block.attributes.get('cluster_endpoint_public_access'))
+    else:
+        # The AWS API defaults endpoint_public_access to true
+        public = any(
+            literal(config.attributes.get('endpoint_public_access', [('ident', 'true', 0)])) is True
+            for config in nested(block, 'vpc_config')
+        )
+    if public is True:
+        yield "Kubernetes API endpoint is reachable from the internet"
+
+
+@rule('tf-rds-multi-az', 'reliability', 'warning', ('aws_db_instance', 'module:terraform-aws-modules/rds/aws'))
+def database_single_az(block):
+    if literal(block.attributes.get('multi_az')) is False:
+        yield "database runs in a single availability zone"
+
+
+@rule('tf-rds-deletion-protection', 'reliability', 'warning', ('aws_db_instance', 'module:terraform-aws-modules/rds/aws'))
+def database_deletion_protection(block):
+    if literal(block.attributes.get('deletion_protection')) is False:
+        yield "deletion protection is disabled"
+
+
+@rule('tf-rds-encryption', 'security', 'critical', ('aws_db_instance', 'module:terraform-aws-modules/rds/aws'))
+def database_unencrypted(block):
+    if literal(block.attributes.get('storage_encrypted')) is False:
+        yield "storage is not encrypted at rest"
+
+
+@rule('tf-k8s-deployment-resources', 'performance', 'warning', ('kubernetes_deployment',))
+def terraform_deployment_without_resources(block):
+    for container in nested(block, 'spec', 'template', 'spec', 'container'):
+        if not nested(container, 'resources'):
+            name = literal(container.attributes.get('name'))
+            yield f"container '{name if name is not UNKNOWN else '?'}' has no resources block"
+
+
+@rule('tf-k8s-pvc-storage-class', 'performance', 'warning', ('kubernetes_persistent_volume_claim',))
+def terraform_pvc_without_storage_class(block):
+    if not any('storage_class_name' in spec.attributes for spec in nested(block, 'spec')):
+        yield "no storage_class_name; the cluster default class decides performance"
+
+
+# --- Aggregate rules ---------------------------------------------------------
+
+@aggregate_rule('k8s-missing-hpa', 'performance', 'info')
+def deployments_without_hpa(facts):
+    targets = {tuple(target) for target in facts.get('hpa_targets', [])}
+    for namespace, name, rel_path in facts.get('deployments', []):
+        if (namespace, 'Deployment', name) not in targets:
+            yield rel_path, f"Deployment/{namespace}/{name}", "no HorizontalPodAutoscaler targets this deployment"
+
+
+@aggregate_rule('k8s-namespace-quota', 'cost', 'info')
+def namespaces_without_quota(facts):
+    quotas = set(facts.get('quota_namespaces', []))
+    namespaces = {}
+    for name, rel_path in facts.get('namespaces', []):
+        namespaces.setdefault(name, rel_path)
+    for name, rel_path in sorted(namespaces.items()):
+        if name not in quotas:
+            yield rel_path, f"Namespace/{name}", "no ResourceQuota caps what this namespace can consume"
+
+
+def build_rule_index(rules):
+    """Rules grouped by the resource kinds they apply to"""
+    index = {}
+    for registered in rules:
+        for kind in registered.kinds:
+            index.setdefault(kind, []).append(registered)
+    return index
+
+
+RULE_INDEX = build_rule_index(RULES)
+
+
+def finding(registered, rel_path, resource, message):
+    return {
+        "rule": registered.id,
+        "area": registered.area,
+        "severity": registered.severity,
+        "file": rel_path,
+        "resource": resource,
+        "message": message
+    }
+
+
+def analyze_kubernetes_file(rel_path, content):
+    """(findings, facts, kinds) of one YAML file"""
+    findings = []
+    facts = {"hpa_targets": [], "deployments": [], "namespaces": [], "quota_namespaces": []}
+    kinds = []
+    for manifest in parse_documents(content):
+        kind = manifest.get('kind')
+        kinds.append(kind)
+        for registered in RULE_INDEX.get(kind, ()):
+            for message in registered.check(manifest):
+                findings.append(finding(registered, rel_path, manifest_name(manifest), message))
+
+        namespace, name = resource_key(manifest)
+        if kind == 'HorizontalPodAutoscaler':
+            target = (manifest.get('spec') or {}).get('scaleTargetRef') or {}
+            facts['hpa_targets'].append([namespace, target.get('kind'), target.get('name')])
+        elif kind == 'Deployment':
+            facts['deployments'].append([namespace, name, rel_path])
+        elif kind == 'Namespace':
+            facts['namespaces'].append([name, rel_path])
+        elif kind == 'ResourceQuota':
+            facts['quota_namespaces'].append(namespace)
+    return findings, facts, kinds
+
+
+def analyze_terraform_file(rel_path, content):
+    """(findings, facts, kinds) of one .tf file"""
+    findings = []
+    kinds = []
+    for block in parse_hcl(content):
+        kind = terraform_kind(block)
+        if kind is None:
+            continue
+        kinds.append(kind)
+        for registered in RULE_INDEX.get(kind, ()):
+            for message in registered.check(block):
+                findings.append(finding(registered, rel_path, terraform_name(block), message))
+    return findings, {}, kinds
+
+
+class InfrastructureAnalyzer:
+    def __init__(self, infrastructure_dir, file_index=None, graph_store=None, cache_dir=None):
+        self.root = Path(infrastructure_dir).resolve()
+        self.file_index = file_index or FileIndex(self.root, cache_dir)
+        self.graph_store = graph_store or GraphStore(self.root / 'terraform', file_index=self.file_index,
+                                                     cache_dir=cache_dir)
+        root_id = hashlib.sha256(str(self.root).encode('utf-8')).hexdigest()[:16]
+        self.results_file = Path(cache_dir or default_cache_dir()) / 'analysis' / f'{root_id}.json'
+        self.results = {}  # relative path -> {"sha256", "findings", "facts", "kinds"}
+        self.stats = {"checked": 0, "reused": 0}
+        self._lock = threading.Lock()
+        self._load()
+
+    def scope(self, environment):
+        """(relative path, index record) of the Terraform and Kubernetes files an environment is built from"""
+        graph = self.graph_store.environment_graph(environment)
+        prefix = self.graph_store.terraform_dir.relative_to(self.root).as_posix()
+        terraform_dirs = sorted(set(graph['modules'].values()))
+        patterns = [f'{prefix}/{rel_dir}/*.tf' for rel_dir in terraform_dirs]
+        patterns += ['kubernetes/base/**/*.yaml', f'kubernetes/overlays/{environment}/**/*.yaml']
+        return self.file_index.entries(patterns)
+
+    def analyze(self, environment):
+        """Findings for one environment, re-checking only files whose content changed"""
+        with self._lock:
+            files = self.scope(environment)
+            rel_paths = [rel_path for rel_path, _ in files]
+            dirty = False
+            for rel_path, entry in files:
+                sha256 = entry['sha256']
+                cached = self.results.get(rel_path)
+                if cached is not None and cached['sha256'] == sha256:
+                    self.stats['reused'] += 1
+                    continue
+                self.results[rel_path] = dict(self._check_file(rel_path), sha256=sha256)
+                self.stats['checked'] += 1
+                dirty = True
+            if dirty:
+                self._save()
+
+            findings = []
+            facts = {}
+            kinds = {}
+            for rel_path in rel_paths:
+                result = self.results[rel_path]
+                findings += result['findings']
+                for name, values in result['facts'].items():
+                    facts.setdefault(name, []).extend(values)
+                for kind in result['kinds']:
+                    kinds[kind] = kinds.get(kind, 0) + 1
+
+            for registered in AGGREGATE_RULES:
+                for rel_path, resource, message in registered.check(facts):
+                    findings.append(finding(registered, rel_path, resource, message))
+
+            return {
+                "environment": environment,
+                "files": len(rel_paths),
+                "kinds": kinds,
+                "findings": findings
+            }
+
+    def _check_file(self, rel_path):
+        try:
+            with open(self.root / rel_path, 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+            if rel_path.endswith('.tf'):
+                findings, facts, kinds = analyze_terraform_file(rel_path, content)
+            else:
+                findings, facts, kinds = analyze_kubernetes_file(rel_path, content)
+        except (OSError, yaml.YAMLError):
+            findings, facts, kinds = [], {}, []
+        return {"findings": findings, "facts": facts, "kinds": kinds}
+
+    def _load(self):
+        try:
+            with open(self.results_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('ruleset') == RULESET_DIGEST:
+            self.results = data.get('results', {})
+
+    def _save(self):
+        self.results_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.results_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"ruleset": RULESET_DIGEST, "results": self.results}, f)
+        os.replace(tmp_file, self.results_file)
+
+
+def format_report(report, focus_area='all', limit=25):
+    """Markdown report of analyze() output, optionally restricted to one area"""
+    findings = [f for f in report['findings'] if focus_area == 'all' or f['area'] == focus_area]
+    kinds = sorted(report['kinds'].items(), key=lambda item: (-item[1], item[0]))
+    counts = {severity: sum(1 for f in findings if f['severity'] == severity) for severity in SEVERITIES}
+
+    lines = [
+        f"🔍 Infrastructure Analysis Report - {report['environment'].title()} Environment",
+        "",
+        f"📊 **Focus Area:** {focus_area.title()}",
+        f"📅 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"📁 **Files analyzed:** {report['files']}",
+        f"🚨 **Findings:** {counts['critical']} critical, {counts['warning']} warning, {counts['info']} info",
+        "",
+        "## 🏗️ Inventory",
+        "",
+    ]
+    lines += [f"- {kind}: {count}" for kind, count in kinds[:15]]
+
+    icons = {'security': '🔒', 'performance': '⚡', 'cost': '💰', 'reliability': '🛡️'}
+    severity_icons = {'critical': '❌', 'warning': '⚠️', 'info': 'ℹ️'}
+    for area in AREAS:
+        if focus_area not in ('all', area):
+            continue
+        area_findings = sorted(
+            (f for f in findings if f['area'] == area),
+            key=lambda f: (SEVERITIES.index(f['severity']), f['rule'], f['file'], f['resource'])
+        )
+        lines += ["", f"## {icons[area]} {area.title()} ({len(area_findings)})", ""]
+        if not area_findings:
+            lines.append("✅ No findings")
+        for f in area_findings[:limit]:
+            lines.append(f"{severity_icons[f['severity']]} `{f['rule']}` {f['resource']} ({f['file']}): {f['message']}")
+        if len(area_findings) > limit:
+            lines.append(f"... {len(area_findings) - limit} more")
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    script_dir = Path(__file__).resolve().parent
+    parser = argparse.ArgumentParser(description="Rule-based analysis of the Terraform and Kubernetes configuration")
+    parser.add_argument("-e", "--environment", default="local", help="Environment to analyze")
+    parser.add_argument("--focus", choices=('all',) + AREAS, default="all", help="Restrict the report to one area")
+    parser.add_argument("--format", choices=("markdown", "json"), default="markdown", help="Output format")
+    parser.add_argument("--infrastructure-dir", default=str(script_dir.parent.parent),
+                        help="Directory containing terraform/ and kubernetes/")
+    args = parser.parse_args()
+
+    analyzer = InfrastructureAnalyzer(args.infrastructure_dir)
+    try:
+        report = analyzer.analyze(args.environment)
+    except FileNotFoundError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == 'json':
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        sys.stdout.write(format_report(report, args.focus))
+    print(f"{analyzer.stats['checked']} file(s) checked, {analyzer.stats['reused']} reused from the last run",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
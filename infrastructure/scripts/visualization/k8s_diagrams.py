@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Kubernetes Infrastructure Visualization using Diagrams-as-Code
+Generates architecture diagrams from Kubernetes manifests or live cluster data
+"""
+
+import sys
+from pathlib import Path
+
+from k8s_manifests import load_kubernetes_manifests, match_services, resource_key
+
+# Imported once per process; diagram_pool workers load this module before taking jobs
+try:
+    from diagrams import Diagram, Node, Cluster
+    from diagrams.k8s.compute import Deployment
+    from diagrams.k8s.network import Service, Ingress
+    from diagrams.k8s.storage import PVC
+    from diagrams.onprem.database import PostgreSQL
+    from diagrams.onprem.inmemory import Redis
+    # diagrams has no MinIO node; the generic storage icon stands in
+    from diagrams.generic.storage import Storage as Minio
+    from diagrams.onprem.monitoring import Prometheus, Grafana
+    from diagrams.onprem.gitops import ArgoCD
+    from diagrams.programming.framework import FastAPI, React
+except ImportError as e:
+    Diagram = None
+    DIAGRAMS_IMPORT_ERROR = e
+
+
+def require_diagrams():
+    if Diagram is None:
+        raise RuntimeError(f"Error importing diagrams library: {DIAGRAMS_IMPORT_ERROR}\n"
+                           "Install with: pip3 install diagrams")
+
+
+def generate_ml_platform_diagram(output_dir, environment, format_type):
+    """Generate ML Platform architecture diagram"""
+    output_file = f"kubernetes-{environment}-architecture"
+
+    with Diagram(
+        f"ML Platform - {environment.title()} Environment",
+        filename=f"{output_dir}/{output_file}",
+        outformat=format_type,
+        show=False,
+        direction="TB"
+    ):
+        # External traffic
+        users = Node("Users", icon="diagrams.onprem.client.Users")
+
+        # Ingress layer
+        with Cluster("Ingress"):
+            ingress = Ingress("NGINX Ingress")
+
+        # Application layer
+        with Cluster("ML Platform Applications"):
+            frontend = React("Frontend\n(React)")
+            backend = FastAPI("Backend API\n(FastAPI)")
+            ml_service = Node("ML Service\n(Training/Inference)")
+
+        # Data layer
+        with Cluster("Data Services"):
+            database = PostgreSQL("PostgreSQL\nDatabase")
+            cache = Redis("Redis\nCache")
+            storage = Minio("MinIO\nObject Storage")
+
+        # Monitoring layer
+        with Cluster("Monitoring"):
+            prometheus = Prometheus("Prometheus\nMetrics")
+            grafana = Grafana("Grafana\nDashboards")
+
+        # GitOps layer
+        with Cluster("GitOps"):
+            argocd = ArgoCD("ArgoCD\nDeployment")
+
+        # Network connections
+        users >> ingress >> [frontend, backend]
+        backend >> [database, cache, storage]
+        ml_service >> [database, storage]
+        [frontend, backend, ml_service] >> prometheus
+        prometheus >> grafana
+        argocd >> [frontend, backend, ml_service]
+
+    return f"{output_dir}/{output_file}.{format_type}"
+
+
+def generate_detailed_diagram(output_dir, environment, resources, format_type):
+    """Generate detailed Kubernetes resource diagram"""
+    output_file = f"kubernetes-{environment}-detailed"
+
+    with Diagram(
+        f"Kubernetes Resources - {environment.title()}",
+        filename=f"{output_dir}/{output_file}",
+        outformat=format_type,
+        show=False,
+        direction="TB"
+    ):
+        # Group by namespace
+        namespaces = {}
+
+        # Create namespace clusters
+        for ns in resources['namespaces']:
+            ns_name = ns['metadata']['name']
+            namespaces[ns_name] = Cluster(f"Namespace: {ns_name}")
+
+        def namespace_cluster(ns):
+            # Resources may live in namespaces that have no Namespace manifest
+            if ns not in namespaces:
+                namespaces[ns] = Cluster(f"Namespace: {ns}")
+            return namespaces[ns]
+
+        # Add deployments
+        deployments = {}
+        for deployment in resources['deployments']:
+            ns, name = resource_key(deployment)
+
+            with namespace_cluster(ns):
+                deployments[(ns, name)] = Deployment(f"Deployment\n{name}")
+
+        # Add services
+        services = {}
+        for service in resources['services']:
+            ns, name = resource_key(service)
+
+            with namespace_cluster(ns):
+                services[(ns, name)] = Service(f"Service\n{name}")
+
+        # Add PVCs
+        pvcs = {}
+        for pvc in resources['pvcs']:
+            name = pvc['metadata']['name']
+            ns = pvc['metadata'].get('namespace', 'default')
+
+            with namespace_cluster(ns):
+                pvcs[name] = PVC(f"PVC\n{name}")
+
+        # Connect services to the deployments their label selectors match
+        for svc_key, dep_key in match_services(resources['services'], resources['deployments']):
+            services[svc_key] >> deployments[dep_key]
+
+    return f"{output_dir}/{output_file}.{format_type}"
+
+
+def render(spec):
+    """Render the diagrams described by a spec; returns the files written
+
+    spec: {"kubernetes_dir", "environment", "output_dir", "format"}
+    """
+    require_diagrams()
+    kubernetes_dir = spec['kubernetes_dir']
+    environment = spec['environment']
+    output_dir = spec['output_dir']
+    format_type = spec.get('format', 'png')
+
+    # Ensure output directory exists
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    print(f"Loading Kubernetes manifests from {kubernetes_dir}...")
+    manifests, resources = load_kubernetes_manifests(kubernetes_dir, environment)
+    print(f"Found {len(manifests)} Kubernetes resources")
+
+    # Generate ML Platform architecture diagram
+    print("Generating ML Platform architecture diagram...")
+    files = [generate_ml_platform_diagram(output_dir, environment, format_type)]
+
+    # Generate detailed resource diagram
+    if manifests:
+        print("Generating detailed Kubernetes resource diagram...")
+        files.append(generate_detailed_diagram(output_dir, environment, resources, format_type))
+
+    print(f"Diagrams generated in {output_dir}/")
+    return files
+
+
+def main():
+    if len(sys.argv) < 4:
+        print("Usage: python3 k8s_diagrams.py <kubernetes_dir> <environment> <output_dir> [format]")
+        sys.exit(1)
+
+    try:
+        render({
+            "kubernetes_dir": sys.argv[1],
+            "environment": sys.argv[2],
+            "output_dir": sys.argv[3],
+            "format": sys.argv[4] if len(sys.argv) > 4 else "png"
+        })
+    except RuntimeError as e:
+        print(str(e))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Batched live-cluster inventory
+Fetches each resource type once cluster-wide and streams the list items into per-namespace counts
+"""
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+import urllib.request
+from pathlib import Path
+
+# Resource type -> API path, used when talking to an API server directly (kubectl proxy or a fake server)
+RESOURCE_PATHS = {
+    'namespaces': '/api/v1/namespaces',
+    'pods': '/api/v1/pods',
+    'services': '/api/v1/services',
+    'deployments': '/apis/apps/v1/deployments',
+}
+COUNTED_TYPES = ('pods', 'services', 'deployments')
+COLUMN_LABELS = {'pods': 'Pods', 'services': 'Services', 'deployments': 'Deployments'}
+
+READ_CHUNK = 64 * 1024
+WHITESPACE = ' \t\r\n'
+
+
+class ChunkReader:
+    """Incremental JSON reader over a text stream that keeps only the unparsed tail in memory"""
+
+    def __init__(self, stream, chunk_size=READ_CHUNK):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character, or '' at end of input"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of the current chunk")
+        self.pos += 1
+
+    def value(self):
+        """Decode one complete JSON value, reading more input until it parses"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and isinstance(value, (int, float)):
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_list_items(stream):
+    """Yield the elements of a Kubernetes List's "items" array one at a time"""
+    reader = ChunkReader(stream)
+    reader.expect('{')
+    while reader.peek() != '}':
+        key = reader.value()
+        reader.expect(':')
+        if key != 'items':
+            reader.value()
+        elif reader.peek() == 'n':
+            reader.value()  # "items": null
+        else:
+            reader.expect('[')
+            while reader.peek() != ']':
+                yield reader.value()
+                if reader.peek() == ',':
+                    reader.pos += 1
+            reader.expect(']')
+        if reader.peek() == ',':
+            reader.pos += 1
+        elif reader.peek() == '':
+            raise ValueError("Unexpected end of input inside List object")
+
+
+class TeeReader:
+    """Copy everything read from a stream into a recording file"""
+
+    def __init__(self, stream, record):
+        self.stream = stream
+        self.record = record
+
+    def read(self, size=-1):
+        chunk = self.stream.read(size)
+        if chunk:
+            self.record.write(chunk)
+        return chunk
+
+
+class InventoryCollector:
+    """One cluster-wide list call per resource type, from kubectl, an API server URL or recorded fixtures"""
+
+    def __init__(self, source=None, context=None, record_dir=None, timeout=60):
+        self.source = source
+        self.context = context
+        self.record_dir = Path(record_dir) if record_dir else None
+        self.timeout = timeout
+        self.calls = 0
+
+    def open_list(self, resource_type):
+        """(stream, close) for the List JSON of one resource type"""
+        self.calls += 1
+        if self.source and self.source.startswith(('http://', 'https://')):
+            response = urllib.request.urlopen(self.source.rstrip('/') + RESOURCE_PATHS[resource_type],
+                                              timeout=self.timeout)
+            return io.TextIOWrapper(response, encoding='utf-8'), response.close
+
+        if self.source:
+            f = open(Path(self.source) / f'{resource_type}.json', 'r', encoding='utf-8')
+            return f, f.close
+
+        cmd = ['kubectl', 'get', resource_type, '-o', 'json']
+        if resource_type != 'namespaces':
+            cmd.insert(3, '--all-namespaces')
+        if self.context:
+            cmd += ['--context', self.context]
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+
+        def close():
+            process.stdout.close()
+            if process.wait() != 0:
+                raise RuntimeError(f"kubectl get {resource_type} exited with {process.returncode}")
+        return process.stdout, close
+
+    def items(self, resource_type):
+        """Stream the items of one resource type, recording the raw response if requested"""
+        stream, close = self.open_list(resource_type)
+        record = None
+        if self.record_dir is not None:
+            self.record_dir.mkdir(parents=True, exist_ok=True)
+            record = open(self.record_dir / f'{resource_type}.json', 'w', encoding='utf-8')
+            stream = TeeReader(stream, record)
+        try:
+            yield from iter_list_items(stream)
+            if record is not None:
+                # Keep the recording complete even though the parser stops at the List's closing brace
+                while stream.read(READ_CHUNK):
+                    pass
+        finally:
+            if record is not None:
+                record.close()
+            close()
+
+    def collect(self):
+        """Per-namespace counts of pods, services and deployments"""
+        counts = {}
+        for item in self.items('namespaces'):
+            name = (item.get('metadata') or {}).get('name')
+            if name:
+                counts[name] = dict.fromkeys(COUNTED_TYPES, 0)
+
+        for resource_type in COUNTED_TYPES:
+            for item in self.items(resource_type):
+                namespace = (item.get('metadata') or {}).get('namespace', 'default')
+                counts.setdefault(namespace, dict.fromkeys(COUNTED_TYPES, 0))[resource_type] += 1
+
+        return dict(sorted(counts.items()))
+
+
+def format_counts(counts):
+    """Lines in the namespace overview's 'ns: Pods(n) Services(n) Deployments(n)' layout"""
+    lines = []
+    for namespace, namespace_counts in counts.items():
+        columns = ' '.join(f"{COLUMN_LABELS[t]}({namespace_counts[t]})" for t in COUNTED_TYPES)
+        lines.append(f"{namespace}: {columns}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-namespace resource counts from one list call per type")
+    parser.add_argument("--source", help="API server URL (e.g. kubectl proxy) or directory of recorded <type>.json "
+                                         "lists; defaults to kubectl")
+    parser.add_argument("--context", help="kubectl context to query")
+    parser.add_argument("--record", metavar="DIR", help="Save the raw list responses as fixtures")
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="Output format")
+    args = parser.parse_args()
+
+    collector = InventoryCollector(args.source, args.context, args.record)
+    try:
+        counts = collector.collect()
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Unable to collect cluster inventory: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == 'json':
+        print(json.dumps({"namespaces": counts, "list_calls": collector.calls}, indent=2))
+    else:
+        print(format_counts(counts))
+
+
+if __name__ == "__main__":
+    main()
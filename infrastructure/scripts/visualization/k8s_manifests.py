@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Kubernetes manifest loader with a parsed-document cache
+Parses each YAML file once per content hash and categorizes resources in the same pass
+"""
+
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import yaml
+
+# LibYAML's C loader is several times faster; fall back to pure Python when it is not compiled in
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from file_index import FileIndex
+from render_cache import default_cache_dir, hash_file
+
+CATEGORIES = (
+    'deployments', 'services', 'ingresses', 'pvcs', 'configmaps', 'secrets',
+    'jobs', 'cronjobs', 'serviceaccounts', 'namespaces', 'other'
+)
+CATEGORY_BY_KIND = {
+    'deployment': 'deployments',
+    'service': 'services',
+    'ingress': 'ingresses',
+    'persistentvolumeclaim': 'pvcs',
+    'configmap': 'configmaps',
+    'secret': 'secrets',
+    'job': 'jobs',
+    'cronjob': 'cronjobs',
+    'serviceaccount': 'serviceaccounts',
+    'namespace': 'namespaces',
+}
+
+
+def empty_categories():
+    return {category: [] for category in CATEGORIES}
+
+
+def categorize(manifest, resources):
+    """Append a manifest to its category list"""
+    kind = str(manifest.get('kind', '')).lower()
+    resources[CATEGORY_BY_KIND.get(kind, 'other')].append(manifest)
+
+
+def categorize_resources(manifests):
+    """Categorize Kubernetes resources by type"""
+    resources = empty_categories()
+    for manifest in manifests:
+        categorize(manifest, resources)
+    return resources
+
+
+def parse_documents(content):
+    """Kubernetes objects (dicts with a kind) from a multi-document YAML string"""
+    return [
+        doc for doc in yaml.load_all(content, Loader=SafeLoader)
+        if isinstance(doc, dict) and 'kind' in doc
+    ]
+
+
+def resource_key(manifest):
+    """(namespace, name) identity of a namespaced object"""
+    metadata = manifest.get('metadata') or {}
+    return metadata.get('namespace', 'default'), metadata.get('name', '')
+
+
+def pod_template_labels(workload):
+    """Labels a workload stamps on its pods"""
+    template = (workload.get('spec') or {}).get('template') or {}
+    return (template.get('metadata') or {}).get('labels') or {}
+
+
+def build_selector_index(workloads):
+    """Map (namespace, label key, label value) to the keys of workloads whose pods carry it"""
+    index = {}
+    for workload in workloads:
+        key = resource_key(workload)
+        for label, value in pod_template_labels(workload).items():
+            index.setdefault((key[0], label, str(value)), set()).add(key)
+    return index
+
+
+def match_selector(namespace, selector, index):
+    """Workload keys whose pod labels satisfy every selector pair, via index lookups"""
+    if not selector:
+        # A service without a selector is backed by manually managed endpoints
+        return set()
+
+    candidates = [index.get((namespace, label, str(value)), set()) for label, value in selector.items()]
+    candidates.sort(key=len)
+    matched = set(candidates[0])
+    for candidate in candidates[1:]:
+        if not matched:
+            break
+        matched &= candidate
+    return matched
+
+
+def match_services(services, workloads):
+    """(service key, workload key) pairs linked by the service's spec.selector"""
+    index = build_selector_index(workloads)
+    links = []
+    for service in services:
+        key = resource_key(service)
+        selector = (service.get('spec') or {}).get('selector') or {}
+        for workload_key in sorted(match_selector(key[0], selector, index)):
+            links.append((key, workload_key))
+    return links
+
+
+class ManifestLoader:
+    def __init__(self, kubernetes_dir, cache_dir=None, use_index=True):
+        self.kubernetes_dir = Path(kubernetes_dir).resolve()
+        cache_root = Path(cache_dir or default_cache_dir())
+        self.cache_dir = cache_root / 'manifests'
+        self.index = FileIndex(self.kubernetes_dir, cache_dir=cache_root) if use_index else None
+        self._refreshed = False
+        self._parsed = {}
+        self.stats = {"parsed": 0, "cached": 0}
+
+    def files(self, subdirs):
+        """Relative paths of the YAML files under the given subdirectories, with content hashes"""
+        if self.index is not None:
+            self._refresh_index()
+            patterns = [f"{subdir.strip('/')}/**/*.yaml" for subdir in subdirs]
+            return [(rel_path, entry['sha256']) for rel_path, entry in self.index.entries(patterns)]
+
+        files = []
+        for subdir in subdirs:
+            directory = self.kubernetes_dir / subdir
+            if directory.exists():
+                for yaml_file in sorted(directory.rglob("*.yaml")):
+                    files.append((yaml_file.relative_to(self.kubernetes_dir).as_posix(), hash_file(yaml_file)))
+        return files
+
+    def file_hash(self, rel_path):
+        """Content hash of one file, taken from the index when it tracks the file"""
+        if self.index is not None:
+            self._refresh_index()
+            entry = self.index.entry(rel_path)
+            if entry is not None:
+                return entry['sha256']
+        return hash_file(self.kubernetes_dir / rel_path)
+
+    def _refresh_index(self):
+        if not self._refreshed:
+            self.index.refresh()
+            self._refreshed = True
+
+    def documents(self, rel_path, sha256):
+        """Parsed objects of one file, reusing the cached parse when its hash is unchanged"""
+        docs = self._parsed.get(sha256)
+        if docs is not None:
+            return docs
+
+        cache_file = self.cache_dir / sha256[:2] / f'{sha256}.pickle'
+        try:
+            with open(cache_file, 'rb') as f:
+                docs = pickle.load(f)
+            self.stats['cached'] += 1
+        except (OSError, pickle.UnpicklingError, EOFError):
+            with open(self.kubernetes_dir / rel_path, 'r', encoding='utf-8') as f:
+                docs = parse_documents(f.read())
+            self.stats['parsed'] += 1
+            self._store(cache_file, docs)
+
+        self._parsed[sha256] = docs
+        return docs
+
+    def load(self, environment):
+        """Manifests from base/ and overlays/<environment>, plus their categorized view"""
+        manifests = []
+        resources = empty_categories()
+
+        for subdir in ('base', f'overlays/{environment}'):
+            for rel_path, sha256 in self.files([subdir]):
+                try:
+                    docs = self.documents(rel_path, sha256)
+                except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+                    print(f"Warning: Could not parse {self.kubernetes_dir / rel_path}: {e}")
+                    continue
+                for doc in docs:
+                    manifests.append(doc)
+                    categorize(doc, resources)
+
+        return manifests, resources
+
+    def _store(self, cache_file, docs):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(docs, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+
+
+def load_kubernetes_manifests(kubernetes_dir, environment, cache_dir=None):
+    """Load Kubernetes manifests and their categorized view from directory structure"""
+    return ManifestLoader(kubernetes_dir, cache_dir).load(environment)
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python3 k8s_manifests.py <kubernetes_dir> <environment>")
+        sys.exit(1)
+
+    loader = ManifestLoader(sys.argv[1])
+    manifests, resources = loader.load(sys.argv[2])
+    print(f"Found {len(manifests)} Kubernetes resources "
+          f"({loader.stats['parsed']} files parsed, {loader.stats['cached']} from cache)")
+    for category in CATEGORIES:
+        if resources[category]:
+            print(f"  {category}: {len(resources[category])}")
+
+
+if __name__ == "__main__":
+    main()
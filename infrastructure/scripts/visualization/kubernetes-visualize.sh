@@ -13,23 +13,24 @@ NC='\033[0m' # No Color
 
 # Logging functions
 log_info() {
-    echo -e "${BLUE}[INFO]${NC} $1"
+    echo -e "${BLUE}[INFO]${NC} $1" >&2
 }
 
 log_success() {
-    echo -e "${GREEN}[SUCCESS]${NC} $1"
+    echo -e "${GREEN}[SUCCESS]${NC} $1" >&2
 }
 
 log_warn() {
-    echo -e "${YELLOW}[WARN]${NC} $1"
+    echo -e "${YELLOW}[WARN]${NC} $1" >&2
 }
 
 log_error() {
-    echo -e "${RED}[ERROR]${NC} $1"
+    echo -e "${RED}[ERROR]${NC} $1" >&2
 }
 
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+source "${SCRIPT_DIR}/stage-timing.sh"
 OUTPUT_DIR="${SCRIPT_DIR}/../../docs/diagrams"
 KUBERNETES_DIR="${SCRIPT_DIR}/../../kubernetes"
 
@@ -145,6 +146,11 @@ check_prerequisites() {
 # Install Python dependencies
 setup_python_environment() {
     if [[ "$USE_DIAGRAMS_AS_CODE" == true ]]; then
+        if [[ -S "${ML_PLATFORM_VIZ_RENDER_SOCKET:-}" ]]; then
+            log_info "Using warm diagram render pool at $ML_PLATFORM_VIZ_RENDER_SOCKET"
+            return 0
+        fi
+        
         log_info "Setting up Python environment for diagrams-as-code..."
         
         # Check if diagrams library is installed
@@ -220,261 +226,14 @@ generate_diagrams_as_code() {
     # Create output directory
     mkdir -p "$OUTPUT_DIR"
     
-    # Create Python script for diagram generation
-    local python_script="${OUTPUT_DIR}/generate_k8s_diagram.py"
-    
-    cat > "$python_script" << 'EOF'
-#!/usr/bin/env python3
-"""
-Kubernetes Infrastructure Visualization using Diagrams-as-Code
-Generates architecture diagrams from Kubernetes manifests or live cluster data
-"""
-
-import os
-import sys
-import yaml
-import glob
-from pathlib import Path
-
-# Import diagrams library
-try:
-    from diagrams import Diagram, Node, Cluster, Edge
-    from diagrams.k8s.clusterconfig import Namespace
-    from diagrams.k8s.compute import Deployment, Pod, ReplicaSet, Job, CronJob
-    from diagrams.k8s.network import Service, Ingress
-    from diagrams.k8s.storage import PV, PVC, StorageClass
-    from diagrams.k8s.rbac import ServiceAccount, Role, RoleBinding
-    from diagrams.onprem.database import PostgreSQL
-    from diagrams.onprem.inmemory import Redis
-    from diagrams.onprem.storage import Minio
-    from diagrams.onprem.monitoring import Prometheus, Grafana
-    from diagrams.onprem.gitops import ArgoCD
-    from diagrams.programming.framework import FastAPI, React
-except ImportError as e:
-    print(f"Error importing diagrams library: {e}")
-    print("Install with: pip3 install diagrams")
-    sys.exit(1)
-
-def load_kubernetes_manifests(kubernetes_dir, environment):
-    """Load Kubernetes manifests from directory structure"""
-    manifests = []
-    
-    # Base manifests
-    base_dir = Path(kubernetes_dir) / "base"
-    if base_dir.exists():
-        for yaml_file in base_dir.rglob("*.yaml"):
-            try:
-                with open(yaml_file, 'r') as f:
-                    docs = yaml.safe_load_all(f)
-                    for doc in docs:
-                        if doc and 'kind' in doc:
-                            manifests.append(doc)
-            except Exception as e:
-                print(f"Warning: Could not parse {yaml_file}: {e}")
-    
-    # Environment-specific overlays
-    overlay_dir = Path(kubernetes_dir) / "overlays" / environment
-    if overlay_dir.exists():
-        for yaml_file in overlay_dir.rglob("*.yaml"):
-            try:
-                with open(yaml_file, 'r') as f:
-                    docs = yaml.safe_load_all(f)
-                    for doc in docs:
-                        if doc and 'kind' in doc:
-                            manifests.append(doc)
-            except Exception as e:
-                print(f"Warning: Could not parse {yaml_file}: {e}")
-    
-    return manifests
-
-def categorize_resources(manifests):
-    """Categorize Kubernetes resources by type"""
-    resources = {
-        'deployments': [],
-        'services': [],
-        'ingresses': [],
-        'pvcs': [],
-        'configmaps': [],
-        'secrets': [],
-        'jobs': [],
-        'cronjobs': [],
-        'serviceaccounts': [],
-        'namespaces': [],
-        'other': []
-    }
-    
-    for manifest in manifests:
-        kind = manifest.get('kind', '').lower()
-        if kind == 'deployment':
-            resources['deployments'].append(manifest)
-        elif kind == 'service':
-            resources['services'].append(manifest)
-        elif kind == 'ingress':
-            resources['ingresses'].append(manifest)
-        elif kind == 'persistentvolumeclaim':
-            resources['pvcs'].append(manifest)
-        elif kind == 'configmap':
-            resources['configmaps'].append(manifest)
-        elif kind == 'secret':
-            resources['secrets'].append(manifest)
-        elif kind == 'job':
-            resources['jobs'].append(manifest)
-        elif kind == 'cronjob':
-            resources['cronjobs'].append(manifest)
-        elif kind == 'serviceaccount':
-            resources['serviceaccounts'].append(manifest)
-        elif kind == 'namespace':
-            resources['namespaces'].append(manifest)
-        else:
-            resources['other'].append(manifest)
-    
-    return resources
-
-def generate_ml_platform_diagram(output_dir, environment, format_type):
-    """Generate ML Platform architecture diagram"""
-    output_file = f"kubernetes-{environment}-architecture"
-    
-    with Diagram(
-        f"ML Platform - {environment.title()} Environment",
-        filename=f"{output_dir}/{output_file}",
-        format=format_type,
-        show=False,
-        direction="TB"
-    ):
-        # External traffic
-        users = Node("Users", icon="diagrams.onprem.client.Users")
-        
-        # Ingress layer
-        with Cluster("Ingress"):
-            ingress = Ingress("NGINX Ingress")
-        
-        # Application layer
-        with Cluster("ML Platform Applications"):
-            frontend = React("Frontend\n(React)")
-            backend = FastAPI("Backend API\n(FastAPI)")
-            ml_service = Node("ML Service\n(Training/Inference)")
-        
-        # Data layer
-        with Cluster("Data Services"):
-            database = PostgreSQL("PostgreSQL\nDatabase")
-            cache = Redis("Redis\nCache")
-            storage = Minio("MinIO\nObject Storage")
-        
-        # Monitoring layer
-        with Cluster("Monitoring"):
-            prometheus = Prometheus("Prometheus\nMetrics")
-            grafana = Grafana("Grafana\nDashboards")
-        
-        # GitOps layer
-        with Cluster("GitOps"):
-            argocd = ArgoCD("ArgoCD\nDeployment")
-        
-        # Network connections
-        users >> ingress >> [frontend, backend]
-        backend >> [database, cache, storage]
-        ml_service >> [database, storage]
-        [frontend, backend, ml_service] >> prometheus
-        prometheus >> grafana
-        argocd >> [frontend, backend, ml_service]
-
-def generate_detailed_diagram(output_dir, environment, manifests, format_type):
-    """Generate detailed Kubernetes resource diagram"""
-    resources = categorize_resources(manifests)
-    output_file = f"kubernetes-{environment}-detailed"
-    
-    with Diagram(
-        f"Kubernetes Resources - {environment.title()}",
-        filename=f"{output_dir}/{output_file}",
-        format=format_type,
-        show=False,
-        direction="TB"
-    ):
-        # Group by namespace
-        namespaces = {}
-        
-        # Create namespace clusters
-        for ns in resources['namespaces']:
-            ns_name = ns['metadata']['name']
-            namespaces[ns_name] = Cluster(f"Namespace: {ns_name}")
-        
-        # Default namespace for resources without explicit namespace
-        if not namespaces:
-            namespaces['default'] = Cluster("Default Namespace")
-        
-        # Add deployments
-        deployments = {}
-        for deployment in resources['deployments']:
-            name = deployment['metadata']['name']
-            ns = deployment['metadata'].get('namespace', 'default')
-            
-            with namespaces.get(ns, namespaces['default']):
-                deployments[name] = Deployment(f"Deployment\n{name}")
-        
-        # Add services
-        services = {}
-        for service in resources['services']:
-            name = service['metadata']['name']
-            ns = service['metadata'].get('namespace', 'default')
-            
-            with namespaces.get(ns, namespaces['default']):
-                services[name] = Service(f"Service\n{name}")
-        
-        # Add PVCs
-        pvcs = {}
-        for pvc in resources['pvcs']:
-            name = pvc['metadata']['name']
-            ns = pvc['metadata'].get('namespace', 'default')
-            
-            with namespaces.get(ns, namespaces['default']):
-                pvcs[name] = PVC(f"PVC\n{name}")
-        
-        # Connect services to deployments (simplified)
-        for svc_name, svc_node in services.items():
-            for dep_name, dep_node in deployments.items():
-                if svc_name.startswith(dep_name) or dep_name.startswith(svc_name):
-                    svc_node >> dep_node
-
-def main():
-    if len(sys.argv) < 4:
-        print("Usage: python3 generate_k8s_diagram.py <kubernetes_dir> <environment> <output_dir> [format]")
-        sys.exit(1)
-    
-    kubernetes_dir = sys.argv[1]
-    environment = sys.argv[2]
-    output_dir = sys.argv[3]
-    format_type = sys.argv[4] if len(sys.argv) > 4 else "png"
-    
-    # Ensure output directory exists
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-    
-    print(f"Loading Kubernetes manifests from {kubernetes_dir}...")
-    manifests = load_kubernetes_manifests(kubernetes_dir, environment)
-    print(f"Found {len(manifests)} Kubernetes resources")
-    
-    # Generate ML Platform architecture diagram
-    print("Generating ML Platform architecture diagram...")
-    generate_ml_platform_diagram(output_dir, environment, format_type)
-    
-    # Generate detailed resource diagram
-    if manifests:
-        print("Generating detailed Kubernetes resource diagram...")
-        generate_detailed_diagram(output_dir, environment, manifests, format_type)
-    
-    print(f"Diagrams generated in {output_dir}/")
-
-if __name__ == "__main__":
-    main()
-EOF
-
-    # Make Python script executable
-    chmod +x "$python_script"
-    
-    # Run the Python script
+    # Rendered by k8s_diagrams.py; with a warm render pool listening (MCP server or
+    # `diagram_pool.py serve`) the job runs in an already-initialized worker
     log_info "Running diagrams-as-code generation..."
-    python3 "$python_script" "$KUBERNETES_DIR" "$ENVIRONMENT" "$OUTPUT_DIR" "$FORMAT"
-    
-    # Clean up the generated Python script
-    rm "$python_script"
+    python3 "${SCRIPT_DIR}/diagram_pool.py" render kubernetes \
+        kubernetes_dir="$KUBERNETES_DIR" \
+        environment="$ENVIRONMENT" \
+        output_dir="$OUTPUT_DIR" \
+        format="$FORMAT"
     
     # Return the generated file paths
     local generated_files=()
@@ -486,6 +245,7 @@ EOF
     
     if [ ${#generated_files[@]} -gt 0 ]; then
         log_success "Diagrams-as-code visualization generated"
+        record_output "${generated_files[@]}"
         printf '%s\n' "${generated_files[@]}"
     else
         log_error "Failed to generate diagrams-as-code visualization"
@@ -504,7 +264,7 @@ generate_kubectl_graph() {
     
     if [[ "$USE_LIVE_CLUSTER" == true ]]; then
         # Use live cluster data
-        kubectl graph all --namespace="$NAMESPACE" --output="$output_file"
+        kubectl graph all --namespace="$NAMESPACE" --output="$output_file" >&2
     else
         log_warn "kubectl-graph requires a live cluster, switching to manifest analysis"
         return 1
@@ -512,6 +272,7 @@ generate_kubectl_graph() {
     
     if [[ -f "$output_file" ]]; then
         log_success "kubectl-graph visualization generated: $output_file"
+        record_output "$output_file"
         echo "$output_file"
     else
         log_error "Failed to generate kubectl-graph visualization"
@@ -545,35 +306,20 @@ EOF
         echo "### Resource Count by Namespace" >> "$output_file"
         echo '```' >> "$output_file"
         
-        for ns in $(kubectl get namespaces -o jsonpath='{.items[*].metadata.name}' 2>/dev/null); do
-            local pod_count=$(kubectl get pods -n "$ns" --no-headers 2>/dev/null | wc -l)
-            local svc_count=$(kubectl get services -n "$ns" --no-headers 2>/dev/null | wc -l)
-            local dep_count=$(kubectl get deployments -n "$ns" --no-headers 2>/dev/null | wc -l)
-            echo "$ns: Pods($pod_count) Services($svc_count) Deployments($dep_count)" >> "$output_file"
-        done
+        # One cluster-wide list per resource type; KUBE_INVENTORY_SOURCE can point at
+        # an API server URL or a directory of recorded list responses instead of kubectl
+        python3 "${SCRIPT_DIR}/k8s_inventory.py" ${KUBE_INVENTORY_SOURCE:+--source "$KUBE_INVENTORY_SOURCE"} \
+            >> "$output_file" 2>/dev/null || echo "Unable to fetch resource counts" >> "$output_file"
         
         echo '```' >> "$output_file"
     else
         echo "### Configured Namespaces (from manifests)" >> "$output_file"
+        echo "" >> "$output_file"
         
-        # Analyze manifest files for namespaces
-        local namespaces=()
-        if [[ -d "${KUBERNETES_DIR}/base" ]]; then
-            namespaces+=($(grep -r "namespace:" "${KUBERNETES_DIR}/base" | grep -v "kustomization" | cut -d: -f3 | sort -u | sed 's/^ *//'))
-        fi
-        
-        if [[ -d "${KUBERNETES_DIR}/overlays/${ENVIRONMENT}" ]]; then
-            namespaces+=($(grep -r "namespace:" "${KUBERNETES_DIR}/overlays/${ENVIRONMENT}" | grep -v "kustomization" | cut -d: -f3 | sort -u | sed 's/^ *//'))
-        fi
-        
-        # Remove duplicates and sort
-        IFS=$'\n' sorted_namespaces=($(printf '%s\n' "${namespaces[@]}" | sort -u))
-        
-        echo '```' >> "$output_file"
-        for ns in "${sorted_namespaces[@]}"; do
-            echo "- $ns" >> "$output_file"
-        done
-        echo '```' >> "$output_file"
+        # Resolves the overlay's kustomizations (namespace overrides, generators, patches) plus
+        # team-apps and counts the rendered objects per namespace; each file is parsed once
+        python3 "${SCRIPT_DIR}/manifest_inventory.py" "$ENVIRONMENT" --kubernetes-dir "$KUBERNETES_DIR" \
+            --format markdown >> "$output_file" 2>/dev/null || echo "Unable to resolve manifests" >> "$output_file"
     fi
 
     cat >> "$output_file" << EOF
@@ -602,6 +348,7 @@ EOF
 EOF
 
     log_success "Namespace overview generated: $output_file"
+    record_output "$output_file"
     echo "$output_file"
 }
 
@@ -637,8 +384,8 @@ open_files() {
 main() {
     log_info "Starting Kubernetes visualization for environment: $ENVIRONMENT"
     
-    check_prerequisites
-    validate_kubernetes_access
+    run_stage prerequisites check_prerequisites
+    run_stage validate validate_kubernetes_access
     
     # Create output directory
     mkdir -p "$OUTPUT_DIR"
@@ -647,25 +394,25 @@ main() {
     
     # Set up tools based on selection
     if [[ "$USE_DIAGRAMS_AS_CODE" == true ]]; then
-        setup_python_environment
+        run_stage python_setup setup_python_environment
         
         log_info "Generating architecture diagrams using diagrams-as-code..."
-        if readarray -t diagram_files < <(generate_diagrams_as_code); then
+        if readarray -t diagram_files < <(run_stage diagrams_as_code generate_diagrams_as_code); then
             generated_files+=("${diagram_files[@]}")
         fi
     fi
     
     if [[ "$USE_KUBECTL_GRAPH" == true ]]; then
-        setup_kubectl_graph
+        run_stage kubectl_graph_setup setup_kubectl_graph
         
         log_info "Generating resource graph using kubectl-graph..."
-        if graph_file=$(generate_kubectl_graph); then
+        if graph_file=$(run_stage kubectl_graph generate_kubectl_graph); then
             generated_files+=("$graph_file")
         fi
     fi
     
     # Generate namespace overview
-    if overview_file=$(generate_namespace_overview); then
+    if overview_file=$(run_stage namespace_overview generate_namespace_overview); then
         generated_files+=("$overview_file")
     fi
     
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Static namespace and resource inventory from the Kubernetes manifests
+Resolves each environment the way kustomize would (resources, namespace overrides, generators
+and namespace patches) and counts the resulting objects per namespace. Every kustomization is
+built once and memoized, so a base shared by several overlays is only read a single time.
+"""
+
+import argparse
+import json
+import posixpath
+import re
+import sys
+from pathlib import Path
+
+import yaml
+
+from k8s_manifests import ManifestLoader, SafeLoader
+
+KUSTOMIZATION_FILES = ('kustomization.yaml', 'kustomization.yml', 'Kustomization')
+# Kinds that never carry a namespace; a kustomization's namespace leaves them alone
+CLUSTER_SCOPED_KINDS = frozenset({
+    'Namespace', 'Node', 'PersistentVolume', 'StorageClass', 'PriorityClass', 'RuntimeClass',
+    'ClusterRole', 'ClusterRoleBinding', 'CustomResourceDefinition', 'APIService', 'IngressClass',
+    'MutatingWebhookConfiguration', 'ValidatingWebhookConfiguration', 'PodSecurityPolicy',
+    'VolumeSnapshotClass', 'CSIDriver', 'ClusterIssuer', 'ClusterPolicy', 'ClusterSecretStore',
+})
+GENERATOR_KINDS = (('configMapGenerator', 'ConfigMap'), ('secretGenerator', 'Secret'))
+# Roots applied in every environment, next to overlays/<environment>
+SHARED_ROOTS = ('team-apps',)
+
+
+def object_ref(doc):
+    """(kind, name, namespace) of a manifest; namespace is None when cluster-scoped, '' when unset"""
+    kind = doc.get('kind', '')
+    metadata = doc.get('metadata') or {}
+    if kind in CLUSTER_SCOPED_KINDS:
+        return kind, metadata.get('name', ''), None
+    return kind, metadata.get('name', ''), metadata.get('namespace') or ''
+
+
+def is_remote(reference):
+    return '://' in reference or reference.startswith(('github.com/', 'git@', 'git::'))
+
+
+def target_matches(target, ref):
+    """Whether a patch target selects an object; names are anchored regexes as in kustomize"""
+    kind, name, namespace = ref
+    if target.get('kind') and target['kind'] != kind:
+        return False
+    if target.get('name') and not re.fullmatch(target['name'], name):
+        return False
+    if target.get('namespace') and target['namespace'] != namespace:
+        return False
+    return True
+
+
+class ManifestInventory:
+    """Objects each kustomization renders to, built lazily and memoized per directory"""
+
+    def __init__(self, kubernetes_dir, cache_dir=None, loader=None):
+        self.loader = loader or ManifestLoader(kubernetes_dir, cache_dir)
+        self.kubernetes_dir = self.loader.kubernetes_dir
+        # rel_dir -> tuple of (kind, name, namespace)
+        self._built = {}
+        # (referencing directory, reference, reason) for everything that could not be resolved
+        self.skipped = []
+        self.stats = {"kustomizations": 0, "reused": 0, "files": 0}
+
+    def build(self, rel_dir, _stack=()):
+        """Objects a directory renders to; plain directories contribute all their YAML files"""
+        rel_dir = posixpath.normpath(rel_dir)
+        if rel_dir in self._built:
+            self.stats['reused'] += 1
+            return self._built[rel_dir]
+        if rel_dir in _stack:
+            self.skipped.append((_stack[-1], rel_dir, "reference cycle"))
+            return ()
+
+        kustomization = self._kustomization(rel_dir)
+        if kustomization is None:
+            refs = self._directory_refs(rel_dir)
+        else:
+            self.stats['kustomizations'] += 1
+            refs = self._kustomize(rel_dir, kustomization, _stack + (rel_dir,))
+
+        self._built[rel_dir] = tuple(refs)
+        return self._built[rel_dir]
+
+    def environment(self, environment):
+        """Objects deployed in an environment: its overlay (base when it has none) plus the shared roots"""
+        overlay = f'overlays/{environment}'
+        roots = [overlay if (self.kubernetes_dir / overlay).is_dir() else 'base']
+        roots += [root for root in SHARED_ROOTS if (self.kubernetes_dir / root).is_dir()]
+
+        # The same object from two roots is still a single object in the cluster
+        refs = {}
+        for root in roots:
+            refs.update(dict.fromkeys(self.build(root)))
+        return list(refs)
+
+    def _kustomization(self, rel_dir):
+        for name in KUSTOMIZATION_FILES:
+            if (self.kubernetes_dir / rel_dir / name).is_file():
+                rel_path = posixpath.join(rel_dir, name)
+                # Kustomization files without a kind are valid too, so do not go through parse_documents
+                with open(self.kubernetes_dir / rel_path, 'r', encoding='utf-8') as f:
+                    self.stats['files'] += 1
+                    return yaml.load(f, Loader=SafeLoader) or {}
+        return None
+
+    def _file_refs(self, rel_dir, rel_path):
+        try:
+            docs = self.loader.documents(rel_path, self.loader.file_hash(rel_path))
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+            self.skipped.append((rel_dir, rel_path, str(e).splitlines()[0]))
+            return []
+        self.stats['files'] += 1
+        return [object_ref(doc) for doc in docs]
+
+    def _directory_refs(self, rel_dir):
+        refs = []
+        for path in sorted((self.kubernetes_dir / rel_dir).rglob('*.y*ml')):
+            if path.name not in KUSTOMIZATION_FILES:
+                refs.extend(self._file_refs(rel_dir, path.relative_to(self.kubernetes_dir).as_posix()))
+        return refs
+
+    def _kustomize(self, rel_dir, kustomization, stack):
+        refs = []
+        references = []
+        for field in ('resources', 'bases', 'components'):
+            references.extend(kustomization.get(field) or [])
+
+        for reference in references:
+            reference = str(reference)
+            if is_remote(reference):
+                self.skipped.append((rel_dir, reference, "remote reference"))
+                continue
+            rel_path = posixpath.normpath(posixpath.join(rel_dir, reference))
+            path = self.kubernetes_dir / rel_path
+            if rel_path.startswith('..'):
+                self.skipped.append((rel_dir, reference, "outside the kubernetes directory"))
+            elif path.is_dir():
+                # Memoized objects are shared: transformations below build new lists
+                refs.extend(self.build(rel_path, stack))
+            elif path.is_file():
+                refs.extend(self._file_refs(rel_dir, rel_path))
+            else:
+                self.skipped.append((rel_dir, reference, "not found"))
+
+        for field, kind in GENERATOR_KINDS:
+            for generator in kustomization.get(field) or []:
+                # merge and replace modify an object from the resources instead of adding one
+                if generator.get('behavior', 'create') == 'create':
+                    refs.append((kind, generator.get('name', ''), generator.get('namespace') or ''))
+
+        namespace = kustomization.get('namespace')
+        if namespace:
+            refs = [(kind, name, namespace if ns is not None else None) for kind, name, ns in refs]
+
+        for target, new_namespace in self._namespace_patches(rel_dir, kustomization):
+            refs = [
+                (kind, name, new_namespace) if ns is not None and target_matches(target, (kind, name, ns))
+                else (kind, name, ns)
+                for kind, name, ns in refs
+            ]
+        return refs
+
+    def _namespace_patches(self, rel_dir, kustomization):
+        """(target, namespace) for every JSON 6902 patch that sets /metadata/namespace"""
+        for patch in (kustomization.get('patches') or []) + (kustomization.get('patchesJson6902') or []):
+            if not isinstance(patch, dict) or not patch.get('target'):
+                continue
+            body = patch.get('patch')
+            if body is None and patch.get('path'):
+                try:
+                    with open(self.kubernetes_dir / rel_dir / patch['path'], 'r', encoding='utf-8') as f:
+                        body = f.read()
+                except OSError as e:
+                    self.skipped.append((rel_dir, patch['path'], str(e)))
+                    continue
+            operations = yaml.load(body or '', Loader=SafeLoader)
+            if not isinstance(operations, list):
+                continue  # strategic merge patch
+            for operation in operations:
+                if (isinstance(operation, dict) and operation.get('path') == '/metadata/namespace'
+                        and operation.get('op') in ('add', 'replace')):
+                    yield patch['target'], operation.get('value')
+
+
+def summarize(refs):
+    """Per-namespace counts by kind, plus cluster-scoped counts"""
+    namespaces = {}
+    cluster_scoped = {}
+    declared = set()
+
+    for kind, name, namespace in refs:
+        if namespace is None:
+            cluster_scoped[kind] = cluster_scoped.get(kind, 0) + 1
+            if kind == 'Namespace':
+                declared.add(name)
+            continue
+        kinds = namespaces.setdefault(namespace or 'default', {})
+        kinds[kind] = kinds.get(kind, 0) + 1
+
+    for name in declared:
+        namespaces.setdefault(name, {})
+
+    return {
+        "namespaces": {
+            namespace: {
+                "declared": namespace in declared,
+                "resources": sum(namespaces[namespace].values()),
+                "kinds": dict(sorted(namespaces[namespace].items())),
+            }
+            for namespace in sorted(namespaces)
+        },
+        "cluster_scoped": dict(sorted(cluster_scoped.items())),
+    }
+
+
+def format_markdown(summary):
+    """Namespace table followed by the cluster-scoped objects"""
+    lines = [
+        "| Namespace | Declared | Resources | Kinds |",
+        "|-----------|----------|-----------|-------|",
+    ]
+    for namespace, entry in summary['namespaces'].items():
+        kinds = ', '.join(f"{kind}({count})" for kind, count in entry['kinds'].items()) or '-'
+        lines.append(f"| {namespace} | {'yes' if entry['declared'] else 'no'} | {entry['resources']} | {kinds} |")
+
+    if summary['cluster_scoped']:
+        kinds = ', '.join(f"{kind}({count})" for kind, count in summary['cluster_scoped'].items())
+        lines += ["", f"Cluster-scoped: {kinds}"]
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-namespace resource inventory of the kustomize manifests")
+    parser.add_argument("environments", nargs='+', help="Environments to resolve (overlays/<environment>)")
+    parser.add_argument("--kubernetes-dir", default="infrastructure/kubernetes", help="Kubernetes manifests directory")
+    parser.add_argument("--format", choices=("json", "markdown"), default="json", help="Output format")
+    args = parser.parse_args()
+
+    if not Path(args.kubernetes_dir).is_dir():
+        print(f"Kubernetes directory not found: {args.kubernetes_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    inventory = ManifestInventory(args.kubernetes_dir)
+    try:
+        summaries = {environment: summarize(inventory.environment(environment)) for environment in args.environments}
+    except (OSError, yaml.YAMLError) as e:
+        print(f"Unable to resolve kustomizations: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for rel_dir, reference, reason in inventory.skipped:
+        print(f"Warning: skipped {reference} in {rel_dir}: {reason}", file=sys.stderr)
+
+    if args.format == 'markdown':
+        for environment, summary in summaries.items():
+            if len(summaries) > 1:
+                print(f"#### {environment}\n")
+            print(format_markdown(summary))
+            if len(summaries) > 1:
+                print()
+    else:
+        print(json.dumps({
+            "environments": summaries,
+            "stats": inventory.stats,
+            "skipped": [
+                {"from": rel_dir, "reference": reference, "reason": reason}
+                for rel_dir, reference, reason in inventory.skipped
+            ],
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,258 +4,465 @@ MCP Server wrapper for ML Platform infrastructure visualization
 Provides AI assistant access to our visualization tools through Model Context Protocol
 """
 
+import asyncio
 import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
 from pathlib import Path
 
+import dot_render
+from diagram_pool import SOCKET_ENV, DiagramRenderPool, serve_socket
+from file_index import FileIndex
+from mcp_tools import TOOLS
+from parallel_viz import DEFAULT_MAX_WORKERS, visualize_environments
+from render_cache import (
+    FULL_SUITE_INPUTS,
+    KUBERNETES_INPUTS,
+    TERRAFORM_INPUTS,
+    RenderCache,
+    expand_inputs,
+)
+from resource_reader import ResourceReadError, read_file_resource
+from script_progress import ScriptProgress
+from stage_metrics import StageMetrics, read_timings
+from tool_registry import RawJSON
+
+# orjson parses and serializes several times faster; fall back to the standard library without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+CACHE_HIT_NOTE = "♻️  Served from render cache (inputs unchanged since last render)\n\n"
+
+# Static, so serialized once instead of per resources/list
+RESOURCE_LISTING = RawJSON(json.dumps({
+    "resources": [
+        {
+            "uri": "file://terraform/environments",
+            "name": "Terraform Environments",
+            "description": "Terraform configuration files for all environments",
+            "mimeType": "text/directory"
+        },
+        {
+            "uri": "file://kubernetes/base",
+            "name": "Kubernetes Base Configurations",
+            "description": "Base Kubernetes manifests and Kustomize configurations",
+            "mimeType": "text/directory"
+        },
+        {
+            "uri": "file://docs/diagrams",
+            "name": "Generated Diagrams",
+            "description": "Previously generated infrastructure diagrams",
+            "mimeType": "text/directory"
+        },
+        {
+            "uri": "file://scripts/visualization",
+            "name": "Visualization Scripts",
+            "description": "Infrastructure visualization automation scripts",
+            "mimeType": "text/directory"
+        },
+        {
+            "uri": "cache://render/stats",
+            "name": "Render Cache Statistics",
+            "description": "Hit/miss counters and size of the visualization render cache",
+            "mimeType": "application/json"
+        },
+        {
+            "uri": "metrics://visualization",
+            "name": "Visualization Metrics",
+            "description": "Per-tool latency and per-stage script timings (start, end, duration, exit code)",
+            "mimeType": "application/json"
+        },
+        {
+            "uri": "metrics://visualization/prometheus",
+            "name": "Visualization Metrics (Prometheus)",
+            "description": "The same metrics in Prometheus text exposition format",
+            "mimeType": "text/plain; version=0.0.4"
+        }
+    ]
+}))
+
 
 class MLPlatformMCPServer:
-    def __init__(self):
+    def __init__(self, max_concurrent_tools=4):
         self.script_dir = Path(__file__).parent
         self.infrastructure_dir = self.script_dir.parent.parent
-
-    def handle_request(self, request):
-        """Handle MCP requests for infrastructure visualization"""
+        # Bounds how many visualization scripts run at once; cheap methods
+        # (tools/list, resources/*) never wait on this
+        self.max_concurrent_tools = max_concurrent_tools
+        self._tool_slots = None
+        self.render_cache = RenderCache()
+        # Shared by directory listings, output discovery and cache keys; with
+        # inotify available only changed directories are rescanned per refresh
+        self.file_index = FileIndex(self.infrastructure_dir, watch=True)
+        # Per-tool latency and per-stage script timings; optionally mirrored to a
+        # node_exporter textfile so the monitoring stack can scrape them
+        self.metrics = StageMetrics()
+        self.metrics_file = os.environ.get('ML_PLATFORM_VIZ_METRICS_FILE')
+        # HCL graph store, graph differ and rule analyzer are built on first use (see the
+        # properties below), keeping their parsers out of server start-up
+        self._graph_store = None
+        self._graph_differ = None
+        self._analyzer = None
+        # Declared tools; tools/list is served from its pre-serialized listing
+        self.tools = TOOLS
+        # JSON-RPC method -> handler(params, notify); plain handlers may return a coroutine
+        self.methods = {
+            'initialize': self.initialize,
+            'tools/list': self.list_tools,
+            'tools/call': self.call_tool,
+            'resources/list': self.list_resources,
+            'resources/read': self.read_resource,
+        }
+        # diagrams-as-code workers with the node modules imported; warmed after the
+        # handshake and shared with the scripts through a Unix socket
+        self.diagram_pool = DiagramRenderPool()
+        self._render_server = None
+        self._render_dir = None
+        self._render_lock = None
+
+    async def handle_request(self, request, notify=None):
+        """Handle MCP requests for infrastructure visualization
+
+        notify, when given, sends server-to-client notifications (tool progress).
+        """
         method = request.get('method')
         params = request.get('params', {})
 
-        if method == 'tools/list':
-            return self.list_tools()
-        elif method == 'tools/call':
-            return self.call_tool(params)
-        elif method == 'resources/list':
-            return self.list_resources()
-        elif method == 'resources/read':
-            return self.read_resource(params)
-        else:
-            return {"error": f"Unknown method: {method}"}
-
-    def list_tools(self):
-        """List available visualization tools"""
+        handler = self.methods.get(method)
+        if handler is None:
+            return {"error": f"Unknown method: {method}", "code": METHOD_NOT_FOUND}
+        result = handler(params, notify)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    @property
+    def graph_store(self):
+        """Module subgraphs parsed from HCL, keyed by content hash and shared by graph diffs and analysis"""
+        if self._graph_store is None:
+            from graph_store import GraphStore
+            self._graph_store = GraphStore(self.infrastructure_dir / "terraform", file_index=self.file_index)
+        return self._graph_store
+
+    @property
+    def graph_differ(self):
+        if self._graph_differ is None:
+            from graph_diff import GraphDiffer
+            self._graph_differ = GraphDiffer(self.infrastructure_dir / "terraform", self.graph_store)
+        return self._graph_differ
+
+    @property
+    def analyzer(self):
+        """Rule findings are kept per file and only re-checked when the file's hash changes"""
+        if self._analyzer is None:
+            from infra_analysis import InfrastructureAnalyzer
+            self._analyzer = InfrastructureAnalyzer(self.infrastructure_dir, self.file_index, self.graph_store)
+        return self._analyzer
+
+    def initialize(self, params, notify=None):
+        """Describe server capabilities for the MCP handshake"""
+        # Warm the diagram pool once the handshake response is out
+        asyncio.ensure_future(self.ensure_render_pool())
         return {
-            "tools": [
-                {
-                    "name": "visualize_terraform",
-                    "description": "Generate Terraform infrastructure visualizations using multiple tools (terraform graph, Rover, InfraMap)",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "environment": {
-                                "type": "string",
-                                "default": "local",
-                                "enum": ["local", "dev", "staging", "prod"],
-                                "description": "Target environment for visualization"
-                            },
-                            "format": {
-                                "type": "string",
-                                "default": "png",
-                                "enum": ["png", "svg", "pdf", "html"],
-                                "description": "Output format for diagrams"
-                            },
-                            "tool": {
-                                "type": "string",
-                                "enum": ["rover", "inframap", "graph"],
-                                "description": "Specific visualization tool to use"
-                            },
-                            "open_browser": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Open generated diagrams in browser"
-                            }
-                        }
-                    }
-                },
-                {
-                    "name": "visualize_kubernetes",
-                    "description": "Generate Kubernetes application visualizations using diagrams-as-code and kubectl integration",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "environment": {
-                                "type": "string",
-                                "default": "local",
-                                "enum": ["local", "dev", "staging", "prod"],
-                                "description": "Target environment for visualization"
-                            },
-                            "namespace": {
-                                "type": "string",
-                                "default": "ml-platform",
-                                "description": "Kubernetes namespace to focus on"
-                            },
-                            "format": {
-                                "type": "string",
-                                "default": "png",
-                                "enum": ["png", "svg", "pdf"],
-                                "description": "Output format for diagrams"
-                            },
-                            "use_live_cluster": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Use live cluster data instead of manifests"
-                            },
-                            "open_browser": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Open generated diagrams in browser"
-                            }
-                        }
-                    }
-                },
-                {
-                    "name": "visualize_full_infrastructure",
-                    "description": "Generate comprehensive infrastructure visualization suite combining Terraform and Kubernetes with unified documentation",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "environment": {
-                                "type": "string",
-                                "default": "local",
-                                "enum": ["local", "dev", "staging", "prod"],
-                                "description": "Target environment for visualization"
-                            },
-                            "format": {
-                                "type": "string",
-                                "default": "png",
-                                "enum": ["png", "svg", "pdf"],
-                                "description": "Output format for diagrams"
-                            },
-                            "open_browser": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Open visualization suite in browser"
-                            },
-                            "terraform_only": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Generate only Terraform visualizations"
-                            },
-                            "kubernetes_only": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Generate only Kubernetes visualizations"
-                            }
-                        }
-                    }
-                },
-                {
-                    "name": "analyze_infrastructure",
-                    "description": "Analyze infrastructure configuration and provide insights about architecture, dependencies, and potential improvements",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "environment": {
-                                "type": "string",
-                                "default": "local",
-                                "enum": ["local", "dev", "staging", "prod"],
-                                "description": "Environment to analyze"
-                            },
-                            "focus_area": {
-                                "type": "string",
-                                "enum": ["security", "performance", "cost", "reliability", "all"],
-                                "default": "all",
-                                "description": "Specific area to focus analysis on"
-                            }
-                        }
-                    }
-                }
-            ]
+            "protocolVersion": "2024-11-05",
+            "capabilities": {
+                "tools": {},
+                "resources": {}
+            },
+            "serverInfo": {
+                "name": "ml-platform-infrastructure-viz",
+                "version": "1.0.0"
+            }
         }
 
-    def list_resources(self):
+    def list_tools(self, params=None, notify=None):
+        """List available visualization tools (serialized once, see mcp_tools.py)"""
+        return self.tools.listing()
+
+    def list_resources(self, params=None, notify=None):
         """List available infrastructure resources"""
-        return {
-            "resources": [
-                {
-                    "uri": "file://terraform/environments",
-                    "name": "Terraform Environments",
-                    "description": "Terraform configuration files for all environments",
-                    "mimeType": "text/directory"
-                },
-                {
-                    "uri": "file://kubernetes/base",
-                    "name": "Kubernetes Base Configurations",
-                    "description": "Base Kubernetes manifests and Kustomize configurations",
-                    "mimeType": "text/directory"
-                },
-                {
-                    "uri": "file://docs/diagrams",
-                    "name": "Generated Diagrams",
-                    "description": "Previously generated infrastructure diagrams",
-                    "mimeType": "text/directory"
-                },
-                {
-                    "uri": "file://scripts/visualization",
-                    "name": "Visualization Scripts",
-                    "description": "Infrastructure visualization automation scripts",
-                    "mimeType": "text/directory"
-                }
-            ]
-        }
+        return RESOURCE_LISTING
 
-    def read_resource(self, params):
+    async def read_resource(self, params, notify=None):
         """Read infrastructure resource content"""
         uri = params.get('uri', '')
 
-        if uri.startswith('file://'):
-            file_path = self.infrastructure_dir / uri[7:]  # Remove 'file://' prefix
-
-            try:
-                if file_path.is_file():
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    return {
-                        "contents": [
-                            {
-                                "uri": uri,
-                                "mimeType": "text/plain",
-                                "text": content
-                            }
-                        ]
+        if uri == 'cache://render/stats':
+            return {
+                "contents": [
+                    {
+                        "uri": uri,
+                        "mimeType": "application/json",
+                        "text": json.dumps(self.render_cache.get_stats(), indent=2)
                     }
-                elif file_path.is_dir():
-                    # List directory contents
-                    files = []
-                    for item in file_path.iterdir():
-                        files.append(f"{'📁' if item.is_dir() else '📄'} {item.name}")
-
-                    return {
-                        "contents": [
-                            {
-                                "uri": uri,
-                                "mimeType": "text/plain",
-                                "text": f"Directory listing for {file_path}:\n\n" + "\n".join(files)
-                            }
-                        ]
+                ]
+            }
+        elif uri == 'metrics://visualization':
+            return {
+                "contents": [
+                    {
+                        "uri": uri,
+                        "mimeType": "application/json",
+                        "text": json.dumps(self.metrics.snapshot(), indent=2)
                     }
-                else:
-                    return {"error": f"Resource not found: {file_path}"}
-
-            except Exception as e:
-                return {"error": f"Failed to read resource: {str(e)}"}
+                ]
+            }
+        elif uri == 'metrics://visualization/prometheus':
+            return {
+                "contents": [
+                    {
+                        "uri": uri,
+                        "mimeType": "text/plain; version=0.0.4",
+                        "text": self.metrics.prometheus()
+                    }
+                ]
+            }
+        elif uri.startswith('file://'):
+            # stat, paged reads and index refreshes stay off the event loop, so a batch
+            # of reads proceeds concurrently and running tools keep reporting progress
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.read_file_uri, uri, params)
         else:
             return {"error": f"Unsupported URI scheme: {uri}"}
 
-    def call_tool(self, params):
+    def read_file_uri(self, uri, params):
+        """resources/read result for a file:// URI; blocking, run in an executor"""
+        file_path = self.infrastructure_dir / uri[7:]  # Remove 'file://' prefix
+
+        try:
+            try:
+                rel_path = file_path.resolve().relative_to(self.file_index.root).as_posix()
+            except ValueError:
+                return {"error": f"Resource outside the infrastructure directory: {uri}", "code": INVALID_PARAMS}
+
+            if file_path.is_file():
+                # Paged by offset/length; unchanged files short-circuit on ifNoneMatch/ifModifiedSince
+                return {
+                    "contents": [
+                        read_file_resource(file_path, uri, params, self.file_index.entry(rel_path))
+                    ]
+                }
+            elif file_path.is_dir():
+                # List directory contents from the index
+                self.file_index.refresh()
+                files = []
+                for name, is_dir in self.file_index.listdir('' if rel_path == '.' else rel_path):
+                    files.append(f"{'📁' if is_dir else '📄'} {name}")
+
+                return {
+                    "contents": [
+                        {
+                            "uri": uri,
+                            "mimeType": "text/plain",
+                            "text": f"Directory listing for {file_path}:\n\n" + "\n".join(files)
+                        }
+                    ]
+                }
+            else:
+                return {"error": f"Resource not found: {file_path}"}
+
+        except ResourceReadError as e:
+            return {"error": str(e), "code": INVALID_PARAMS}
+        except Exception as e:
+            return {"error": f"Failed to read resource: {str(e)}"}
+
+    async def ensure_render_pool(self):
+        """Start the warm diagram pool and its socket once
+
+        Scripts started afterwards inherit the socket path through the
+        environment, so their diagrams-as-code jobs skip interpreter start-up
+        and the diagrams imports.
+        """
+        if self._render_lock is None:
+            self._render_lock = asyncio.Lock()
+        async with self._render_lock:
+            if self._render_server is None:
+                loop = asyncio.get_running_loop()
+                try:
+                    await loop.run_in_executor(None, self.diagram_pool.start)
+                    self._render_dir = Path(tempfile.mkdtemp(prefix='viz-render-'))
+                    socket_path = self._render_dir / 'render.sock'
+                    self._render_server = await serve_socket(self.diagram_pool, socket_path)
+                except (OSError, AttributeError) as e:
+                    # Scripts fall back to rendering in their own interpreter
+                    print(f"Diagram render pool unavailable: {e}", file=sys.stderr)
+                    return
+                os.environ[SOCKET_ENV] = str(socket_path)
+
+    async def render_diagram(self, spec):
+        """Render one diagrams-as-code spec on a warm worker"""
+        await self.ensure_render_pool()
+        return await self.diagram_pool.render(spec)
+
+    def close(self):
+        """Stop the render pool and remove its socket"""
+        if self._render_server is not None:
+            self._render_server.close()
+            self._render_server = None
+            os.environ.pop(SOCKET_ENV, None)
+        self.diagram_pool.close()
+        if self._render_dir is not None:
+            shutil.rmtree(self._render_dir, ignore_errors=True)
+            self._render_dir = None
+
+    async def call_tool(self, params, notify=None):
         """Execute visualization tools"""
         tool_name = params.get('name')
         arguments = params.get('arguments', {})
+        progress_token = (params.get('_meta') or {}).get('progressToken')
+        progress = ScriptProgress(notify, progress_token, self.infrastructure_dir)
+
+        if self._tool_slots is None:
+            self._tool_slots = asyncio.Semaphore(self.max_concurrent_tools)
 
+        if tool_name not in self.tools:
+            return {"error": f"Unknown tool: {tool_name}"}
+
+        started = time.monotonic()
         try:
-            if tool_name == 'visualize_terraform':
-                return self.run_terraform_viz(arguments)
-            elif tool_name == 'visualize_kubernetes':
-                return self.run_kubernetes_viz(arguments)
-            elif tool_name == 'visualize_full_infrastructure':
-                return self.run_full_viz(arguments)
-            elif tool_name == 'analyze_infrastructure':
-                return self.analyze_infrastructure(arguments)
-            else:
-                return {"error": f"Unknown tool: {tool_name}"}
+            # Plugin tools are imported here on their first call
+            handler = self.tools.resolve(tool_name, self)
+            async with self._tool_slots:
+                result = await handler(arguments, progress)
+        except ImportError as e:
+            result = {"error": f"Tool plugin for {tool_name} failed to load: {str(e)}"}
         except Exception as e:
-            return {"error": f"Tool execution failed: {str(e)}"}
+            result = {"error": f"Tool execution failed: {str(e)}"}
+
+        self.record_tool_metrics(tool_name, time.monotonic() - started, 'error' not in result)
+        return result
+
+    def record_tool_metrics(self, tool_name, duration, ok):
+        self.metrics.record_tool(tool_name, duration, ok)
+        if self.metrics_file:
+            try:
+                self.metrics.write_textfile(self.metrics_file)
+            except OSError:
+                pass
+
+    async def run_script(self, cmd, progress=None):
+        """Run a visualization script without blocking the event loop
+
+        Output is consumed line by line: stage markers and generated files are
+        reported through progress as they appear, and only a bounded tail of
+        each stream is kept for the final result.
+        """
+        if progress is None:
+            progress = ScriptProgress(base_dir=self.infrastructure_dir)
+
+        # Scripts append one JSON line per stage (stage-timing.sh) to this file,
+        # and the path of every file they generate to the outputs file
+        timing_fd, timing_file = tempfile.mkstemp(prefix='viz-timing-', suffix='.jsonl')
+        os.close(timing_fd)
+        outputs_fd, outputs_file = tempfile.mkstemp(prefix='viz-outputs-', suffix='.txt')
+        os.close(outputs_fd)
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.infrastructure_dir,
+            env=dict(os.environ, VIZ_TIMING_FILE=timing_file, VIZ_OUTPUTS_FILE=outputs_file)
+        )
+
+        async def pump(stream, feed):
+            while True:
+                line = await stream.readline()
+                if not line:
+                    break
+                feed(line.decode('utf-8', errors='replace'))
+
+        await asyncio.gather(
+            pump(process.stdout, progress.feed_stdout),
+            pump(process.stderr, progress.feed_stderr)
+        )
+        returncode = await process.wait()
+
+        self.metrics.record_stages(read_timings(timing_file))
+        os.unlink(timing_file)
+        with open(outputs_file, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if line.strip():
+                    progress.add_output(line.strip())
+        os.unlink(outputs_file)
+        return subprocess.CompletedProcess(cmd, returncode, progress.stdout.text(), progress.stderr.text())
+
+    async def run_cached_script(self, tool_name, args, cmd, input_patterns, progress=None):
+        """Run a visualization script unless the render cache already holds its output
+
+        Returns the (possibly replayed) script result and whether it was a cache hit.
+        """
+        if not args.get('use_cache', True) or args.get('use_live_cluster', False):
+            return await self.run_script(cmd, progress), False
+
+        if progress is None:
+            progress = ScriptProgress(base_dir=self.infrastructure_dir)
+
+        loop = asyncio.get_running_loop()
+        input_digest = await loop.run_in_executor(None, self.input_digest, input_patterns)
+        key = self.render_cache.make_key(tool_name, args, input_digest)
+
+        entry = await loop.run_in_executor(None, self.render_cache.get, key, self.infrastructure_dir)
+        if entry is not None:
+            progress.report("served from render cache")
+            for item in entry['files']:
+                progress.add_file(item['path'])
+            return subprocess.CompletedProcess(cmd, 0, entry['stdout'], entry['stderr']), True
+
+        result = await self.run_script(cmd, progress)
+        if result.returncode == 0:
+            # Only the files this run declared: tool runs overlap, so anything else
+            # under docs/diagrams may belong to another one
+            outputs = [path for path in progress.outputs if not Path(path).is_absolute()]
+            await loop.run_in_executor(
+                None, self.render_cache.put, key, self.infrastructure_dir, outputs,
+                result.stdout, result.stderr, tool_name
+            )
+        return result, False
+
+    def script_report(self, header, generated_files, result, cache_hit):
+        """Tool result text for a script run: header, generated files, output and warnings"""
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"{header}"
+                            f"{CACHE_HIT_NOTE if cache_hit else ''}"
+                            f"✅ Generated files:\n" + "\n".join(f"  📊 {f}" for f in generated_files) + "\n\n"
+                            f"📝 Output:\n{result.stdout}\n\n"
+                            f"⚠️  Warnings/Errors:\n{result.stderr if result.stderr else 'None'}"
+                }
+            ]
+        }
+
+    def input_digest(self, input_patterns):
+        """Content hash of the visualization inputs, from the file index"""
+        self.file_index.refresh()
+        return self.file_index.digest(input_patterns)
+
+    def list_diagrams(self, prefix):
+        """Top-level generated diagrams whose name starts with prefix"""
+        self.file_index.refresh()
+        return [
+            f"docs/diagrams/{name}" for name, is_dir in self.file_index.listdir('docs/diagrams')
+            if not is_dir and name.startswith(prefix)
+        ]
 
-    def run_terraform_viz(self, args):
+    async def run_terraform_viz(self, args, progress=None):
         """Run Terraform visualization"""
         cmd = [
             str(self.script_dir / "terraform-visualize.sh"),
@@ -271,29 +478,68 @@ class MLPlatformMCPServer:
         if args.get('open_browser', False):
             cmd.append('-o')
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.infrastructure_dir)
+        if args.get('static', False):
+            cmd.append('--static')
+
+        inputs = expand_inputs(TERRAFORM_INPUTS, environment=args.get('environment', 'local'))
+        result, cache_hit = await self.run_cached_script('visualize_terraform', args, cmd, inputs, progress)
 
         # Find generated files
+        generated_files = self.list_diagrams("terraform-")
+
+        return self.script_report(
+            f"🔧 Terraform visualization completed for {args.get('environment', 'local')} environment\n\n",
+            generated_files, result, cache_hit
+        )
+
+    async def run_terraform_diff(self, args):
+        """Diff two Terraform graphs and render the changed neighbourhood"""
+        from graph_diff import format_summary, write_diff_dot
+        left = args.get('left')
+        right = args.get('right')
+        if not left or not right:
+            return {"error": "Both 'left' and 'right' are required"}
+        format_type = args.get('format', 'svg')
+        context = args.get('context', 1)
+
+        loop = asyncio.get_running_loop()
+        graph_differ = self.graph_differ
+        old, new, diff = await loop.run_in_executor(None, graph_differ.diff, left, right)
+
+        slug = '-vs-'.join(re.sub(r'[^A-Za-z0-9._-]+', '_', side) for side in (left, right))
         diagrams_dir = self.infrastructure_dir / "docs" / "diagrams"
-        generated_files = []
-        if diagrams_dir.exists():
-            for file in diagrams_dir.glob("terraform-*"):
-                generated_files.append(str(file.relative_to(self.infrastructure_dir)))
+        diagrams_dir.mkdir(parents=True, exist_ok=True)
+        dot_file = diagrams_dir / f"terraform-diff-{slug}.dot"
+        with open(dot_file, 'w', encoding='utf-8') as f:
+            node_count, edge_count = write_diff_dot(old, new, diff, f, context)
+
+        generated_files = [dot_file]
+        render_note = ''
+        if format_type != 'dot' and node_count:
+            output_file = dot_file.with_suffix(f'.{format_type}')
+            try:
+                await loop.run_in_executor(None, dot_render.render, dot_file, [(format_type, output_file)])
+                generated_files.append(output_file)
+            except (OSError, subprocess.CalledProcessError) as e:
+                render_note = f"⚠️  Rendering {format_type} failed ({e}); the DOT file is still available\n\n"
 
         return {
             "content": [
                 {
                     "type": "text",
-                    "text": f"🔧 Terraform visualization completed for {args.get('environment', 'local')} environment\n\n"
-                            f"✅ Generated files:\n" + "\n".join(f"  📊 {f}" for f in generated_files) + "\n\n"
-                                                                                                       f"📝 Output:\n{result.stdout}\n\n"
-                                                                                                       f"⚠️  Warnings/Errors:\n{result.stderr if result.stderr else 'None'}"
+                    "text": f"🔀 Terraform graph diff: {left} → {right}\n\n"
+                            f"{render_note}"
+                            f"🧭 Changed neighbourhood: {node_count} nodes, {edge_count} edges\n"
+                            f"✅ Generated files:\n" + "\n".join(
+                                f"  📊 {path.relative_to(self.infrastructure_dir)}" for path in generated_files
+                            ) + "\n\n" + format_summary(left, right, diff)
                 }
             ]
         }
 
-    def run_kubernetes_viz(self, args):
+    async def run_kubernetes_viz(self, args, progress=None):
         """Run Kubernetes visualization"""
+        await self.ensure_render_pool()
         cmd = [
             str(self.script_dir / "kubernetes-visualize.sh"),
             "-e", args.get('environment', 'local'),
@@ -307,30 +553,25 @@ class MLPlatformMCPServer:
         if args.get('open_browser', False):
             cmd.append('-o')
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.infrastructure_dir)
+        result, cache_hit = await self.run_cached_script('visualize_kubernetes', args, cmd, KUBERNETES_INPUTS,
+                                                         progress)
 
         # Find generated files
-        diagrams_dir = self.infrastructure_dir / "docs" / "diagrams"
-        generated_files = []
-        if diagrams_dir.exists():
-            for file in diagrams_dir.glob("kubernetes-*"):
-                generated_files.append(str(file.relative_to(self.infrastructure_dir)))
+        generated_files = self.list_diagrams("kubernetes-")
 
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": f"🚀 Kubernetes visualization completed for {args.get('environment', 'local')} environment\n\n"
-                            f"📦 Namespace: {args.get('namespace', 'ml-platform')}\n"
-                            f"✅ Generated files:\n" + "\n".join(f"  📊 {f}" for f in generated_files) + "\n\n"
-                                                                                                       f"📝 Output:\n{result.stdout}\n\n"
-                                                                                                       f"⚠️  Warnings/Errors:\n{result.stderr if result.stderr else 'None'}"
-                }
-            ]
-        }
+        return self.script_report(
+            f"🚀 Kubernetes visualization completed for {args.get('environment', 'local')} environment\n\n"
+            f"📦 Namespace: {args.get('namespace', 'ml-platform')}\n",
+            generated_files, result, cache_hit
+        )
 
-    def run_full_viz(self, args):
+    async def run_full_viz(self, args, progress=None):
         """Run full infrastructure visualization suite"""
+        if not args.get('terraform_only', False):
+            await self.ensure_render_pool()
+        if args.get('environments'):
+            return await self.run_parallel_viz(args)
+
         cmd = [
             str(self.script_dir / "visualize-infrastructure.sh"),
             "-e", args.get('environment', 'local'),
@@ -345,19 +586,23 @@ class MLPlatformMCPServer:
         elif args.get('kubernetes_only', False):
             cmd.append('--kubernetes-only')
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.infrastructure_dir)
+        inputs = expand_inputs(FULL_SUITE_INPUTS, environment=args.get('environment', 'local'))
+        result, cache_hit = await self.run_cached_script('visualize_full_infrastructure', args, cmd, inputs,
+                                                         progress)
 
         # Count generated files
-        diagrams_dir = self.infrastructure_dir / "docs" / "diagrams"
-        file_count = 0
-        if diagrams_dir.exists():
-            file_count = len(list(diagrams_dir.rglob("*.*")))
+        self.file_index.refresh()
+        file_count = sum(
+            1 for rel_path, _ in self.file_index.files_under('docs/diagrams')
+            if '.' in rel_path.rsplit('/', 1)[-1]
+        )
 
         return {
             "content": [
                 {
                     "type": "text",
                     "text": f"🏗️ Complete infrastructure visualization suite generated!\n\n"
+                            f"{CACHE_HIT_NOTE if cache_hit else ''}"
                             f"📊 Environment: {args.get('environment', 'local')}\n"
                             f"📁 Total files generated: {file_count}\n"
                             f"🌐 Navigation: docs/diagrams/index.html\n\n"
@@ -372,175 +617,211 @@ class MLPlatformMCPServer:
             ]
         }
 
-    def analyze_infrastructure(self, args):
-        """Analyze infrastructure and provide insights"""
-        environment = args.get('environment', 'local')
-        focus_area = args.get('focus_area', 'all')
-
-        # This would typically integrate with actual analysis tools
-        # For now, provide a structured analysis framework
-
-        analysis = f"""🔍 Infrastructure Analysis Report - {environment.title()} Environment
-
-📊 **Focus Area:** {focus_area.title()}
-📅 **Generated:** {subprocess.run(['date'], capture_output=True, text=True).stdout.strip()}
-
-## 🏗️ Architecture Overview
-
-### Two-Layer Design
-✅ **Layer 1 (Terraform):** Infrastructure foundations
-✅ **Layer 2 (Kubernetes):** Application deployments
-
-### Environment Characteristics
-"""
-
-        if environment == 'local':
-            analysis += """
-- **Type:** Development (Kind cluster)
-- **Scale:** Single node
-- **Storage:** Local volumes
-- **Network:** Host networking
-- **Security:** Basic RBAC
-"""
-        else:
-            analysis += f"""
-- **Type:** Cloud ({environment})
-- **Scale:** Multi-node EKS
-- **Storage:** AWS EBS/EFS
-- **Network:** VPC with subnets
-- **Security:** Enterprise-grade
-"""
+    async def run_parallel_viz(self, args):
+        """Render several environments with their stages fanned out across a worker pool"""
+        stages = ('terraform', 'kubernetes')
+        if args.get('terraform_only', False):
+            stages = ('terraform',)
+        elif args.get('kubernetes_only', False):
+            stages = ('kubernetes',)
+
+        summary = await visualize_environments(
+            args['environments'],
+            self.infrastructure_dir / "docs" / "diagrams",
+            args.get('format', 'png'),
+            stages,
+            args.get('max_workers', DEFAULT_MAX_WORKERS)
+        )
+
+        lines = []
+        for result in summary['results']:
+            status = "✅" if result['returncode'] == 0 else "❌"
+            output_dir = Path(result['output_dir']).relative_to(self.infrastructure_dir)
+            lines.append(f"  {status} {result['environment']} / {result['stage']}: "
+                         f"{result['duration']:.1f}s → {output_dir}")
+            if result['returncode'] != 0:
+                lines.extend(f"      {line}" for line in result['output_tail'][-10:])
 
-        if focus_area in ['security', 'all']:
-            analysis += """
-## 🔒 Security Analysis
-
-### Strengths
-✅ Network policies implemented
-✅ RBAC configured
-✅ Pod security standards
-✅ Secret management
-
-### Recommendations
-🔧 Enable admission controllers
-🔧 Implement OPA policies
-🔧 Add runtime security scanning
-🔧 Regular security audits
-"""
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"🏗️ Parallel infrastructure visualization completed!\n\n"
+                            f"📊 Environments: {', '.join(summary['environments'])}\n"
+                            f"⚙️  Workers: {summary['max_workers']}\n"
+                            f"⏱️  Wall time: {summary['wall_time']:.1f}s "
+                            f"(sequential stage time: {summary['stage_time']:.1f}s)\n\n"
+                            f"📋 Stages:\n" + "\n".join(lines) + "\n\n"
+                            f"🌐 Navigation: docs/diagrams/<env>/index.html"
+                }
+            ]
+        }
 
-        if focus_area in ['performance', 'all']:
-            analysis += """
-## ⚡ Performance Analysis
+    async def analyze_infrastructure(self, args):
+        """Analyze infrastructure against the rule index and report findings"""
+        from infra_analysis import format_report
+        environment = args.get('environment', 'local')
+        focus_area = args.get('focus_area', 'all')
 
-### Resource Allocation
-- CPU requests/limits configured
-- Memory management in place
-- Storage provisioning automated
+        loop = asyncio.get_running_loop()
+        analyzer = self.analyzer
+        report = await loop.run_in_executor(None, analyzer.analyze, environment)
 
-### Optimization Opportunities
-🚀 Implement HPA for auto-scaling
-🚀 Add resource quotas per namespace
-🚀 Configure node affinity rules
-🚀 Optimize container images
-"""
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": format_report(report, focus_area)
+                }
+            ]
+        }
 
-        if focus_area in ['reliability', 'all']:
-            analysis += """
-## 🛡️ Reliability Analysis
 
-### High Availability
-- Multi-AZ deployment (cloud environments)
-- Replicated data stores
-- Load balancing configured
+def make_response(request_id, result):
+    """Wrap a handler result in a JSON-RPC 2.0 envelope carrying the request id"""
+    if isinstance(result, RawJSON):
+        # Pre-serialized result: splice it in instead of encoding it again
+        return RawJSON(f'{{"jsonrpc": "2.0", "id": {json.dumps(request_id)}, "result": {result}}}')
+    if isinstance(result, dict) and isinstance(result.get('error'), str):
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {
+                "code": result.get('code', INTERNAL_ERROR),
+                "message": result['error']
+            }
+        }
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
 
-### Disaster Recovery
-📋 Backup strategies needed
-📋 Recovery procedures documented
-📋 RTO/RPO targets defined
-"""
 
-        if focus_area in ['cost', 'all']:
-            analysis += """
-## 💰 Cost Analysis
+def decode_message(line):
+    """Parse one input line: a request, or a JSON-RPC batch array of requests"""
+    if orjson is not None:
+        return orjson.loads(line)  # orjson.JSONDecodeError is a ValueError
+    return json.loads(line)
 
-### Resource Utilization
-- Monitor unused resources
-- Right-size instances
-- Implement spot instances where appropriate
 
-### Cost Optimization
-💡 Use reserved instances for predictable workloads
-💡 Implement resource lifecycle policies
-💡 Monitor and alert on cost spikes
-"""
+def encode_message(message):
+    """Serialize one outgoing message; pre-serialized results pass through as they are"""
+    if isinstance(message, RawJSON):
+        return message
+    if orjson is not None:
+        try:
+            return orjson.dumps(message).decode('utf-8')
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which the standard encoder handles
+    return json.dumps(message)
+
+
+def error_message(request_id, code, message):
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class MessageWriter:
+    """Buffers outgoing messages and writes them out once per event loop pass
+
+    Responses and progress notifications produced in the same pass (a burst
+    of resources/read calls finishing together, a batch) share a single
+    write and flush instead of paying for one each.
+    """
+
+    def __init__(self, stream, loop):
+        self.stream = stream
+        self.loop = loop
+        self._pending = []
+        self._scheduled = False
+
+    def write(self, message):
+        self._pending.append(encode_message(message))
+        if not self._scheduled:
+            self._scheduled = True
+            self.loop.call_soon(self.flush)
+
+    def flush(self):
+        self._scheduled = False
+        if self._pending:
+            data = "\n".join(self._pending) + "\n"
+            self._pending.clear()
+            self.stream.write(data)
+            self.stream.flush()
+
+
+async def serve(server, stdin=sys.stdin, stdout=sys.stdout):
+    """Read requests from stdin and handle them concurrently
+
+    Each request runs in its own task, so a long visualization does not
+    hold back tools/list or resources/read from other clients. Responses
+    are written as soon as they are ready and matched by JSON-RPC id;
+    progress notifications for a tool call are interleaved as they occur.
+    A batch array is answered with one array once all of its requests are
+    done; its members are independent and run concurrently.
+    """
+    loop = asyncio.get_running_loop()
+    writer = MessageWriter(stdout, loop)
+    in_flight = set()
+
+    async def handle(request):
+        """The response to one request, or None for a notification"""
+        if not isinstance(request, dict):
+            return error_message(None, INVALID_REQUEST, "Invalid Request: expected a JSON object")
+        try:
+            result = await server.handle_request(request, writer.write)
+        except Exception as e:
+            result = {"error": f"Server error: {str(e)}"}
+        # Notifications carry no id and expect no response
+        if 'id' in request:
+            return make_response(request.get('id'), result)
+        return None
+
+    async def dispatch(message):
+        if not isinstance(message, list):
+            response = await handle(message)
+            if response is not None:
+                writer.write(response)
+            return
+
+        if not message:
+            writer.write(error_message(None, INVALID_REQUEST, "Invalid Request: empty batch"))
+            return
+        responses = [response for response in await asyncio.gather(*map(handle, message)) if response is not None]
+        # A batch of notifications only gets no reply at all
+        if responses:
+            writer.write(RawJSON("[" + ",".join(map(encode_message, responses)) + "]"))
 
-        analysis += """
-## 📈 Next Steps
+    while True:
+        line = await loop.run_in_executor(None, stdin.readline)
+        if not line:
+            break
+        line = line.strip()
+        if not line:
+            continue
 
-1. **Generate Current Diagrams:** Run visualization suite
-2. **Review Configurations:** Check against best practices
-3. **Implement Recommendations:** Prioritize by impact/effort
-4. **Monitor Progress:** Set up tracking for improvements
+        try:
+            message = decode_message(line)
+        except ValueError as e:
+            writer.write(error_message(None, PARSE_ERROR, f"Parse error: {str(e)}"))
+            continue
 
----
-**Generated by ML Platform Infrastructure Analysis**
-"""
+        task = asyncio.ensure_future(dispatch(message))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
 
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": analysis
-                }
-            ]
-        }
+    # Let in-flight requests finish before exiting on EOF
+    if in_flight:
+        await asyncio.gather(*in_flight, return_exceptions=True)
+    writer.flush()
 
 
 def main():
     """Main MCP server loop"""
     server = MLPlatformMCPServer()
 
-    # Handle initialize request
     try:
-        line = sys.stdin.readline()
-        if line:
-            request = json.loads(line.strip())
-            if request.get('method') == 'initialize':
-                response = {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {},
-                        "resources": {}
-                    },
-                    "serverInfo": {
-                        "name": "ml-platform-infrastructure-viz",
-                        "version": "1.0.0"
-                    }
-                }
-                print(json.dumps(response))
-                sys.stdout.flush()
-    except:
+        asyncio.run(serve(server))
+    except KeyboardInterrupt:
         pass
-
-    # Main request loop
-    while True:
-        try:
-            line = sys.stdin.readline()
-            if not line:
-                break
-
-            request = json.loads(line.strip())
-            response = server.handle_request(request)
-
-            print(json.dumps(response))
-            sys.stdout.flush()
-
-        except KeyboardInterrupt:
-            break
-        except Exception as e:
-            error_response = {"error": f"Server error: {str(e)}"}
-            print(json.dumps(error_response))
-            sys.stdout.flush()
+    finally:
+        server.close()
 
 
 if __name__ == "__main__":
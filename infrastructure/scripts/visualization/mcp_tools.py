@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Tool declarations for the ML Platform MCP server
+Built-in tools name a server method; plugin tools name a "module:function" that is only
+imported when the tool is first called, so adding one does not slow down server start.
+"""
+
+from parallel_viz import DEFAULT_MAX_WORKERS
+from tool_registry import ToolRegistry
+
+ENVIRONMENTS = ["local", "dev", "staging", "prod"]
+
+TOOLS = ToolRegistry()
+
+TOOLS.register(
+    "visualize_terraform",
+    "Generate Terraform infrastructure visualizations using multiple tools (terraform graph, Rover, InfraMap)",
+    {
+        "type": "object",
+        "properties": {
+            "environment": {
+                "type": "string",
+                "default": "local",
+                "enum": ENVIRONMENTS,
+                "description": "Target environment for visualization"
+            },
+            "format": {
+                "type": "string",
+                "default": "png",
+                "enum": ["png", "svg", "pdf", "html"],
+                "description": "Output format for diagrams"
+            },
+            "tool": {
+                "type": "string",
+                "enum": ["rover", "inframap", "graph"],
+                "description": "Specific visualization tool to use"
+            },
+            "open_browser": {
+                "type": "boolean",
+                "default": False,
+                "description": "Open generated diagrams in browser"
+            },
+            "static": {
+                "type": "boolean",
+                "default": False,
+                "description": "Build the graph from the HCL sources without terraform init"
+            },
+            "use_cache": {
+                "type": "boolean",
+                "default": True,
+                "description": "Reuse cached diagrams when inputs are unchanged"
+            }
+        }
+    },
+    handler="run_terraform_viz",
+    progress=True
+)
+
+TOOLS.register(
+    "diff_terraform",
+    "Compare Terraform dependency graphs between two environments or git revisions and render only what changed",
+    {
+        "type": "object",
+        "properties": {
+            "left": {
+                "type": "string",
+                "description": "Old side: an environment, optionally at a git revision (e.g. staging, prod@HEAD~3)"
+            },
+            "right": {
+                "type": "string",
+                "description": "New side: an environment, optionally at a git revision (e.g. prod)"
+            },
+            "format": {
+                "type": "string",
+                "default": "svg",
+                "enum": ["dot", "png", "svg", "pdf"],
+                "description": "Output format for the changed-neighbourhood diagram"
+            },
+            "context": {
+                "type": "integer",
+                "default": 1,
+                "minimum": 0,
+                "description": "Neighbour hops shown around each change"
+            }
+        },
+        "required": ["left", "right"]
+    },
+    handler="run_terraform_diff"
+)
+
+TOOLS.register(
+    "visualize_kubernetes",
+    "Generate Kubernetes application visualizations using diagrams-as-code and kubectl integration",
+    {
+        "type": "object",
+        "properties": {
+            "environment": {
+                "type": "string",
+                "default": "local",
+                "enum": ENVIRONMENTS,
+                "description": "Target environment for visualization"
+            },
+            "namespace": {
+                "type": "string",
+                "default": "ml-platform",
+                "description": "Kubernetes namespace to focus on"
+            },
+            "format": {
+                "type": "string",
+                "default": "png",
+                "enum": ["png", "svg", "pdf"],
+                "description": "Output format for diagrams"
+            },
+            "use_live_cluster": {
+                "type": "boolean",
+                "default": False,
+                "description": "Use live cluster data instead of manifests"
+            },
+            "open_browser": {
+                "type": "boolean",
+                "default": False,
+                "description": "Open generated diagrams in browser"
+            },
+            "use_cache": {
+                "type": "boolean",
+                "default": True,
+                "description": "Reuse cached diagrams when inputs are unchanged"
+            }
+        }
+    },
+    handler="run_kubernetes_viz",
+    progress=True
+)
+
+TOOLS.register(
+    "visualize_full_infrastructure",
+    "Generate comprehensive infrastructure visualization suite combining Terraform and Kubernetes with unified documentation",
+    {
+        "type": "object",
+        "properties": {
+            "environment": {
+                "type": "string",
+                "default": "local",
+                "enum": ENVIRONMENTS,
+                "description": "Target environment for visualization"
+            },
+            "format": {
+                "type": "string",
+                "default": "png",
+                "enum": ["png", "svg", "pdf"],
+                "description": "Output format for diagrams"
+            },
+            "open_browser": {
+                "type": "boolean",
+                "default": True,
+                "description": "Open visualization suite in browser"
+            },
+            "terraform_only": {
+                "type": "boolean",
+                "default": False,
+                "description": "Generate only Terraform visualizations"
+            },
+            "kubernetes_only": {
+                "type": "boolean",
+                "default": False,
+                "description": "Generate only Kubernetes visualizations"
+            },
+            "environments": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ENVIRONMENTS
+                },
+                "description": "Render several environments in parallel, each into docs/diagrams/<env>"
+            },
+            "max_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "default": DEFAULT_MAX_WORKERS,
+                "description": "Maximum concurrent Terraform/Kubernetes stages with 'environments'"
+            },
+            "use_cache": {
+                "type": "boolean",
+                "default": True,
+                "description": "Reuse cached diagrams when inputs are unchanged"
+            }
+        }
+    },
+    handler="run_full_viz",
+    progress=True
+)
+
+TOOLS.register(
+    "analyze_infrastructure",
+    "Analyze infrastructure configuration and provide insights about architecture, dependencies, and potential improvements",
+    {
+        "type": "object",
+        "properties": {
+            "environment": {
+                "type": "string",
+                "default": "local",
+                "enum": ENVIRONMENTS,
+                "description": "Environment to analyze"
+            },
+            "focus_area": {
+                "type": "string",
+                "enum": ["security", "performance", "cost", "reliability", "all"],
+                "default": "all",
+                "description": "Specific area to focus analysis on"
+            }
+        }
+    },
+    handler="analyze_infrastructure"
+)
+
+# Plugins: imported on first call
+
+TOOLS.register(
+    "visualize_argocd",
+    "Generate ArgoCD GitOps workflow and application sync-status diagrams",
+    {
+        "type": "object",
+        "properties": {
+            "environment": {
+                "type": "string",
+                "default": "local",
+                "enum": ENVIRONMENTS,
+                "description": "Target environment for visualization"
+            },
+            "namespace": {
+                "type": "string",
+                "default": "argocd",
+                "description": "Namespace ArgoCD is installed in"
+            },
+            "format": {
+                "type": "string",
+                "default": "png",
+                "enum": ["png", "svg", "pdf"],
+                "description": "Output format for diagrams"
+            },
+            "use_live_cluster": {
+                "type": "boolean",
+                "default": False,
+                "description": "Read applications from the live cluster instead of manifests"
+            },
+            "open_browser": {
+                "type": "boolean",
+                "default": False,
+                "description": "Open generated diagrams in browser"
+            },
+            "use_cache": {
+                "type": "boolean",
+                "default": True,
+                "description": "Reuse cached diagrams when inputs are unchanged"
+            }
+        }
+    },
+    plugin="argocd_tool:run",
+    progress=True
+)
+
+TOOLS.register(
+    "visualize_terraform_enhanced",
+    "Generate a styled Terraform dependency graph (colour-coded by resource kind) plus an interactive HTML viewer",
+    {
+        "type": "object",
+        "properties": {
+            "environment": {
+                "type": "string",
+                "default": "local",
+                "enum": ENVIRONMENTS,
+                "description": "Target environment for visualization"
+            },
+            "format": {
+                "type": "string",
+                "default": "png",
+                "enum": ["png", "svg", "pdf"],
+                "description": "Output format for the rendered graph"
+            },
+            "graph_file": {
+                "type": "string",
+                "description": "Saved 'terraform graph' output to style instead of running terraform"
+            },
+            "use_cache": {
+                "type": "boolean",
+                "default": True,
+                "description": "Reuse cached diagrams when inputs are unchanged"
+            }
+        }
+    },
+    plugin="terraform_graph_tool:run",
+    progress=True
+)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Parallel multi-environment visualization
+Fans the Terraform and Kubernetes stages of several environments out across a bounded pool of worker processes
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+INFRASTRUCTURE_DIR = SCRIPT_DIR.parent.parent
+
+ENVIRONMENTS = ('local', 'dev', 'staging', 'prod')
+STAGE_SCRIPTS = {
+    'terraform': 'terraform-visualize.sh',
+    'kubernetes': 'kubernetes-visualize.sh',
+}
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 2)
+OUTPUT_TAIL_LINES = 40
+
+
+def plan_jobs(environments, output_root, format_type='png', stages=('terraform', 'kubernetes')):
+    """One job per (environment, stage), each with its own output and working directory"""
+    output_root = Path(output_root)
+    jobs = []
+    for environment in environments:
+        for stage in stages:
+            output_dir = output_root / environment / stage
+            work_dir = output_root / '.work' / f'{environment}-{stage}'
+            jobs.append({
+                "environment": environment,
+                "stage": stage,
+                "output_dir": output_dir,
+                "work_dir": work_dir,
+                "cmd": [
+                    str(SCRIPT_DIR / STAGE_SCRIPTS[stage]),
+                    "-e", environment,
+                    "-f", format_type,
+                    "--output-dir", str(output_dir)
+                ]
+            })
+    return jobs
+
+
+async def run_job(job, slots, cwd):
+    """Run one stage once a worker slot is free"""
+    async with slots:
+        job['output_dir'].mkdir(parents=True, exist_ok=True)
+        job['work_dir'].mkdir(parents=True, exist_ok=True)
+        # Scratch files (mktemp, generated helper scripts) stay inside the worker's own directory
+        env = dict(os.environ, TMPDIR=str(job['work_dir']))
+
+        started = time.time()
+        process = await asyncio.create_subprocess_exec(
+            *job['cmd'],
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=cwd,
+            env=env
+        )
+
+        # Keep only the tail of the log; stage output can be large
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            tail.append(line.decode('utf-8', errors='replace').rstrip())
+        returncode = await process.wait()
+
+        shutil.rmtree(job['work_dir'], ignore_errors=True)
+        return {
+            "environment": job['environment'],
+            "stage": job['stage'],
+            "output_dir": str(job['output_dir']),
+            "returncode": returncode,
+            "duration": round(time.time() - started, 3),
+            "output_tail": list(tail)
+        }
+
+
+async def run_jobs(jobs, max_workers=DEFAULT_MAX_WORKERS, cwd=INFRASTRUCTURE_DIR):
+    """Run all jobs with at most max_workers in flight, returning results in job order"""
+    slots = asyncio.Semaphore(max(1, max_workers))
+    results = await asyncio.gather(*(run_job(job, slots, cwd) for job in jobs))
+
+    for work_root in {job['work_dir'].parent for job in jobs}:
+        try:
+            work_root.rmdir()
+        except OSError:
+            pass
+    return results
+
+
+async def generate_environment_docs(environment, output_root, format_type, cwd=INFRASTRUCTURE_DIR):
+    """Write the unified docs and navigation index for one environment's output tree"""
+    process = await asyncio.create_subprocess_exec(
+        str(SCRIPT_DIR / 'visualize-infrastructure.sh'),
+        "--docs-only",
+        "-e", environment,
+        "-f", format_type,
+        "--output-dir", str(Path(output_root) / environment),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+        cwd=cwd
+    )
+    return await process.wait()
+
+
+async def visualize_environments(environments, output_root, format_type='png',
+                                 stages=('terraform', 'kubernetes'), max_workers=DEFAULT_MAX_WORKERS):
+    """Render every environment/stage in parallel, then the per-environment docs"""
+    started = time.time()
+    results = await run_jobs(plan_jobs(environments, output_root, format_type, stages), max_workers)
+
+    if set(stages) == set(STAGE_SCRIPTS):
+        await asyncio.gather(*(
+            generate_environment_docs(environment, output_root, format_type)
+            for environment in environments
+        ))
+
+    return {
+        "environments": list(environments),
+        "output_root": str(output_root),
+        "max_workers": max_workers,
+        "wall_time": round(time.time() - started, 3),
+        "stage_time": round(sum(r['duration'] for r in results), 3),
+        "results": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel multi-environment infrastructure visualization")
+    parser.add_argument("-e", "--environments", default=",".join(ENVIRONMENTS),
+                        help="Comma-separated environments (default: local,dev,staging,prod)")
+    parser.add_argument("-f", "--format", default="png", help="Output format (png, svg, pdf)")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_MAX_WORKERS, help="Maximum concurrent stages")
+    parser.add_argument("--output-dir", default=str(INFRASTRUCTURE_DIR / "docs" / "diagrams"),
+                        help="Root output directory; each environment gets its own subdirectory")
+    parser.add_argument("--terraform-only", action="store_true", help="Only run the Terraform stage")
+    parser.add_argument("--kubernetes-only", action="store_true", help="Only run the Kubernetes stage")
+    args = parser.parse_args()
+
+    environments = [e.strip() for e in args.environments.split(",") if e.strip()]
+    stages = ('terraform', 'kubernetes')
+    if args.terraform_only:
+        stages = ('terraform',)
+    elif args.kubernetes_only:
+        stages = ('kubernetes',)
+
+    summary = asyncio.run(visualize_environments(environments, args.output_dir, args.format, stages, args.jobs))
+
+    failed = 0
+    for result in summary['results']:
+        status = "✅" if result['returncode'] == 0 else "❌"
+        print(f"{status} {result['environment']:<8} {result['stage']:<11} {result['duration']:>8.1f}s  {result['output_dir']}")
+        if result['returncode'] != 0:
+            failed += 1
+            for line in result['output_tail'][-10:]:
+                print(f"      {line}")
+
+    print(f"\nWall time: {summary['wall_time']:.1f}s (sequential stage time: {summary['stage_time']:.1f}s, "
+          f"{summary['max_workers']} workers)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Content-addressed render cache for infrastructure visualizations
+Reuses previously generated diagrams when the Terraform/Kubernetes inputs and tool arguments are unchanged
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MiB
+DEFAULT_MAX_AGE = 7 * 24 * 3600  # one week
+
+# Arguments that change how results are presented, not what is rendered
+CACHE_KEY_IGNORED_ARGS = ('open_browser', 'use_cache')
+
+# Input files that determine each visualization, relative to the infrastructure directory
+TERRAFORM_INPUTS = [
+    'terraform/environments/{environment}/**/*.tf',
+    'terraform/environments/{environment}/**/*.tfvars',
+    'terraform/modules/**/*.tf',
+    'scripts/visualization/terraform-visualize.sh',
+    'scripts/visualization/terraform-graph-enhanced.sh',
+    'scripts/visualization/dot_styler.py',
+    'scripts/visualization/dot_render.py',
+    'scripts/visualization/hcl_graph.py',
+    'scripts/visualization/graph_viewer.py',
+    'scripts/visualization/graph_store.py',
+]
+KUBERNETES_INPUTS = [
+    'kubernetes/**/*.yaml',
+    'scripts/visualization/kubernetes-visualize.sh',
+    'scripts/visualization/k8s_manifests.py',
+    'scripts/visualization/k8s_diagrams.py',
+    'scripts/visualization/manifest_inventory.py',
+]
+ARGOCD_INPUTS = [
+    'kubernetes/base/gitops/**/*.yaml',
+    'scripts/visualization/argocd-visualize.sh',
+    'scripts/visualization/argocd_diagrams.py',
+    'scripts/visualization/argocd_apps.py',
+]
+FULL_SUITE_INPUTS = TERRAFORM_INPUTS + KUBERNETES_INPUTS + [
+    'scripts/visualization/visualize-infrastructure.sh',
+]
+
+
+def default_cache_dir():
+    """Cache location, overridable with ML_PLATFORM_VIZ_CACHE"""
+    return Path(os.environ.get('ML_PLATFORM_VIZ_CACHE', Path.home() / '.cache' / 'ml-platform-viz'))
+
+
+def hash_file(path, chunk_size=1 << 20):
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def expand_inputs(patterns, **values):
+    """Fill environment placeholders in input patterns"""
+    return [pattern.format(**values) for pattern in patterns]
+
+
+class RenderCache:
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, max_age=DEFAULT_MAX_AGE):
+        self.root = Path(cache_dir or default_cache_dir()) / 'renders'
+        self.entries_dir = self.root / 'entries'
+        self.stats_file = self.root / 'stats.json'
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = self._load_stats()
+
+    def make_key(self, tool_name, arguments, input_digest):
+        """Cache key for a tool invocation over a given set of inputs"""
+        relevant_args = {
+            k: v for k, v in sorted(arguments.items()) if k not in CACHE_KEY_IGNORED_ARGS
+        }
+        payload = json.dumps(
+            {"tool": tool_name, "arguments": relevant_args, "inputs": input_digest},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key, base_dir):
+        """Return the cached entry for key, restoring any missing outputs under base_dir"""
+        entry_dir = self.entries_dir / key
+        manifest = self._read_manifest(entry_dir)
+
+        if manifest is None or time.time() - manifest['created'] > self.max_age:
+            self.stats['misses'] += 1
+            self._save_stats()
+            return None
+
+        base_dir = Path(base_dir)
+        for item in manifest['files']:
+            target = base_dir / item['path']
+            if not self._is_current(target, item):
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(entry_dir / 'files' / item['path'], target)
+
+        manifest['last_access'] = time.time()
+        manifest['hits'] = manifest.get('hits', 0) + 1
+        self._write_manifest(entry_dir, manifest)
+
+        self.stats['hits'] += 1
+        self._save_stats()
+        return manifest
+
+    def put(self, key, base_dir, files, stdout='', stderr='', tool_name=''):
+        """Store generated files (relative to base_dir) and script output under key"""
+        base_dir = Path(base_dir)
+        staging_dir = Path(tempfile.mkdtemp(prefix=f'{key[:12]}-', dir=self.entries_dir))
+
+        items = []
+        for rel_path in sorted(set(files)):
+            source = base_dir / rel_path
+            if not source.is_file():
+                continue
+            target = staging_dir / 'files' / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+            items.append({"path": str(rel_path), "size": target.stat().st_size, "sha256": hash_file(target)})
+
+        now = time.time()
+        manifest = {
+            "key": key,
+            "tool": tool_name,
+            "created": now,
+            "last_access": now,
+            "hits": 0,
+            "size": sum(item['size'] for item in items),
+            "files": items,
+            "stdout": stdout,
+            "stderr": stderr
+        }
+        self._write_manifest(staging_dir, manifest)
+
+        # Swap the finished entry in, replacing one written by a concurrent run
+        entry_dir = self.entries_dir / key
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(staging_dir, entry_dir)
+
+        self.stats['stores'] += 1
+        self.evict()
+        return manifest
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones until under max_bytes"""
+        now = time.time()
+        entries = []
+        for entry_dir in self.entries_dir.iterdir():
+            manifest = self._read_manifest(entry_dir)
+            if manifest is None:
+                # Leftover staging directory from an interrupted put
+                if now - entry_dir.stat().st_mtime > 3600:
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                continue
+            if now - manifest['created'] > self.max_age:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                self.stats['evictions'] += 1
+                continue
+            entries.append((manifest['last_access'], manifest['size'], entry_dir))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            self.stats['evictions'] += 1
+
+        self._save_stats()
+
+    def clear(self):
+        """Remove every cached entry"""
+        shutil.rmtree(self.entries_dir, ignore_errors=True)
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_stats(self):
+        """Hit/miss counters plus current cache size"""
+        entries = 0
+        total_bytes = 0
+        for entry_dir in self.entries_dir.iterdir():
+            manifest = self._read_manifest(entry_dir)
+            if manifest is not None:
+                entries += 1
+                total_bytes += manifest['size']
+
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats['hits'] / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "max_age_seconds": self.max_age
+        }
+
+    def _is_current(self, target, item):
+        """Whether a restored output already holds the cached content"""
+        if not target.is_file() or target.stat().st_size != item['size']:
+            return False
+        # Entries written before hashes were stored are always restored
+        return 'sha256' in item and hash_file(target) == item['sha256']
+
+    def _read_manifest(self, entry_dir):
+        try:
+            with open(entry_dir / 'manifest.json', 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, entry_dir, manifest):
+        tmp_file = entry_dir / 'manifest.json.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_file, entry_dir / 'manifest.json')
+
+    def _load_stats(self):
+        stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                stats.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        return stats
+
+    def _save_stats(self):
+        tmp_file = self.stats_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.stats, f)
+        os.replace(tmp_file, self.stats_file)
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('stats', 'clear', 'evict'):
+        print("Usage: python3 render_cache.py <stats|clear|evict>")
+        sys.exit(1)
+
+    cache = RenderCache()
+    if sys.argv[1] == 'clear':
+        cache.clear()
+    elif sys.argv[1] == 'evict':
+        cache.evict()
+    print(json.dumps(cache.get_stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Paged, conditional reads of files served as MCP resources
+Returns text or base64 chunks by byte offset with an ETag, so clients polling generated diagrams
+only transfer what changed and never more than one chunk per request
+"""
+
+import argparse
+import base64
+import json
+import mimetypes
+import mmap
+import sys
+from pathlib import Path
+
+DEFAULT_CHUNK_BYTES = 1024 * 1024  # 1 MiB per read unless the client asks for less
+MAX_CHUNK_BYTES = 8 * 1024 * 1024  # hard cap on a single response
+MMAP_THRESHOLD = 4 * 1024 * 1024  # larger files are sliced from a memory map instead of read()
+
+# Types mimetypes does not know, or guesses differently per platform
+MIME_OVERRIDES = {
+    '.tf': 'text/x-terraform',
+    '.tfvars': 'text/x-terraform',
+    '.hcl': 'text/x-terraform',
+    '.dot': 'text/vnd.graphviz',
+    '.gv': 'text/vnd.graphviz',
+    '.yaml': 'application/yaml',
+    '.yml': 'application/yaml',
+    '.md': 'text/markdown',
+    '.sh': 'text/x-shellscript',
+    '.py': 'text/x-python',
+    '.json': 'application/json',
+    '.svg': 'image/svg+xml',
+}
+# Non-text/* types whose content is still text
+TEXT_MIME_TYPES = frozenset({
+    'application/json', 'application/yaml', 'application/xml', 'application/javascript', 'image/svg+xml',
+})
+
+
+class ResourceReadError(ValueError):
+    """Invalid paging or conditional parameters"""
+
+
+def guess_mime_type(path):
+    suffix = Path(path).suffix.lower()
+    if suffix in MIME_OVERRIDES:
+        return MIME_OVERRIDES[suffix]
+    mime_type, _ = mimetypes.guess_type(str(path))
+    return mime_type or 'application/octet-stream'
+
+
+def is_text_type(mime_type):
+    return mime_type.startswith('text/') or mime_type in TEXT_MIME_TYPES
+
+
+def make_etag(stat, sha256=None):
+    """Strong ETag from the content hash when known, otherwise a weak one from mtime and size"""
+    if sha256:
+        return f'"{sha256[:32]}"'
+    return f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def opaque_tag(etag):
+    return etag[2:] if etag.startswith('W/') else etag
+
+
+def read_range(path, offset, length, size):
+    """Bytes [offset, offset + length) of a file, via mmap for large files"""
+    if length <= 0 or offset >= size:
+        return b''
+    with open(path, 'rb') as f:
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[offset:offset + length]
+        f.seek(offset)
+        return f.read(length)
+
+
+def utf8_sequence_length(lead_byte):
+    """Bytes in the UTF-8 sequence a lead byte starts"""
+    return 1 if lead_byte < 0x80 else 2 if lead_byte >> 5 == 0x6 else 3 if lead_byte >> 4 == 0xE else 4
+
+
+def utf8_boundary(data, at_eof):
+    """Length of the longest prefix of data that does not end inside a UTF-8 sequence"""
+    if at_eof:
+        return len(data)
+    # Walk back over at most three continuation bytes to the lead byte
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 != 0x80:
+            return len(data) if utf8_sequence_length(byte) <= back else len(data) - back
+    return len(data)
+
+
+def parse_paging(params):
+    """(offset, length) from resources/read params"""
+    try:
+        offset = int(params.get('offset', 0))
+        length = int(params.get('length', DEFAULT_CHUNK_BYTES))
+    except (TypeError, ValueError):
+        raise ResourceReadError("offset and length must be integers")
+    if offset < 0 or length <= 0:
+        raise ResourceReadError("offset must be >= 0 and length > 0")
+    return offset, min(length, MAX_CHUNK_BYTES)
+
+
+def not_modified(params, etag, stat):
+    """True when the client's ETag or modification time shows it already has this content"""
+    if_none_match = params.get('ifNoneMatch')
+    if if_none_match is not None:
+        candidates = if_none_match if isinstance(if_none_match, list) else [if_none_match]
+        # Weak comparison, as for If-None-Match in HTTP: the W/ prefix is ignored
+        return any(opaque_tag(str(tag)) == opaque_tag(etag) for tag in candidates)
+    if_modified_since = params.get('ifModifiedSince')
+    if if_modified_since is not None:
+        try:
+            return stat.st_mtime <= float(if_modified_since)
+        except (TypeError, ValueError):
+            raise ResourceReadError("ifModifiedSince must be a Unix timestamp")
+    return False
+
+
+def read_file_resource(path, uri, params, index_entry=None):
+    """One resources/read content item for a file
+
+    params may carry offset/length (bytes) to page through large files and
+    ifNoneMatch/ifModifiedSince to skip unchanged content. Text is returned as
+    'text' cut on a UTF-8 boundary, anything else as base64 'blob'; nextOffset
+    is set while more of the file remains. index_entry, a FileIndex record,
+    supplies the content hash for a strong ETag when it is still current.
+    """
+    path = Path(path)
+    stat = path.stat()
+    sha256 = None
+    if index_entry and index_entry['mtime_ns'] == stat.st_mtime_ns and index_entry['size'] == stat.st_size:
+        sha256 = index_entry['sha256']
+    etag = make_etag(stat, sha256)
+    mime_type = guess_mime_type(path)
+    item = {
+        "uri": uri,
+        "mimeType": mime_type,
+        "etag": etag,
+        "lastModified": stat.st_mtime,
+        "size": stat.st_size,
+    }
+
+    if not_modified(params, etag, stat):
+        item["notModified"] = True
+        return item
+
+    offset, length = parse_paging(params)
+    data = read_range(path, offset, length, stat.st_size)
+    at_eof = offset + len(data) >= stat.st_size
+
+    text = None
+    if is_text_type(mime_type) or (mime_type == 'application/octet-stream' and b'\0' not in data[:8192]):
+        cut = utf8_boundary(data, at_eof)
+        if cut == 0:
+            # A length shorter than one character would never advance: return that character whole
+            data = read_range(path, offset, utf8_sequence_length(data[0]), stat.st_size)
+            cut = len(data)
+        try:
+            text = data[:cut].decode('utf-8')
+            data = data[:cut]
+            at_eof = offset + cut >= stat.st_size
+        except UnicodeDecodeError:
+            text = None
+
+    if text is not None:
+        item["text"] = text
+        if mime_type == 'application/octet-stream':
+            item["mimeType"] = 'text/plain'
+    else:
+        item["blob"] = base64.b64encode(data).decode('ascii')
+    item["offset"] = offset
+    item["length"] = len(data)
+    item["nextOffset"] = None if at_eof else offset + len(data)
+    return item
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read a file the way the MCP server serves it as a resource")
+    parser.add_argument("path", help="File to read")
+    parser.add_argument("--offset", type=int, default=0, help="Byte offset")
+    parser.add_argument("--length", type=int, default=DEFAULT_CHUNK_BYTES, help="Maximum bytes to return")
+    parser.add_argument("--if-none-match", help="Return notModified when the ETag still matches")
+    parser.add_argument("--full", action="store_true", help="Print the content too, not just the metadata")
+    args = parser.parse_args()
+
+    params = {"offset": args.offset, "length": args.length}
+    if args.if_none_match:
+        params["ifNoneMatch"] = args.if_none_match
+    try:
+        item = read_file_resource(args.path, Path(args.path).resolve().as_uri(), params)
+    except (OSError, ResourceReadError) as e:
+        print(f"Read failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not args.full:
+        for key in ('text', 'blob'):
+            if key in item:
+                item[key] = f"<{len(item[key])} characters>"
+    json.dump(item, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == "__main__":
+    main()
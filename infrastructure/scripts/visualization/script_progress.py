@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Progress tracking for visualization script output
+Turns log_info/log_success lines into MCP progress notifications and keeps only a bounded log tail
+"""
+
+import re
+from collections import deque
+from pathlib import Path
+
+LOG_TAIL_LINES = 200
+
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+# Lines written by the scripts' log_step/log_info/log_success/log_warn/log_error helpers
+MARKER_PATTERN = re.compile(r'^\s*\[(STEP|INFO|SUCCESS|WARN|ERROR)\]\s*(.*)$')
+OUTPUT_PATH_PATTERN = re.compile(r'(?<![\w:])((?:\.{0,2}/)?[\w.@+-]+(?:/[\w.@+-]+)*\.(?:png|svg|pdf|html|dot|md|json|py))\b')
+
+
+def parse_marker(line):
+    """(level, message) of a script log line, or None for plain output"""
+    match = MARKER_PATTERN.match(ANSI_ESCAPE.sub('', line))
+    if match is None:
+        return None
+    return match.group(1), match.group(2).strip()
+
+
+class BoundedLog:
+    """Last max_lines lines of a stream, plus how many earlier lines were dropped"""
+
+    def __init__(self, max_lines=LOG_TAIL_LINES):
+        self.lines = deque(maxlen=max_lines)
+        self.total = 0
+
+    def append(self, line):
+        self.lines.append(line)
+        self.total += 1
+
+    def text(self):
+        dropped = self.total - len(self.lines)
+        header = [f"... {dropped} earlier lines omitted"] if dropped else []
+        return "\n".join(header + list(self.lines))
+
+
+class ScriptProgress:
+    """Tracks stages and generated files of one script run, reporting them as they happen
+
+    Notifications are only sent when the client supplied a progress token with
+    the tools/call request; the bounded logs are kept either way.
+    """
+
+    def __init__(self, notify=None, progress_token=None, base_dir=None, max_lines=LOG_TAIL_LINES):
+        self.notify = notify if progress_token is not None else None
+        self.progress_token = progress_token
+        self.base_dir = Path(base_dir).resolve() if base_dir else None
+        self.stdout = BoundedLog(max_lines)
+        self.stderr = BoundedLog(max_lines)
+        self.stages = []
+        self.files = []
+        # Files the script itself declared as its outputs (record_output in stage-timing.sh)
+        self.outputs = []
+        self.progress = 0
+
+    def report(self, message):
+        """Send one progress notification"""
+        self.progress += 1
+        if self.notify is None:
+            return
+        self.notify({
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {
+                "progressToken": self.progress_token,
+                "progress": self.progress,
+                "message": message
+            }
+        })
+
+    def feed_stdout(self, line):
+        line = line.rstrip('\n')
+        self.stdout.append(line)
+        self._handle_marker(line)
+
+    def feed_stderr(self, line):
+        """The scripts log to stderr so stdout stays free for stage return values
+
+        Progress markers are kept with the regular output; only warnings, errors and
+        unmarked tool output end up in the stderr log.
+        """
+        line = line.rstrip('\n')
+        marker = self._handle_marker(line)
+        if marker is not None and marker[0] not in ('WARN', 'ERROR'):
+            self.stdout.append(line)
+        else:
+            self.stderr.append(line)
+
+    def _handle_marker(self, line):
+        marker = parse_marker(line)
+        if marker is None:
+            return None
+        level, message = marker
+        if level in ('STEP', 'INFO') and message.endswith('...'):
+            self.stages.append(message.rstrip('.'))
+        self.report(f"{level.lower()}: {message}")
+
+        if level == 'SUCCESS':
+            for path in OUTPUT_PATH_PATTERN.findall(message):
+                self.add_file(path)
+        return marker
+
+    def add_file(self, path):
+        """Report a generated file once, as soon as it exists on disk; returns its reported path"""
+        path = Path(path)
+        if self.base_dir is not None and not path.is_absolute():
+            path = self.base_dir / path
+        if not path.is_file():
+            return None
+        path = path.resolve()
+        if self.base_dir is not None:
+            try:
+                path = path.relative_to(self.base_dir)
+            except ValueError:
+                pass
+        if str(path) not in self.files:
+            self.files.append(str(path))
+            self.report(f"generated: {path}")
+        return str(path)
+
+    def add_output(self, path):
+        """Record a file the script declared as output, reporting it if no marker named it yet"""
+        path = self.add_file(path)
+        if path is not None and path not in self.outputs:
+            self.outputs.append(path)
@@ -0,0 +1,89 @@
+#!/bin/bash
+# Per-stage timing for the visualization scripts
+# Sourced by the scripts; when VIZ_TIMING_FILE is set, each stage appends one JSON line
+# (script, stage, environment, start, end, exit_code) that stage_metrics.py aggregates.
+# When VIZ_OUTPUTS_FILE is set, record_output appends the absolute path of every file the
+# script generated, so a caller knows exactly which outputs belong to its run.
+
+VIZ_TIMING_FILE="${VIZ_TIMING_FILE:-}"
+VIZ_OUTPUTS_FILE="${VIZ_OUTPUTS_FILE:-}"
+VIZ_TIMING_SCRIPT="$(basename "$0")"
+_VIZ_STAGE=""
+_VIZ_STAGE_START=""
+# The script's own EXIT trap (temp file cleanup), run after the open stage is recorded
+_VIZ_EXIT_TRAP=""
+
+# Wall clock with sub-second resolution where the shell provides it (bash >= 5)
+viz_now() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        echo "${EPOCHREALTIME/,/.}"
+    else
+        date +%s
+    fi
+}
+
+stage_begin() {
+    _VIZ_STAGE="$1"
+    _VIZ_STAGE_START="$(viz_now)"
+    # Record the open stage if the script exits inside it (set -e failures);
+    # re-armed per stage because subshells do not inherit the EXIT trap
+    if [[ "$BASHPID" == "$$" ]]; then
+        # Only the script's own shell: a subshell's trap -p still lists its parent's traps
+        local current=()
+        eval "current=($(trap -p EXIT))"
+        if [[ ${#current[@]} -gt 2 && "${current[2]}" != '_viz_exit $?' ]]; then
+            _VIZ_EXIT_TRAP="${current[2]}"
+        fi
+    fi
+    trap '_viz_exit $?' EXIT
+}
+
+_viz_exit() {
+    local exit_code="$1"
+    stage_end "$exit_code"
+    if [[ -n "$_VIZ_EXIT_TRAP" && "$BASHPID" == "$$" ]]; then
+        # Give the chained trap the exit status it would have seen on its own;
+        # the script is exiting anyway, so errexit must not cut the trap short
+        set +e
+        (exit "$exit_code")
+        eval "$_VIZ_EXIT_TRAP"
+    fi
+}
+
+stage_end() {
+    local exit_code="${1:-0}"
+    if [[ -z "$_VIZ_STAGE" ]]; then
+        return 0
+    fi
+    if [[ -n "$VIZ_TIMING_FILE" ]]; then
+        printf '{"script":"%s","stage":"%s","environment":"%s","start":%s,"end":%s,"exit_code":%d}\n' \
+            "$VIZ_TIMING_SCRIPT" "$_VIZ_STAGE" "${ENVIRONMENT:-}" "$_VIZ_STAGE_START" "$(viz_now)" "$exit_code" \
+            >> "$VIZ_TIMING_FILE"
+    fi
+    _VIZ_STAGE=""
+    return 0
+}
+
+# run_stage <name> <command> [args...]: time one stage, preserving the command's exit status
+run_stage() {
+    stage_begin "$1"
+    shift
+    "$@"
+    local exit_code=$?
+    stage_end "$exit_code"
+    return "$exit_code"
+}
+
+# record_output <file>...: list generated files for the caller (no-op without VIZ_OUTPUTS_FILE)
+record_output() {
+    local file
+    if [[ -z "$VIZ_OUTPUTS_FILE" ]]; then
+        return 0
+    fi
+    for file in "$@"; do
+        if [[ -f "$file" ]]; then
+            echo "$(cd "$(dirname "$file")" && pwd)/$(basename "$file")" >> "$VIZ_OUTPUTS_FILE"
+        fi
+    done
+    return 0
+}
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Stage and tool timing metrics for the visualization suite
+Aggregates the JSON lines written by stage-timing.sh and per-tool latencies, rendered as JSON or Prometheus text
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+METRIC_PREFIX = 'ml_platform_viz'
+# Histogram buckets in seconds: visualization stages range from sub-second to many minutes
+DURATION_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+RECENT_STAGES = 100
+
+
+def read_timings(path):
+    """Stage records from a timing file, each with its duration in seconds"""
+    records = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                record['duration'] = round(max(0.0, record['end'] - record['start']), 6)
+                records.append(record)
+    except OSError:
+        pass
+    return records
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{escape_label(value)}"' for name, value in labels) + '}'
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus model"""
+
+    def __init__(self):
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if value <= bound:
+                self.buckets[i] += 1
+
+    def exposition(self, name, labels):
+        lines = []
+        for bound, count in zip(DURATION_BUCKETS, self.buckets):
+            lines.append(f'{name}_bucket{format_labels(labels + [("le", bound)])} {count}')
+        lines.append(f'{name}_bucket{format_labels(labels + [("le", "+Inf")])} {self.count}')
+        lines.append(f'{name}_sum{format_labels(labels)} {round(self.sum, 6)}')
+        lines.append(f'{name}_count{format_labels(labels)} {self.count}')
+        return lines
+
+
+class StageMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.tool_latency = {}
+        self.tool_calls = {}
+        self.stage_latency = {}
+        self.stage_last = {}
+        self.recent = deque(maxlen=RECENT_STAGES)
+
+    def record_tool(self, tool, duration, ok):
+        """One MCP tool call"""
+        status = 'ok' if ok else 'error'
+        with self._lock:
+            self.tool_latency.setdefault(tool, Histogram()).observe(duration)
+            self.tool_calls[(tool, status)] = self.tool_calls.get((tool, status), 0) + 1
+
+    def record_stages(self, records):
+        """Stage records read from a script run's timing file"""
+        with self._lock:
+            for record in records:
+                key = (record['script'], record['stage'])
+                self.stage_latency.setdefault(key, Histogram()).observe(record['duration'])
+                self.stage_last[key] = record
+                self.recent.append(record)
+
+    def snapshot(self):
+        """JSON-friendly view: per-tool and per-stage aggregates plus the most recent stage runs"""
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started, 3),
+                "tools": {
+                    tool: {
+                        "calls": histogram.count,
+                        "errors": self.tool_calls.get((tool, 'error'), 0),
+                        "total_seconds": round(histogram.sum, 6),
+                        "mean_seconds": round(histogram.sum / histogram.count, 6) if histogram.count else 0.0
+                    }
+                    for tool, histogram in sorted(self.tool_latency.items())
+                },
+                "stages": [
+                    {
+                        "script": script,
+                        "stage": stage,
+                        "runs": histogram.count,
+                        "total_seconds": round(histogram.sum, 6),
+                        "last_duration": self.stage_last[(script, stage)]['duration'],
+                        "last_exit_code": self.stage_last[(script, stage)]['exit_code']
+                    }
+                    for (script, stage), histogram in sorted(self.stage_latency.items())
+                ],
+                "recent": list(self.recent)
+            }
+
+    def prometheus(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            lines = [
+                f'# HELP {METRIC_PREFIX}_tool_calls_total MCP visualization tool calls by outcome',
+                f'# TYPE {METRIC_PREFIX}_tool_calls_total counter',
+            ]
+            for (tool, status), count in sorted(self.tool_calls.items()):
+                lines.append(f'{METRIC_PREFIX}_tool_calls_total{format_labels([("tool", tool), ("status", status)])} {count}')
+
+            lines += [
+                f'# HELP {METRIC_PREFIX}_tool_duration_seconds MCP visualization tool call latency',
+                f'# TYPE {METRIC_PREFIX}_tool_duration_seconds histogram',
+            ]
+            for tool, histogram in sorted(self.tool_latency.items()):
+                lines += histogram.exposition(f'{METRIC_PREFIX}_tool_duration_seconds', [("tool", tool)])
+
+            lines += [
+                f'# HELP {METRIC_PREFIX}_stage_duration_seconds Duration of visualization script stages',
+                f'# TYPE {METRIC_PREFIX}_stage_duration_seconds histogram',
+            ]
+            for (script, stage), histogram in sorted(self.stage_latency.items()):
+                lines += histogram.exposition(f'{METRIC_PREFIX}_stage_duration_seconds',
+                                              [("script", script), ("stage", stage)])
+
+            lines += [
+                f'# HELP {METRIC_PREFIX}_stage_last_exit_code Exit code of the most recent run of each stage',
+                f'# TYPE {METRIC_PREFIX}_stage_last_exit_code gauge',
+            ]
+            for (script, stage), record in sorted(self.stage_last.items()):
+                labels = format_labels([("script", script), ("stage", stage)])
+                lines.append(f'{METRIC_PREFIX}_stage_last_exit_code{labels} {record["exit_code"]}')
+
+            return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path):
+        """Atomically write the Prometheus text for node_exporter's textfile collector"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus())
+        os.replace(tmp_file, path)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 stage_metrics.py <timing.jsonl> [--prometheus]")
+        sys.exit(1)
+
+    metrics = StageMetrics()
+    metrics.record_stages(read_timings(sys.argv[1]))
+    if '--prometheus' in sys.argv[2:]:
+        sys.stdout.write(metrics.prometheus())
+        return
+
+    for stage in metrics.snapshot()['stages']:
+        status = "✅" if stage['last_exit_code'] == 0 else "❌"
+        print(f"{status} {stage['script']:<30} {stage['stage']:<20} {stage['total_seconds']:>9.2f}s "
+              f"({stage['runs']} run{'s' if stage['runs'] != 1 else ''})")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,29 +13,31 @@ NC='\033[0m' # No Color
 
 # Logging functions
 log_info() {
-    echo -e "${BLUE}[INFO]${NC} $1"
+    echo -e "${BLUE}[INFO]${NC} $1" >&2
 }
 
 log_success() {
-    echo -e "${GREEN}[SUCCESS]${NC} $1"
+    echo -e "${GREEN}[SUCCESS]${NC} $1" >&2
 }
 
 log_warn() {
-    echo -e "${YELLOW}[WARN]${NC} $1"
+    echo -e "${YELLOW}[WARN]${NC} $1" >&2
 }
 
 log_error() {
-    echo -e "${RED}[ERROR]${NC} $1"
+    echo -e "${RED}[ERROR]${NC} $1" >&2
 }
 
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+source "${SCRIPT_DIR}/stage-timing.sh"
 OUTPUT_DIR="${SCRIPT_DIR}/../../docs/diagrams"
 TERRAFORM_DIR="${SCRIPT_DIR}/../../terraform"
 
 # Default values
 ENVIRONMENT="local"
 FORMAT="png"
+GRAPH_FILE=""
 
 # Parse command line arguments
 usage() {
@@ -45,8 +47,10 @@ usage() {
     echo ""
     echo "Options:"
     echo "  -e, --environment ENV    Environment (local, dev, staging, prod)"
-    echo "  -f, --format FORMAT      Output format (png, svg, pdf)"
+    echo "  -f, --format FORMAT      Output format (png, svg, pdf); comma-separate several,"
+    echo "                           e.g. png,svg, to render them all from one layout"
     echo "  --output-dir DIR         Output directory"
+    echo "  --graph-file FILE        Use saved 'terraform graph' output instead of running it"
     echo "  --help, -h              Show this help"
 }
 
@@ -64,6 +68,10 @@ while [[ $# -gt 0 ]]; do
             OUTPUT_DIR="$2"
             shift 2
             ;;
+        --graph-file)
+            GRAPH_FILE="$2"
+            shift 2
+            ;;
         --help|-h)
             usage
             exit 0
@@ -75,6 +83,11 @@ while [[ $# -gt 0 ]]; do
     esac
 done
 
+# generate_enhanced_graph changes into the environment directory
+if [[ -n "$GRAPH_FILE" ]]; then
+    GRAPH_FILE="$(cd "$(dirname "$GRAPH_FILE")" && pwd)/$(basename "$GRAPH_FILE")"
+fi
+
 # Generate enhanced graph visualization
 generate_enhanced_graph() {
     local env_dir="${TERRAFORM_DIR}/environments/${ENVIRONMENT}"
@@ -86,457 +99,84 @@ generate_enhanced_graph() {
     mkdir -p "$OUTPUT_DIR"
     
     # Check if terraform is initialized
-    if [[ ! -d ".terraform" ]]; then
+    if [[ -z "$GRAPH_FILE" ]] && [[ ! -d ".terraform" ]]; then
         log_info "Initializing Terraform..."
+        stage_begin init
         terraform init -upgrade
+        stage_end $?
     fi
     
-    # Generate graph with enhanced styling
-    local graph_file="${OUTPUT_DIR}/${base_name}.dot"
-    
-    log_info "Generating Terraform dependency graph..."
-    terraform graph > "$graph_file"
-    
-    # Enhance the DOT file with better styling
+    # Generate graph and style it in one streaming pass: each node's style is
+    # declared once and the output goes through a single buffered handle
     local styled_graph="${OUTPUT_DIR}/${base_name}-styled.dot"
     
-    cat > "$styled_graph" << 'EOF'
-digraph {
-    // Graph attributes
-    bgcolor="white";
-    rankdir="TB";
-    splines="ortho";
-    nodesep="0.8";
-    ranksep="1.2";
-    fontname="Arial";
-    fontsize="14";
-    
-    // Default node style
-    node [
-        shape="box",
-        style="rounded,filled",
-        fillcolor="lightblue",
-        fontname="Arial",
-        fontsize="12",
-        margin="0.2,0.1"
-    ];
-    
-    // Default edge style
-    edge [
-        color="gray60",
-        fontname="Arial",
-        fontsize="10",
-        arrowsize="0.8"
-    ];
-    
-EOF
-    
-    # Process the original graph and enhance it
-    tail -n +2 "$graph_file" | head -n -1 | while IFS= read -r line; do
-        if [[ "$line" =~ \"([^\"]+)\"[[:space:]]*-\>[[:space:]]*\"([^\"]+)\" ]]; then
-            local from="${BASH_REMATCH[1]}"
-            local to="${BASH_REMATCH[2]}"
-            
-            # Color nodes based on resource type
-            local from_color="lightblue"
-            local to_color="lightblue"
-            
-            case "$from" in
-                *provider*) from_color="lightgreen" ;;
-                *data*) from_color="lightyellow" ;;
-                *resource*) from_color="lightcoral" ;;
-                *module*) from_color="lightpink" ;;
-                *var*) from_color="lightgray" ;;
-                *output*) from_color="lightsteelblue" ;;
-            esac
-            
-            case "$to" in
-                *provider*) to_color="lightgreen" ;;
-                *data*) to_color="lightyellow" ;;
-                *resource*) to_color="lightcoral" ;;
-                *module*) to_color="lightpink" ;;
-                *var*) to_color="lightgray" ;;
-                *output*) to_color="lightsteelblue" ;;
-            esac
-            
-            echo "    \"$from\" [fillcolor=\"$from_color\"];" >> "$styled_graph"
-            echo "    \"$to\" [fillcolor=\"$to_color\"];" >> "$styled_graph"
-            echo "    \"$from\" -> \"$to\";" >> "$styled_graph"
-        else
-            echo "    $line" >> "$styled_graph"
-        fi
+    stage_begin graph
+    if [[ -n "$GRAPH_FILE" ]]; then
+        log_info "Styling saved Terraform dependency graph..."
+        python3 "${SCRIPT_DIR}/dot_styler.py" "$GRAPH_FILE" "$styled_graph"
+    else
+        log_info "Generating Terraform dependency graph..."
+        terraform graph | python3 "${SCRIPT_DIR}/dot_styler.py" - "$styled_graph"
+    fi
+    stage_end $?
+    
+    # Every requested format is drawn from a single layout pass
+    local formats=()
+    local format
+    local output_files=()
+    local render_args=()
+    IFS=',' read -ra formats <<< "$FORMAT"
+    for format in "${formats[@]}"; do
+        case "$format" in
+            png|svg|pdf)
+                output_files+=("${OUTPUT_DIR}/${base_name}.${format}")
+                render_args+=(-o "${format}:${OUTPUT_DIR}/${base_name}.${format}")
+                ;;
+            *)
+                log_error "Unsupported format: $format"
+                return 1
+                ;;
+        esac
     done
     
-    echo "}" >> "$styled_graph"
-    
-    # Generate output in requested format
-    local output_file="${OUTPUT_DIR}/${base_name}.${FORMAT}"
-    
-    case "$FORMAT" in
-        png)
-            dot -Tpng -Gdpi=300 "$styled_graph" -o "$output_file"
-            ;;
-        svg)
-            dot -Tsvg "$styled_graph" -o "$output_file"
-            ;;
-        pdf)
-            dot -Tpdf "$styled_graph" -o "$output_file"
-            ;;
-        *)
-            log_error "Unsupported format: $FORMAT"
-            return 1
-            ;;
-    esac
+    run_stage dot_render python3 "${SCRIPT_DIR}/dot_render.py" "$styled_graph" --png-dpi 300 "${render_args[@]}"
     
     # Generate interactive HTML version
     local html_file="${OUTPUT_DIR}/${base_name}.html"
-    generate_interactive_html "$styled_graph" "$html_file"
+    run_stage html generate_interactive_html "$styled_graph" "$html_file"
     
     # Clean up temporary files
-    rm -f "$graph_file" "$styled_graph"
+    rm -f "$styled_graph"
     
-    log_success "Enhanced graph visualization generated: $output_file"
+    local output_file
+    for output_file in "${output_files[@]}"; do
+        log_success "Enhanced graph visualization generated: $output_file"
+    done
     log_success "Interactive HTML version: $html_file"
+    record_output "${output_files[@]}" "$html_file"
     
-    echo "$output_file"
+    printf '%s\n' "${output_files[@]}"
 }
 
-# Generate interactive HTML visualization
+# Generate interactive HTML visualization: nodes and edges ship as compact
+# JSON and are drawn on a canvas, only what is in view
 generate_interactive_html() {
-    local dot_file="$1"
+    local graph_file="$1"
     local html_file="$2"
     
     log_info "Generating interactive HTML visualization..."
     
-    # Convert DOT to SVG for embedding
-    local svg_content=$(dot -Tsvg "$dot_file" | tail -n +7)  # Skip XML declaration
-    
-    cat > "$html_file" << EOF
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Terraform Infrastructure - ${ENVIRONMENT}</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }
-        
-        .header {
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-            color: white;
-            padding: 20px;
-            text-align: center;
-            box-shadow: 0 2px 20px rgba(0,0,0,0.1);
-        }
-        
-        .header h1 {
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        
-        .header p {
-            margin: 10px 0 0 0;
-            opacity: 0.9;
-            font-size: 1.1em;
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 20px auto;
-            padding: 0 20px;
-        }
-        
-        .controls {
-            background: white;
-            border-radius: 8px;
-            padding: 20px;
-            margin-bottom: 20px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            display: flex;
-            gap: 15px;
-            align-items: center;
-            flex-wrap: wrap;
-        }
-        
-        .control-group {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-        
-        button {
-            background: #667eea;
-            color: white;
-            border: none;
-            padding: 10px 20px;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 14px;
-            transition: background 0.3s;
-        }
-        
-        button:hover {
-            background: #5a6fd8;
-        }
-        
-        .graph-container {
-            background: white;
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            overflow: auto;
-            max-height: 80vh;
-        }
-        
-        .graph-svg {
-            width: 100%;
-            height: auto;
-            cursor: grab;
-        }
-        
-        .graph-svg:active {
-            cursor: grabbing;
-        }
-        
-        .legend {
-            background: white;
-            border-radius: 8px;
-            padding: 20px;
-            margin-top: 20px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        
-        .legend h3 {
-            margin-top: 0;
-            color: #333;
-        }
-        
-        .legend-item {
-            display: inline-block;
-            margin: 5px 15px 5px 0;
-            padding: 5px 10px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: bold;
-        }
-        
-        .legend-provider { background: lightgreen; }
-        .legend-data { background: lightyellow; }
-        .legend-resource { background: lightcoral; }
-        .legend-module { background: lightpink; }
-        .legend-variable { background: lightgray; }
-        .legend-output { background: lightsteelblue; }
-        
-        .stats {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }
-        
-        .stat-card {
-            background: white;
-            border-radius: 8px;
-            padding: 20px;
-            text-align: center;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        
-        .stat-number {
-            font-size: 2em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 5px;
-        }
-        
-        .stat-label {
-            color: #666;
-            font-size: 0.9em;
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🚀 Terraform Infrastructure Visualization</h1>
-        <p>Environment: ${ENVIRONMENT} | Generated: $(date)</p>
-    </div>
-    
-    <div class="container">
-        <div class="controls">
-            <div class="control-group">
-                <button onclick="zoomIn()">🔍 Zoom In</button>
-                <button onclick="zoomOut()">🔍 Zoom Out</button>
-                <button onclick="resetZoom()">🔄 Reset Zoom</button>
-            </div>
-            <div class="control-group">
-                <button onclick="fitToScreen()">📐 Fit to Screen</button>
-                <button onclick="downloadSVG()">💾 Download SVG</button>
-            </div>
-        </div>
-        
-        <div class="graph-container">
-            <div class="graph-svg" id="graphSVG">
-                $svg_content
-            </div>
-        </div>
-        
-        <div class="legend">
-            <h3>🏷️ Resource Types</h3>
-            <div class="legend-item legend-provider">Provider</div>
-            <div class="legend-item legend-data">Data Source</div>
-            <div class="legend-item legend-resource">Resource</div>
-            <div class="legend-item legend-module">Module</div>
-            <div class="legend-item legend-variable">Variable</div>
-            <div class="legend-item legend-output">Output</div>
-        </div>
-        
-        <div class="stats">
-            <div class="stat-card">
-                <div class="stat-number" id="nodeCount">-</div>
-                <div class="stat-label">Nodes</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number" id="edgeCount">-</div>
-                <div class="stat-label">Dependencies</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">${ENVIRONMENT}</div>
-                <div class="stat-label">Environment</div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        let scale = 1;
-        const svgContainer = document.getElementById('graphSVG');
-        const svg = svgContainer.querySelector('svg');
-        
-        if (svg) {
-            // Set initial viewBox
-            const bbox = svg.getBBox();
-            svg.setAttribute('viewBox', \`\${bbox.x} \${bbox.y} \${bbox.width} \${bbox.height}\`);
-            
-            // Calculate stats
-            const nodes = svg.querySelectorAll('g.node');
-            const edges = svg.querySelectorAll('g.edge');
-            
-            document.getElementById('nodeCount').textContent = nodes.length;
-            document.getElementById('edgeCount').textContent = edges.length;
-            
-            // Add hover effects
-            nodes.forEach(node => {
-                node.addEventListener('mouseenter', function() {
-                    this.style.opacity = '0.8';
-                    this.style.transform = 'scale(1.05)';
-                });
-                
-                node.addEventListener('mouseleave', function() {
-                    this.style.opacity = '1';
-                    this.style.transform = 'scale(1)';
-                });
-            });
-        }
-        
-        function zoomIn() {
-            scale *= 1.2;
-            updateZoom();
-        }
-        
-        function zoomOut() {
-            scale /= 1.2;
-            updateZoom();
-        }
-        
-        function resetZoom() {
-            scale = 1;
-            updateZoom();
-        }
-        
-        function updateZoom() {
-            if (svg) {
-                svg.style.transform = \`scale(\${scale})\`;
-            }
-        }
-        
-        function fitToScreen() {
-            if (svg) {
-                const containerRect = svgContainer.getBoundingClientRect();
-                const svgRect = svg.getBoundingClientRect();
-                const scaleX = containerRect.width / svgRect.width;
-                const scaleY = containerRect.height / svgRect.height;
-                scale = Math.min(scaleX, scaleY) * 0.9;
-                updateZoom();
-            }
-        }
-        
-        function downloadSVG() {
-            if (svg) {
-                const svgData = new XMLSerializer().serializeToString(svg);
-                const blob = new Blob([svgData], {type: 'image/svg+xml'});
-                const url = URL.createObjectURL(blob);
-                const a = document.createElement('a');
-                a.href = url;
-                a.download = 'terraform-${ENVIRONMENT}-graph.svg';
-                document.body.appendChild(a);
-                a.click();
-                document.body.removeChild(a);
-                URL.revokeObjectURL(url);
-            }
-        }
-        
-        // Pan functionality
-        let isPanning = false;
-        let startPoint = { x: 0, y: 0 };
-        let currentTranslate = { x: 0, y: 0 };
-        
-        svgContainer.addEventListener('mousedown', function(e) {
-            isPanning = true;
-            startPoint = { x: e.clientX, y: e.clientY };
-        });
-        
-        document.addEventListener('mousemove', function(e) {
-            if (!isPanning) return;
-            
-            const dx = e.clientX - startPoint.x;
-            const dy = e.clientY - startPoint.y;
-            
-            currentTranslate.x += dx;
-            currentTranslate.y += dy;
-            
-            if (svg) {
-                svg.style.transform = \`scale(\${scale}) translate(\${currentTranslate.x}px, \${currentTranslate.y}px)\`;
-            }
-            
-            startPoint = { x: e.clientX, y: e.clientY };
-        });
-        
-        document.addEventListener('mouseup', function() {
-            isPanning = false;
-        });
-        
-        // Initialize
-        fitToScreen();
-    </script>
-</body>
-</html>
-EOF
+    python3 "${SCRIPT_DIR}/graph_viewer.py" "$graph_file" "$html_file" \
+        --title "Terraform Infrastructure - ${ENVIRONMENT}" \
+        --subtitle "Environment: ${ENVIRONMENT} | Generated: $(date)"
 }
 
 # Main execution
 main() {
     log_info "Starting enhanced Terraform graph visualization for environment: $ENVIRONMENT"
     
-    # Check prerequisites
-    if ! command -v terraform &> /dev/null; then
+    # Check prerequisites; a saved graph needs no terraform binary
+    if [[ -z "$GRAPH_FILE" ]] && ! command -v terraform &> /dev/null; then
         log_error "Terraform not found"
         exit 1
     fi
@@ -546,12 +186,21 @@ main() {
         exit 1
     fi
     
+    if ! command -v python3 &> /dev/null; then
+        log_error "python3 not found (needed for DOT styling)"
+        exit 1
+    fi
+    
     # Generate visualization
-    if output_file=$(generate_enhanced_graph); then
+    local output_files=()
+    if readarray -t output_files < <(generate_enhanced_graph) && [[ ${#output_files[@]} -gt 0 ]]; then
         log_success "Enhanced Terraform visualization complete!"
         echo "Generated files:"
-        echo "  📊 Graph: $output_file"
-        echo "  🌐 Interactive: ${output_file%.*}.html"
+        local output_file
+        for output_file in "${output_files[@]}"; do
+            echo "  📊 Graph: $output_file"
+        done
+        echo "  🌐 Interactive: ${output_files[0]%.*}.html"
     else
         log_error "Failed to generate visualization"
         exit 1
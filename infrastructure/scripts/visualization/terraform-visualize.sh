@@ -13,23 +13,24 @@ NC='\033[0m' # No Color
 
 # Logging functions
 log_info() {
-    echo -e "${BLUE}[INFO]${NC} $1"
+    echo -e "${BLUE}[INFO]${NC} $1" >&2
 }
 
 log_success() {
-    echo -e "${GREEN}[SUCCESS]${NC} $1"
+    echo -e "${GREEN}[SUCCESS]${NC} $1" >&2
 }
 
 log_warn() {
-    echo -e "${YELLOW}[WARN]${NC} $1"
+    echo -e "${YELLOW}[WARN]${NC} $1" >&2
 }
 
 log_error() {
-    echo -e "${RED}[ERROR]${NC} $1"
+    echo -e "${RED}[ERROR]${NC} $1" >&2
 }
 
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+source "${SCRIPT_DIR}/stage-timing.sh"
 OUTPUT_DIR="${SCRIPT_DIR}/../../docs/diagrams"
 TERRAFORM_DIR="${SCRIPT_DIR}/../../terraform"
 
@@ -39,6 +40,9 @@ FORMAT="png"
 OPEN_BROWSER=false
 USE_ROVER=true
 USE_INFRAMAP=false
+STATIC_GRAPH=false
+GRAPH_DOT=""
+GRAPH_OK=false
 
 # Parse command line arguments
 usage() {
@@ -53,12 +57,14 @@ usage() {
     echo "  --use-rover              Use Rover for interactive visualization (default)"
     echo "  --use-inframap           Use InfraMap for simplified visualization"
     echo "  --output-dir DIR         Output directory for diagrams"
+    echo "  --static                 Build the graph from the HCL sources (no terraform init)"
     echo "  --help, -h              Show this help message"
     echo ""
     echo "Examples:"
     echo "  $0                       # Visualize local environment with Rover"
     echo "  $0 -e prod -f svg -o     # Visualize production, output SVG, open browser"
     echo "  $0 --use-inframap        # Use InfraMap instead of Rover"
+    echo "  $0 -e dev --static       # Offline dependency graph of the dev environment"
 }
 
 while [[ $# -gt 0 ]]; do
@@ -89,6 +95,10 @@ while [[ $# -gt 0 ]]; do
             OUTPUT_DIR="$2"
             shift 2
             ;;
+        --static)
+            STATIC_GRAPH=true
+            shift
+            ;;
         --help|-h)
             usage
             exit 0
@@ -118,7 +128,7 @@ check_prerequisites() {
 
     local missing_tools=()
 
-    if ! command -v terraform &> /dev/null; then
+    if [[ "$STATIC_GRAPH" != true ]] && ! command -v terraform &> /dev/null; then
         missing_tools+=("terraform")
     fi
 
@@ -168,6 +178,39 @@ init_terraform() {
     log_success "Terraform initialization complete"
 }
 
+# Build the dependency graph straight from the HCL sources; module subgraphs
+# are cached by content hash, so only edited modules are parsed again
+capture_static_graph() {
+    log_info "Parsing HCL for environment: $ENVIRONMENT"
+    if python3 "${SCRIPT_DIR}/graph_store.py" "$ENVIRONMENT" --terraform-dir "$TERRAFORM_DIR" -o "$GRAPH_DOT"; then
+        GRAPH_OK=true
+    else
+        log_warn "Static HCL parsing failed"
+        echo 'digraph G { Error -> "Run terraform init first"; }' > "$GRAPH_DOT"
+    fi
+}
+
+# Run terraform graph once; the Graphviz diagram, the Rover page and the
+# enhanced fallback all read the saved output
+capture_terraform_graph() {
+    local env_dir="${TERRAFORM_DIR}/environments/${ENVIRONMENT}"
+    
+    GRAPH_DOT="$(mktemp "${TMPDIR:-/tmp}/terraform-${ENVIRONMENT}-graph.XXXXXX")"
+    if [[ "$STATIC_GRAPH" == true ]]; then
+        capture_static_graph
+        return
+    fi
+    
+    cd "$env_dir"
+    
+    if terraform graph > "$GRAPH_DOT" 2>/dev/null; then
+        GRAPH_OK=true
+    else
+        log_warn "terraform graph failed; falling back to static HCL parsing"
+        capture_static_graph
+    fi
+}
+
 # Generate basic Terraform graph
 generate_terraform_graph() {
     local env_dir="${TERRAFORM_DIR}/environments/${ENVIRONMENT}"
@@ -180,14 +223,19 @@ generate_terraform_graph() {
     # Create output directory
     mkdir -p "$OUTPUT_DIR"
     
+    if [[ "$GRAPH_OK" != true ]]; then
+        log_error "No Terraform graph available for $ENVIRONMENT"
+        return 1
+    fi
+    
     case $FORMAT in
         png|svg|pdf)
             log_info "Generating $FORMAT diagram using Graphviz..."
-            terraform graph | dot -T${FORMAT} -o "$output_file"
+            dot -T${FORMAT} -o "$output_file" "$GRAPH_DOT"
             ;;
         html)
             log_warn "HTML format not supported for terraform graph, generating PNG instead"
-            terraform graph | dot -Tpng -o "${OUTPUT_DIR}/terraform-${ENVIRONMENT}-graph.png"
+            dot -Tpng -o "${OUTPUT_DIR}/terraform-${ENVIRONMENT}-graph.png" "$GRAPH_DOT"
             output_file="${OUTPUT_DIR}/terraform-${ENVIRONMENT}-graph.png"
             ;;
         *)
@@ -197,6 +245,7 @@ generate_terraform_graph() {
     esac
     
     log_success "Terraform graph generated: $output_file"
+    record_output "$output_file"
     echo "$output_file"
 }
 
@@ -225,8 +274,16 @@ generate_rover_visualization() {
     # Create a simple HTML file with Rover-style visualization
     local rover_html="${OUTPUT_DIR}/terraform-${ENVIRONMENT}-rover.html"
     
-    # Generate terraform graph data
-    local graph_data=$(terraform graph 2>/dev/null || echo "digraph G { Error -> \"Run terraform init first\"; }")
+    # Reuse the graph captured for the Graphviz diagram; the graph itself goes
+    # to a canvas viewer page instead of being pasted into this one
+    local viewer_html="${OUTPUT_DIR}/terraform-${ENVIRONMENT}-viewer.html"
+    python3 "${SCRIPT_DIR}/graph_viewer.py" "$GRAPH_DOT" "$viewer_html" \
+        --title "Terraform Infrastructure - ${ENVIRONMENT}" \
+        --subtitle "Environment: ${ENVIRONMENT} | Generated: $(date)"
+    log_success "Graph viewer generated: $viewer_html"
+    record_output "$viewer_html"
+    local edge_count=$(grep -c -- '->' "$GRAPH_DOT" | tr -d ' ')
+    local resource_count=$(grep -o '[a-zA-Z_][a-zA-Z0-9_]*\.' "$GRAPH_DOT" | sort -u | wc -l | tr -d ' ')
     
     cat > "$rover_html" << EOF
 <!DOCTYPE html>
@@ -268,15 +325,11 @@ generate_rover_visualization() {
             background: #fafafa; 
             overflow-x: auto;
         }
-        .graph-data { 
-            font-family: 'Monaco', 'Menlo', monospace; 
-            font-size: 12px; 
-            white-space: pre-wrap; 
-            background: #2c3e50; 
-            color: #ecf0f1; 
-            padding: 15px; 
+        .graph-viewer { 
+            width: 100%; 
+            height: 700px; 
+            border: none; 
             border-radius: 4px;
-            overflow-x: auto;
         }
         .interactive-note {
             background: #e3f2fd;
@@ -320,11 +373,11 @@ generate_rover_visualization() {
                 
                 <div class="stats">
                     <div class="stat-card">
-                        <div class="stat-number">$(echo "$graph_data" | grep -o '\->' | wc -l | tr -d ' ')</div>
+                        <div class="stat-number">${edge_count}</div>
                         <div class="stat-label">Dependencies</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-number">$(echo "$graph_data" | grep -o '[a-zA-Z_][a-zA-Z0-9_]*\.' | sort -u | wc -l | tr -d ' ')</div>
+                        <div class="stat-number">${resource_count}</div>
                         <div class="stat-label">Resources</div>
                     </div>
                     <div class="stat-card">
@@ -335,9 +388,10 @@ generate_rover_visualization() {
             </div>
             
             <div class="section">
-                <h2>🔗 Resource Dependencies (Graph Data)</h2>
+                <h2>🔗 Resource Dependencies</h2>
                 <div class="graph-container">
-                    <div class="graph-data">$graph_data</div>
+                    <iframe class="graph-viewer" src="$(basename "$viewer_html")" title="Dependency graph"></iframe>
+                    <p><a href="$(basename "$viewer_html")">Open the graph viewer in its own window</a></p>
                 </div>
             </div>
             
@@ -384,6 +438,7 @@ inframap generate --format png .</code></pre>
 EOF
     
     log_success "Static Rover-style visualization generated: $rover_html"
+    record_output "$rover_html"
     
     # Try to run actual Rover if Docker is available and user wants interactive mode
     if [[ "$OPEN_BROWSER" == true ]] && command -v docker &> /dev/null; then
@@ -414,7 +469,8 @@ EOF
             log_info "Using enhanced graph visualization as fallback..."
             local enhanced_script="${SCRIPT_DIR}/terraform-graph-enhanced.sh"
             if [[ -x "$enhanced_script" ]]; then
-                "$enhanced_script" -e "$ENVIRONMENT" -f "$FORMAT" --output-dir "$(dirname "$rover_html")"
+                "$enhanced_script" -e "$ENVIRONMENT" -f "$FORMAT" --output-dir "$(dirname "$rover_html")" \
+                    --graph-file "$GRAPH_DOT" >&2
                 log_success "Enhanced graph visualization generated as alternative"
             fi
         fi
@@ -440,10 +496,10 @@ generate_inframap_visualization() {
         log_info "Using local InfraMap installation..."
         case $FORMAT in
             png|svg)
-                inframap generate --output "$output_file" --format "$FORMAT" .
+                inframap generate --output "$output_file" --format "$FORMAT" . >&2
                 ;;
             html)
-                inframap generate --output "${OUTPUT_DIR}/terraform-${ENVIRONMENT}-inframap.html" --format html .
+                inframap generate --output "${OUTPUT_DIR}/terraform-${ENVIRONMENT}-inframap.html" --format html . >&2
                 output_file="${OUTPUT_DIR}/terraform-${ENVIRONMENT}-inframap.html"
                 ;;
             *)
@@ -457,11 +513,12 @@ generate_inframap_visualization() {
             -v "$(pwd):/workspace" \
             -v "$OUTPUT_DIR:/output" \
             cyclonedx/inframap:latest \
-            generate --output "/output/terraform-${ENVIRONMENT}-inframap.${FORMAT}" --format "$FORMAT" /workspace
+            generate --output "/output/terraform-${ENVIRONMENT}-inframap.${FORMAT}" --format "$FORMAT" /workspace >&2
     fi
     
     if [[ -f "$output_file" ]]; then
         log_success "InfraMap visualization generated: $output_file"
+        record_output "$output_file"
         echo "$output_file"
     else
         log_error "Failed to generate InfraMap visualization"
@@ -543,6 +600,7 @@ fi)
 EOF
 
     log_success "Documentation generated: $doc_file"
+    record_output "$doc_file"
     echo "$doc_file"
 }
 
@@ -577,27 +635,32 @@ open_files() {
 # Main execution
 main() {
     log_info "Starting Terraform visualization for environment: $ENVIRONMENT"
+    # Also removes the saved graph when a stage aborts the script (set -e)
+    trap 'rm -f "$GRAPH_DOT"' EXIT
     
-    validate_environment
-    check_prerequisites
+    run_stage validate validate_environment
+    run_stage prerequisites check_prerequisites
     
     # Create output directory
     mkdir -p "$OUTPUT_DIR"
     
-    init_terraform
+    if [[ "$STATIC_GRAPH" != true ]]; then
+        run_stage init init_terraform
+    fi
+    run_stage graph_capture capture_terraform_graph
     
     local generated_files=()
     
     # Generate basic Terraform graph
     log_info "Generating basic Terraform dependency graph..."
-    if graph_file=$(generate_terraform_graph); then
+    if graph_file=$(run_stage graph generate_terraform_graph); then
         generated_files+=("$graph_file")
     fi
     
     # Generate Rover visualization if requested
     if [[ "$USE_ROVER" == true ]]; then
         log_info "Generating interactive Rover visualization..."
-        if rover_file=$(generate_rover_visualization); then
+        if rover_file=$(run_stage rover generate_rover_visualization); then
             generated_files+=("$rover_file")
         fi
     fi
@@ -605,16 +668,18 @@ main() {
     # Generate InfraMap visualization if requested
     if [[ "$USE_INFRAMAP" == true ]]; then
         log_info "Generating InfraMap visualization..."
-        if inframap_file=$(generate_inframap_visualization); then
+        if inframap_file=$(run_stage inframap generate_inframap_visualization); then
             generated_files+=("$inframap_file")
         fi
     fi
     
     # Generate documentation
-    if doc_file=$(generate_documentation); then
+    if doc_file=$(run_stage docs generate_documentation); then
         generated_files+=("$doc_file")
     fi
     
+    rm -f "$GRAPH_DOT"
+    
     # Display results
     echo ""
     log_success "Terraform visualization complete!"
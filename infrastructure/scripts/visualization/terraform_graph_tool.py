@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+visualize_terraform_enhanced MCP tool plugin
+Runs terraform-graph-enhanced.sh through the server's render cache; loaded on the tool's first call
+"""
+
+from pathlib import Path
+
+from render_cache import TERRAFORM_INPUTS, expand_inputs
+
+
+async def run(server, args, progress=None):
+    """Run enhanced Terraform graph visualization"""
+    environment = args.get('environment', 'local')
+    cmd = [
+        str(server.script_dir / "terraform-graph-enhanced.sh"),
+        "-e", environment,
+        "-f", args.get('format', 'png')
+    ]
+
+    inputs = expand_inputs(TERRAFORM_INPUTS, environment=environment)
+    if args.get('graph_file'):
+        graph_file = Path(args['graph_file'])
+        if not graph_file.is_absolute():
+            graph_file = server.infrastructure_dir / graph_file
+        if not graph_file.is_file():
+            return {"error": f"Graph file not found: {args['graph_file']}"}
+        cmd += ["--graph-file", str(graph_file)]
+        try:
+            # The saved graph is an input too; outside the tree it cannot be hashed, so skip the cache
+            inputs.append(graph_file.resolve().relative_to(server.file_index.root).as_posix())
+        except ValueError:
+            args = dict(args, use_cache=False)
+
+    result, cache_hit = await server.run_cached_script('visualize_terraform_enhanced', args, cmd, inputs, progress)
+
+    # Find generated files
+    generated_files = server.list_diagrams(f"terraform-{environment}-enhanced")
+
+    return server.script_report(
+        f"🎨 Enhanced Terraform graph completed for {environment} environment\n\n",
+        generated_files, result, cache_hit
+    )
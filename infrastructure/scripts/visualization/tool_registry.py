@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Declarative tool registry for the MCP server
+Tools are declared once with their schema and a handler reference; the tools/list payload is
+serialized a single time and calls dispatch through a name lookup. Handlers given as
+"module:function" are plugins, imported on their first call rather than at server start.
+"""
+
+import importlib
+import json
+
+
+class RawJSON(str):
+    """A result that is already serialized JSON; written into the response envelope verbatim"""
+
+
+class Tool:
+    """One registered tool: its MCP description plus how to reach its handler"""
+
+    __slots__ = ('name', 'description', 'input_schema', 'handler', 'plugin', 'progress')
+
+    def __init__(self, name, description, input_schema, handler=None, plugin=None, progress=False):
+        if (handler is None) == (plugin is None):
+            raise ValueError(f"Tool {name} needs exactly one of handler or plugin")
+        self.name = name
+        self.description = description
+        self.input_schema = input_schema
+        # Server method name, or "module:function" taking (server, arguments[, progress])
+        self.handler = handler
+        self.plugin = plugin
+        # Whether the handler accepts a ScriptProgress as its last argument
+        self.progress = progress
+
+    def describe(self):
+        return {"name": self.name, "description": self.description, "inputSchema": self.input_schema}
+
+
+class ToolRegistry:
+    """Ordered tool declarations with a pre-serialized listing and lazily resolved handlers"""
+
+    def __init__(self):
+        self._tools = {}
+        self._listing = None
+        self._plugins = {}
+
+    def register(self, name, description, input_schema, handler=None, plugin=None, progress=False):
+        if name in self._tools:
+            raise ValueError(f"Tool already registered: {name}")
+        self._tools[name] = Tool(name, description, input_schema, handler, plugin, progress)
+        self._listing = None
+        return self._tools[name]
+
+    def __contains__(self, name):
+        return name in self._tools
+
+    def __iter__(self):
+        return iter(self._tools.values())
+
+    def get(self, name):
+        return self._tools.get(name)
+
+    def listing(self):
+        """The tools/list result, serialized on first use and reused until the next register"""
+        if self._listing is None:
+            self._listing = RawJSON(json.dumps({"tools": [tool.describe() for tool in self._tools.values()]}))
+        return self._listing
+
+    def resolve(self, name, server):
+        """Callable taking (arguments, progress) for a tool, or None when it is not registered
+
+        Plugin modules are imported here, on the first call of one of their tools;
+        an import failure propagates so the caller can report it for that call only.
+        """
+        tool = self._tools.get(name)
+        if tool is None:
+            return None
+
+        if tool.plugin is None:
+            function = getattr(server, tool.handler)
+            if tool.progress:
+                return function
+            return lambda arguments, progress: function(arguments)
+
+        function = self._plugins.get(tool.plugin)
+        if function is None:
+            module_name, _, attribute = tool.plugin.partition(':')
+            function = getattr(importlib.import_module(module_name), attribute)
+            self._plugins[tool.plugin] = function
+        if tool.progress:
+            return lambda arguments, progress: function(server, arguments, progress)
+        return lambda arguments, progress: function(server, arguments)
@@ -14,27 +14,28 @@ NC='\033[0m' # No Color
 
 # Logging functions
 log_info() {
-    echo -e "${BLUE}[INFO]${NC} $1"
+    echo -e "${BLUE}[INFO]${NC} $1" >&2
 }
 
 log_success() {
-    echo -e "${GREEN}[SUCCESS]${NC} $1"
+    echo -e "${GREEN}[SUCCESS]${NC} $1" >&2
 }
 
 log_warn() {
-    echo -e "${YELLOW}[WARN]${NC} $1"
+    echo -e "${YELLOW}[WARN]${NC} $1" >&2
 }
 
 log_error() {
-    echo -e "${RED}[ERROR]${NC} $1"
+    echo -e "${RED}[ERROR]${NC} $1" >&2
 }
 
 log_step() {
-    echo -e "${PURPLE}[STEP]${NC} $1"
+    echo -e "${PURPLE}[STEP]${NC} $1" >&2
 }
 
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+source "${SCRIPT_DIR}/stage-timing.sh"
 OUTPUT_DIR="${SCRIPT_DIR}/../../docs/diagrams"
 
 # Default values
@@ -45,6 +46,9 @@ TERRAFORM_ONLY=false
 KUBERNETES_ONLY=false
 FULL_SUITE=true
 CLEANUP_AFTER=false
+ENVIRONMENTS=""
+PARALLEL_JOBS=""
+DOCS_ONLY=false
 
 # Parse command line arguments
 usage() {
@@ -64,6 +68,10 @@ OPTIONS:
   --kubernetes-only          Only generate Kubernetes visualizations
   --cleanup                  Remove temporary files after generation
   --output-dir DIR           Output directory for diagrams
+  --environments LIST        Comma-separated environments rendered in parallel
+                             (each into its own DIR/<env> subdirectory)
+  -j, --jobs N               Maximum concurrent stages with --environments
+  --docs-only                Only (re)generate unified docs and index.html
   --help, -h                Show this help message
 
 EXAMPLES:
@@ -71,6 +79,8 @@ EXAMPLES:
   $0 -e prod -f svg -o       # Production diagrams as SVG, open in browser
   $0 --terraform-only        # Only Terraform infrastructure diagrams
   $0 --kubernetes-only       # Only Kubernetes application diagrams
+  $0 --environments local,dev,staging,prod -j 4
+                             # All environments, TF/K8s stages in parallel
 
 GENERATED OUTPUTS:
   📊 Terraform Infrastructure:
@@ -132,6 +142,18 @@ while [[ $# -gt 0 ]]; do
             OUTPUT_DIR="$2"
             shift 2
             ;;
+        --environments)
+            ENVIRONMENTS="$2"
+            shift 2
+            ;;
+        -j|--jobs)
+            PARALLEL_JOBS="$2"
+            shift 2
+            ;;
+        --docs-only)
+            DOCS_ONLY=true
+            shift
+            ;;
         --help|-h)
             usage
             exit 0
@@ -475,6 +497,7 @@ Users → Ingress → Frontend/Backend → ML Services → Data Storage
 EOF
 
     log_success "Unified documentation generated: $unified_doc"
+    record_output "$unified_doc"
     echo "$unified_doc"
 }
 
@@ -532,6 +555,7 @@ update_index_html() {
     rm -f "${temp_file}.bak"
     
     log_success "Navigation index updated: $index_file"
+    record_output "$index_file"
 }
 
 # Cleanup temporary files
@@ -624,31 +648,62 @@ display_summary() {
     echo "  4. Consider automating visualization in CI/CD pipelines"
 }
 
+# Render several environments in parallel via the worker pool
+run_parallel_environments() {
+    local parallel_args=(-e "$ENVIRONMENTS" -f "$FORMAT" --output-dir "$OUTPUT_DIR")
+
+    if [[ -n "$PARALLEL_JOBS" ]]; then
+        parallel_args+=(-j "$PARALLEL_JOBS")
+    fi
+
+    if [[ "$TERRAFORM_ONLY" == true ]]; then
+        parallel_args+=(--terraform-only)
+    elif [[ "$KUBERNETES_ONLY" == true ]]; then
+        parallel_args+=(--kubernetes-only)
+    fi
+
+    log_step "Rendering environments in parallel: $ENVIRONMENTS"
+    python3 "${SCRIPT_DIR}/parallel_viz.py" "${parallel_args[@]}"
+}
+
 # Main execution
 main() {
+    if [[ -n "$ENVIRONMENTS" ]]; then
+        check_prerequisites
+        run_parallel_environments
+        return
+    fi
+
+    if [[ "$DOCS_ONLY" == true ]]; then
+        setup_output_directory
+        generate_unified_documentation > /dev/null
+        update_index_html
+        return
+    fi
+
     echo ""
     log_step "🏗️ ML Platform Infrastructure Visualization Suite"
     echo ""
     log_info "Environment: $ENVIRONMENT | Format: $FORMAT | Output: $OUTPUT_DIR"
     echo ""
     
-    check_prerequisites
-    setup_output_directory
+    run_stage prerequisites check_prerequisites
+    run_stage setup setup_output_directory
     
     # Generate visualizations based on selection
     if [[ "$TERRAFORM_ONLY" == true ]]; then
-        generate_terraform_visualizations
+        run_stage terraform generate_terraform_visualizations
     elif [[ "$KUBERNETES_ONLY" == true ]]; then
-        generate_kubernetes_visualizations
+        run_stage kubernetes generate_kubernetes_visualizations
     else
         # Full suite
-        generate_terraform_visualizations
-        generate_kubernetes_visualizations
-        generate_unified_documentation
+        run_stage terraform generate_terraform_visualizations
+        run_stage kubernetes generate_kubernetes_visualizations
+        run_stage unified_docs generate_unified_documentation
     fi
     
-    update_index_html
-    cleanup_temp_files
+    run_stage index update_index_html
+    run_stage cleanup cleanup_temp_files
     
     display_summary
     open_visualization_suite
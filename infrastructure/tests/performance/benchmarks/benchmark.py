@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the infrastructure visualization tooling
+Times manifest parsing, the kustomize namespace inventory, HCL graph building, DOT styling, graph layout,
+the ArgoCD sync-wave graph, MCP request handling and the full generation pipeline on the checked-in fixtures,
+and compares the results against a stored baseline
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+FIXTURES_DIR = BENCHMARK_DIR / 'fixtures'
+INFRASTRUCTURE_DIR = BENCHMARK_DIR.parent.parent.parent
+VISUALIZATION_DIR = INFRASTRUCTURE_DIR / 'scripts' / 'visualization'
+DEFAULT_BASELINE = BENCHMARK_DIR / 'baseline.json'
+
+RESULTS_VERSION = 1
+SIZES = ('small', 'medium', 'large')
+ENVIRONMENT = 'bench'
+DEFAULT_REPEAT = 5
+# The fastest run is compared: scheduler and cache noise only ever add time, so the
+# minimum is far more stable between runs than the median
+DEFAULT_THRESHOLD = 0.30  # fail when the best run is more than 30% slower than the baseline's
+DEFAULT_MIN_REGRESSION_MS = 10.0  # and only when it is slower by at least this much
+MCP_REQUESTS = {"small": 100, "medium": 400, "large": 1000}
+MCP_BATCH_SIZE = 25
+GRAPHVIZ_SIZES = ('small', 'medium')  # dot needs minutes for the large graph
+
+sys.path.insert(0, str(VISUALIZATION_DIR))
+
+from argocd_apps import AppGraph, ArgoCDCollector  # noqa: E402
+from dot_styler import node_address, read_graph, style_graph  # noqa: E402
+from file_index import FileIndex  # noqa: E402
+from graph_store import GraphStore  # noqa: E402
+from graph_viewer import compact_graph, render_html  # noqa: E402
+from hcl_graph import compose, write_dot  # noqa: E402
+from infra_analysis import InfrastructureAnalyzer  # noqa: E402
+from k8s_manifests import ManifestLoader, categorize_resources, parse_documents  # noqa: E402
+from manifest_inventory import ManifestInventory, summarize  # noqa: E402
+
+BENCHMARKS = {}
+
+
+def benchmark(name, sizes=SIZES):
+    """Register a benchmark; the decorated function takes a Fixture and returns (timed callable, extra)"""
+    def register(prepare):
+        BENCHMARKS[name] = (prepare, sizes)
+        return prepare
+    return register
+
+
+class Fixture:
+    """One synthetic infrastructure tree, with the derived inputs benchmarks share"""
+
+    def __init__(self, size, scratch):
+        self.size = size
+        self.root = FIXTURES_DIR / size
+        self.terraform_dir = self.root / 'terraform'
+        self.kubernetes_dir = self.root / 'kubernetes'
+        self.argocd_snapshot = self.root / 'argocd' / 'applications.json'
+        self.env_dir = self.terraform_dir / 'environments' / ENVIRONMENT
+        self.scratch = Path(scratch) / size
+        self.scratch.mkdir(parents=True, exist_ok=True)
+        self._graph = None
+        self._terraform_dot = None
+        self._styled_dot = None
+        self._runs = 0
+
+    def cache_dir(self):
+        """A fresh cache directory, so every run starts cold"""
+        self._runs += 1
+        return self.scratch / f'cache-{self._runs}'
+
+    @property
+    def graph(self):
+        if self._graph is None:
+            self._graph = compose(self.env_dir, base_dir=self.terraform_dir)
+        return self._graph
+
+    @property
+    def terraform_dot(self):
+        """The composed graph in `terraform graph` output form: "[root] <address> (expand)" nodes"""
+        if self._terraform_dot is None:
+            lines = ['digraph {', '\tcompound = "true"', '\tnewrank = "true"', '\tsubgraph "root" {']
+            for address in sorted(self.graph['nodes']):
+                lines.append(f'\t\t"[root] {address} (expand)" [label = "{address}", shape = "box"]')
+            for src, dst in self.graph['edges']:
+                lines.append(f'\t\t"[root] {src} (expand)" -> "[root] {dst} (expand)"')
+            lines += ['\t}', '}']
+            self._terraform_dot = [line + '\n' for line in lines]
+        return self._terraform_dot
+
+    @property
+    def styled_dot(self):
+        if self._styled_dot is None:
+            out = io.StringIO()
+            style_graph(self.terraform_dot, out)
+            self._styled_dot = out.getvalue().splitlines(True)
+        return self._styled_dot
+
+    def manifest_files(self):
+        return sorted(self.kubernetes_dir.rglob('*.yaml'))
+
+
+def viewer_graph(lines):
+    """(nodes, edges) for the viewer, merged by address as graph_viewer.load_graph does"""
+    raw_nodes, raw_edges = read_graph(lines)
+    addresses = {name: node_address(name) for name in raw_nodes}
+    nodes = {}
+    for name, kind in raw_nodes.items():
+        nodes.setdefault(addresses[name], kind)
+    edges = {(addresses[src], addresses[dst]) for src, dst in raw_edges if addresses[src] != addresses[dst]}
+    return nodes, sorted(edges)
+
+
+@benchmark('manifest_parse')
+def bench_manifest_parse(fixture):
+    contents = [path.read_text(encoding='utf-8') for path in fixture.manifest_files()]
+
+    def run():
+        manifests = [doc for content in contents for doc in parse_documents(content)]
+        categorize_resources(manifests)
+        return len(manifests)
+
+    return run, {"files": len(contents)}
+
+
+@benchmark('manifest_inventory')
+def bench_manifest_inventory(fixture):
+    """Kustomize resolution of the bench overlay and per-namespace counts, from a cold parse cache"""
+    def run():
+        inventory = ManifestInventory(fixture.kubernetes_dir, cache_dir=fixture.cache_dir())
+        return summarize(inventory.environment(ENVIRONMENT))
+
+    summary = run()
+    return run, {
+        "namespaces": len(summary['namespaces']),
+        "resources": sum(entry['resources'] for entry in summary['namespaces'].values())
+    }
+
+
+@benchmark('hcl_graph')
+def bench_hcl_graph(fixture):
+    def run():
+        return compose(fixture.env_dir, base_dir=fixture.terraform_dir)
+
+    return run, {"nodes": len(fixture.graph['nodes']), "edges": len(fixture.graph['edges'])}
+
+
+@benchmark('argocd_graph')
+def bench_argocd_graph(fixture):
+    """Recorded Application List -> slim records -> sync-wave DAG and its stages"""
+    def run():
+        graph = AppGraph(ArgoCDCollector(str(fixture.argocd_snapshot)).collect())
+        return len(graph.stages())
+
+    graph = AppGraph(ArgoCDCollector(str(fixture.argocd_snapshot)).collect())
+    return run, {"apps": len(graph.nodes), "stages": len(graph.stages()), "edges": graph.edge_count()}
+
+
+@benchmark('dot_style')
+def bench_dot_style(fixture):
+    lines = fixture.terraform_dot
+
+    def run():
+        return style_graph(lines, io.StringIO())
+
+    return run, {"lines": len(lines)}
+
+
+@benchmark('graph_layout')
+def bench_graph_layout(fixture):
+    nodes, edges = viewer_graph(fixture.styled_dot)
+
+    def run():
+        return render_html(compact_graph(nodes, edges), 'benchmark', fixture.size)
+
+    return run, {"nodes": len(nodes), "edges": len(edges)}
+
+
+@benchmark('graphviz_layout', sizes=GRAPHVIZ_SIZES)
+def bench_graphviz_layout(fixture):
+    if shutil.which('dot') is None:
+        return None, {"skipped": "graphviz not installed"}
+    source = fixture.scratch / 'styled.dot'
+    source.write_text(''.join(fixture.styled_dot), encoding='utf-8')
+    output = fixture.scratch / 'styled.svg'
+
+    def run():
+        subprocess.run(['dot', '-Tsvg', str(source), '-o', str(output)], check=True)
+
+    return run, {}
+
+
+def mcp_benchmark(fixture, batch_size=None):
+    """Mixed tools/list, resources/list and paged resources/read traffic through serve()
+
+    With batch_size, requests are sent as JSON-RPC batch arrays of that many.
+    """
+    spec = importlib.util.spec_from_file_location('mcp_wrapper', VISUALIZATION_DIR / 'mcp-wrapper.py')
+    wrapper = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(wrapper)
+    server = wrapper.MLPlatformMCPServer()
+    server.file_index.refresh()
+
+    rng = random.Random(fixture.size)
+    # Terraform and Kubernetes sources only, so the request mix stays comparable with older baselines
+    files = [
+        'file://' + path.relative_to(INFRASTRUCTURE_DIR).as_posix()
+        for path in sorted(
+            path for directory in (fixture.kubernetes_dir, fixture.terraform_dir) for path in directory.rglob('*')
+        ) if path.is_file()
+    ]
+    requests = []
+    for request_id in range(MCP_REQUESTS[fixture.size]):
+        roll = rng.random()
+        if roll < 0.25:
+            request = {"method": "tools/list"}
+        elif roll < 0.5:
+            request = {"method": "resources/list"}
+        else:
+            request = {"method": "resources/read", "params": {"uri": rng.choice(files), "length": 65536}}
+        requests.append(dict(request, jsonrpc="2.0", id=request_id))
+    if batch_size:
+        messages = [requests[i:i + batch_size] for i in range(0, len(requests), batch_size)]
+    else:
+        messages = requests
+    payload = ''.join(json.dumps(message) + '\n' for message in messages)
+
+    latencies = []
+    handle_request = server.handle_request
+
+    async def timed(request, notify=None):
+        started = time.perf_counter()
+        try:
+            return await handle_request(request, notify)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    server.handle_request = timed
+
+    def run():
+        latencies.clear()
+        out = io.StringIO()
+        asyncio.run(wrapper.serve(server, io.StringIO(payload), out))
+        responses = sum(
+            len(message) if isinstance(message, list) else 1
+            for message in map(json.loads, out.getvalue().splitlines())
+        )
+        if responses != len(requests):
+            raise RuntimeError(f"expected {len(requests)} responses, got {responses}")
+        return responses
+
+    def summary(duration):
+        ordered = sorted(latencies)
+        return {
+            "requests": len(requests),
+            "requests_per_second": round(len(requests) / duration, 1),
+            "latency_p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+            "latency_p95_ms": round(ordered[int(len(ordered) * 0.95)] * 1000, 3)
+        }
+
+    run.summary = summary
+    return run, {"requests": len(requests)}
+
+
+@benchmark('mcp_requests')
+def bench_mcp_requests(fixture):
+    return mcp_benchmark(fixture)
+
+
+@benchmark('mcp_batch')
+def bench_mcp_batch(fixture):
+    return mcp_benchmark(fixture, MCP_BATCH_SIZE)
+
+
+@benchmark('full_suite')
+def bench_full_suite(fixture):
+    """The offline generation pipeline from cold caches: graph, styled DOT, viewer, manifests, analysis"""
+    def run():
+        cache_dir = fixture.cache_dir()
+        index = FileIndex(fixture.root, cache_dir=cache_dir)
+        store = GraphStore(fixture.terraform_dir, file_index=index, cache_dir=cache_dir)
+        graph = store.environment_graph(ENVIRONMENT)
+
+        dot = io.StringIO()
+        write_dot(graph, dot)
+        styled = io.StringIO()
+        style_graph(dot.getvalue().splitlines(True), styled)
+        nodes, edges = viewer_graph(styled.getvalue().splitlines(True))
+        (fixture.scratch / 'viewer.html').write_text(
+            render_html(compact_graph(nodes, edges), 'benchmark', fixture.size), encoding='utf-8'
+        )
+
+        ManifestLoader(fixture.kubernetes_dir, cache_dir=cache_dir).load(ENVIRONMENT)
+        InfrastructureAnalyzer(fixture.root, file_index=index, graph_store=store, cache_dir=cache_dir).analyze(ENVIRONMENT)
+
+    return run, {}
+
+
+def measure(run, repeat):
+    """Wall-clock seconds of one warm-up plus `repeat` timed calls"""
+    run()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def run_benchmarks(names, sizes, repeat, log=sys.stderr):
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='viz-bench-') as scratch:
+        # Keep the caches of the MCP server (file index, renders) away from the user's
+        os.environ['ML_PLATFORM_VIZ_CACHE'] = str(Path(scratch) / 'cache')
+        for size in sizes:
+            if not (FIXTURES_DIR / size).is_dir():
+                raise FileNotFoundError(f"Fixture '{size}' missing; run generate_fixtures.py")
+            fixture = Fixture(size, scratch)
+            for name in names:
+                prepare, benchmark_sizes = BENCHMARKS[name]
+                if size not in benchmark_sizes:
+                    continue
+                key = f'{name}/{size}'
+                run, extra = prepare(fixture)
+                if run is None:
+                    results[key] = dict(extra, status="skipped")
+                    print(f"  {key:32} skipped ({extra.get('skipped')})", file=log)
+                    continue
+                timings = measure(run, repeat)
+                median = statistics.median(timings)
+                if hasattr(run, 'summary'):
+                    extra = dict(extra, **run.summary(median))
+                results[key] = {
+                    "status": "ok",
+                    "median": round(median, 6),
+                    "min": round(min(timings), 6),
+                    "mean": round(statistics.mean(timings), 6),
+                    "runs": [round(t, 6) for t in timings],
+                    "extra": extra
+                }
+                print(f"  {key:32} {median * 1000:10.1f} ms (min {min(timings) * 1000:.1f} ms)", file=log)
+    return results
+
+
+def compare(results, baseline, threshold, min_regression_ms=DEFAULT_MIN_REGRESSION_MS):
+    """Rows of (key, baseline min, current min, ratio, regressed) for benchmarks in both runs"""
+    rows = []
+    for key, result in sorted(results.items()):
+        reference = baseline.get('results', {}).get(key)
+        if result.get('status') != 'ok' or not reference or reference.get('status') != 'ok':
+            continue
+        ratio = result['min'] / reference['min'] if reference['min'] else 1.0
+        regressed = (
+            ratio > 1 + threshold
+            and (result['min'] - reference['min']) * 1000 >= min_regression_ms
+        )
+        rows.append((key, reference['min'], result['min'], ratio, regressed))
+    return rows
+
+
+def format_comparison(rows, threshold, min_regression_ms=DEFAULT_MIN_REGRESSION_MS):
+    lines = [f"{'benchmark (best run)':32} {'baseline':>12} {'current':>12} {'change':>9}"]
+    for key, reference, current, ratio, regressed in rows:
+        mark = '  REGRESSION' if regressed else ''
+        lines.append(f"{key:32} {reference * 1000:10.1f}ms {current * 1000:10.1f}ms {(ratio - 1) * 100:+8.1f}%{mark}")
+    regressions = sum(1 for row in rows if row[4])
+    lines.append(f"\n{regressions} regression(s) beyond {threshold * 100:.0f}% and {min_regression_ms:g} ms "
+                 f"across {len(rows)} compared benchmark(s)")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline visualization benchmarks and compare with a baseline")
+    parser.add_argument("--sizes", nargs="+", choices=SIZES, default=list(SIZES), help="Fixture sizes to run")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+    parser.add_argument("--results", help="Write results JSON here")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown of the best run as a fraction (default: 0.30)")
+    parser.add_argument("--min-regression-ms", type=float, default=DEFAULT_MIN_REGRESSION_MS,
+                        help="Smallest absolute slowdown that counts as a regression (default: 10)")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args()
+
+    names = args.only or list(BENCHMARKS)
+    print(f"Running {len(names)} benchmark(s) on {', '.join(args.sizes)} fixtures ({args.repeat} runs each)",
+          file=sys.stderr)
+    try:
+        results = run_benchmarks(names, args.sizes, args.repeat)
+    except (OSError, RuntimeError) as e:
+        print(f"Benchmark failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    report = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results
+    }
+    if args.results:
+        Path(args.results).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.results, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        if baseline_path.exists():
+            with open(baseline_path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            # Keep entries for benchmarks this run did not cover
+            report['results'] = dict(previous.get('results', {}), **results)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"Baseline updated: {baseline_path}", file=sys.stderr)
+        return
+
+    try:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one", file=sys.stderr)
+        return
+
+    rows = compare(results, baseline, args.threshold, args.min_regression_ms)
+    print(format_comparison(rows, args.threshold, args.min_regression_ms))
+    if any(row[4] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+terraform {
+  required_providers {
+    aws = {
+      source = "hashicorp/aws"
+    }
+  }
+}
+
+provider "aws" {
+  region = var.region
+}
+
+variable "region" {
+  type    = string
+  default = "eu-west-1"
+}
+
+variable "prefix" {
+  type    = string
+  default = "bench"
+}
+
+module "m0" {
+  source   = "../../modules/m0"
+  prefix   = var.prefix
+}
+
+module "m1" {
+  source   = "../../modules/m1"
+  prefix   = var.prefix
+  upstream = module.m0.id
+}
+
+module "m2" {
+  source   = "../../modules/m2"
+  prefix   = var.prefix
+  upstream = module.m1.id
+}
+
+module "m3" {
+  source   = "../../modules/m3"
+  prefix   = var.prefix
+  upstream = module.m1.id
+}
+
+module "m4" {
+  source   = "../../modules/m4"
+  prefix   = var.prefix
+  upstream = module.m1.id
+}
+
+module "m5" {
+  source   = "../../modules/m5"
+  prefix   = var.prefix
+  upstream = module.m4.id
+}
+
+module "m6" {
+  source   = "../../modules/m6"
+  prefix   = var.prefix
+  upstream = module.m4.id
+}
+
+module "m7" {
+  source   = "../../modules/m7"
+  prefix   = var.prefix
+  upstream = module.m4.id
+}
+
+module "m8" {
+  source   = "../../modules/m8"
+  prefix   = var.prefix
+  upstream = module.m0.id
+}
+
+module "m9" {
+  source   = "../../modules/m9"
+  prefix   = var.prefix
+  upstream = module.m7.id
+}
+
+module "m10" {
+  source   = "../../modules/m10"
+  prefix   = var.prefix
+  upstream = module.m2.id
+}
+
+module "m11" {
+  source   = "../../modules/m11"
+  prefix   = var.prefix
+  upstream = module.m2.id
+}
+
+module "m12" {
+  source   = "../../modules/m12"
+  prefix   = var.prefix
+  upstream = module.m6.id
+}
+
+module "m13" {
+  source   = "../../modules/m13"
+  prefix   = var.prefix
+  upstream = module.m12.id
+}
+
+module "m14" {
+  source   = "../../modules/m14"
+  prefix   = var.prefix
+  upstream = module.m2.id
+}
+
+module "m15" {
+  source   = "../../modules/m15"
+  prefix   = var.prefix
+  upstream = module.m2.id
+}
+
+module "m16" {
+  source   = "../../modules/m16"
+  prefix   = var.prefix
+  upstream = module.m5.id
+}
+
+module "m17" {
+  source   = "../../modules/m17"
+  prefix   = var.prefix
+  upstream = module.m15.id
+}
+
+module "m18" {
+  source   = "../../modules/m18"
+  prefix   = var.prefix
+  upstream = module.m13.id
+}
+
+module "m19" {
+  source   = "../../modules/m19"
+  prefix   = var.prefix
+  upstream = module.m11.id
+}
+
+module "m20" {
+  source   = "../../modules/m20"
+  prefix   = var.prefix
+  upstream = module.m12.id
+}
+
+module "m21" {
+  source   = "../../modules/m21"
+  prefix   = var.prefix
+  upstream = module.m9.id
+}
+
+module "m22" {
+  source   = "../../modules/m22"
+  prefix   = var.prefix
+  upstream = module.m16.id
+}
+
+module "m23" {
+  source   = "../../modules/m23"
+  prefix   = var.prefix
+  upstream = module.m19.id
+}
+
+module "m24" {
+  source   = "../../modules/m24"
+  prefix   = var.prefix
+  upstream = module.m9.id
+}
+
+module "m25" {
+  source   = "../../modules/m25"
+  prefix   = var.prefix
+  upstream = module.m19.id
+}
+
+module "m26" {
+  source   = "../../modules/m26"
+  prefix   = var.prefix
+  upstream = module.m15.id
+}
+
+module "m27" {
+  source   = "../../modules/m27"
+  prefix   = var.prefix
+  upstream = module.m6.id
+}
+
+module "m28" {
+  source   = "../../modules/m28"
+  prefix   = var.prefix
+  upstream = module.m4.id
+}
+
+module "m29" {
+  source   = "../../modules/m29"
+  prefix   = var.prefix
+  upstream = module.m2.id
+}
+
+module "m30" {
+  source   = "../../modules/m30"
+  prefix   = var.prefix
+  upstream = module.m22.id
+}
+
+module "m31" {
+  source   = "../../modules/m31"
+  prefix   = var.prefix
+  upstream = module.m6.id
+}
+
+module "m32" {
+  source   = "../../modules/m32"
+  prefix   = var.prefix
+  upstream = module.m30.id
+}
+
+module "m33" {
+  source   = "../../modules/m33"
+  prefix   = var.prefix
+  upstream = module.m14.id
+}
+
+module "m34" {
+  source   = "../../modules/m34"
+  prefix   = var.prefix
+  upstream = module.m6.id
+}
+
+module "m35" {
+  source   = "../../modules/m35"
+  prefix   = var.prefix
+  upstream = module.m32.id
+}
+
+module "m36" {
+  source   = "../../modules/m36"
+  prefix   = var.prefix
+  upstream = module.m4.id
+}
+
+module "m37" {
+  source   = "../../modules/m37"
+  prefix   = var.prefix
+  upstream = module.m5.id
+}
+
+module "m38" {
+  source   = "../../modules/m38"
+  prefix   = var.prefix
+  upstream = module.m23.id
+}
+
+module "m39" {
+  source   = "../../modules/m39"
+  prefix   = var.prefix
+  upstream = module.m19.id
+}
+
+module "m40" {
+  source   = "../../modules/m40"
+  prefix   = var.prefix
+  upstream = module.m6.id
+}
+
+module "m41" {
+  source   = "../../modules/m41"
+  prefix   = var.prefix
+  upstream = module.m3.id
+}
+
+module "m42" {
+  source   = "../../modules/m42"
+  prefix   = var.prefix
+  upstream = module.m11.id
+}
+
+module "m43" {
+  source   = "../../modules/m43"
+  prefix   = var.prefix
+  upstream = module.m38.id
+}
+
+module "m44" {
+  source   = "../../modules/m44"
+  prefix   = var.prefix
+  upstream = module.m4.id
+}
+
+module "m45" {
+  source   = "../../modules/m45"
+  prefix   = var.prefix
+  upstream = module.m6.id
+}
+
+module "m46" {
+  source   = "../../modules/m46"
+  prefix   = var.prefix
+  upstream = module.m25.id
+}
+
+module "m47" {
+  source   = "../../modules/m47"
+  prefix   = var.prefix
+  upstream = module.m11.id
+}
+
+output "last" {
+  value = module.m47.id
+}
@@ -0,0 +1,394 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m0"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_security_group" "r0" {
+  name     = "${var.prefix}-m0-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r1" {
+  name     = "${var.prefix}-m0-r1"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r2" {
+  name     = "${var.prefix}-m0-r2"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m0-r3"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m0-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r5" {
+  name     = "${var.prefix}-m0-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r6" {
+  name     = "${var.prefix}-m0-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r7" {
+  name     = "${var.prefix}-m0-r7"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r8" {
+  name     = "${var.prefix}-m0-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m0-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r10" {
+  name     = "${var.prefix}-m0-r10"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r11" {
+  name     = "${var.prefix}-m0-r11"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r12" {
+  name     = "${var.prefix}-m0-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  ref_1    = kubernetes_config_map.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r13" {
+  name     = "${var.prefix}-m0-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r10.id
+  ref_1    = helm_release.r12.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r14" {
+  name     = "${var.prefix}-m0-r14"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r15" {
+  name     = "${var.prefix}-m0-r15"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r16" {
+  name     = "${var.prefix}-m0-r16"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r17" {
+  name     = "${var.prefix}-m0-r17"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r18" {
+  name     = "${var.prefix}-m0-r18"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r19" {
+  name     = "${var.prefix}-m0-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  ref_1    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r20" {
+  name     = "${var.prefix}-m0-r20"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  ref_1    = kubernetes_service.r19.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r21" {
+  name     = "${var.prefix}-m0-r21"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r20.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r22" {
+  name     = "${var.prefix}-m0-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m0-r23"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r24" {
+  name     = "${var.prefix}-m0-r24"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_db_instance.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r25" {
+  name     = "${var.prefix}-m0-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r26" {
+  name     = "${var.prefix}-m0-r26"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r27" {
+  name     = "${var.prefix}-m0-r27"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r20.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r28" {
+  name     = "${var.prefix}-m0-r28"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  ref_1    = aws_instance.r13.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r29" {
+  name     = "${var.prefix}-m0-r29"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r30" {
+  name     = "${var.prefix}-m0-r30"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  ref_1    = aws_security_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r31" {
+  name     = "${var.prefix}-m0-r31"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m0-r32"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r33" {
+  name     = "${var.prefix}-m0-r33"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r25.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r34" {
+  name     = "${var.prefix}-m0-r34"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r35" {
+  name     = "${var.prefix}-m0-r35"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  ref_1    = aws_instance.r24.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r36" {
+  name     = "${var.prefix}-m0-r36"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r25.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r37" {
+  name     = "${var.prefix}-m0-r37"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r38" {
+  name     = "${var.prefix}-m0-r38"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r39" {
+  name     = "${var.prefix}-m0-r39"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  ref_1    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r40" {
+  name     = "${var.prefix}-m0-r40"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r36.id
+  ref_1    = aws_lb_target_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r41" {
+  name     = "${var.prefix}-m0-r41"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r42" {
+  name     = "${var.prefix}-m0-r42"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r28.id
+  ref_1    = kubernetes_service.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r43" {
+  name     = "${var.prefix}-m0-r43"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r35.id
+  ref_1    = aws_security_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r44" {
+  name     = "${var.prefix}-m0-r44"
+  upstream = var.upstream
+  ref_0    = aws_instance.r24.id
+  ref_1    = aws_security_group.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r45" {
+  name     = "${var.prefix}-m0-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r35.id
+  ref_1    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r46" {
+  name     = "${var.prefix}-m0-r46"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  ref_1    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r47" {
+  name     = "${var.prefix}-m0-r47"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r48" {
+  name     = "${var.prefix}-m0-r48"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r43.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r49" {
+  name     = "${var.prefix}-m0-r49"
+  upstream = var.upstream
+  ref_0    = helm_release.r12.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_instance.r49.id
+}
@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m1"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_ecr_repository" "r0" {
+  name     = "${var.prefix}-m1-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m1-r1"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r2" {
+  name     = "${var.prefix}-m1-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m1-r3"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r4" {
+  name     = "${var.prefix}-m1-r4"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r5" {
+  name     = "${var.prefix}-m1-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r6" {
+  name     = "${var.prefix}-m1-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r7" {
+  name     = "${var.prefix}-m1-r7"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r8" {
+  name     = "${var.prefix}-m1-r8"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  ref_1    = kubernetes_config_map.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r9" {
+  name     = "${var.prefix}-m1-r9"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r10" {
+  name     = "${var.prefix}-m1-r10"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r11" {
+  name     = "${var.prefix}-m1-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_instance.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m1-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r13" {
+  name     = "${var.prefix}-m1-r13"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = aws_s3_bucket.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r14" {
+  name     = "${var.prefix}-m1-r14"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r15" {
+  name     = "${var.prefix}-m1-r15"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r16" {
+  name     = "${var.prefix}-m1-r16"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  ref_1    = aws_instance.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r17" {
+  name     = "${var.prefix}-m1-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  ref_1    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r18" {
+  name     = "${var.prefix}-m1-r18"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  ref_1    = aws_s3_bucket.r6.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r19" {
+  name     = "${var.prefix}-m1-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r18.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r20" {
+  name     = "${var.prefix}-m1-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r21" {
+  name     = "${var.prefix}-m1-r21"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r16.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r22" {
+  name     = "${var.prefix}-m1-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r20.id
+  ref_1    = helm_release.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r23" {
+  name     = "${var.prefix}-m1-r23"
+  upstream = var.upstream
+  ref_0    = aws_instance.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r24" {
+  name     = "${var.prefix}-m1-r24"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r25" {
+  name     = "${var.prefix}-m1-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r26" {
+  name     = "${var.prefix}-m1-r26"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r27" {
+  name     = "${var.prefix}-m1-r27"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r19.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r28" {
+  name     = "${var.prefix}-m1-r28"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r27.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r29" {
+  name     = "${var.prefix}-m1-r29"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r30" {
+  name     = "${var.prefix}-m1-r30"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r21.id
+  ref_1    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r31" {
+  name     = "${var.prefix}-m1-r31"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m1-r32"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = aws_security_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r33" {
+  name     = "${var.prefix}-m1-r33"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r34" {
+  name     = "${var.prefix}-m1-r34"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r35" {
+  name     = "${var.prefix}-m1-r35"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r7.id
+  ref_1    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r36" {
+  name     = "${var.prefix}-m1-r36"
+  upstream = var.upstream
+  ref_0    = aws_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r37" {
+  name     = "${var.prefix}-m1-r37"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r36.id
+  ref_1    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r38" {
+  name     = "${var.prefix}-m1-r38"
+  upstream = var.upstream
+  ref_0    = aws_instance.r9.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r39" {
+  name     = "${var.prefix}-m1-r39"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m1-r40"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r41" {
+  name     = "${var.prefix}-m1-r41"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r23.id
+  ref_1    = aws_s3_bucket.r6.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r42" {
+  name     = "${var.prefix}-m1-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r26.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r43" {
+  name     = "${var.prefix}-m1-r43"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = aws_iam_role.r15.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r44" {
+  name     = "${var.prefix}-m1-r44"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r20.id
+  ref_1    = aws_security_group.r40.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r45" {
+  name     = "${var.prefix}-m1-r45"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m1-r46"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r20.id
+  ref_1    = aws_security_group.r40.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r47" {
+  name     = "${var.prefix}-m1-r47"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r32.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r48" {
+  name     = "${var.prefix}-m1-r48"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r49" {
+  name     = "${var.prefix}-m1-r49"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r32.id
+  ref_1    = aws_cloudwatch_log_group.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_security_group.r49.id
+}
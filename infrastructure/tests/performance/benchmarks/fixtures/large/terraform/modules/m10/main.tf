@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m10"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_service" "r0" {
+  name     = "${var.prefix}-m10-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r1" {
+  name     = "${var.prefix}-m10-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r2" {
+  name     = "${var.prefix}-m10-r2"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  ref_1    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r3" {
+  name     = "${var.prefix}-m10-r3"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m10-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = aws_security_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r5" {
+  name     = "${var.prefix}-m10-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  ref_1    = helm_release.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r6" {
+  name     = "${var.prefix}-m10-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  ref_1    = aws_lb_target_group.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r7" {
+  name     = "${var.prefix}-m10-r7"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r8" {
+  name     = "${var.prefix}-m10-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  ref_1    = aws_lb_target_group.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m10-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r10" {
+  name     = "${var.prefix}-m10-r10"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r11" {
+  name     = "${var.prefix}-m10-r11"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  ref_1    = aws_lb_target_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r12" {
+  name     = "${var.prefix}-m10-r12"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r13" {
+  name     = "${var.prefix}-m10-r13"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r14" {
+  name     = "${var.prefix}-m10-r14"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r8.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r15" {
+  name     = "${var.prefix}-m10-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r16" {
+  name     = "${var.prefix}-m10-r16"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  ref_1    = kubernetes_service.r7.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m10-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r18" {
+  name     = "${var.prefix}-m10-r18"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  ref_1    = helm_release.r15.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r19" {
+  name     = "${var.prefix}-m10-r19"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r20" {
+  name     = "${var.prefix}-m10-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r7.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r21" {
+  name     = "${var.prefix}-m10-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r22" {
+  name     = "${var.prefix}-m10-r22"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r21.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r23" {
+  name     = "${var.prefix}-m10-r23"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r17.id
+  ref_1    = aws_iam_role.r8.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r24" {
+  name     = "${var.prefix}-m10-r24"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r25" {
+  name     = "${var.prefix}-m10-r25"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r26" {
+  name     = "${var.prefix}-m10-r26"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r14.id
+  ref_1    = aws_security_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r27" {
+  name     = "${var.prefix}-m10-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r26.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r28" {
+  name     = "${var.prefix}-m10-r28"
+  upstream = var.upstream
+  ref_0    = helm_release.r15.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r29" {
+  name     = "${var.prefix}-m10-r29"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r30" {
+  name     = "${var.prefix}-m10-r30"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r13.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r31" {
+  name     = "${var.prefix}-m10-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  ref_1    = aws_db_instance.r17.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r32" {
+  name     = "${var.prefix}-m10-r32"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  ref_1    = aws_cloudwatch_log_group.r18.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r33" {
+  name     = "${var.prefix}-m10-r33"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r20.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r34" {
+  name     = "${var.prefix}-m10-r34"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r26.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r35" {
+  name     = "${var.prefix}-m10-r35"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r17.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r36" {
+  name     = "${var.prefix}-m10-r36"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r21.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r37" {
+  name     = "${var.prefix}-m10-r37"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r19.id
+  ref_1    = kubernetes_config_map.r26.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r38" {
+  name     = "${var.prefix}-m10-r38"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r39" {
+  name     = "${var.prefix}-m10-r39"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r25.id
+  ref_1    = aws_db_instance.r17.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r40" {
+  name     = "${var.prefix}-m10-r40"
+  upstream = var.upstream
+  ref_0    = helm_release.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r41" {
+  name     = "${var.prefix}-m10-r41"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r26.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r42" {
+  name     = "${var.prefix}-m10-r42"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r33.id
+  ref_1    = aws_security_group.r39.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r43" {
+  name     = "${var.prefix}-m10-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r25.id
+  ref_1    = aws_instance.r40.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r44" {
+  name     = "${var.prefix}-m10-r44"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r27.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r45" {
+  name     = "${var.prefix}-m10-r45"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r37.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m10-r46"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r25.id
+  ref_1    = kubernetes_service.r41.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r47" {
+  name     = "${var.prefix}-m10-r47"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r46.id
+  ref_1    = aws_security_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r48" {
+  name     = "${var.prefix}-m10-r48"
+  upstream = var.upstream
+  ref_0    = helm_release.r15.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r49" {
+  name     = "${var.prefix}-m10-r49"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  ref_1    = aws_cloudwatch_log_group.r27.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_iam_role.r49.id
+}
@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m11"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_s3_bucket" "r0" {
+  name     = "${var.prefix}-m11-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m11-r1"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r2" {
+  name     = "${var.prefix}-m11-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r3" {
+  name     = "${var.prefix}-m11-r3"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m11-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r5" {
+  name     = "${var.prefix}-m11-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r6" {
+  name     = "${var.prefix}-m11-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = kubernetes_service.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r7" {
+  name     = "${var.prefix}-m11-r7"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r8" {
+  name     = "${var.prefix}-m11-r8"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  ref_1    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r9" {
+  name     = "${var.prefix}-m11-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r10" {
+  name     = "${var.prefix}-m11-r10"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r9.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r11" {
+  name     = "${var.prefix}-m11-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r12" {
+  name     = "${var.prefix}-m11-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r13" {
+  name     = "${var.prefix}-m11-r13"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r14" {
+  name     = "${var.prefix}-m11-r14"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r15" {
+  name     = "${var.prefix}-m11-r15"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_lb_target_group.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r16" {
+  name     = "${var.prefix}-m11-r16"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r12.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r17" {
+  name     = "${var.prefix}-m11-r17"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  ref_1    = helm_release.r13.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r18" {
+  name     = "${var.prefix}-m11-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r12.id
+  ref_1    = aws_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r19" {
+  name     = "${var.prefix}-m11-r19"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r9.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r20" {
+  name     = "${var.prefix}-m11-r20"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = kubernetes_service.r12.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r21" {
+  name     = "${var.prefix}-m11-r21"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  ref_1    = aws_iam_role.r14.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r22" {
+  name     = "${var.prefix}-m11-r22"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r19.id
+  ref_1    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m11-r23"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_lb_target_group.r17.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r24" {
+  name     = "${var.prefix}-m11-r24"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r25" {
+  name     = "${var.prefix}-m11-r25"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = kubernetes_service.r23.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r26" {
+  name     = "${var.prefix}-m11-r26"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r23.id
+  ref_1    = aws_lb_target_group.r21.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r27" {
+  name     = "${var.prefix}-m11-r27"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r28" {
+  name     = "${var.prefix}-m11-r28"
+  upstream = var.upstream
+  ref_0    = aws_instance.r26.id
+  ref_1    = aws_iam_role.r19.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r29" {
+  name     = "${var.prefix}-m11-r29"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  ref_1    = aws_lb_target_group.r24.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r30" {
+  name     = "${var.prefix}-m11-r30"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r31" {
+  name     = "${var.prefix}-m11-r31"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r32" {
+  name     = "${var.prefix}-m11-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r33" {
+  name     = "${var.prefix}-m11-r33"
+  upstream = var.upstream
+  ref_0    = helm_release.r30.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r34" {
+  name     = "${var.prefix}-m11-r34"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r16.id
+  ref_1    = aws_cloudwatch_log_group.r15.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r35" {
+  name     = "${var.prefix}-m11-r35"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = aws_db_instance.r32.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r36" {
+  name     = "${var.prefix}-m11-r36"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r19.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r37" {
+  name     = "${var.prefix}-m11-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r36.id
+  ref_1    = aws_iam_role.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r38" {
+  name     = "${var.prefix}-m11-r38"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r25.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r39" {
+  name     = "${var.prefix}-m11-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r36.id
+  ref_1    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r40" {
+  name     = "${var.prefix}-m11-r40"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r9.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r41" {
+  name     = "${var.prefix}-m11-r41"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r31.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r42" {
+  name     = "${var.prefix}-m11-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r36.id
+  ref_1    = aws_ecr_repository.r39.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r43" {
+  name     = "${var.prefix}-m11-r43"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r44" {
+  name     = "${var.prefix}-m11-r44"
+  upstream = var.upstream
+  ref_0    = helm_release.r30.id
+  ref_1    = kubernetes_service.r16.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r45" {
+  name     = "${var.prefix}-m11-r45"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m11-r46"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r47" {
+  name     = "${var.prefix}-m11-r47"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r16.id
+  ref_1    = aws_lb_target_group.r28.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r48" {
+  name     = "${var.prefix}-m11-r48"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r9.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r49" {
+  name     = "${var.prefix}-m11-r49"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r12.id
+  ref_1    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_config_map.r49.id
+}
@@ -0,0 +1,411 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m12"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_iam_role" "r0" {
+  name     = "${var.prefix}-m12-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r1" {
+  name     = "${var.prefix}-m12-r1"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r2" {
+  name     = "${var.prefix}-m12-r2"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r3" {
+  name     = "${var.prefix}-m12-r3"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m12-r4"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r3.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r5" {
+  name     = "${var.prefix}-m12-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = aws_iam_role.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r6" {
+  name     = "${var.prefix}-m12-r6"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r7" {
+  name     = "${var.prefix}-m12-r7"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  ref_1    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r8" {
+  name     = "${var.prefix}-m12-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  ref_1    = aws_iam_role.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r9" {
+  name     = "${var.prefix}-m12-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  ref_1    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r10" {
+  name     = "${var.prefix}-m12-r10"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  ref_1    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r11" {
+  name     = "${var.prefix}-m12-r11"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r12" {
+  name     = "${var.prefix}-m12-r12"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r13" {
+  name     = "${var.prefix}-m12-r13"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r14" {
+  name     = "${var.prefix}-m12-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r9.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r15" {
+  name     = "${var.prefix}-m12-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r16" {
+  name     = "${var.prefix}-m12-r16"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r9.id
+  ref_1    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r17" {
+  name     = "${var.prefix}-m12-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r16.id
+  ref_1    = kubernetes_config_map.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r18" {
+  name     = "${var.prefix}-m12-r18"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  ref_1    = aws_db_instance.r14.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r19" {
+  name     = "${var.prefix}-m12-r19"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r20" {
+  name     = "${var.prefix}-m12-r20"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r21" {
+  name     = "${var.prefix}-m12-r21"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r2.id
+  ref_1    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r22" {
+  name     = "${var.prefix}-m12-r22"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r20.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m12-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = aws_cloudwatch_log_group.r20.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r24" {
+  name     = "${var.prefix}-m12-r24"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r25" {
+  name     = "${var.prefix}-m12-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r16.id
+  ref_1    = kubernetes_config_map.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r26" {
+  name     = "${var.prefix}-m12-r26"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = kubernetes_config_map.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r27" {
+  name     = "${var.prefix}-m12-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = kubernetes_config_map.r21.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r28" {
+  name     = "${var.prefix}-m12-r28"
+  upstream = var.upstream
+  ref_0    = aws_instance.r12.id
+  ref_1    = aws_s3_bucket.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r29" {
+  name     = "${var.prefix}-m12-r29"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r18.id
+  ref_1    = kubernetes_service.r13.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r30" {
+  name     = "${var.prefix}-m12-r30"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r31" {
+  name     = "${var.prefix}-m12-r31"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r2.id
+  ref_1    = aws_lb_target_group.r25.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m12-r32"
+  upstream = var.upstream
+  ref_0    = aws_instance.r22.id
+  ref_1    = kubernetes_config_map.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r33" {
+  name     = "${var.prefix}-m12-r33"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r15.id
+  ref_1    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r34" {
+  name     = "${var.prefix}-m12-r34"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r18.id
+  ref_1    = kubernetes_config_map.r16.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r35" {
+  name     = "${var.prefix}-m12-r35"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r36" {
+  name     = "${var.prefix}-m12-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r34.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r37" {
+  name     = "${var.prefix}-m12-r37"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r20.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r38" {
+  name     = "${var.prefix}-m12-r38"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = kubernetes_config_map.r16.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r39" {
+  name     = "${var.prefix}-m12-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r17.id
+  ref_1    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r40" {
+  name     = "${var.prefix}-m12-r40"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r41" {
+  name     = "${var.prefix}-m12-r41"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r40.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r42" {
+  name     = "${var.prefix}-m12-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  ref_1    = kubernetes_service.r39.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r43" {
+  name     = "${var.prefix}-m12-r43"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  ref_1    = aws_security_group.r31.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r44" {
+  name     = "${var.prefix}-m12-r44"
+  upstream = var.upstream
+  ref_0    = aws_instance.r22.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r45" {
+  name     = "${var.prefix}-m12-r45"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m12-r46"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r16.id
+  ref_1    = aws_ecr_repository.r29.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r47" {
+  name     = "${var.prefix}-m12-r47"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r48" {
+  name     = "${var.prefix}-m12-r48"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r45.id
+  ref_1    = aws_cloudwatch_log_group.r40.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r49" {
+  name     = "${var.prefix}-m12-r49"
+  upstream = var.upstream
+  ref_0    = aws_instance.r33.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_iam_role.r49.id
+}
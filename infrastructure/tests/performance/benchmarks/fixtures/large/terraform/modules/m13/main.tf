@@ -0,0 +1,410 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m13"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_lb_target_group" "r0" {
+  name     = "${var.prefix}-m13-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r1" {
+  name     = "${var.prefix}-m13-r1"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m13-r2"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r3" {
+  name     = "${var.prefix}-m13-r3"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r4" {
+  name     = "${var.prefix}-m13-r4"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r5" {
+  name     = "${var.prefix}-m13-r5"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r4.id
+  ref_1    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r6" {
+  name     = "${var.prefix}-m13-r6"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r4.id
+  ref_1    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r7" {
+  name     = "${var.prefix}-m13-r7"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r8" {
+  name     = "${var.prefix}-m13-r8"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r9" {
+  name     = "${var.prefix}-m13-r9"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r10" {
+  name     = "${var.prefix}-m13-r10"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  ref_1    = aws_iam_role.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r11" {
+  name     = "${var.prefix}-m13-r11"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r4.id
+  ref_1    = aws_lb_target_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r12" {
+  name     = "${var.prefix}-m13-r12"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = aws_cloudwatch_log_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r13" {
+  name     = "${var.prefix}-m13-r13"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r14" {
+  name     = "${var.prefix}-m13-r14"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  ref_1    = aws_cloudwatch_log_group.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r15" {
+  name     = "${var.prefix}-m13-r15"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r4.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r16" {
+  name     = "${var.prefix}-m13-r16"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r17" {
+  name     = "${var.prefix}-m13-r17"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r18" {
+  name     = "${var.prefix}-m13-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r19" {
+  name     = "${var.prefix}-m13-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r18.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r20" {
+  name     = "${var.prefix}-m13-r20"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r21" {
+  name     = "${var.prefix}-m13-r21"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r16.id
+  ref_1    = aws_lb_target_group.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r22" {
+  name     = "${var.prefix}-m13-r22"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m13-r23"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r24" {
+  name     = "${var.prefix}-m13-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r25" {
+  name     = "${var.prefix}-m13-r25"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  ref_1    = kubernetes_service.r18.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r26" {
+  name     = "${var.prefix}-m13-r26"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r15.id
+  ref_1    = aws_s3_bucket.r25.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r27" {
+  name     = "${var.prefix}-m13-r27"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r11.id
+  ref_1    = aws_ecr_repository.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r28" {
+  name     = "${var.prefix}-m13-r28"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r29" {
+  name     = "${var.prefix}-m13-r29"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r30" {
+  name     = "${var.prefix}-m13-r30"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  ref_1    = aws_lb_target_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r31" {
+  name     = "${var.prefix}-m13-r31"
+  upstream = var.upstream
+  ref_0    = helm_release.r7.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m13-r32"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r27.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r33" {
+  name     = "${var.prefix}-m13-r33"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r11.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r34" {
+  name     = "${var.prefix}-m13-r34"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r26.id
+  ref_1    = aws_cloudwatch_log_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r35" {
+  name     = "${var.prefix}-m13-r35"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r33.id
+  ref_1    = aws_iam_role.r17.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r36" {
+  name     = "${var.prefix}-m13-r36"
+  upstream = var.upstream
+  ref_0    = helm_release.r30.id
+  ref_1    = kubernetes_service.r23.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r37" {
+  name     = "${var.prefix}-m13-r37"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r34.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r38" {
+  name     = "${var.prefix}-m13-r38"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r20.id
+  ref_1    = helm_release.r7.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r39" {
+  name     = "${var.prefix}-m13-r39"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r32.id
+  ref_1    = aws_instance.r38.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r40" {
+  name     = "${var.prefix}-m13-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r23.id
+  ref_1    = aws_instance.r28.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r41" {
+  name     = "${var.prefix}-m13-r41"
+  upstream = var.upstream
+  ref_0    = aws_instance.r21.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r42" {
+  name     = "${var.prefix}-m13-r42"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r36.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r43" {
+  name     = "${var.prefix}-m13-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r36.id
+  ref_1    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r44" {
+  name     = "${var.prefix}-m13-r44"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r34.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r45" {
+  name     = "${var.prefix}-m13-r45"
+  upstream = var.upstream
+  ref_0    = aws_instance.r44.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m13-r46"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r22.id
+  ref_1    = kubernetes_service.r18.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r47" {
+  name     = "${var.prefix}-m13-r47"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r37.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r48" {
+  name     = "${var.prefix}-m13-r48"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r23.id
+  ref_1    = aws_db_instance.r46.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r49" {
+  name     = "${var.prefix}-m13-r49"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = helm_release.r49.id
+}
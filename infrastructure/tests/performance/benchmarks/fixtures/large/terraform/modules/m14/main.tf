@@ -0,0 +1,402 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m14"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_s3_bucket" "r0" {
+  name     = "${var.prefix}-m14-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r1" {
+  name     = "${var.prefix}-m14-r1"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r2" {
+  name     = "${var.prefix}-m14-r2"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r3" {
+  name     = "${var.prefix}-m14-r3"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r4" {
+  name     = "${var.prefix}-m14-r4"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  ref_1    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r5" {
+  name     = "${var.prefix}-m14-r5"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  ref_1    = kubernetes_service.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r6" {
+  name     = "${var.prefix}-m14-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r7" {
+  name     = "${var.prefix}-m14-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  ref_1    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r8" {
+  name     = "${var.prefix}-m14-r8"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_cloudwatch_log_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r9" {
+  name     = "${var.prefix}-m14-r9"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r10" {
+  name     = "${var.prefix}-m14-r10"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r11" {
+  name     = "${var.prefix}-m14-r11"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r12" {
+  name     = "${var.prefix}-m14-r12"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  ref_1    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r13" {
+  name     = "${var.prefix}-m14-r13"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r4.id
+  ref_1    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r14" {
+  name     = "${var.prefix}-m14-r14"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_cloudwatch_log_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r15" {
+  name     = "${var.prefix}-m14-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r12.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r16" {
+  name     = "${var.prefix}-m14-r16"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r17" {
+  name     = "${var.prefix}-m14-r17"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r13.id
+  ref_1    = kubernetes_config_map.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r18" {
+  name     = "${var.prefix}-m14-r18"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r17.id
+  ref_1    = aws_iam_role.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r19" {
+  name     = "${var.prefix}-m14-r19"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r16.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r20" {
+  name     = "${var.prefix}-m14-r20"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r21" {
+  name     = "${var.prefix}-m14-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r22" {
+  name     = "${var.prefix}-m14-r22"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m14-r23"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r15.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r24" {
+  name     = "${var.prefix}-m14-r24"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r11.id
+  ref_1    = kubernetes_config_map.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r25" {
+  name     = "${var.prefix}-m14-r25"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r20.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r26" {
+  name     = "${var.prefix}-m14-r26"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r12.id
+  ref_1    = helm_release.r24.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r27" {
+  name     = "${var.prefix}-m14-r27"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r18.id
+  ref_1    = kubernetes_service.r23.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r28" {
+  name     = "${var.prefix}-m14-r28"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r18.id
+  ref_1    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r29" {
+  name     = "${var.prefix}-m14-r29"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r30" {
+  name     = "${var.prefix}-m14-r30"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r22.id
+  ref_1    = helm_release.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r31" {
+  name     = "${var.prefix}-m14-r31"
+  upstream = var.upstream
+  ref_0    = helm_release.r24.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r32" {
+  name     = "${var.prefix}-m14-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r33" {
+  name     = "${var.prefix}-m14-r33"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r17.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r34" {
+  name     = "${var.prefix}-m14-r34"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r16.id
+  ref_1    = kubernetes_config_map.r31.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r35" {
+  name     = "${var.prefix}-m14-r35"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r15.id
+  ref_1    = aws_s3_bucket.r17.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r36" {
+  name     = "${var.prefix}-m14-r36"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r27.id
+  ref_1    = aws_iam_role.r28.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r37" {
+  name     = "${var.prefix}-m14-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r31.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r38" {
+  name     = "${var.prefix}-m14-r38"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r39" {
+  name     = "${var.prefix}-m14-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r12.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r40" {
+  name     = "${var.prefix}-m14-r40"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r14.id
+  ref_1    = kubernetes_service.r23.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r41" {
+  name     = "${var.prefix}-m14-r41"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r29.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r42" {
+  name     = "${var.prefix}-m14-r42"
+  upstream = var.upstream
+  ref_0    = helm_release.r21.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r43" {
+  name     = "${var.prefix}-m14-r43"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r16.id
+  ref_1    = aws_lb_target_group.r35.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r44" {
+  name     = "${var.prefix}-m14-r44"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r32.id
+  ref_1    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r45" {
+  name     = "${var.prefix}-m14-r45"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r32.id
+  ref_1    = aws_cloudwatch_log_group.r38.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r46" {
+  name     = "${var.prefix}-m14-r46"
+  upstream = var.upstream
+  ref_0    = aws_instance.r41.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r47" {
+  name     = "${var.prefix}-m14-r47"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r31.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r48" {
+  name     = "${var.prefix}-m14-r48"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r17.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r49" {
+  name     = "${var.prefix}-m14-r49"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  ref_1    = aws_cloudwatch_log_group.r6.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_cloudwatch_log_group.r49.id
+}
@@ -0,0 +1,402 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m15"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_service" "r0" {
+  name     = "${var.prefix}-m15-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r1" {
+  name     = "${var.prefix}-m15-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r2" {
+  name     = "${var.prefix}-m15-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r3" {
+  name     = "${var.prefix}-m15-r3"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r4" {
+  name     = "${var.prefix}-m15-r4"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r5" {
+  name     = "${var.prefix}-m15-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r6" {
+  name     = "${var.prefix}-m15-r6"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r7" {
+  name     = "${var.prefix}-m15-r7"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r8" {
+  name     = "${var.prefix}-m15-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r9" {
+  name     = "${var.prefix}-m15-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r10" {
+  name     = "${var.prefix}-m15-r10"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r11" {
+  name     = "${var.prefix}-m15-r11"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r9.id
+  ref_1    = aws_security_group.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r12" {
+  name     = "${var.prefix}-m15-r12"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r4.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r13" {
+  name     = "${var.prefix}-m15-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r14" {
+  name     = "${var.prefix}-m15-r14"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  ref_1    = kubernetes_service.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r15" {
+  name     = "${var.prefix}-m15-r15"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r16" {
+  name     = "${var.prefix}-m15-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r17" {
+  name     = "${var.prefix}-m15-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r18" {
+  name     = "${var.prefix}-m15-r18"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = aws_lb_target_group.r16.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r19" {
+  name     = "${var.prefix}-m15-r19"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r20" {
+  name     = "${var.prefix}-m15-r20"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r21" {
+  name     = "${var.prefix}-m15-r21"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r22" {
+  name     = "${var.prefix}-m15-r22"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  ref_1    = helm_release.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r23" {
+  name     = "${var.prefix}-m15-r23"
+  upstream = var.upstream
+  ref_0    = helm_release.r17.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r24" {
+  name     = "${var.prefix}-m15-r24"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r22.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r25" {
+  name     = "${var.prefix}-m15-r25"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r26" {
+  name     = "${var.prefix}-m15-r26"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r27" {
+  name     = "${var.prefix}-m15-r27"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  ref_1    = aws_lb_target_group.r21.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r28" {
+  name     = "${var.prefix}-m15-r28"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = aws_lb_target_group.r27.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r29" {
+  name     = "${var.prefix}-m15-r29"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r30" {
+  name     = "${var.prefix}-m15-r30"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r15.id
+  ref_1    = aws_lb_target_group.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r31" {
+  name     = "${var.prefix}-m15-r31"
+  upstream = var.upstream
+  ref_0    = aws_instance.r28.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r32" {
+  name     = "${var.prefix}-m15-r32"
+  upstream = var.upstream
+  ref_0    = helm_release.r17.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r33" {
+  name     = "${var.prefix}-m15-r33"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r34" {
+  name     = "${var.prefix}-m15-r34"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = aws_cloudwatch_log_group.r13.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r35" {
+  name     = "${var.prefix}-m15-r35"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r30.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r36" {
+  name     = "${var.prefix}-m15-r36"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r37" {
+  name     = "${var.prefix}-m15-r37"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r16.id
+  ref_1    = aws_ecr_repository.r30.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r38" {
+  name     = "${var.prefix}-m15-r38"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r27.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r39" {
+  name     = "${var.prefix}-m15-r39"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r15.id
+  ref_1    = aws_s3_bucket.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r40" {
+  name     = "${var.prefix}-m15-r40"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r4.id
+  ref_1    = aws_db_instance.r38.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r41" {
+  name     = "${var.prefix}-m15-r41"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r39.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r42" {
+  name     = "${var.prefix}-m15-r42"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r24.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r43" {
+  name     = "${var.prefix}-m15-r43"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r36.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r44" {
+  name     = "${var.prefix}-m15-r44"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = aws_cloudwatch_log_group.r13.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r45" {
+  name     = "${var.prefix}-m15-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = aws_iam_role.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r46" {
+  name     = "${var.prefix}-m15-r46"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r47" {
+  name     = "${var.prefix}-m15-r47"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r48" {
+  name     = "${var.prefix}-m15-r48"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r47.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r49" {
+  name     = "${var.prefix}-m15-r49"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r39.id
+  ref_1    = kubernetes_config_map.r40.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_ecr_repository.r49.id
+}
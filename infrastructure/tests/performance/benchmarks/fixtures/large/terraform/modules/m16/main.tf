@@ -0,0 +1,410 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m16"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_security_group" "r0" {
+  name     = "${var.prefix}-m16-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r1" {
+  name     = "${var.prefix}-m16-r1"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r2" {
+  name     = "${var.prefix}-m16-r2"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r3" {
+  name     = "${var.prefix}-m16-r3"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r4" {
+  name     = "${var.prefix}-m16-r4"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r5" {
+  name     = "${var.prefix}-m16-r5"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r6" {
+  name     = "${var.prefix}-m16-r6"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r7" {
+  name     = "${var.prefix}-m16-r7"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r8" {
+  name     = "${var.prefix}-m16-r8"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r9" {
+  name     = "${var.prefix}-m16-r9"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r10" {
+  name     = "${var.prefix}-m16-r10"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r11" {
+  name     = "${var.prefix}-m16-r11"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r10.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r12" {
+  name     = "${var.prefix}-m16-r12"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r13" {
+  name     = "${var.prefix}-m16-r13"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = aws_iam_role.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r14" {
+  name     = "${var.prefix}-m16-r14"
+  upstream = var.upstream
+  ref_0    = aws_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r15" {
+  name     = "${var.prefix}-m16-r15"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r8.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r16" {
+  name     = "${var.prefix}-m16-r16"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r17" {
+  name     = "${var.prefix}-m16-r17"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r13.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r18" {
+  name     = "${var.prefix}-m16-r18"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r19" {
+  name     = "${var.prefix}-m16-r19"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = kubernetes_service.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r20" {
+  name     = "${var.prefix}-m16-r20"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  ref_1    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r21" {
+  name     = "${var.prefix}-m16-r21"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r22" {
+  name     = "${var.prefix}-m16-r22"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m16-r23"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_iam_role.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r24" {
+  name     = "${var.prefix}-m16-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r25" {
+  name     = "${var.prefix}-m16-r25"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r16.id
+  ref_1    = aws_s3_bucket.r23.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r26" {
+  name     = "${var.prefix}-m16-r26"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r27" {
+  name     = "${var.prefix}-m16-r27"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r8.id
+  ref_1    = aws_iam_role.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r28" {
+  name     = "${var.prefix}-m16-r28"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r13.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r29" {
+  name     = "${var.prefix}-m16-r29"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r25.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r30" {
+  name     = "${var.prefix}-m16-r30"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r14.id
+  ref_1    = aws_security_group.r25.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r31" {
+  name     = "${var.prefix}-m16-r31"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r10.id
+  ref_1    = aws_db_instance.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r32" {
+  name     = "${var.prefix}-m16-r32"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r33" {
+  name     = "${var.prefix}-m16-r33"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r32.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r34" {
+  name     = "${var.prefix}-m16-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r35" {
+  name     = "${var.prefix}-m16-r35"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r36" {
+  name     = "${var.prefix}-m16-r36"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  ref_1    = aws_lb_target_group.r32.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r37" {
+  name     = "${var.prefix}-m16-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r36.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r38" {
+  name     = "${var.prefix}-m16-r38"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r18.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r39" {
+  name     = "${var.prefix}-m16-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r11.id
+  ref_1    = aws_lb_target_group.r34.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r40" {
+  name     = "${var.prefix}-m16-r40"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r37.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r41" {
+  name     = "${var.prefix}-m16-r41"
+  upstream = var.upstream
+  ref_0    = aws_instance.r29.id
+  ref_1    = aws_lb_target_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r42" {
+  name     = "${var.prefix}-m16-r42"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r17.id
+  ref_1    = aws_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r43" {
+  name     = "${var.prefix}-m16-r43"
+  upstream = var.upstream
+  ref_0    = aws_instance.r31.id
+  ref_1    = aws_iam_role.r16.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r44" {
+  name     = "${var.prefix}-m16-r44"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r27.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r45" {
+  name     = "${var.prefix}-m16-r45"
+  upstream = var.upstream
+  ref_0    = aws_instance.r31.id
+  ref_1    = aws_iam_role.r24.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r46" {
+  name     = "${var.prefix}-m16-r46"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r45.id
+  ref_1    = aws_lb_target_group.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r47" {
+  name     = "${var.prefix}-m16-r47"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r48" {
+  name     = "${var.prefix}-m16-r48"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r36.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r49" {
+  name     = "${var.prefix}-m16-r49"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r11.id
+  ref_1    = aws_instance.r31.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_cloudwatch_log_group.r49.id
+}
@@ -0,0 +1,408 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m17"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_db_instance" "r0" {
+  name     = "${var.prefix}-m17-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m17-r1"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m17-r2"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r0.id
+  ref_1    = helm_release.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r3" {
+  name     = "${var.prefix}-m17-r3"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m17-r4"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  ref_1    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r5" {
+  name     = "${var.prefix}-m17-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_instance.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r6" {
+  name     = "${var.prefix}-m17-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r7" {
+  name     = "${var.prefix}-m17-r7"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r8" {
+  name     = "${var.prefix}-m17-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r9" {
+  name     = "${var.prefix}-m17-r9"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r10" {
+  name     = "${var.prefix}-m17-r10"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r0.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r11" {
+  name     = "${var.prefix}-m17-r11"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r12" {
+  name     = "${var.prefix}-m17-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r13" {
+  name     = "${var.prefix}-m17-r13"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r12.id
+  ref_1    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r14" {
+  name     = "${var.prefix}-m17-r14"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  ref_1    = aws_db_instance.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r15" {
+  name     = "${var.prefix}-m17-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r14.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r16" {
+  name     = "${var.prefix}-m17-r16"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r17" {
+  name     = "${var.prefix}-m17-r17"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r16.id
+  ref_1    = aws_lb_target_group.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r18" {
+  name     = "${var.prefix}-m17-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r19" {
+  name     = "${var.prefix}-m17-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r20" {
+  name     = "${var.prefix}-m17-r20"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r18.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r21" {
+  name     = "${var.prefix}-m17-r21"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  ref_1    = aws_s3_bucket.r20.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r22" {
+  name     = "${var.prefix}-m17-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_db_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r23" {
+  name     = "${var.prefix}-m17-r23"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r24" {
+  name     = "${var.prefix}-m17-r24"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r25" {
+  name     = "${var.prefix}-m17-r25"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  ref_1    = aws_s3_bucket.r22.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r26" {
+  name     = "${var.prefix}-m17-r26"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  ref_1    = helm_release.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r27" {
+  name     = "${var.prefix}-m17-r27"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r28" {
+  name     = "${var.prefix}-m17-r28"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r14.id
+  ref_1    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r29" {
+  name     = "${var.prefix}-m17-r29"
+  upstream = var.upstream
+  ref_0    = helm_release.r27.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r30" {
+  name     = "${var.prefix}-m17-r30"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r31" {
+  name     = "${var.prefix}-m17-r31"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  ref_1    = aws_s3_bucket.r22.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r32" {
+  name     = "${var.prefix}-m17-r32"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r8.id
+  ref_1    = aws_ecr_repository.r29.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r33" {
+  name     = "${var.prefix}-m17-r33"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r30.id
+  ref_1    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r34" {
+  name     = "${var.prefix}-m17-r34"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r10.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r35" {
+  name     = "${var.prefix}-m17-r35"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r36" {
+  name     = "${var.prefix}-m17-r36"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r23.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r37" {
+  name     = "${var.prefix}-m17-r37"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r34.id
+  ref_1    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r38" {
+  name     = "${var.prefix}-m17-r38"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r31.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r39" {
+  name     = "${var.prefix}-m17-r39"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r40" {
+  name     = "${var.prefix}-m17-r40"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r30.id
+  ref_1    = aws_db_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r41" {
+  name     = "${var.prefix}-m17-r41"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r42" {
+  name     = "${var.prefix}-m17-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r10.id
+  ref_1    = aws_db_instance.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r43" {
+  name     = "${var.prefix}-m17-r43"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  ref_1    = aws_lb_target_group.r17.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r44" {
+  name     = "${var.prefix}-m17-r44"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r41.id
+  ref_1    = aws_db_instance.r34.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r45" {
+  name     = "${var.prefix}-m17-r45"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r13.id
+  ref_1    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r46" {
+  name     = "${var.prefix}-m17-r46"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r25.id
+  ref_1    = kubernetes_service.r40.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r47" {
+  name     = "${var.prefix}-m17-r47"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r22.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r48" {
+  name     = "${var.prefix}-m17-r48"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r31.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r49" {
+  name     = "${var.prefix}-m17-r49"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r32.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_cloudwatch_log_group.r49.id
+}
@@ -0,0 +1,403 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m18"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_security_group" "r0" {
+  name     = "${var.prefix}-m18-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r1" {
+  name     = "${var.prefix}-m18-r1"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r2" {
+  name     = "${var.prefix}-m18-r2"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r3" {
+  name     = "${var.prefix}-m18-r3"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m18-r4"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r5" {
+  name     = "${var.prefix}-m18-r5"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  ref_1    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r6" {
+  name     = "${var.prefix}-m18-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r7" {
+  name     = "${var.prefix}-m18-r7"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r8" {
+  name     = "${var.prefix}-m18-r8"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m18-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r7.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r10" {
+  name     = "${var.prefix}-m18-r10"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r11" {
+  name     = "${var.prefix}-m18-r11"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r12" {
+  name     = "${var.prefix}-m18-r12"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r13" {
+  name     = "${var.prefix}-m18-r13"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r14" {
+  name     = "${var.prefix}-m18-r14"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r15" {
+  name     = "${var.prefix}-m18-r15"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r16" {
+  name     = "${var.prefix}-m18-r16"
+  upstream = var.upstream
+  ref_0    = aws_instance.r8.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r17" {
+  name     = "${var.prefix}-m18-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r12.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r18" {
+  name     = "${var.prefix}-m18-r18"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  ref_1    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r19" {
+  name     = "${var.prefix}-m18-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r12.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m18-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r13.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r21" {
+  name     = "${var.prefix}-m18-r21"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m18-r22"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  ref_1    = helm_release.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r23" {
+  name     = "${var.prefix}-m18-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r12.id
+  ref_1    = aws_s3_bucket.r17.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r24" {
+  name     = "${var.prefix}-m18-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r23.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r25" {
+  name     = "${var.prefix}-m18-r25"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r26" {
+  name     = "${var.prefix}-m18-r26"
+  upstream = var.upstream
+  ref_0    = helm_release.r20.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r27" {
+  name     = "${var.prefix}-m18-r27"
+  upstream = var.upstream
+  ref_0    = helm_release.r21.id
+  ref_1    = aws_lb_target_group.r25.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r28" {
+  name     = "${var.prefix}-m18-r28"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r11.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r29" {
+  name     = "${var.prefix}-m18-r29"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r26.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r30" {
+  name     = "${var.prefix}-m18-r30"
+  upstream = var.upstream
+  ref_0    = aws_instance.r8.id
+  ref_1    = aws_db_instance.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r31" {
+  name     = "${var.prefix}-m18-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r32" {
+  name     = "${var.prefix}-m18-r32"
+  upstream = var.upstream
+  ref_0    = aws_instance.r30.id
+  ref_1    = kubernetes_service.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r33" {
+  name     = "${var.prefix}-m18-r33"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r32.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r34" {
+  name     = "${var.prefix}-m18-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r35" {
+  name     = "${var.prefix}-m18-r35"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r17.id
+  ref_1    = aws_iam_role.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r36" {
+  name     = "${var.prefix}-m18-r36"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r37" {
+  name     = "${var.prefix}-m18-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r36.id
+  ref_1    = aws_s3_bucket.r27.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r38" {
+  name     = "${var.prefix}-m18-r38"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r6.id
+  ref_1    = aws_s3_bucket.r24.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r39" {
+  name     = "${var.prefix}-m18-r39"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r14.id
+  ref_1    = helm_release.r20.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r40" {
+  name     = "${var.prefix}-m18-r40"
+  upstream = var.upstream
+  ref_0    = helm_release.r21.id
+  ref_1    = aws_iam_role.r22.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r41" {
+  name     = "${var.prefix}-m18-r41"
+  upstream = var.upstream
+  ref_0    = aws_instance.r31.id
+  ref_1    = helm_release.r20.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r42" {
+  name     = "${var.prefix}-m18-r42"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r17.id
+  ref_1    = aws_iam_role.r16.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r43" {
+  name     = "${var.prefix}-m18-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r19.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r44" {
+  name     = "${var.prefix}-m18-r44"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r35.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r45" {
+  name     = "${var.prefix}-m18-r45"
+  upstream = var.upstream
+  ref_0    = aws_instance.r31.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r46" {
+  name     = "${var.prefix}-m18-r46"
+  upstream = var.upstream
+  ref_0    = aws_instance.r33.id
+  ref_1    = aws_lb_target_group.r25.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r47" {
+  name     = "${var.prefix}-m18-r47"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r48" {
+  name     = "${var.prefix}-m18-r48"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r27.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r49" {
+  name     = "${var.prefix}-m18-r49"
+  upstream = var.upstream
+  ref_0    = aws_instance.r31.id
+  ref_1    = aws_lb_target_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = helm_release.r49.id
+}
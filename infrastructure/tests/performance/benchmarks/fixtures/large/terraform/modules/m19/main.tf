@@ -0,0 +1,398 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m19"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_ecr_repository" "r0" {
+  name     = "${var.prefix}-m19-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r1" {
+  name     = "${var.prefix}-m19-r1"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r2" {
+  name     = "${var.prefix}-m19-r2"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r3" {
+  name     = "${var.prefix}-m19-r3"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r4" {
+  name     = "${var.prefix}-m19-r4"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r5" {
+  name     = "${var.prefix}-m19-r5"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r6" {
+  name     = "${var.prefix}-m19-r6"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r1.id
+  ref_1    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r7" {
+  name     = "${var.prefix}-m19-r7"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r8" {
+  name     = "${var.prefix}-m19-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r9" {
+  name     = "${var.prefix}-m19-r9"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r10" {
+  name     = "${var.prefix}-m19-r10"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r11" {
+  name     = "${var.prefix}-m19-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  ref_1    = aws_ecr_repository.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r12" {
+  name     = "${var.prefix}-m19-r12"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r13" {
+  name     = "${var.prefix}-m19-r13"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r14" {
+  name     = "${var.prefix}-m19-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r15" {
+  name     = "${var.prefix}-m19-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r16" {
+  name     = "${var.prefix}-m19-r16"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r1.id
+  ref_1    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r17" {
+  name     = "${var.prefix}-m19-r17"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r12.id
+  ref_1    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r18" {
+  name     = "${var.prefix}-m19-r18"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  ref_1    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r19" {
+  name     = "${var.prefix}-m19-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  ref_1    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r20" {
+  name     = "${var.prefix}-m19-r20"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r21" {
+  name     = "${var.prefix}-m19-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  ref_1    = aws_ecr_repository.r9.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r22" {
+  name     = "${var.prefix}-m19-r22"
+  upstream = var.upstream
+  ref_0    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m19-r23"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  ref_1    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r24" {
+  name     = "${var.prefix}-m19-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  ref_1    = aws_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r25" {
+  name     = "${var.prefix}-m19-r25"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r24.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r26" {
+  name     = "${var.prefix}-m19-r26"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r27" {
+  name     = "${var.prefix}-m19-r27"
+  upstream = var.upstream
+  ref_0    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r28" {
+  name     = "${var.prefix}-m19-r28"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  ref_1    = aws_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r29" {
+  name     = "${var.prefix}-m19-r29"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r30" {
+  name     = "${var.prefix}-m19-r30"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  ref_1    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r31" {
+  name     = "${var.prefix}-m19-r31"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  ref_1    = aws_security_group.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r32" {
+  name     = "${var.prefix}-m19-r32"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = kubernetes_service.r20.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r33" {
+  name     = "${var.prefix}-m19-r33"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r23.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r34" {
+  name     = "${var.prefix}-m19-r34"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r22.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r35" {
+  name     = "${var.prefix}-m19-r35"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r36" {
+  name     = "${var.prefix}-m19-r36"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r27.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r37" {
+  name     = "${var.prefix}-m19-r37"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  ref_1    = aws_ecr_repository.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r38" {
+  name     = "${var.prefix}-m19-r38"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r25.id
+  ref_1    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r39" {
+  name     = "${var.prefix}-m19-r39"
+  upstream = var.upstream
+  ref_0    = aws_instance.r29.id
+  ref_1    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r40" {
+  name     = "${var.prefix}-m19-r40"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r12.id
+  ref_1    = kubernetes_service.r30.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r41" {
+  name     = "${var.prefix}-m19-r41"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r38.id
+  ref_1    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r42" {
+  name     = "${var.prefix}-m19-r42"
+  upstream = var.upstream
+  ref_0    = aws_instance.r15.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r43" {
+  name     = "${var.prefix}-m19-r43"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r24.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r44" {
+  name     = "${var.prefix}-m19-r44"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  ref_1    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r45" {
+  name     = "${var.prefix}-m19-r45"
+  upstream = var.upstream
+  ref_0    = helm_release.r44.id
+  ref_1    = kubernetes_service.r23.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r46" {
+  name     = "${var.prefix}-m19-r46"
+  upstream = var.upstream
+  ref_0    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r47" {
+  name     = "${var.prefix}-m19-r47"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r48" {
+  name     = "${var.prefix}-m19-r48"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  ref_1    = aws_security_group.r42.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r49" {
+  name     = "${var.prefix}-m19-r49"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_config_map.r49.id
+}
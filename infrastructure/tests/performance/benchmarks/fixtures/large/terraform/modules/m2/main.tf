@@ -0,0 +1,403 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m2"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_service" "r0" {
+  name     = "${var.prefix}-m2-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r1" {
+  name     = "${var.prefix}-m2-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r2" {
+  name     = "${var.prefix}-m2-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r3" {
+  name     = "${var.prefix}-m2-r3"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r4" {
+  name     = "${var.prefix}-m2-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r5" {
+  name     = "${var.prefix}-m2-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r6" {
+  name     = "${var.prefix}-m2-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r7" {
+  name     = "${var.prefix}-m2-r7"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r8" {
+  name     = "${var.prefix}-m2-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  ref_1    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r9" {
+  name     = "${var.prefix}-m2-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  ref_1    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r10" {
+  name     = "${var.prefix}-m2-r10"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r11" {
+  name     = "${var.prefix}-m2-r11"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r12" {
+  name     = "${var.prefix}-m2-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r13" {
+  name     = "${var.prefix}-m2-r13"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r14" {
+  name     = "${var.prefix}-m2-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r15" {
+  name     = "${var.prefix}-m2-r15"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r10.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r16" {
+  name     = "${var.prefix}-m2-r16"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r17" {
+  name     = "${var.prefix}-m2-r17"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r18" {
+  name     = "${var.prefix}-m2-r18"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = aws_security_group.r15.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r19" {
+  name     = "${var.prefix}-m2-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  ref_1    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r20" {
+  name     = "${var.prefix}-m2-r20"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r18.id
+  ref_1    = aws_security_group.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r21" {
+  name     = "${var.prefix}-m2-r21"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  ref_1    = aws_security_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r22" {
+  name     = "${var.prefix}-m2-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r7.id
+  ref_1    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r23" {
+  name     = "${var.prefix}-m2-r23"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r24" {
+  name     = "${var.prefix}-m2-r24"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r22.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r25" {
+  name     = "${var.prefix}-m2-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r26" {
+  name     = "${var.prefix}-m2-r26"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  ref_1    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r27" {
+  name     = "${var.prefix}-m2-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r28" {
+  name     = "${var.prefix}-m2-r28"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r29" {
+  name     = "${var.prefix}-m2-r29"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = aws_instance.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r30" {
+  name     = "${var.prefix}-m2-r30"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r20.id
+  ref_1    = aws_cloudwatch_log_group.r22.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r31" {
+  name     = "${var.prefix}-m2-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r32" {
+  name     = "${var.prefix}-m2-r32"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r20.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r33" {
+  name     = "${var.prefix}-m2-r33"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r22.id
+  ref_1    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r34" {
+  name     = "${var.prefix}-m2-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r16.id
+  ref_1    = aws_instance.r26.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r35" {
+  name     = "${var.prefix}-m2-r35"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r18.id
+  ref_1    = aws_cloudwatch_log_group.r22.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r36" {
+  name     = "${var.prefix}-m2-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r35.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r37" {
+  name     = "${var.prefix}-m2-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r21.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r38" {
+  name     = "${var.prefix}-m2-r38"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r31.id
+  ref_1    = aws_ecr_repository.r33.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r39" {
+  name     = "${var.prefix}-m2-r39"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r20.id
+  ref_1    = aws_db_instance.r25.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r40" {
+  name     = "${var.prefix}-m2-r40"
+  upstream = var.upstream
+  ref_0    = helm_release.r32.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r41" {
+  name     = "${var.prefix}-m2-r41"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r38.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r42" {
+  name     = "${var.prefix}-m2-r42"
+  upstream = var.upstream
+  ref_0    = helm_release.r32.id
+  ref_1    = aws_instance.r14.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r43" {
+  name     = "${var.prefix}-m2-r43"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r39.id
+  ref_1    = kubernetes_service.r11.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r44" {
+  name     = "${var.prefix}-m2-r44"
+  upstream = var.upstream
+  ref_0    = helm_release.r23.id
+  ref_1    = kubernetes_service.r35.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r45" {
+  name     = "${var.prefix}-m2-r45"
+  upstream = var.upstream
+  ref_0    = aws_instance.r26.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r46" {
+  name     = "${var.prefix}-m2-r46"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r45.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r47" {
+  name     = "${var.prefix}-m2-r47"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r35.id
+  ref_1    = aws_instance.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r48" {
+  name     = "${var.prefix}-m2-r48"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r27.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r49" {
+  name     = "${var.prefix}-m2-r49"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r39.id
+  ref_1    = aws_security_group.r46.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_ecr_repository.r49.id
+}
@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m20"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_instance" "r0" {
+  name     = "${var.prefix}-m20-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r1" {
+  name     = "${var.prefix}-m20-r1"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m20-r2"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  ref_1    = aws_instance.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r3" {
+  name     = "${var.prefix}-m20-r3"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r4" {
+  name     = "${var.prefix}-m20-r4"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r5" {
+  name     = "${var.prefix}-m20-r5"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = aws_security_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r6" {
+  name     = "${var.prefix}-m20-r6"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r7" {
+  name     = "${var.prefix}-m20-r7"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r8" {
+  name     = "${var.prefix}-m20-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m20-r9"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r10" {
+  name     = "${var.prefix}-m20-r10"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r11" {
+  name     = "${var.prefix}-m20-r11"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r12" {
+  name     = "${var.prefix}-m20-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r13" {
+  name     = "${var.prefix}-m20-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  ref_1    = aws_iam_role.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r14" {
+  name     = "${var.prefix}-m20-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r15" {
+  name     = "${var.prefix}-m20-r15"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  ref_1    = aws_iam_role.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r16" {
+  name     = "${var.prefix}-m20-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r17" {
+  name     = "${var.prefix}-m20-r17"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r18" {
+  name     = "${var.prefix}-m20-r18"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  ref_1    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r19" {
+  name     = "${var.prefix}-m20-r19"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r20" {
+  name     = "${var.prefix}-m20-r20"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r16.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r21" {
+  name     = "${var.prefix}-m20-r21"
+  upstream = var.upstream
+  ref_0    = helm_release.r12.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r22" {
+  name     = "${var.prefix}-m20-r22"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r23" {
+  name     = "${var.prefix}-m20-r23"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r24" {
+  name     = "${var.prefix}-m20-r24"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r13.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r25" {
+  name     = "${var.prefix}-m20-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r18.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r26" {
+  name     = "${var.prefix}-m20-r26"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r27" {
+  name     = "${var.prefix}-m20-r27"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  ref_1    = aws_s3_bucket.r6.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r28" {
+  name     = "${var.prefix}-m20-r28"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  ref_1    = kubernetes_service.r24.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r29" {
+  name     = "${var.prefix}-m20-r29"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r30" {
+  name     = "${var.prefix}-m20-r30"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  ref_1    = helm_release.r29.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r31" {
+  name     = "${var.prefix}-m20-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m20-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r21.id
+  ref_1    = aws_ecr_repository.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r33" {
+  name     = "${var.prefix}-m20-r33"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r34" {
+  name     = "${var.prefix}-m20-r34"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  ref_1    = aws_s3_bucket.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r35" {
+  name     = "${var.prefix}-m20-r35"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r15.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r36" {
+  name     = "${var.prefix}-m20-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  ref_1    = aws_ecr_repository.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r37" {
+  name     = "${var.prefix}-m20-r37"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r32.id
+  ref_1    = aws_s3_bucket.r36.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r38" {
+  name     = "${var.prefix}-m20-r38"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r32.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r39" {
+  name     = "${var.prefix}-m20-r39"
+  upstream = var.upstream
+  ref_0    = helm_release.r12.id
+  ref_1    = aws_instance.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r40" {
+  name     = "${var.prefix}-m20-r40"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r35.id
+  ref_1    = aws_iam_role.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r41" {
+  name     = "${var.prefix}-m20-r41"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r6.id
+  ref_1    = aws_lb_target_group.r31.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r42" {
+  name     = "${var.prefix}-m20-r42"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r22.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r43" {
+  name     = "${var.prefix}-m20-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r44" {
+  name     = "${var.prefix}-m20-r44"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r18.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r45" {
+  name     = "${var.prefix}-m20-r45"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r25.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m20-r46"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r16.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r47" {
+  name     = "${var.prefix}-m20-r47"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r30.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r48" {
+  name     = "${var.prefix}-m20-r48"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r30.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r49" {
+  name     = "${var.prefix}-m20-r49"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r41.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_iam_role.r49.id
+}
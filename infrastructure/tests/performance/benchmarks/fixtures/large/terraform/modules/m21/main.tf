@@ -0,0 +1,400 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m21"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_security_group" "r0" {
+  name     = "${var.prefix}-m21-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m21-r1"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r2" {
+  name     = "${var.prefix}-m21-r2"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r3" {
+  name     = "${var.prefix}-m21-r3"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m21-r4"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r5" {
+  name     = "${var.prefix}-m21-r5"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r6" {
+  name     = "${var.prefix}-m21-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_s3_bucket.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r7" {
+  name     = "${var.prefix}-m21-r7"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r8" {
+  name     = "${var.prefix}-m21-r8"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  ref_1    = aws_instance.r7.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r9" {
+  name     = "${var.prefix}-m21-r9"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r10" {
+  name     = "${var.prefix}-m21-r10"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r11" {
+  name     = "${var.prefix}-m21-r11"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r12" {
+  name     = "${var.prefix}-m21-r12"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r13" {
+  name     = "${var.prefix}-m21-r13"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r12.id
+  ref_1    = aws_instance.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r14" {
+  name     = "${var.prefix}-m21-r14"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  ref_1    = aws_iam_role.r11.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r15" {
+  name     = "${var.prefix}-m21-r15"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r16" {
+  name     = "${var.prefix}-m21-r16"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r17" {
+  name     = "${var.prefix}-m21-r17"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r12.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r18" {
+  name     = "${var.prefix}-m21-r18"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r19" {
+  name     = "${var.prefix}-m21-r19"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r20" {
+  name     = "${var.prefix}-m21-r20"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  ref_1    = helm_release.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r21" {
+  name     = "${var.prefix}-m21-r21"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r22" {
+  name     = "${var.prefix}-m21-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  ref_1    = aws_iam_role.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r23" {
+  name     = "${var.prefix}-m21-r23"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r20.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r24" {
+  name     = "${var.prefix}-m21-r24"
+  upstream = var.upstream
+  ref_0    = aws_instance.r23.id
+  ref_1    = helm_release.r22.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r25" {
+  name     = "${var.prefix}-m21-r25"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  ref_1    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r26" {
+  name     = "${var.prefix}-m21-r26"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r17.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r27" {
+  name     = "${var.prefix}-m21-r27"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r28" {
+  name     = "${var.prefix}-m21-r28"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r9.id
+  ref_1    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r29" {
+  name     = "${var.prefix}-m21-r29"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r30" {
+  name     = "${var.prefix}-m21-r30"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_cloudwatch_log_group.r18.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r31" {
+  name     = "${var.prefix}-m21-r31"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r32" {
+  name     = "${var.prefix}-m21-r32"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r19.id
+  ref_1    = aws_instance.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r33" {
+  name     = "${var.prefix}-m21-r33"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  ref_1    = aws_lb_target_group.r31.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r34" {
+  name     = "${var.prefix}-m21-r34"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r16.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r35" {
+  name     = "${var.prefix}-m21-r35"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r21.id
+  ref_1    = aws_cloudwatch_log_group.r28.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r36" {
+  name     = "${var.prefix}-m21-r36"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r28.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r37" {
+  name     = "${var.prefix}-m21-r37"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r38" {
+  name     = "${var.prefix}-m21-r38"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r19.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r39" {
+  name     = "${var.prefix}-m21-r39"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r28.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m21-r40"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r9.id
+  ref_1    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r41" {
+  name     = "${var.prefix}-m21-r41"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r32.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r42" {
+  name     = "${var.prefix}-m21-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r38.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r43" {
+  name     = "${var.prefix}-m21-r43"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  ref_1    = aws_instance.r30.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r44" {
+  name     = "${var.prefix}-m21-r44"
+  upstream = var.upstream
+  ref_0    = aws_instance.r41.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r45" {
+  name     = "${var.prefix}-m21-r45"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r46" {
+  name     = "${var.prefix}-m21-r46"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r40.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r47" {
+  name     = "${var.prefix}-m21-r47"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r48" {
+  name     = "${var.prefix}-m21-r48"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r12.id
+  ref_1    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r49" {
+  name     = "${var.prefix}-m21-r49"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r48.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_cloudwatch_log_group.r49.id
+}
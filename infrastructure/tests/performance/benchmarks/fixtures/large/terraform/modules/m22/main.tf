@@ -0,0 +1,402 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m22"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_service" "r0" {
+  name     = "${var.prefix}-m22-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r1" {
+  name     = "${var.prefix}-m22-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r2" {
+  name     = "${var.prefix}-m22-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = kubernetes_config_map.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r3" {
+  name     = "${var.prefix}-m22-r3"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r4" {
+  name     = "${var.prefix}-m22-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r5" {
+  name     = "${var.prefix}-m22-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  ref_1    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r6" {
+  name     = "${var.prefix}-m22-r6"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r7" {
+  name     = "${var.prefix}-m22-r7"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r8" {
+  name     = "${var.prefix}-m22-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r9" {
+  name     = "${var.prefix}-m22-r9"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r10" {
+  name     = "${var.prefix}-m22-r10"
+  upstream = var.upstream
+  ref_0    = aws_instance.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r11" {
+  name     = "${var.prefix}-m22-r11"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m22-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r13" {
+  name     = "${var.prefix}-m22-r13"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r10.id
+  ref_1    = aws_s3_bucket.r12.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r14" {
+  name     = "${var.prefix}-m22-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = aws_s3_bucket.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r15" {
+  name     = "${var.prefix}-m22-r15"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r13.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r16" {
+  name     = "${var.prefix}-m22-r16"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r17" {
+  name     = "${var.prefix}-m22-r17"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r18" {
+  name     = "${var.prefix}-m22-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r19" {
+  name     = "${var.prefix}-m22-r19"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r13.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m22-r20"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  ref_1    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r21" {
+  name     = "${var.prefix}-m22-r21"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r13.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r22" {
+  name     = "${var.prefix}-m22-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  ref_1    = aws_s3_bucket.r12.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r23" {
+  name     = "${var.prefix}-m22-r23"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m22-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r25" {
+  name     = "${var.prefix}-m22-r25"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r26" {
+  name     = "${var.prefix}-m22-r26"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r10.id
+  ref_1    = kubernetes_config_map.r25.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r27" {
+  name     = "${var.prefix}-m22-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  ref_1    = aws_db_instance.r23.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r28" {
+  name     = "${var.prefix}-m22-r28"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r29" {
+  name     = "${var.prefix}-m22-r29"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  ref_1    = aws_db_instance.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r30" {
+  name     = "${var.prefix}-m22-r30"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r19.id
+  ref_1    = helm_release.r20.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r31" {
+  name     = "${var.prefix}-m22-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  ref_1    = aws_security_group.r30.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r32" {
+  name     = "${var.prefix}-m22-r32"
+  upstream = var.upstream
+  ref_0    = aws_instance.r22.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r33" {
+  name     = "${var.prefix}-m22-r33"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r30.id
+  ref_1    = aws_db_instance.r23.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r34" {
+  name     = "${var.prefix}-m22-r34"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r35" {
+  name     = "${var.prefix}-m22-r35"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r21.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r36" {
+  name     = "${var.prefix}-m22-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r37" {
+  name     = "${var.prefix}-m22-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r38" {
+  name     = "${var.prefix}-m22-r38"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r24.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r39" {
+  name     = "${var.prefix}-m22-r39"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r31.id
+  ref_1    = kubernetes_config_map.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r40" {
+  name     = "${var.prefix}-m22-r40"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r30.id
+  ref_1    = kubernetes_config_map.r37.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r41" {
+  name     = "${var.prefix}-m22-r41"
+  upstream = var.upstream
+  ref_0    = helm_release.r32.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r42" {
+  name     = "${var.prefix}-m22-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r43" {
+  name     = "${var.prefix}-m22-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r17.id
+  ref_1    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r44" {
+  name     = "${var.prefix}-m22-r44"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r45" {
+  name     = "${var.prefix}-m22-r45"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r46" {
+  name     = "${var.prefix}-m22-r46"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r31.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r47" {
+  name     = "${var.prefix}-m22-r47"
+  upstream = var.upstream
+  ref_0    = aws_instance.r42.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r48" {
+  name     = "${var.prefix}-m22-r48"
+  upstream = var.upstream
+  ref_0    = aws_instance.r9.id
+  ref_1    = aws_instance.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r49" {
+  name     = "${var.prefix}-m22-r49"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r8.id
+  ref_1    = aws_instance.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_instance.r49.id
+}
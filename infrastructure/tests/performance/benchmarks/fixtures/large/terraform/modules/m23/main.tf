@@ -0,0 +1,396 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m23"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_config_map" "r0" {
+  name     = "${var.prefix}-m23-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r1" {
+  name     = "${var.prefix}-m23-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r2" {
+  name     = "${var.prefix}-m23-r2"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r3" {
+  name     = "${var.prefix}-m23-r3"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r4" {
+  name     = "${var.prefix}-m23-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r5" {
+  name     = "${var.prefix}-m23-r5"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r6" {
+  name     = "${var.prefix}-m23-r6"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r7" {
+  name     = "${var.prefix}-m23-r7"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r8" {
+  name     = "${var.prefix}-m23-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r9" {
+  name     = "${var.prefix}-m23-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r10" {
+  name     = "${var.prefix}-m23-r10"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  ref_1    = kubernetes_config_map.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r11" {
+  name     = "${var.prefix}-m23-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r9.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r12" {
+  name     = "${var.prefix}-m23-r12"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r11.id
+  ref_1    = kubernetes_config_map.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r13" {
+  name     = "${var.prefix}-m23-r13"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r14" {
+  name     = "${var.prefix}-m23-r14"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r15" {
+  name     = "${var.prefix}-m23-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r8.id
+  ref_1    = kubernetes_service.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r16" {
+  name     = "${var.prefix}-m23-r16"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r13.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r17" {
+  name     = "${var.prefix}-m23-r17"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r18" {
+  name     = "${var.prefix}-m23-r18"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r19" {
+  name     = "${var.prefix}-m23-r19"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r20" {
+  name     = "${var.prefix}-m23-r20"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r21" {
+  name     = "${var.prefix}-m23-r21"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r22" {
+  name     = "${var.prefix}-m23-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_iam_role.r11.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r23" {
+  name     = "${var.prefix}-m23-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r24" {
+  name     = "${var.prefix}-m23-r24"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r25" {
+  name     = "${var.prefix}-m23-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  ref_1    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r26" {
+  name     = "${var.prefix}-m23-r26"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r27" {
+  name     = "${var.prefix}-m23-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r8.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r28" {
+  name     = "${var.prefix}-m23-r28"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = aws_instance.r21.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r29" {
+  name     = "${var.prefix}-m23-r29"
+  upstream = var.upstream
+  ref_0    = aws_instance.r28.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r30" {
+  name     = "${var.prefix}-m23-r30"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r31" {
+  name     = "${var.prefix}-m23-r31"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m23-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r33" {
+  name     = "${var.prefix}-m23-r33"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r31.id
+  ref_1    = aws_security_group.r23.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r34" {
+  name     = "${var.prefix}-m23-r34"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r31.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r35" {
+  name     = "${var.prefix}-m23-r35"
+  upstream = var.upstream
+  ref_0    = aws_instance.r28.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r36" {
+  name     = "${var.prefix}-m23-r36"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r37" {
+  name     = "${var.prefix}-m23-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r9.id
+  ref_1    = kubernetes_service.r10.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r38" {
+  name     = "${var.prefix}-m23-r38"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r39" {
+  name     = "${var.prefix}-m23-r39"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r40" {
+  name     = "${var.prefix}-m23-r40"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r13.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r41" {
+  name     = "${var.prefix}-m23-r41"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r26.id
+  ref_1    = aws_security_group.r23.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r42" {
+  name     = "${var.prefix}-m23-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r43" {
+  name     = "${var.prefix}-m23-r43"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  ref_1    = aws_instance.r33.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r44" {
+  name     = "${var.prefix}-m23-r44"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r14.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r45" {
+  name     = "${var.prefix}-m23-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r46" {
+  name     = "${var.prefix}-m23-r46"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r30.id
+  ref_1    = helm_release.r41.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r47" {
+  name     = "${var.prefix}-m23-r47"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r23.id
+  ref_1    = aws_cloudwatch_log_group.r32.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r48" {
+  name     = "${var.prefix}-m23-r48"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r35.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r49" {
+  name     = "${var.prefix}-m23-r49"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_instance.r49.id
+}
@@ -0,0 +1,403 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m24"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_cloudwatch_log_group" "r0" {
+  name     = "${var.prefix}-m24-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m24-r1"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r2" {
+  name     = "${var.prefix}-m24-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r3" {
+  name     = "${var.prefix}-m24-r3"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r4" {
+  name     = "${var.prefix}-m24-r4"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  ref_1    = aws_cloudwatch_log_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r5" {
+  name     = "${var.prefix}-m24-r5"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r6" {
+  name     = "${var.prefix}-m24-r6"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  ref_1    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r7" {
+  name     = "${var.prefix}-m24-r7"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r8" {
+  name     = "${var.prefix}-m24-r8"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m24-r9"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r10" {
+  name     = "${var.prefix}-m24-r10"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r11" {
+  name     = "${var.prefix}-m24-r11"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r12" {
+  name     = "${var.prefix}-m24-r12"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r13" {
+  name     = "${var.prefix}-m24-r13"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r14" {
+  name     = "${var.prefix}-m24-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  ref_1    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r15" {
+  name     = "${var.prefix}-m24-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  ref_1    = aws_cloudwatch_log_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r16" {
+  name     = "${var.prefix}-m24-r16"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  ref_1    = aws_s3_bucket.r13.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m24-r17"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r13.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r18" {
+  name     = "${var.prefix}-m24-r18"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r19" {
+  name     = "${var.prefix}-m24-r19"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r18.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r20" {
+  name     = "${var.prefix}-m24-r20"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r21" {
+  name     = "${var.prefix}-m24-r21"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r16.id
+  ref_1    = kubernetes_config_map.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r22" {
+  name     = "${var.prefix}-m24-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r23" {
+  name     = "${var.prefix}-m24-r23"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m24-r24"
+  upstream = var.upstream
+  ref_0    = aws_instance.r22.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r25" {
+  name     = "${var.prefix}-m24-r25"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r13.id
+  ref_1    = aws_db_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r26" {
+  name     = "${var.prefix}-m24-r26"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r27" {
+  name     = "${var.prefix}-m24-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r23.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r28" {
+  name     = "${var.prefix}-m24-r28"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  ref_1    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r29" {
+  name     = "${var.prefix}-m24-r29"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r14.id
+  ref_1    = aws_cloudwatch_log_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r30" {
+  name     = "${var.prefix}-m24-r30"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r31" {
+  name     = "${var.prefix}-m24-r31"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r32" {
+  name     = "${var.prefix}-m24-r32"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r33" {
+  name     = "${var.prefix}-m24-r33"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r23.id
+  ref_1    = aws_s3_bucket.r32.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r34" {
+  name     = "${var.prefix}-m24-r34"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r35" {
+  name     = "${var.prefix}-m24-r35"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r36" {
+  name     = "${var.prefix}-m24-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r27.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r37" {
+  name     = "${var.prefix}-m24-r37"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r31.id
+  ref_1    = aws_iam_role.r28.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r38" {
+  name     = "${var.prefix}-m24-r38"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r39" {
+  name     = "${var.prefix}-m24-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r23.id
+  ref_1    = aws_instance.r37.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r40" {
+  name     = "${var.prefix}-m24-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r15.id
+  ref_1    = aws_cloudwatch_log_group.r34.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r41" {
+  name     = "${var.prefix}-m24-r41"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r13.id
+  ref_1    = aws_instance.r29.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r42" {
+  name     = "${var.prefix}-m24-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r27.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r43" {
+  name     = "${var.prefix}-m24-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r16.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r44" {
+  name     = "${var.prefix}-m24-r44"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r20.id
+  ref_1    = aws_security_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r45" {
+  name     = "${var.prefix}-m24-r45"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  ref_1    = aws_cloudwatch_log_group.r40.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m24-r46"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_ecr_repository.r35.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r47" {
+  name     = "${var.prefix}-m24-r47"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r48" {
+  name     = "${var.prefix}-m24-r48"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r33.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r49" {
+  name     = "${var.prefix}-m24-r49"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r25.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_service.r49.id
+}
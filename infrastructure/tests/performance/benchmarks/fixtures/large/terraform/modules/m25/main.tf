@@ -0,0 +1,408 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m25"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_lb_target_group" "r0" {
+  name     = "${var.prefix}-m25-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r1" {
+  name     = "${var.prefix}-m25-r1"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r2" {
+  name     = "${var.prefix}-m25-r2"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  ref_1    = aws_lb_target_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r3" {
+  name     = "${var.prefix}-m25-r3"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r4" {
+  name     = "${var.prefix}-m25-r4"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r5" {
+  name     = "${var.prefix}-m25-r5"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r6" {
+  name     = "${var.prefix}-m25-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r7" {
+  name     = "${var.prefix}-m25-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r8" {
+  name     = "${var.prefix}-m25-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r9" {
+  name     = "${var.prefix}-m25-r9"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r10" {
+  name     = "${var.prefix}-m25-r10"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r11" {
+  name     = "${var.prefix}-m25-r11"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r12" {
+  name     = "${var.prefix}-m25-r12"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r11.id
+  ref_1    = aws_db_instance.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r13" {
+  name     = "${var.prefix}-m25-r13"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  ref_1    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r14" {
+  name     = "${var.prefix}-m25-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r15" {
+  name     = "${var.prefix}-m25-r15"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  ref_1    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r16" {
+  name     = "${var.prefix}-m25-r16"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r17" {
+  name     = "${var.prefix}-m25-r17"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  ref_1    = aws_iam_role.r11.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r18" {
+  name     = "${var.prefix}-m25-r18"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r17.id
+  ref_1    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r19" {
+  name     = "${var.prefix}-m25-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r13.id
+  ref_1    = aws_cloudwatch_log_group.r12.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m25-r20"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r12.id
+  ref_1    = kubernetes_config_map.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r21" {
+  name     = "${var.prefix}-m25-r21"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r22" {
+  name     = "${var.prefix}-m25-r22"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r11.id
+  ref_1    = helm_release.r20.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r23" {
+  name     = "${var.prefix}-m25-r23"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r14.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m25-r24"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_ecr_repository.r19.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r25" {
+  name     = "${var.prefix}-m25-r25"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  ref_1    = aws_ecr_repository.r19.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r26" {
+  name     = "${var.prefix}-m25-r26"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r25.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r27" {
+  name     = "${var.prefix}-m25-r27"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r28" {
+  name     = "${var.prefix}-m25-r28"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r29" {
+  name     = "${var.prefix}-m25-r29"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r28.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r30" {
+  name     = "${var.prefix}-m25-r30"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r31" {
+  name     = "${var.prefix}-m25-r31"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  ref_1    = aws_iam_role.r21.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r32" {
+  name     = "${var.prefix}-m25-r32"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r33" {
+  name     = "${var.prefix}-m25-r33"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  ref_1    = aws_cloudwatch_log_group.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r34" {
+  name     = "${var.prefix}-m25-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r22.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r35" {
+  name     = "${var.prefix}-m25-r35"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r28.id
+  ref_1    = kubernetes_config_map.r23.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r36" {
+  name     = "${var.prefix}-m25-r36"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r37" {
+  name     = "${var.prefix}-m25-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  ref_1    = aws_instance.r34.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r38" {
+  name     = "${var.prefix}-m25-r38"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_ecr_repository.r31.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r39" {
+  name     = "${var.prefix}-m25-r39"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r40" {
+  name     = "${var.prefix}-m25-r40"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r29.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r41" {
+  name     = "${var.prefix}-m25-r41"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r38.id
+  ref_1    = aws_iam_role.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r42" {
+  name     = "${var.prefix}-m25-r42"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r43" {
+  name     = "${var.prefix}-m25-r43"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r44" {
+  name     = "${var.prefix}-m25-r44"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = aws_cloudwatch_log_group.r40.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r45" {
+  name     = "${var.prefix}-m25-r45"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r31.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m25-r46"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r30.id
+  ref_1    = kubernetes_config_map.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r47" {
+  name     = "${var.prefix}-m25-r47"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r37.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r48" {
+  name     = "${var.prefix}-m25-r48"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r37.id
+  ref_1    = aws_lb_target_group.r18.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r49" {
+  name     = "${var.prefix}-m25-r49"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_instance.r49.id
+}
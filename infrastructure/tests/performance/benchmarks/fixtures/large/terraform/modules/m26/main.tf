@@ -0,0 +1,407 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m26"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_config_map" "r0" {
+  name     = "${var.prefix}-m26-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r1" {
+  name     = "${var.prefix}-m26-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r2" {
+  name     = "${var.prefix}-m26-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m26-r3"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r4" {
+  name     = "${var.prefix}-m26-r4"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r5" {
+  name     = "${var.prefix}-m26-r5"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r6" {
+  name     = "${var.prefix}-m26-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  ref_1    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r7" {
+  name     = "${var.prefix}-m26-r7"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r8" {
+  name     = "${var.prefix}-m26-r8"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  ref_1    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r9" {
+  name     = "${var.prefix}-m26-r9"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r10" {
+  name     = "${var.prefix}-m26-r10"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r11" {
+  name     = "${var.prefix}-m26-r11"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m26-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r13" {
+  name     = "${var.prefix}-m26-r13"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r14" {
+  name     = "${var.prefix}-m26-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  ref_1    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r15" {
+  name     = "${var.prefix}-m26-r15"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r16" {
+  name     = "${var.prefix}-m26-r16"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m26-r17"
+  upstream = var.upstream
+  ref_0    = helm_release.r15.id
+  ref_1    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r18" {
+  name     = "${var.prefix}-m26-r18"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  ref_1    = aws_cloudwatch_log_group.r13.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r19" {
+  name     = "${var.prefix}-m26-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r20" {
+  name     = "${var.prefix}-m26-r20"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r21" {
+  name     = "${var.prefix}-m26-r21"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r19.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r22" {
+  name     = "${var.prefix}-m26-r22"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r23" {
+  name     = "${var.prefix}-m26-r23"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r24" {
+  name     = "${var.prefix}-m26-r24"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r25" {
+  name     = "${var.prefix}-m26-r25"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r10.id
+  ref_1    = aws_cloudwatch_log_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r26" {
+  name     = "${var.prefix}-m26-r26"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = helm_release.r15.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r27" {
+  name     = "${var.prefix}-m26-r27"
+  upstream = var.upstream
+  ref_0    = helm_release.r15.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r28" {
+  name     = "${var.prefix}-m26-r28"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r29" {
+  name     = "${var.prefix}-m26-r29"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r28.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r30" {
+  name     = "${var.prefix}-m26-r30"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r26.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r31" {
+  name     = "${var.prefix}-m26-r31"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r21.id
+  ref_1    = kubernetes_service.r20.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r32" {
+  name     = "${var.prefix}-m26-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r25.id
+  ref_1    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r33" {
+  name     = "${var.prefix}-m26-r33"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r32.id
+  ref_1    = kubernetes_service.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r34" {
+  name     = "${var.prefix}-m26-r34"
+  upstream = var.upstream
+  ref_0    = helm_release.r18.id
+  ref_1    = aws_security_group.r33.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r35" {
+  name     = "${var.prefix}-m26-r35"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r28.id
+  ref_1    = aws_db_instance.r27.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r36" {
+  name     = "${var.prefix}-m26-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r31.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r37" {
+  name     = "${var.prefix}-m26-r37"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r33.id
+  ref_1    = aws_cloudwatch_log_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r38" {
+  name     = "${var.prefix}-m26-r38"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r17.id
+  ref_1    = aws_ecr_repository.r24.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r39" {
+  name     = "${var.prefix}-m26-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r31.id
+  ref_1    = aws_cloudwatch_log_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r40" {
+  name     = "${var.prefix}-m26-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r20.id
+  ref_1    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r41" {
+  name     = "${var.prefix}-m26-r41"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  ref_1    = aws_ecr_repository.r19.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r42" {
+  name     = "${var.prefix}-m26-r42"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r33.id
+  ref_1    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r43" {
+  name     = "${var.prefix}-m26-r43"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r27.id
+  ref_1    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r44" {
+  name     = "${var.prefix}-m26-r44"
+  upstream = var.upstream
+  ref_0    = helm_release.r15.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r45" {
+  name     = "${var.prefix}-m26-r45"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r46" {
+  name     = "${var.prefix}-m26-r46"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r38.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r47" {
+  name     = "${var.prefix}-m26-r47"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r23.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r48" {
+  name     = "${var.prefix}-m26-r48"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r32.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r49" {
+  name     = "${var.prefix}-m26-r49"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = helm_release.r49.id
+}
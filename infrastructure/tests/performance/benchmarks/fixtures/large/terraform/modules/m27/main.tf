@@ -0,0 +1,409 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m27"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_service" "r0" {
+  name     = "${var.prefix}-m27-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r1" {
+  name     = "${var.prefix}-m27-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r2" {
+  name     = "${var.prefix}-m27-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r1.id
+  ref_1    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r3" {
+  name     = "${var.prefix}-m27-r3"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  ref_1    = kubernetes_service.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r4" {
+  name     = "${var.prefix}-m27-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = kubernetes_service.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r5" {
+  name     = "${var.prefix}-m27-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r6" {
+  name     = "${var.prefix}-m27-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  ref_1    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r7" {
+  name     = "${var.prefix}-m27-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  ref_1    = helm_release.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r8" {
+  name     = "${var.prefix}-m27-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  ref_1    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r9" {
+  name     = "${var.prefix}-m27-r9"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r10" {
+  name     = "${var.prefix}-m27-r10"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r1.id
+  ref_1    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r11" {
+  name     = "${var.prefix}-m27-r11"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  ref_1    = helm_release.r10.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r12" {
+  name     = "${var.prefix}-m27-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r13" {
+  name     = "${var.prefix}-m27-r13"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r14" {
+  name     = "${var.prefix}-m27-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r15" {
+  name     = "${var.prefix}-m27-r15"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r16" {
+  name     = "${var.prefix}-m27-r16"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  ref_1    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r17" {
+  name     = "${var.prefix}-m27-r17"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r18" {
+  name     = "${var.prefix}-m27-r18"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  ref_1    = aws_cloudwatch_log_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r19" {
+  name     = "${var.prefix}-m27-r19"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  ref_1    = aws_s3_bucket.r16.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r20" {
+  name     = "${var.prefix}-m27-r20"
+  upstream = var.upstream
+  ref_0    = aws_instance.r15.id
+  ref_1    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r21" {
+  name     = "${var.prefix}-m27-r21"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  ref_1    = kubernetes_service.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m27-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r23" {
+  name     = "${var.prefix}-m27-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r24" {
+  name     = "${var.prefix}-m27-r24"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r17.id
+  ref_1    = aws_ecr_repository.r11.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r25" {
+  name     = "${var.prefix}-m27-r25"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r26" {
+  name     = "${var.prefix}-m27-r26"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  ref_1    = aws_lb_target_group.r18.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r27" {
+  name     = "${var.prefix}-m27-r27"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r18.id
+  ref_1    = aws_security_group.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r28" {
+  name     = "${var.prefix}-m27-r28"
+  upstream = var.upstream
+  ref_0    = helm_release.r23.id
+  ref_1    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r29" {
+  name     = "${var.prefix}-m27-r29"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r30" {
+  name     = "${var.prefix}-m27-r30"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r31" {
+  name     = "${var.prefix}-m27-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  ref_1    = kubernetes_config_map.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r32" {
+  name     = "${var.prefix}-m27-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r33" {
+  name     = "${var.prefix}-m27-r33"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r34" {
+  name     = "${var.prefix}-m27-r34"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r22.id
+  ref_1    = kubernetes_service.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r35" {
+  name     = "${var.prefix}-m27-r35"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r33.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r36" {
+  name     = "${var.prefix}-m27-r36"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r25.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r37" {
+  name     = "${var.prefix}-m27-r37"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r22.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r38" {
+  name     = "${var.prefix}-m27-r38"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r32.id
+  ref_1    = aws_security_group.r26.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r39" {
+  name     = "${var.prefix}-m27-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  ref_1    = kubernetes_service.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m27-r40"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r16.id
+  ref_1    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r41" {
+  name     = "${var.prefix}-m27-r41"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r28.id
+  ref_1    = aws_ecr_repository.r21.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r42" {
+  name     = "${var.prefix}-m27-r42"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r26.id
+  ref_1    = aws_lb_target_group.r28.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r43" {
+  name     = "${var.prefix}-m27-r43"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r44" {
+  name     = "${var.prefix}-m27-r44"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r20.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r45" {
+  name     = "${var.prefix}-m27-r45"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r46" {
+  name     = "${var.prefix}-m27-r46"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r33.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r47" {
+  name     = "${var.prefix}-m27-r47"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r48" {
+  name     = "${var.prefix}-m27-r48"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r20.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r49" {
+  name     = "${var.prefix}-m27-r49"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r21.id
+  ref_1    = kubernetes_service.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_iam_role.r49.id
+}
@@ -0,0 +1,397 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m28"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_config_map" "r0" {
+  name     = "${var.prefix}-m28-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_instance" "r1" {
+  name     = "${var.prefix}-m28-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r2" {
+  name     = "${var.prefix}-m28-r2"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r3" {
+  name     = "${var.prefix}-m28-r3"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m28-r4"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r5" {
+  name     = "${var.prefix}-m28-r5"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r6" {
+  name     = "${var.prefix}-m28-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r7" {
+  name     = "${var.prefix}-m28-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r8" {
+  name     = "${var.prefix}-m28-r8"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r6.id
+  ref_1    = aws_lb_target_group.r7.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m28-r9"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r10" {
+  name     = "${var.prefix}-m28-r10"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  ref_1    = aws_s3_bucket.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r11" {
+  name     = "${var.prefix}-m28-r11"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r12" {
+  name     = "${var.prefix}-m28-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r13" {
+  name     = "${var.prefix}-m28-r13"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r14" {
+  name     = "${var.prefix}-m28-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r15" {
+  name     = "${var.prefix}-m28-r15"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r16" {
+  name     = "${var.prefix}-m28-r16"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r17" {
+  name     = "${var.prefix}-m28-r17"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r18" {
+  name     = "${var.prefix}-m28-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r16.id
+  ref_1    = aws_instance.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r19" {
+  name     = "${var.prefix}-m28-r19"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  ref_1    = kubernetes_service.r14.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r20" {
+  name     = "${var.prefix}-m28-r20"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r3.id
+  ref_1    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r21" {
+  name     = "${var.prefix}-m28-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r14.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r22" {
+  name     = "${var.prefix}-m28-r22"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  ref_1    = aws_cloudwatch_log_group.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r23" {
+  name     = "${var.prefix}-m28-r23"
+  upstream = var.upstream
+  ref_0    = aws_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m28-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r20.id
+  ref_1    = kubernetes_service.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r25" {
+  name     = "${var.prefix}-m28-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r26" {
+  name     = "${var.prefix}-m28-r26"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r27" {
+  name     = "${var.prefix}-m28-r27"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r28" {
+  name     = "${var.prefix}-m28-r28"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r29" {
+  name     = "${var.prefix}-m28-r29"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r18.id
+  ref_1    = aws_ecr_repository.r20.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r30" {
+  name     = "${var.prefix}-m28-r30"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r19.id
+  ref_1    = aws_s3_bucket.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r31" {
+  name     = "${var.prefix}-m28-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r16.id
+  ref_1    = aws_cloudwatch_log_group.r22.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m28-r32"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r33" {
+  name     = "${var.prefix}-m28-r33"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r34" {
+  name     = "${var.prefix}-m28-r34"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r35" {
+  name     = "${var.prefix}-m28-r35"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r24.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r36" {
+  name     = "${var.prefix}-m28-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  ref_1    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r37" {
+  name     = "${var.prefix}-m28-r37"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r38" {
+  name     = "${var.prefix}-m28-r38"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r24.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r39" {
+  name     = "${var.prefix}-m28-r39"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r40" {
+  name     = "${var.prefix}-m28-r40"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r26.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r41" {
+  name     = "${var.prefix}-m28-r41"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r19.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r42" {
+  name     = "${var.prefix}-m28-r42"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r43" {
+  name     = "${var.prefix}-m28-r43"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  ref_1    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r44" {
+  name     = "${var.prefix}-m28-r44"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r45" {
+  name     = "${var.prefix}-m28-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r39.id
+  ref_1    = aws_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r46" {
+  name     = "${var.prefix}-m28-r46"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r47" {
+  name     = "${var.prefix}-m28-r47"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r43.id
+  ref_1    = aws_cloudwatch_log_group.r22.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r48" {
+  name     = "${var.prefix}-m28-r48"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r49" {
+  name     = "${var.prefix}-m28-r49"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = helm_release.r49.id
+}
@@ -0,0 +1,407 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m29"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_config_map" "r0" {
+  name     = "${var.prefix}-m29-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r1" {
+  name     = "${var.prefix}-m29-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r2" {
+  name     = "${var.prefix}-m29-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m29-r3"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r4" {
+  name     = "${var.prefix}-m29-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = kubernetes_config_map.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r5" {
+  name     = "${var.prefix}-m29-r5"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r6" {
+  name     = "${var.prefix}-m29-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r7" {
+  name     = "${var.prefix}-m29-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r8" {
+  name     = "${var.prefix}-m29-r8"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  ref_1    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r9" {
+  name     = "${var.prefix}-m29-r9"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  ref_1    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r10" {
+  name     = "${var.prefix}-m29-r10"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r11" {
+  name     = "${var.prefix}-m29-r11"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r12" {
+  name     = "${var.prefix}-m29-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r13" {
+  name     = "${var.prefix}-m29-r13"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r14" {
+  name     = "${var.prefix}-m29-r14"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  ref_1    = aws_db_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r15" {
+  name     = "${var.prefix}-m29-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  ref_1    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r16" {
+  name     = "${var.prefix}-m29-r16"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r12.id
+  ref_1    = aws_iam_role.r9.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r17" {
+  name     = "${var.prefix}-m29-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = aws_s3_bucket.r13.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r18" {
+  name     = "${var.prefix}-m29-r18"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r19" {
+  name     = "${var.prefix}-m29-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  ref_1    = aws_db_instance.r15.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r20" {
+  name     = "${var.prefix}-m29-r20"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r12.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r21" {
+  name     = "${var.prefix}-m29-r21"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  ref_1    = aws_cloudwatch_log_group.r17.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r22" {
+  name     = "${var.prefix}-m29-r22"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  ref_1    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r23" {
+  name     = "${var.prefix}-m29-r23"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r24" {
+  name     = "${var.prefix}-m29-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r25" {
+  name     = "${var.prefix}-m29-r25"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  ref_1    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r26" {
+  name     = "${var.prefix}-m29-r26"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r22.id
+  ref_1    = aws_db_instance.r24.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r27" {
+  name     = "${var.prefix}-m29-r27"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r28" {
+  name     = "${var.prefix}-m29-r28"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  ref_1    = aws_iam_role.r21.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r29" {
+  name     = "${var.prefix}-m29-r29"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r30" {
+  name     = "${var.prefix}-m29-r30"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r10.id
+  ref_1    = aws_iam_role.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r31" {
+  name     = "${var.prefix}-m29-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  ref_1    = aws_ecr_repository.r29.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r32" {
+  name     = "${var.prefix}-m29-r32"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r33" {
+  name     = "${var.prefix}-m29-r33"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r34" {
+  name     = "${var.prefix}-m29-r34"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r35" {
+  name     = "${var.prefix}-m29-r35"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r19.id
+  ref_1    = aws_instance.r25.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r36" {
+  name     = "${var.prefix}-m29-r36"
+  upstream = var.upstream
+  ref_0    = aws_instance.r25.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r37" {
+  name     = "${var.prefix}-m29-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r33.id
+  ref_1    = aws_iam_role.r28.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r38" {
+  name     = "${var.prefix}-m29-r38"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r39" {
+  name     = "${var.prefix}-m29-r39"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r29.id
+  ref_1    = aws_cloudwatch_log_group.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r40" {
+  name     = "${var.prefix}-m29-r40"
+  upstream = var.upstream
+  ref_0    = aws_instance.r25.id
+  ref_1    = helm_release.r16.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r41" {
+  name     = "${var.prefix}-m29-r41"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r28.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r42" {
+  name     = "${var.prefix}-m29-r42"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = aws_ecr_repository.r29.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r43" {
+  name     = "${var.prefix}-m29-r43"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r31.id
+  ref_1    = helm_release.r35.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r44" {
+  name     = "${var.prefix}-m29-r44"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r21.id
+  ref_1    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r45" {
+  name     = "${var.prefix}-m29-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r31.id
+  ref_1    = helm_release.r37.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r46" {
+  name     = "${var.prefix}-m29-r46"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r27.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r47" {
+  name     = "${var.prefix}-m29-r47"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r31.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r48" {
+  name     = "${var.prefix}-m29-r48"
+  upstream = var.upstream
+  ref_0    = helm_release.r45.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r49" {
+  name     = "${var.prefix}-m29-r49"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r34.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_db_instance.r49.id
+}
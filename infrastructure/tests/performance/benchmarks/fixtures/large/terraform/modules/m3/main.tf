@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m3"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_lb_target_group" "r0" {
+  name     = "${var.prefix}-m3-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r1" {
+  name     = "${var.prefix}-m3-r1"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r2" {
+  name     = "${var.prefix}-m3-r2"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r3" {
+  name     = "${var.prefix}-m3-r3"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r4" {
+  name     = "${var.prefix}-m3-r4"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r5" {
+  name     = "${var.prefix}-m3-r5"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r6" {
+  name     = "${var.prefix}-m3-r6"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  ref_1    = aws_ecr_repository.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r7" {
+  name     = "${var.prefix}-m3-r7"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r8" {
+  name     = "${var.prefix}-m3-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  ref_1    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r9" {
+  name     = "${var.prefix}-m3-r9"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r10" {
+  name     = "${var.prefix}-m3-r10"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r11" {
+  name     = "${var.prefix}-m3-r11"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r12" {
+  name     = "${var.prefix}-m3-r12"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r13" {
+  name     = "${var.prefix}-m3-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r14" {
+  name     = "${var.prefix}-m3-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  ref_1    = aws_s3_bucket.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r15" {
+  name     = "${var.prefix}-m3-r15"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r16" {
+  name     = "${var.prefix}-m3-r16"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r17" {
+  name     = "${var.prefix}-m3-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r18" {
+  name     = "${var.prefix}-m3-r18"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  ref_1    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r19" {
+  name     = "${var.prefix}-m3-r19"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r14.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m3-r20"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = aws_iam_role.r11.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r21" {
+  name     = "${var.prefix}-m3-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  ref_1    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r22" {
+  name     = "${var.prefix}-m3-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r23" {
+  name     = "${var.prefix}-m3-r23"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r24" {
+  name     = "${var.prefix}-m3-r24"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r25" {
+  name     = "${var.prefix}-m3-r25"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r10.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r26" {
+  name     = "${var.prefix}-m3-r26"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  ref_1    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r27" {
+  name     = "${var.prefix}-m3-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r25.id
+  ref_1    = kubernetes_service.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r28" {
+  name     = "${var.prefix}-m3-r28"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r29" {
+  name     = "${var.prefix}-m3-r29"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r30" {
+  name     = "${var.prefix}-m3-r30"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r31" {
+  name     = "${var.prefix}-m3-r31"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r32" {
+  name     = "${var.prefix}-m3-r32"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r33" {
+  name     = "${var.prefix}-m3-r33"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r27.id
+  ref_1    = kubernetes_config_map.r18.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r34" {
+  name     = "${var.prefix}-m3-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r27.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r35" {
+  name     = "${var.prefix}-m3-r35"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r36" {
+  name     = "${var.prefix}-m3-r36"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r33.id
+  ref_1    = kubernetes_config_map.r31.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r37" {
+  name     = "${var.prefix}-m3-r37"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r36.id
+  ref_1    = kubernetes_config_map.r31.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r38" {
+  name     = "${var.prefix}-m3-r38"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r39" {
+  name     = "${var.prefix}-m3-r39"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = aws_ecr_repository.r7.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r40" {
+  name     = "${var.prefix}-m3-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  ref_1    = aws_security_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r41" {
+  name     = "${var.prefix}-m3-r41"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r29.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r42" {
+  name     = "${var.prefix}-m3-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r43" {
+  name     = "${var.prefix}-m3-r43"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r22.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r44" {
+  name     = "${var.prefix}-m3-r44"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r45" {
+  name     = "${var.prefix}-m3-r45"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r10.id
+  ref_1    = aws_s3_bucket.r22.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r46" {
+  name     = "${var.prefix}-m3-r46"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r42.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r47" {
+  name     = "${var.prefix}-m3-r47"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_s3_bucket.r24.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r48" {
+  name     = "${var.prefix}-m3-r48"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  ref_1    = aws_security_group.r29.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r49" {
+  name     = "${var.prefix}-m3-r49"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r29.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_service.r49.id
+}
@@ -0,0 +1,409 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m30"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_instance" "r0" {
+  name     = "${var.prefix}-m30-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r1" {
+  name     = "${var.prefix}-m30-r1"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r2" {
+  name     = "${var.prefix}-m30-r2"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m30-r3"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m30-r4"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  ref_1    = aws_iam_role.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r5" {
+  name     = "${var.prefix}-m30-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r6" {
+  name     = "${var.prefix}-m30-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r7" {
+  name     = "${var.prefix}-m30-r7"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r8" {
+  name     = "${var.prefix}-m30-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  ref_1    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m30-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r10" {
+  name     = "${var.prefix}-m30-r10"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r11" {
+  name     = "${var.prefix}-m30-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r12" {
+  name     = "${var.prefix}-m30-r12"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r13" {
+  name     = "${var.prefix}-m30-r13"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  ref_1    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r14" {
+  name     = "${var.prefix}-m30-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  ref_1    = aws_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r15" {
+  name     = "${var.prefix}-m30-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  ref_1    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r16" {
+  name     = "${var.prefix}-m30-r16"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r14.id
+  ref_1    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r17" {
+  name     = "${var.prefix}-m30-r17"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r18" {
+  name     = "${var.prefix}-m30-r18"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  ref_1    = helm_release.r16.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r19" {
+  name     = "${var.prefix}-m30-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r20" {
+  name     = "${var.prefix}-m30-r20"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  ref_1    = aws_lb_target_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r21" {
+  name     = "${var.prefix}-m30-r21"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r19.id
+  ref_1    = aws_lb_target_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m30-r22"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r18.id
+  ref_1    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r23" {
+  name     = "${var.prefix}-m30-r23"
+  upstream = var.upstream
+  ref_0    = aws_instance.r21.id
+  ref_1    = helm_release.r16.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m30-r24"
+  upstream = var.upstream
+  ref_0    = aws_instance.r12.id
+  ref_1    = aws_cloudwatch_log_group.r19.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r25" {
+  name     = "${var.prefix}-m30-r25"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r26" {
+  name     = "${var.prefix}-m30-r26"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r27" {
+  name     = "${var.prefix}-m30-r27"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r18.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r28" {
+  name     = "${var.prefix}-m30-r28"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  ref_1    = aws_lb_target_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r29" {
+  name     = "${var.prefix}-m30-r29"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  ref_1    = helm_release.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r30" {
+  name     = "${var.prefix}-m30-r30"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r15.id
+  ref_1    = aws_ecr_repository.r20.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r31" {
+  name     = "${var.prefix}-m30-r31"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m30-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r33" {
+  name     = "${var.prefix}-m30-r33"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = aws_cloudwatch_log_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r34" {
+  name     = "${var.prefix}-m30-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r32.id
+  ref_1    = helm_release.r31.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r35" {
+  name     = "${var.prefix}-m30-r35"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r34.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r36" {
+  name     = "${var.prefix}-m30-r36"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r34.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r37" {
+  name     = "${var.prefix}-m30-r37"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r29.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r38" {
+  name     = "${var.prefix}-m30-r38"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r10.id
+  ref_1    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r39" {
+  name     = "${var.prefix}-m30-r39"
+  upstream = var.upstream
+  ref_0    = aws_instance.r13.id
+  ref_1    = aws_cloudwatch_log_group.r19.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r40" {
+  name     = "${var.prefix}-m30-r40"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r8.id
+  ref_1    = aws_lb_target_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r41" {
+  name     = "${var.prefix}-m30-r41"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r15.id
+  ref_1    = aws_iam_role.r17.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r42" {
+  name     = "${var.prefix}-m30-r42"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  ref_1    = aws_instance.r13.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r43" {
+  name     = "${var.prefix}-m30-r43"
+  upstream = var.upstream
+  ref_0    = helm_release.r31.id
+  ref_1    = kubernetes_service.r35.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r44" {
+  name     = "${var.prefix}-m30-r44"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r45" {
+  name     = "${var.prefix}-m30-r45"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r15.id
+  ref_1    = aws_lb_target_group.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r46" {
+  name     = "${var.prefix}-m30-r46"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r22.id
+  ref_1    = aws_ecr_repository.r33.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r47" {
+  name     = "${var.prefix}-m30-r47"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r18.id
+  ref_1    = aws_security_group.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r48" {
+  name     = "${var.prefix}-m30-r48"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  ref_1    = kubernetes_service.r36.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r49" {
+  name     = "${var.prefix}-m30-r49"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r10.id
+  ref_1    = aws_ecr_repository.r38.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_instance.r49.id
+}
@@ -0,0 +1,401 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m31"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m31-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r1" {
+  name     = "${var.prefix}-m31-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r2" {
+  name     = "${var.prefix}-m31-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r3" {
+  name     = "${var.prefix}-m31-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m31-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = helm_release.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r5" {
+  name     = "${var.prefix}-m31-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r6" {
+  name     = "${var.prefix}-m31-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  ref_1    = kubernetes_config_map.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r7" {
+  name     = "${var.prefix}-m31-r7"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r8" {
+  name     = "${var.prefix}-m31-r8"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r9" {
+  name     = "${var.prefix}-m31-r9"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r10" {
+  name     = "${var.prefix}-m31-r10"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r11" {
+  name     = "${var.prefix}-m31-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = aws_db_instance.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r12" {
+  name     = "${var.prefix}-m31-r12"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r13" {
+  name     = "${var.prefix}-m31-r13"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  ref_1    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r14" {
+  name     = "${var.prefix}-m31-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r15" {
+  name     = "${var.prefix}-m31-r15"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r16" {
+  name     = "${var.prefix}-m31-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r13.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m31-r17"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r18" {
+  name     = "${var.prefix}-m31-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r19" {
+  name     = "${var.prefix}-m31-r19"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r17.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r20" {
+  name     = "${var.prefix}-m31-r20"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r15.id
+  ref_1    = aws_security_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r21" {
+  name     = "${var.prefix}-m31-r21"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r10.id
+  ref_1    = helm_release.r11.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m31-r22"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m31-r23"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r24" {
+  name     = "${var.prefix}-m31-r24"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r21.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r25" {
+  name     = "${var.prefix}-m31-r25"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r26" {
+  name     = "${var.prefix}-m31-r26"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r27" {
+  name     = "${var.prefix}-m31-r27"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r21.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r28" {
+  name     = "${var.prefix}-m31-r28"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r29" {
+  name     = "${var.prefix}-m31-r29"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r21.id
+  ref_1    = aws_iam_role.r22.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r30" {
+  name     = "${var.prefix}-m31-r30"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r24.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r31" {
+  name     = "${var.prefix}-m31-r31"
+  upstream = var.upstream
+  ref_0    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r32" {
+  name     = "${var.prefix}-m31-r32"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r13.id
+  ref_1    = aws_cloudwatch_log_group.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r33" {
+  name     = "${var.prefix}-m31-r33"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  ref_1    = aws_iam_role.r28.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r34" {
+  name     = "${var.prefix}-m31-r34"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r29.id
+  ref_1    = aws_db_instance.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r35" {
+  name     = "${var.prefix}-m31-r35"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r26.id
+  ref_1    = kubernetes_config_map.r19.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r36" {
+  name     = "${var.prefix}-m31-r36"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r35.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r37" {
+  name     = "${var.prefix}-m31-r37"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r15.id
+  ref_1    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r38" {
+  name     = "${var.prefix}-m31-r38"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r31.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r39" {
+  name     = "${var.prefix}-m31-r39"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r8.id
+  ref_1    = kubernetes_service.r33.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r40" {
+  name     = "${var.prefix}-m31-r40"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r28.id
+  ref_1    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r41" {
+  name     = "${var.prefix}-m31-r41"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r42" {
+  name     = "${var.prefix}-m31-r42"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  ref_1    = aws_iam_role.r37.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r43" {
+  name     = "${var.prefix}-m31-r43"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r15.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r44" {
+  name     = "${var.prefix}-m31-r44"
+  upstream = var.upstream
+  ref_0    = helm_release.r30.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r45" {
+  name     = "${var.prefix}-m31-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r26.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r46" {
+  name     = "${var.prefix}-m31-r46"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r15.id
+  ref_1    = aws_cloudwatch_log_group.r38.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r47" {
+  name     = "${var.prefix}-m31-r47"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r5.id
+  ref_1    = aws_instance.r36.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r48" {
+  name     = "${var.prefix}-m31-r48"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = aws_instance.r39.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r49" {
+  name     = "${var.prefix}-m31-r49"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r21.id
+  ref_1    = aws_cloudwatch_log_group.r41.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_security_group.r49.id
+}
@@ -0,0 +1,408 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m32"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_ecr_repository" "r0" {
+  name     = "${var.prefix}-m32-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r1" {
+  name     = "${var.prefix}-m32-r1"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r2" {
+  name     = "${var.prefix}-m32-r2"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r3" {
+  name     = "${var.prefix}-m32-r3"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m32-r4"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = aws_iam_role.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r5" {
+  name     = "${var.prefix}-m32-r5"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r6" {
+  name     = "${var.prefix}-m32-r6"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  ref_1    = aws_db_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r7" {
+  name     = "${var.prefix}-m32-r7"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r8" {
+  name     = "${var.prefix}-m32-r8"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r9" {
+  name     = "${var.prefix}-m32-r9"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r10" {
+  name     = "${var.prefix}-m32-r10"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r11" {
+  name     = "${var.prefix}-m32-r11"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  ref_1    = kubernetes_config_map.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r12" {
+  name     = "${var.prefix}-m32-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  ref_1    = aws_ecr_repository.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r13" {
+  name     = "${var.prefix}-m32-r13"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r14" {
+  name     = "${var.prefix}-m32-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r15" {
+  name     = "${var.prefix}-m32-r15"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r16" {
+  name     = "${var.prefix}-m32-r16"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r17" {
+  name     = "${var.prefix}-m32-r17"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  ref_1    = aws_iam_role.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r18" {
+  name     = "${var.prefix}-m32-r18"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = kubernetes_service.r10.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r19" {
+  name     = "${var.prefix}-m32-r19"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r20" {
+  name     = "${var.prefix}-m32-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r21" {
+  name     = "${var.prefix}-m32-r21"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r15.id
+  ref_1    = aws_cloudwatch_log_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r22" {
+  name     = "${var.prefix}-m32-r22"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  ref_1    = aws_db_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m32-r23"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r24" {
+  name     = "${var.prefix}-m32-r24"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r25" {
+  name     = "${var.prefix}-m32-r25"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r15.id
+  ref_1    = aws_security_group.r13.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r26" {
+  name     = "${var.prefix}-m32-r26"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  ref_1    = aws_cloudwatch_log_group.r15.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r27" {
+  name     = "${var.prefix}-m32-r27"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r28" {
+  name     = "${var.prefix}-m32-r28"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r26.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r29" {
+  name     = "${var.prefix}-m32-r29"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r28.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r30" {
+  name     = "${var.prefix}-m32-r30"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r28.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r31" {
+  name     = "${var.prefix}-m32-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r29.id
+  ref_1    = aws_instance.r30.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m32-r32"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r33" {
+  name     = "${var.prefix}-m32-r33"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r32.id
+  ref_1    = kubernetes_config_map.r18.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r34" {
+  name     = "${var.prefix}-m32-r34"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r28.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r35" {
+  name     = "${var.prefix}-m32-r35"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r36" {
+  name     = "${var.prefix}-m32-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  ref_1    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r37" {
+  name     = "${var.prefix}-m32-r37"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r23.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r38" {
+  name     = "${var.prefix}-m32-r38"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r27.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r39" {
+  name     = "${var.prefix}-m32-r39"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r26.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r40" {
+  name     = "${var.prefix}-m32-r40"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r20.id
+  ref_1    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r41" {
+  name     = "${var.prefix}-m32-r41"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r25.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r42" {
+  name     = "${var.prefix}-m32-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r39.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r43" {
+  name     = "${var.prefix}-m32-r43"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r23.id
+  ref_1    = aws_instance.r30.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r44" {
+  name     = "${var.prefix}-m32-r44"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r45" {
+  name     = "${var.prefix}-m32-r45"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r20.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r46" {
+  name     = "${var.prefix}-m32-r46"
+  upstream = var.upstream
+  ref_0    = aws_instance.r31.id
+  ref_1    = aws_security_group.r28.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r47" {
+  name     = "${var.prefix}-m32-r47"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  ref_1    = aws_iam_role.r36.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r48" {
+  name     = "${var.prefix}-m32-r48"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = aws_ecr_repository.r24.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r49" {
+  name     = "${var.prefix}-m32-r49"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r23.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_s3_bucket.r49.id
+}
@@ -0,0 +1,408 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m33"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_s3_bucket" "r0" {
+  name     = "${var.prefix}-m33-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r1" {
+  name     = "${var.prefix}-m33-r1"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r2" {
+  name     = "${var.prefix}-m33-r2"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r3" {
+  name     = "${var.prefix}-m33-r3"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r4" {
+  name     = "${var.prefix}-m33-r4"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r5" {
+  name     = "${var.prefix}-m33-r5"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r6" {
+  name     = "${var.prefix}-m33-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r7" {
+  name     = "${var.prefix}-m33-r7"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = aws_lb_target_group.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r8" {
+  name     = "${var.prefix}-m33-r8"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r9" {
+  name     = "${var.prefix}-m33-r9"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  ref_1    = aws_ecr_repository.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r10" {
+  name     = "${var.prefix}-m33-r10"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r11" {
+  name     = "${var.prefix}-m33-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  ref_1    = aws_ecr_repository.r2.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m33-r12"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r11.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r13" {
+  name     = "${var.prefix}-m33-r13"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  ref_1    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r14" {
+  name     = "${var.prefix}-m33-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  ref_1    = aws_ecr_repository.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r15" {
+  name     = "${var.prefix}-m33-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  ref_1    = aws_security_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r16" {
+  name     = "${var.prefix}-m33-r16"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  ref_1    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r17" {
+  name     = "${var.prefix}-m33-r17"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r18" {
+  name     = "${var.prefix}-m33-r18"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r2.id
+  ref_1    = aws_s3_bucket.r12.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r19" {
+  name     = "${var.prefix}-m33-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  ref_1    = aws_s3_bucket.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r20" {
+  name     = "${var.prefix}-m33-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r21" {
+  name     = "${var.prefix}-m33-r21"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r22" {
+  name     = "${var.prefix}-m33-r22"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r19.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r23" {
+  name     = "${var.prefix}-m33-r23"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r18.id
+  ref_1    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r24" {
+  name     = "${var.prefix}-m33-r24"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r25" {
+  name     = "${var.prefix}-m33-r25"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r13.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r26" {
+  name     = "${var.prefix}-m33-r26"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r27" {
+  name     = "${var.prefix}-m33-r27"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  ref_1    = aws_lb_target_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r28" {
+  name     = "${var.prefix}-m33-r28"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r29" {
+  name     = "${var.prefix}-m33-r29"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r30" {
+  name     = "${var.prefix}-m33-r30"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r15.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r31" {
+  name     = "${var.prefix}-m33-r31"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r26.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r32" {
+  name     = "${var.prefix}-m33-r32"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r29.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r33" {
+  name     = "${var.prefix}-m33-r33"
+  upstream = var.upstream
+  ref_0    = helm_release.r30.id
+  ref_1    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r34" {
+  name     = "${var.prefix}-m33-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r4.id
+  ref_1    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r35" {
+  name     = "${var.prefix}-m33-r35"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r14.id
+  ref_1    = aws_ecr_repository.r26.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r36" {
+  name     = "${var.prefix}-m33-r36"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r34.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r37" {
+  name     = "${var.prefix}-m33-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  ref_1    = kubernetes_service.r21.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r38" {
+  name     = "${var.prefix}-m33-r38"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r16.id
+  ref_1    = helm_release.r27.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r39" {
+  name     = "${var.prefix}-m33-r39"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  ref_1    = kubernetes_service.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r40" {
+  name     = "${var.prefix}-m33-r40"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r41" {
+  name     = "${var.prefix}-m33-r41"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r42" {
+  name     = "${var.prefix}-m33-r42"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_s3_bucket.r25.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r43" {
+  name     = "${var.prefix}-m33-r43"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r13.id
+  ref_1    = aws_cloudwatch_log_group.r22.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r44" {
+  name     = "${var.prefix}-m33-r44"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r38.id
+  ref_1    = aws_lb_target_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r45" {
+  name     = "${var.prefix}-m33-r45"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r31.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r46" {
+  name     = "${var.prefix}-m33-r46"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r47" {
+  name     = "${var.prefix}-m33-r47"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r43.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r48" {
+  name     = "${var.prefix}-m33-r48"
+  upstream = var.upstream
+  ref_0    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r49" {
+  name     = "${var.prefix}-m33-r49"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r39.id
+  ref_1    = aws_s3_bucket.r35.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_lb_target_group.r49.id
+}
@@ -0,0 +1,408 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m34"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_service" "r0" {
+  name     = "${var.prefix}-m34-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m34-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r2" {
+  name     = "${var.prefix}-m34-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r3" {
+  name     = "${var.prefix}-m34-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m34-r4"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r5" {
+  name     = "${var.prefix}-m34-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  ref_1    = helm_release.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r6" {
+  name     = "${var.prefix}-m34-r6"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r7" {
+  name     = "${var.prefix}-m34-r7"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r8" {
+  name     = "${var.prefix}-m34-r8"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m34-r9"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r10" {
+  name     = "${var.prefix}-m34-r10"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_ecr_repository.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r11" {
+  name     = "${var.prefix}-m34-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r12" {
+  name     = "${var.prefix}-m34-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r13" {
+  name     = "${var.prefix}-m34-r13"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r3.id
+  ref_1    = aws_ecr_repository.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r14" {
+  name     = "${var.prefix}-m34-r14"
+  upstream = var.upstream
+  ref_0    = helm_release.r11.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r15" {
+  name     = "${var.prefix}-m34-r15"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_ecr_repository.r5.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r16" {
+  name     = "${var.prefix}-m34-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r5.id
+  ref_1    = aws_db_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m34-r17"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r18" {
+  name     = "${var.prefix}-m34-r18"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r16.id
+  ref_1    = helm_release.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r19" {
+  name     = "${var.prefix}-m34-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r20" {
+  name     = "${var.prefix}-m34-r20"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  ref_1    = kubernetes_service.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r21" {
+  name     = "${var.prefix}-m34-r21"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_iam_role.r15.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r22" {
+  name     = "${var.prefix}-m34-r22"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r23" {
+  name     = "${var.prefix}-m34-r23"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r22.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r24" {
+  name     = "${var.prefix}-m34-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = kubernetes_service.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r25" {
+  name     = "${var.prefix}-m34-r25"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r26" {
+  name     = "${var.prefix}-m34-r26"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r27" {
+  name     = "${var.prefix}-m34-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r21.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r28" {
+  name     = "${var.prefix}-m34-r28"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  ref_1    = aws_iam_role.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r29" {
+  name     = "${var.prefix}-m34-r29"
+  upstream = var.upstream
+  ref_0    = aws_instance.r26.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r30" {
+  name     = "${var.prefix}-m34-r30"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  ref_1    = aws_s3_bucket.r27.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r31" {
+  name     = "${var.prefix}-m34-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = kubernetes_service.r21.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r32" {
+  name     = "${var.prefix}-m34-r32"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r17.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r33" {
+  name     = "${var.prefix}-m34-r33"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r16.id
+  ref_1    = aws_ecr_repository.r23.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r34" {
+  name     = "${var.prefix}-m34-r34"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = helm_release.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r35" {
+  name     = "${var.prefix}-m34-r35"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r20.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r36" {
+  name     = "${var.prefix}-m34-r36"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  ref_1    = aws_ecr_repository.r23.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r37" {
+  name     = "${var.prefix}-m34-r37"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r38" {
+  name     = "${var.prefix}-m34-r38"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r30.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r39" {
+  name     = "${var.prefix}-m34-r39"
+  upstream = var.upstream
+  ref_0    = helm_release.r25.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m34-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r30.id
+  ref_1    = aws_iam_role.r14.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r41" {
+  name     = "${var.prefix}-m34-r41"
+  upstream = var.upstream
+  ref_0    = helm_release.r18.id
+  ref_1    = aws_security_group.r36.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r42" {
+  name     = "${var.prefix}-m34-r42"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r14.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r43" {
+  name     = "${var.prefix}-m34-r43"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r44" {
+  name     = "${var.prefix}-m34-r44"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r35.id
+  ref_1    = helm_release.r25.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r45" {
+  name     = "${var.prefix}-m34-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r21.id
+  ref_1    = aws_cloudwatch_log_group.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r46" {
+  name     = "${var.prefix}-m34-r46"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r22.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r47" {
+  name     = "${var.prefix}-m34-r47"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r41.id
+  ref_1    = helm_release.r33.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r48" {
+  name     = "${var.prefix}-m34-r48"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r49" {
+  name     = "${var.prefix}-m34-r49"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_db_instance.r49.id
+}
@@ -0,0 +1,410 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m35"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m35-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m35-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r2" {
+  name     = "${var.prefix}-m35-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r3" {
+  name     = "${var.prefix}-m35-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = helm_release.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r4" {
+  name     = "${var.prefix}-m35-r4"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r5" {
+  name     = "${var.prefix}-m35-r5"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r3.id
+  ref_1    = aws_ecr_repository.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r6" {
+  name     = "${var.prefix}-m35-r6"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r7" {
+  name     = "${var.prefix}-m35-r7"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_ecr_repository.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r8" {
+  name     = "${var.prefix}-m35-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  ref_1    = aws_ecr_repository.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r9" {
+  name     = "${var.prefix}-m35-r9"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_cloudwatch_log_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r10" {
+  name     = "${var.prefix}-m35-r10"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r11" {
+  name     = "${var.prefix}-m35-r11"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r12" {
+  name     = "${var.prefix}-m35-r12"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r13" {
+  name     = "${var.prefix}-m35-r13"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r14" {
+  name     = "${var.prefix}-m35-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r15" {
+  name     = "${var.prefix}-m35-r15"
+  upstream = var.upstream
+  ref_0    = aws_instance.r10.id
+  ref_1    = aws_security_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r16" {
+  name     = "${var.prefix}-m35-r16"
+  upstream = var.upstream
+  ref_0    = aws_instance.r10.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r17" {
+  name     = "${var.prefix}-m35-r17"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r8.id
+  ref_1    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r18" {
+  name     = "${var.prefix}-m35-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  ref_1    = aws_db_instance.r16.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r19" {
+  name     = "${var.prefix}-m35-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r20" {
+  name     = "${var.prefix}-m35-r20"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r21" {
+  name     = "${var.prefix}-m35-r21"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  ref_1    = aws_iam_role.r8.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r22" {
+  name     = "${var.prefix}-m35-r22"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r19.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r23" {
+  name     = "${var.prefix}-m35-r23"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r20.id
+  ref_1    = aws_iam_role.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m35-r24"
+  upstream = var.upstream
+  ref_0    = aws_instance.r18.id
+  ref_1    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r25" {
+  name     = "${var.prefix}-m35-r25"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r26" {
+  name     = "${var.prefix}-m35-r26"
+  upstream = var.upstream
+  ref_0    = aws_instance.r18.id
+  ref_1    = aws_security_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r27" {
+  name     = "${var.prefix}-m35-r27"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r21.id
+  ref_1    = aws_iam_role.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r28" {
+  name     = "${var.prefix}-m35-r28"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r14.id
+  ref_1    = aws_cloudwatch_log_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r29" {
+  name     = "${var.prefix}-m35-r29"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r25.id
+  ref_1    = aws_db_instance.r16.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r30" {
+  name     = "${var.prefix}-m35-r30"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  ref_1    = aws_security_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r31" {
+  name     = "${var.prefix}-m35-r31"
+  upstream = var.upstream
+  ref_0    = aws_instance.r17.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r32" {
+  name     = "${var.prefix}-m35-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r11.id
+  ref_1    = aws_db_instance.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r33" {
+  name     = "${var.prefix}-m35-r33"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  ref_1    = aws_instance.r27.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r34" {
+  name     = "${var.prefix}-m35-r34"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r30.id
+  ref_1    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r35" {
+  name     = "${var.prefix}-m35-r35"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r36" {
+  name     = "${var.prefix}-m35-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r37" {
+  name     = "${var.prefix}-m35-r37"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r32.id
+  ref_1    = aws_lb_target_group.r31.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r38" {
+  name     = "${var.prefix}-m35-r38"
+  upstream = var.upstream
+  ref_0    = aws_instance.r17.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r39" {
+  name     = "${var.prefix}-m35-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r35.id
+  ref_1    = aws_instance.r27.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m35-r40"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r41" {
+  name     = "${var.prefix}-m35-r41"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r42" {
+  name     = "${var.prefix}-m35-r42"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r43" {
+  name     = "${var.prefix}-m35-r43"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r33.id
+  ref_1    = aws_instance.r27.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r44" {
+  name     = "${var.prefix}-m35-r44"
+  upstream = var.upstream
+  ref_0    = helm_release.r23.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r45" {
+  name     = "${var.prefix}-m35-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r46" {
+  name     = "${var.prefix}-m35-r46"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r2.id
+  ref_1    = kubernetes_config_map.r9.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r47" {
+  name     = "${var.prefix}-m35-r47"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r29.id
+  ref_1    = aws_instance.r42.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r48" {
+  name     = "${var.prefix}-m35-r48"
+  upstream = var.upstream
+  ref_0    = aws_instance.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r49" {
+  name     = "${var.prefix}-m35-r49"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r2.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_config_map.r49.id
+}
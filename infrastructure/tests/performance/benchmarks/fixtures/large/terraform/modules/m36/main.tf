@@ -0,0 +1,398 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m36"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_instance" "r0" {
+  name     = "${var.prefix}-m36-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r1" {
+  name     = "${var.prefix}-m36-r1"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r2" {
+  name     = "${var.prefix}-m36-r2"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r3" {
+  name     = "${var.prefix}-m36-r3"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r4" {
+  name     = "${var.prefix}-m36-r4"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r5" {
+  name     = "${var.prefix}-m36-r5"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  ref_1    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r6" {
+  name     = "${var.prefix}-m36-r6"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r7" {
+  name     = "${var.prefix}-m36-r7"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r8" {
+  name     = "${var.prefix}-m36-r8"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r9" {
+  name     = "${var.prefix}-m36-r9"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r10" {
+  name     = "${var.prefix}-m36-r10"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r11" {
+  name     = "${var.prefix}-m36-r11"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r12" {
+  name     = "${var.prefix}-m36-r12"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r13" {
+  name     = "${var.prefix}-m36-r13"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r14" {
+  name     = "${var.prefix}-m36-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r10.id
+  ref_1    = aws_instance.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r15" {
+  name     = "${var.prefix}-m36-r15"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  ref_1    = aws_s3_bucket.r14.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r16" {
+  name     = "${var.prefix}-m36-r16"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r17" {
+  name     = "${var.prefix}-m36-r17"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r18" {
+  name     = "${var.prefix}-m36-r18"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  ref_1    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r19" {
+  name     = "${var.prefix}-m36-r19"
+  upstream = var.upstream
+  ref_0    = helm_release.r13.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r20" {
+  name     = "${var.prefix}-m36-r20"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r14.id
+  ref_1    = helm_release.r13.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r21" {
+  name     = "${var.prefix}-m36-r21"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r20.id
+  ref_1    = aws_iam_role.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r22" {
+  name     = "${var.prefix}-m36-r22"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m36-r23"
+  upstream = var.upstream
+  ref_0    = helm_release.r13.id
+  ref_1    = kubernetes_config_map.r15.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r24" {
+  name     = "${var.prefix}-m36-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r25" {
+  name     = "${var.prefix}-m36-r25"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r26" {
+  name     = "${var.prefix}-m36-r26"
+  upstream = var.upstream
+  ref_0    = aws_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r27" {
+  name     = "${var.prefix}-m36-r27"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r28" {
+  name     = "${var.prefix}-m36-r28"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r29" {
+  name     = "${var.prefix}-m36-r29"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r16.id
+  ref_1    = aws_ecr_repository.r9.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r30" {
+  name     = "${var.prefix}-m36-r30"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r21.id
+  ref_1    = aws_security_group.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r31" {
+  name     = "${var.prefix}-m36-r31"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r16.id
+  ref_1    = aws_s3_bucket.r14.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r32" {
+  name     = "${var.prefix}-m36-r32"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r27.id
+  ref_1    = kubernetes_service.r22.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r33" {
+  name     = "${var.prefix}-m36-r33"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r14.id
+  ref_1    = aws_db_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r34" {
+  name     = "${var.prefix}-m36-r34"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  ref_1    = aws_s3_bucket.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r35" {
+  name     = "${var.prefix}-m36-r35"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r36" {
+  name     = "${var.prefix}-m36-r36"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r37" {
+  name     = "${var.prefix}-m36-r37"
+  upstream = var.upstream
+  ref_0    = helm_release.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r38" {
+  name     = "${var.prefix}-m36-r38"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r39" {
+  name     = "${var.prefix}-m36-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r23.id
+  ref_1    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m36-r40"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r41" {
+  name     = "${var.prefix}-m36-r41"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r42" {
+  name     = "${var.prefix}-m36-r42"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r30.id
+  ref_1    = kubernetes_config_map.r25.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r43" {
+  name     = "${var.prefix}-m36-r43"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r16.id
+  ref_1    = aws_ecr_repository.r26.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r44" {
+  name     = "${var.prefix}-m36-r44"
+  upstream = var.upstream
+  ref_0    = aws_instance.r42.id
+  ref_1    = aws_s3_bucket.r14.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r45" {
+  name     = "${var.prefix}-m36-r45"
+  upstream = var.upstream
+  ref_0    = helm_release.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r46" {
+  name     = "${var.prefix}-m36-r46"
+  upstream = var.upstream
+  ref_0    = helm_release.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r47" {
+  name     = "${var.prefix}-m36-r47"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = aws_lb_target_group.r31.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r48" {
+  name     = "${var.prefix}-m36-r48"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r33.id
+  ref_1    = aws_instance.r24.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r49" {
+  name     = "${var.prefix}-m36-r49"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r35.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_ecr_repository.r49.id
+}
@@ -0,0 +1,411 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m37"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_config_map" "r0" {
+  name     = "${var.prefix}-m37-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r1" {
+  name     = "${var.prefix}-m37-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r2" {
+  name     = "${var.prefix}-m37-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  ref_1    = kubernetes_service.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r3" {
+  name     = "${var.prefix}-m37-r3"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = kubernetes_service.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r4" {
+  name     = "${var.prefix}-m37-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r5" {
+  name     = "${var.prefix}-m37-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r6" {
+  name     = "${var.prefix}-m37-r6"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r3.id
+  ref_1    = kubernetes_service.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r7" {
+  name     = "${var.prefix}-m37-r7"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r8" {
+  name     = "${var.prefix}-m37-r8"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r9" {
+  name     = "${var.prefix}-m37-r9"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  ref_1    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r10" {
+  name     = "${var.prefix}-m37-r10"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r11" {
+  name     = "${var.prefix}-m37-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  ref_1    = aws_instance.r10.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r12" {
+  name     = "${var.prefix}-m37-r12"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  ref_1    = aws_ecr_repository.r11.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r13" {
+  name     = "${var.prefix}-m37-r13"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r14" {
+  name     = "${var.prefix}-m37-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r15" {
+  name     = "${var.prefix}-m37-r15"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r16" {
+  name     = "${var.prefix}-m37-r16"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r6.id
+  ref_1    = aws_instance.r10.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r17" {
+  name     = "${var.prefix}-m37-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r9.id
+  ref_1    = aws_ecr_repository.r13.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r18" {
+  name     = "${var.prefix}-m37-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r19" {
+  name     = "${var.prefix}-m37-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r20" {
+  name     = "${var.prefix}-m37-r20"
+  upstream = var.upstream
+  ref_0    = helm_release.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r21" {
+  name     = "${var.prefix}-m37-r21"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r3.id
+  ref_1    = kubernetes_config_map.r19.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m37-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  ref_1    = aws_instance.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m37-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r19.id
+  ref_1    = aws_ecr_repository.r15.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r24" {
+  name     = "${var.prefix}-m37-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r15.id
+  ref_1    = helm_release.r18.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r25" {
+  name     = "${var.prefix}-m37-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r26" {
+  name     = "${var.prefix}-m37-r26"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r14.id
+  ref_1    = aws_security_group.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r27" {
+  name     = "${var.prefix}-m37-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r9.id
+  ref_1    = aws_security_group.r24.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r28" {
+  name     = "${var.prefix}-m37-r28"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r29" {
+  name     = "${var.prefix}-m37-r29"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r22.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r30" {
+  name     = "${var.prefix}-m37-r30"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r24.id
+  ref_1    = aws_security_group.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r31" {
+  name     = "${var.prefix}-m37-r31"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r17.id
+  ref_1    = aws_s3_bucket.r27.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r32" {
+  name     = "${var.prefix}-m37-r32"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r24.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r33" {
+  name     = "${var.prefix}-m37-r33"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r20.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r34" {
+  name     = "${var.prefix}-m37-r34"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  ref_1    = aws_s3_bucket.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r35" {
+  name     = "${var.prefix}-m37-r35"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r20.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r36" {
+  name     = "${var.prefix}-m37-r36"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r37" {
+  name     = "${var.prefix}-m37-r37"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r33.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r38" {
+  name     = "${var.prefix}-m37-r38"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r36.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r39" {
+  name     = "${var.prefix}-m37-r39"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r21.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r40" {
+  name     = "${var.prefix}-m37-r40"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r41" {
+  name     = "${var.prefix}-m37-r41"
+  upstream = var.upstream
+  ref_0    = aws_instance.r30.id
+  ref_1    = aws_ecr_repository.r33.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r42" {
+  name     = "${var.prefix}-m37-r42"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r36.id
+  ref_1    = aws_security_group.r17.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r43" {
+  name     = "${var.prefix}-m37-r43"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r40.id
+  ref_1    = aws_security_group.r24.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r44" {
+  name     = "${var.prefix}-m37-r44"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r33.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r45" {
+  name     = "${var.prefix}-m37-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r9.id
+  ref_1    = aws_ecr_repository.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r46" {
+  name     = "${var.prefix}-m37-r46"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r47" {
+  name     = "${var.prefix}-m37-r47"
+  upstream = var.upstream
+  ref_0    = aws_instance.r30.id
+  ref_1    = aws_s3_bucket.r23.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r48" {
+  name     = "${var.prefix}-m37-r48"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r49" {
+  name     = "${var.prefix}-m37-r49"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r24.id
+  ref_1    = kubernetes_config_map.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_instance.r49.id
+}
@@ -0,0 +1,408 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m38"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_ecr_repository" "r0" {
+  name     = "${var.prefix}-m38-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r1" {
+  name     = "${var.prefix}-m38-r1"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r2" {
+  name     = "${var.prefix}-m38-r2"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  ref_1    = kubernetes_config_map.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r3" {
+  name     = "${var.prefix}-m38-r3"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r4" {
+  name     = "${var.prefix}-m38-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r5" {
+  name     = "${var.prefix}-m38-r5"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r6" {
+  name     = "${var.prefix}-m38-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r7" {
+  name     = "${var.prefix}-m38-r7"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r8" {
+  name     = "${var.prefix}-m38-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r9" {
+  name     = "${var.prefix}-m38-r9"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r10" {
+  name     = "${var.prefix}-m38-r10"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r11" {
+  name     = "${var.prefix}-m38-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r12" {
+  name     = "${var.prefix}-m38-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r13" {
+  name     = "${var.prefix}-m38-r13"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r10.id
+  ref_1    = aws_security_group.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r14" {
+  name     = "${var.prefix}-m38-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r15" {
+  name     = "${var.prefix}-m38-r15"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r16" {
+  name     = "${var.prefix}-m38-r16"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r17" {
+  name     = "${var.prefix}-m38-r17"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r18" {
+  name     = "${var.prefix}-m38-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r11.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r19" {
+  name     = "${var.prefix}-m38-r19"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m38-r20"
+  upstream = var.upstream
+  ref_0    = aws_instance.r19.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r21" {
+  name     = "${var.prefix}-m38-r21"
+  upstream = var.upstream
+  ref_0    = helm_release.r20.id
+  ref_1    = aws_security_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r22" {
+  name     = "${var.prefix}-m38-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r10.id
+  ref_1    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r23" {
+  name     = "${var.prefix}-m38-r23"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m38-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r13.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r25" {
+  name     = "${var.prefix}-m38-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  ref_1    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r26" {
+  name     = "${var.prefix}-m38-r26"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r13.id
+  ref_1    = aws_instance.r19.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r27" {
+  name     = "${var.prefix}-m38-r27"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r28" {
+  name     = "${var.prefix}-m38-r28"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r4.id
+  ref_1    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r29" {
+  name     = "${var.prefix}-m38-r29"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r12.id
+  ref_1    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r30" {
+  name     = "${var.prefix}-m38-r30"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  ref_1    = aws_security_group.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r31" {
+  name     = "${var.prefix}-m38-r31"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r32" {
+  name     = "${var.prefix}-m38-r32"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r17.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r33" {
+  name     = "${var.prefix}-m38-r33"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r16.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r34" {
+  name     = "${var.prefix}-m38-r34"
+  upstream = var.upstream
+  ref_0    = aws_instance.r19.id
+  ref_1    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r35" {
+  name     = "${var.prefix}-m38-r35"
+  upstream = var.upstream
+  ref_0    = aws_instance.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r36" {
+  name     = "${var.prefix}-m38-r36"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r17.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r37" {
+  name     = "${var.prefix}-m38-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r14.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r38" {
+  name     = "${var.prefix}-m38-r38"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r34.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r39" {
+  name     = "${var.prefix}-m38-r39"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r31.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r40" {
+  name     = "${var.prefix}-m38-r40"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  ref_1    = aws_db_instance.r10.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r41" {
+  name     = "${var.prefix}-m38-r41"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r27.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r42" {
+  name     = "${var.prefix}-m38-r42"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r30.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r43" {
+  name     = "${var.prefix}-m38-r43"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r13.id
+  ref_1    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r44" {
+  name     = "${var.prefix}-m38-r44"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r34.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r45" {
+  name     = "${var.prefix}-m38-r45"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r38.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r46" {
+  name     = "${var.prefix}-m38-r46"
+  upstream = var.upstream
+  ref_0    = helm_release.r28.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r47" {
+  name     = "${var.prefix}-m38-r47"
+  upstream = var.upstream
+  ref_0    = helm_release.r28.id
+  ref_1    = aws_iam_role.r25.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r48" {
+  name     = "${var.prefix}-m38-r48"
+  upstream = var.upstream
+  ref_0    = aws_instance.r32.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r49" {
+  name     = "${var.prefix}-m38-r49"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r31.id
+  ref_1    = aws_instance.r33.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_security_group.r49.id
+}
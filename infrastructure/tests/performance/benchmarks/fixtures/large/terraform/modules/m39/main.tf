@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m39"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_s3_bucket" "r0" {
+  name     = "${var.prefix}-m39-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_instance" "r1" {
+  name     = "${var.prefix}-m39-r1"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r2" {
+  name     = "${var.prefix}-m39-r2"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m39-r3"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m39-r4"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r5" {
+  name     = "${var.prefix}-m39-r5"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r6" {
+  name     = "${var.prefix}-m39-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r7" {
+  name     = "${var.prefix}-m39-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  ref_1    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r8" {
+  name     = "${var.prefix}-m39-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r9" {
+  name     = "${var.prefix}-m39-r9"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r10" {
+  name     = "${var.prefix}-m39-r10"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  ref_1    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r11" {
+  name     = "${var.prefix}-m39-r11"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  ref_1    = aws_instance.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r12" {
+  name     = "${var.prefix}-m39-r12"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r13" {
+  name     = "${var.prefix}-m39-r13"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r14" {
+  name     = "${var.prefix}-m39-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r15" {
+  name     = "${var.prefix}-m39-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  ref_1    = aws_iam_role.r14.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r16" {
+  name     = "${var.prefix}-m39-r16"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r17" {
+  name     = "${var.prefix}-m39-r17"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r13.id
+  ref_1    = aws_db_instance.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r18" {
+  name     = "${var.prefix}-m39-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r19" {
+  name     = "${var.prefix}-m39-r19"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  ref_1    = helm_release.r15.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r20" {
+  name     = "${var.prefix}-m39-r20"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r21" {
+  name     = "${var.prefix}-m39-r21"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r10.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r22" {
+  name     = "${var.prefix}-m39-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m39-r23"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r24" {
+  name     = "${var.prefix}-m39-r24"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r23.id
+  ref_1    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r25" {
+  name     = "${var.prefix}-m39-r25"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r19.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r26" {
+  name     = "${var.prefix}-m39-r26"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r17.id
+  ref_1    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r27" {
+  name     = "${var.prefix}-m39-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r21.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r28" {
+  name     = "${var.prefix}-m39-r28"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  ref_1    = kubernetes_service.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r29" {
+  name     = "${var.prefix}-m39-r29"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r30" {
+  name     = "${var.prefix}-m39-r30"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r22.id
+  ref_1    = aws_instance.r24.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r31" {
+  name     = "${var.prefix}-m39-r31"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r32" {
+  name     = "${var.prefix}-m39-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r33" {
+  name     = "${var.prefix}-m39-r33"
+  upstream = var.upstream
+  ref_0    = aws_instance.r24.id
+  ref_1    = kubernetes_config_map.r32.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r34" {
+  name     = "${var.prefix}-m39-r34"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r29.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r35" {
+  name     = "${var.prefix}-m39-r35"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r10.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r36" {
+  name     = "${var.prefix}-m39-r36"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_db_instance.r26.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r37" {
+  name     = "${var.prefix}-m39-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r18.id
+  ref_1    = kubernetes_service.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r38" {
+  name     = "${var.prefix}-m39-r38"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r17.id
+  ref_1    = aws_instance.r24.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r39" {
+  name     = "${var.prefix}-m39-r39"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  ref_1    = aws_db_instance.r26.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r40" {
+  name     = "${var.prefix}-m39-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r32.id
+  ref_1    = aws_instance.r24.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r41" {
+  name     = "${var.prefix}-m39-r41"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r42" {
+  name     = "${var.prefix}-m39-r42"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  ref_1    = aws_iam_role.r41.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r43" {
+  name     = "${var.prefix}-m39-r43"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r22.id
+  ref_1    = aws_db_instance.r35.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r44" {
+  name     = "${var.prefix}-m39-r44"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r20.id
+  ref_1    = kubernetes_service.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r45" {
+  name     = "${var.prefix}-m39-r45"
+  upstream = var.upstream
+  ref_0    = aws_instance.r25.id
+  ref_1    = aws_s3_bucket.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m39-r46"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = aws_cloudwatch_log_group.r34.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r47" {
+  name     = "${var.prefix}-m39-r47"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r29.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r48" {
+  name     = "${var.prefix}-m39-r48"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r32.id
+  ref_1    = aws_db_instance.r26.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r49" {
+  name     = "${var.prefix}-m39-r49"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r38.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_ecr_repository.r49.id
+}
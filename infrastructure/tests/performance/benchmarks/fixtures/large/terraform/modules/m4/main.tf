@@ -0,0 +1,403 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m4"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_iam_role" "r0" {
+  name     = "${var.prefix}-m4-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r1" {
+  name     = "${var.prefix}-m4-r1"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r2" {
+  name     = "${var.prefix}-m4-r2"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r3" {
+  name     = "${var.prefix}-m4-r3"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r4" {
+  name     = "${var.prefix}-m4-r4"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r5" {
+  name     = "${var.prefix}-m4-r5"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r6" {
+  name     = "${var.prefix}-m4-r6"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r4.id
+  ref_1    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r7" {
+  name     = "${var.prefix}-m4-r7"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r8" {
+  name     = "${var.prefix}-m4-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m4-r9"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r10" {
+  name     = "${var.prefix}-m4-r10"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = aws_iam_role.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r11" {
+  name     = "${var.prefix}-m4-r11"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r12" {
+  name     = "${var.prefix}-m4-r12"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  ref_1    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r13" {
+  name     = "${var.prefix}-m4-r13"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r10.id
+  ref_1    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r14" {
+  name     = "${var.prefix}-m4-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r15" {
+  name     = "${var.prefix}-m4-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r16" {
+  name     = "${var.prefix}-m4-r16"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r6.id
+  ref_1    = aws_db_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m4-r17"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = aws_db_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r18" {
+  name     = "${var.prefix}-m4-r18"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = aws_iam_role.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r19" {
+  name     = "${var.prefix}-m4-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r18.id
+  ref_1    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r20" {
+  name     = "${var.prefix}-m4-r20"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r17.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r21" {
+  name     = "${var.prefix}-m4-r21"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  ref_1    = kubernetes_service.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r22" {
+  name     = "${var.prefix}-m4-r22"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r23" {
+  name     = "${var.prefix}-m4-r23"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r13.id
+  ref_1    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r24" {
+  name     = "${var.prefix}-m4-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r12.id
+  ref_1    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r25" {
+  name     = "${var.prefix}-m4-r25"
+  upstream = var.upstream
+  ref_0    = aws_instance.r21.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r26" {
+  name     = "${var.prefix}-m4-r26"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r13.id
+  ref_1    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r27" {
+  name     = "${var.prefix}-m4-r27"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r28" {
+  name     = "${var.prefix}-m4-r28"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r26.id
+  ref_1    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r29" {
+  name     = "${var.prefix}-m4-r29"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r12.id
+  ref_1    = kubernetes_service.r22.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r30" {
+  name     = "${var.prefix}-m4-r30"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r25.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r31" {
+  name     = "${var.prefix}-m4-r31"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r15.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r32" {
+  name     = "${var.prefix}-m4-r32"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r33" {
+  name     = "${var.prefix}-m4-r33"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r34" {
+  name     = "${var.prefix}-m4-r34"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r35" {
+  name     = "${var.prefix}-m4-r35"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r15.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r36" {
+  name     = "${var.prefix}-m4-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r7.id
+  ref_1    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r37" {
+  name     = "${var.prefix}-m4-r37"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r28.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r38" {
+  name     = "${var.prefix}-m4-r38"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r34.id
+  ref_1    = aws_lb_target_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r39" {
+  name     = "${var.prefix}-m4-r39"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r40" {
+  name     = "${var.prefix}-m4-r40"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r24.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r41" {
+  name     = "${var.prefix}-m4-r41"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r23.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r42" {
+  name     = "${var.prefix}-m4-r42"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r13.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r43" {
+  name     = "${var.prefix}-m4-r43"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r44" {
+  name     = "${var.prefix}-m4-r44"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r32.id
+  ref_1    = aws_lb_target_group.r39.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r45" {
+  name     = "${var.prefix}-m4-r45"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r40.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m4-r46"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r28.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r47" {
+  name     = "${var.prefix}-m4-r47"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r48" {
+  name     = "${var.prefix}-m4-r48"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r17.id
+  ref_1    = aws_db_instance.r46.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r49" {
+  name     = "${var.prefix}-m4-r49"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r46.id
+  ref_1    = aws_iam_role.r23.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_iam_role.r49.id
+}
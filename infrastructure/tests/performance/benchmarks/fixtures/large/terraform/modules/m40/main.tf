@@ -0,0 +1,403 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m40"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_cloudwatch_log_group" "r0" {
+  name     = "${var.prefix}-m40-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r1" {
+  name     = "${var.prefix}-m40-r1"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m40-r2"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = aws_cloudwatch_log_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r3" {
+  name     = "${var.prefix}-m40-r3"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m40-r4"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r5" {
+  name     = "${var.prefix}-m40-r5"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = helm_release.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r6" {
+  name     = "${var.prefix}-m40-r6"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r7" {
+  name     = "${var.prefix}-m40-r7"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r8" {
+  name     = "${var.prefix}-m40-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r9" {
+  name     = "${var.prefix}-m40-r9"
+  upstream = var.upstream
+  ref_0    = helm_release.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r10" {
+  name     = "${var.prefix}-m40-r10"
+  upstream = var.upstream
+  ref_0    = helm_release.r8.id
+  ref_1    = helm_release.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r11" {
+  name     = "${var.prefix}-m40-r11"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  ref_1    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r12" {
+  name     = "${var.prefix}-m40-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r13" {
+  name     = "${var.prefix}-m40-r13"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r14" {
+  name     = "${var.prefix}-m40-r14"
+  upstream = var.upstream
+  ref_0    = helm_release.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r15" {
+  name     = "${var.prefix}-m40-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r10.id
+  ref_1    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r16" {
+  name     = "${var.prefix}-m40-r16"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r17" {
+  name     = "${var.prefix}-m40-r17"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r13.id
+  ref_1    = aws_ecr_repository.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r18" {
+  name     = "${var.prefix}-m40-r18"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r17.id
+  ref_1    = helm_release.r14.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r19" {
+  name     = "${var.prefix}-m40-r19"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  ref_1    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m40-r20"
+  upstream = var.upstream
+  ref_0    = helm_release.r14.id
+  ref_1    = aws_db_instance.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r21" {
+  name     = "${var.prefix}-m40-r21"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = aws_security_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r22" {
+  name     = "${var.prefix}-m40-r22"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  ref_1    = aws_instance.r9.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r23" {
+  name     = "${var.prefix}-m40-r23"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r19.id
+  ref_1    = kubernetes_service.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r24" {
+  name     = "${var.prefix}-m40-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  ref_1    = helm_release.r8.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r25" {
+  name     = "${var.prefix}-m40-r25"
+  upstream = var.upstream
+  ref_0    = helm_release.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r26" {
+  name     = "${var.prefix}-m40-r26"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = aws_ecr_repository.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r27" {
+  name     = "${var.prefix}-m40-r27"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  ref_1    = aws_instance.r25.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r28" {
+  name     = "${var.prefix}-m40-r28"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  ref_1    = helm_release.r14.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r29" {
+  name     = "${var.prefix}-m40-r29"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r30" {
+  name     = "${var.prefix}-m40-r30"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r24.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r31" {
+  name     = "${var.prefix}-m40-r31"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r32" {
+  name     = "${var.prefix}-m40-r32"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r33" {
+  name     = "${var.prefix}-m40-r33"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r29.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r34" {
+  name     = "${var.prefix}-m40-r34"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r16.id
+  ref_1    = aws_ecr_repository.r12.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r35" {
+  name     = "${var.prefix}-m40-r35"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r36" {
+  name     = "${var.prefix}-m40-r36"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = helm_release.r23.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r37" {
+  name     = "${var.prefix}-m40-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r18.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r38" {
+  name     = "${var.prefix}-m40-r38"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r17.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r39" {
+  name     = "${var.prefix}-m40-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r18.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r40" {
+  name     = "${var.prefix}-m40-r40"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r39.id
+  ref_1    = helm_release.r23.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r41" {
+  name     = "${var.prefix}-m40-r41"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r28.id
+  ref_1    = aws_ecr_repository.r12.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r42" {
+  name     = "${var.prefix}-m40-r42"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r43" {
+  name     = "${var.prefix}-m40-r43"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r38.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r44" {
+  name     = "${var.prefix}-m40-r44"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r40.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r45" {
+  name     = "${var.prefix}-m40-r45"
+  upstream = var.upstream
+  ref_0    = helm_release.r43.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r46" {
+  name     = "${var.prefix}-m40-r46"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r47" {
+  name     = "${var.prefix}-m40-r47"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  ref_1    = aws_s3_bucket.r29.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r48" {
+  name     = "${var.prefix}-m40-r48"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r41.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r49" {
+  name     = "${var.prefix}-m40-r49"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r42.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_lb_target_group.r49.id
+}
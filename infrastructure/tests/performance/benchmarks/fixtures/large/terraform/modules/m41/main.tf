@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m41"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m41-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r1" {
+  name     = "${var.prefix}-m41-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r2" {
+  name     = "${var.prefix}-m41-r2"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r3" {
+  name     = "${var.prefix}-m41-r3"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m41-r4"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r5" {
+  name     = "${var.prefix}-m41-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r6" {
+  name     = "${var.prefix}-m41-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r7" {
+  name     = "${var.prefix}-m41-r7"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r8" {
+  name     = "${var.prefix}-m41-r8"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r9" {
+  name     = "${var.prefix}-m41-r9"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  ref_1    = aws_iam_role.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r10" {
+  name     = "${var.prefix}-m41-r10"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r11" {
+  name     = "${var.prefix}-m41-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r12" {
+  name     = "${var.prefix}-m41-r12"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r13" {
+  name     = "${var.prefix}-m41-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r14" {
+  name     = "${var.prefix}-m41-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r15" {
+  name     = "${var.prefix}-m41-r15"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  ref_1    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r16" {
+  name     = "${var.prefix}-m41-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r17" {
+  name     = "${var.prefix}-m41-r17"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r18" {
+  name     = "${var.prefix}-m41-r18"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r19" {
+  name     = "${var.prefix}-m41-r19"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r15.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r20" {
+  name     = "${var.prefix}-m41-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  ref_1    = aws_iam_role.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r21" {
+  name     = "${var.prefix}-m41-r21"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r22" {
+  name     = "${var.prefix}-m41-r22"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r23" {
+  name     = "${var.prefix}-m41-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r7.id
+  ref_1    = aws_security_group.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m41-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r25" {
+  name     = "${var.prefix}-m41-r25"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r26" {
+  name     = "${var.prefix}-m41-r26"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_cloudwatch_log_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r27" {
+  name     = "${var.prefix}-m41-r27"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  ref_1    = kubernetes_config_map.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r28" {
+  name     = "${var.prefix}-m41-r28"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  ref_1    = helm_release.r23.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r29" {
+  name     = "${var.prefix}-m41-r29"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_iam_role.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r30" {
+  name     = "${var.prefix}-m41-r30"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  ref_1    = kubernetes_config_map.r18.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r31" {
+  name     = "${var.prefix}-m41-r31"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r29.id
+  ref_1    = aws_s3_bucket.r27.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r32" {
+  name     = "${var.prefix}-m41-r32"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r33" {
+  name     = "${var.prefix}-m41-r33"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r24.id
+  ref_1    = aws_iam_role.r16.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r34" {
+  name     = "${var.prefix}-m41-r34"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r35" {
+  name     = "${var.prefix}-m41-r35"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r22.id
+  ref_1    = kubernetes_config_map.r13.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r36" {
+  name     = "${var.prefix}-m41-r36"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r35.id
+  ref_1    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r37" {
+  name     = "${var.prefix}-m41-r37"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r25.id
+  ref_1    = aws_ecr_repository.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r38" {
+  name     = "${var.prefix}-m41-r38"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = helm_release.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r39" {
+  name     = "${var.prefix}-m41-r39"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r19.id
+  ref_1    = aws_s3_bucket.r29.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m41-r40"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r39.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r41" {
+  name     = "${var.prefix}-m41-r41"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r32.id
+  ref_1    = aws_cloudwatch_log_group.r24.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r42" {
+  name     = "${var.prefix}-m41-r42"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r43" {
+  name     = "${var.prefix}-m41-r43"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r27.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r44" {
+  name     = "${var.prefix}-m41-r44"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r21.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r45" {
+  name     = "${var.prefix}-m41-r45"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r22.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m41-r46"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r24.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r47" {
+  name     = "${var.prefix}-m41-r47"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r34.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r48" {
+  name     = "${var.prefix}-m41-r48"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r39.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r49" {
+  name     = "${var.prefix}-m41-r49"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_cloudwatch_log_group.r49.id
+}
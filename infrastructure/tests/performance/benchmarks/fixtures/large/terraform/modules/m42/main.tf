@@ -0,0 +1,408 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m42"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_s3_bucket" "r0" {
+  name     = "${var.prefix}-m42-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r1" {
+  name     = "${var.prefix}-m42-r1"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r2" {
+  name     = "${var.prefix}-m42-r2"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r3" {
+  name     = "${var.prefix}-m42-r3"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m42-r4"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r5" {
+  name     = "${var.prefix}-m42-r5"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r6" {
+  name     = "${var.prefix}-m42-r6"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r7" {
+  name     = "${var.prefix}-m42-r7"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  ref_1    = aws_security_group.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r8" {
+  name     = "${var.prefix}-m42-r8"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r9" {
+  name     = "${var.prefix}-m42-r9"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  ref_1    = kubernetes_config_map.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r10" {
+  name     = "${var.prefix}-m42-r10"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r11" {
+  name     = "${var.prefix}-m42-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m42-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r13" {
+  name     = "${var.prefix}-m42-r13"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r14" {
+  name     = "${var.prefix}-m42-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = aws_ecr_repository.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r15" {
+  name     = "${var.prefix}-m42-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  ref_1    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r16" {
+  name     = "${var.prefix}-m42-r16"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  ref_1    = helm_release.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r17" {
+  name     = "${var.prefix}-m42-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = aws_security_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r18" {
+  name     = "${var.prefix}-m42-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r19" {
+  name     = "${var.prefix}-m42-r19"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r20" {
+  name     = "${var.prefix}-m42-r20"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  ref_1    = aws_security_group.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r21" {
+  name     = "${var.prefix}-m42-r21"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r22" {
+  name     = "${var.prefix}-m42-r22"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m42-r23"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  ref_1    = aws_cloudwatch_log_group.r22.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m42-r24"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r25" {
+  name     = "${var.prefix}-m42-r25"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r26" {
+  name     = "${var.prefix}-m42-r26"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r27" {
+  name     = "${var.prefix}-m42-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r15.id
+  ref_1    = aws_s3_bucket.r25.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r28" {
+  name     = "${var.prefix}-m42-r28"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  ref_1    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r29" {
+  name     = "${var.prefix}-m42-r29"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r30" {
+  name     = "${var.prefix}-m42-r30"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  ref_1    = aws_s3_bucket.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r31" {
+  name     = "${var.prefix}-m42-r31"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r16.id
+  ref_1    = kubernetes_service.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r32" {
+  name     = "${var.prefix}-m42-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r21.id
+  ref_1    = aws_ecr_repository.r26.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r33" {
+  name     = "${var.prefix}-m42-r33"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  ref_1    = aws_cloudwatch_log_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r34" {
+  name     = "${var.prefix}-m42-r34"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r31.id
+  ref_1    = aws_ecr_repository.r26.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r35" {
+  name     = "${var.prefix}-m42-r35"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r14.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r36" {
+  name     = "${var.prefix}-m42-r36"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r37" {
+  name     = "${var.prefix}-m42-r37"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r25.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r38" {
+  name     = "${var.prefix}-m42-r38"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r26.id
+  ref_1    = aws_ecr_repository.r31.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r39" {
+  name     = "${var.prefix}-m42-r39"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m42-r40"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r41" {
+  name     = "${var.prefix}-m42-r41"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r23.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r42" {
+  name     = "${var.prefix}-m42-r42"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  ref_1    = aws_db_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r43" {
+  name     = "${var.prefix}-m42-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  ref_1    = aws_ecr_repository.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r44" {
+  name     = "${var.prefix}-m42-r44"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r45" {
+  name     = "${var.prefix}-m42-r45"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r46" {
+  name     = "${var.prefix}-m42-r46"
+  upstream = var.upstream
+  ref_0    = aws_instance.r42.id
+  ref_1    = aws_ecr_repository.r9.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r47" {
+  name     = "${var.prefix}-m42-r47"
+  upstream = var.upstream
+  ref_0    = aws_instance.r34.id
+  ref_1    = aws_s3_bucket.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r48" {
+  name     = "${var.prefix}-m42-r48"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r29.id
+  ref_1    = aws_security_group.r46.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r49" {
+  name     = "${var.prefix}-m42-r49"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r33.id
+  ref_1    = aws_db_instance.r35.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = helm_release.r49.id
+}
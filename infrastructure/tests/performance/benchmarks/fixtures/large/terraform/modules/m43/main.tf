@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m43"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m43-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r1" {
+  name     = "${var.prefix}-m43-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r2" {
+  name     = "${var.prefix}-m43-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r3" {
+  name     = "${var.prefix}-m43-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m43-r4"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r5" {
+  name     = "${var.prefix}-m43-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r6" {
+  name     = "${var.prefix}-m43-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_cloudwatch_log_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r7" {
+  name     = "${var.prefix}-m43-r7"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r8" {
+  name     = "${var.prefix}-m43-r8"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m43-r9"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r10" {
+  name     = "${var.prefix}-m43-r10"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = helm_release.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r11" {
+  name     = "${var.prefix}-m43-r11"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  ref_1    = aws_lb_target_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m43-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r13" {
+  name     = "${var.prefix}-m43-r13"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r14" {
+  name     = "${var.prefix}-m43-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r10.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r15" {
+  name     = "${var.prefix}-m43-r15"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  ref_1    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r16" {
+  name     = "${var.prefix}-m43-r16"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = helm_release.r11.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m43-r17"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r15.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r18" {
+  name     = "${var.prefix}-m43-r18"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  ref_1    = aws_db_instance.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r19" {
+  name     = "${var.prefix}-m43-r19"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r20" {
+  name     = "${var.prefix}-m43-r20"
+  upstream = var.upstream
+  ref_0    = helm_release.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r21" {
+  name     = "${var.prefix}-m43-r21"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r15.id
+  ref_1    = aws_db_instance.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r22" {
+  name     = "${var.prefix}-m43-r22"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  ref_1    = aws_ecr_repository.r6.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m43-r23"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r22.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r24" {
+  name     = "${var.prefix}-m43-r24"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = aws_s3_bucket.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r25" {
+  name     = "${var.prefix}-m43-r25"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r26" {
+  name     = "${var.prefix}-m43-r26"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r15.id
+  ref_1    = helm_release.r16.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r27" {
+  name     = "${var.prefix}-m43-r27"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r28" {
+  name     = "${var.prefix}-m43-r28"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  ref_1    = aws_cloudwatch_log_group.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r29" {
+  name     = "${var.prefix}-m43-r29"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r30" {
+  name     = "${var.prefix}-m43-r30"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r31" {
+  name     = "${var.prefix}-m43-r31"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r28.id
+  ref_1    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r32" {
+  name     = "${var.prefix}-m43-r32"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  ref_1    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r33" {
+  name     = "${var.prefix}-m43-r33"
+  upstream = var.upstream
+  ref_0    = aws_instance.r25.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r34" {
+  name     = "${var.prefix}-m43-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r21.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r35" {
+  name     = "${var.prefix}-m43-r35"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r20.id
+  ref_1    = aws_lb_target_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r36" {
+  name     = "${var.prefix}-m43-r36"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r27.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r37" {
+  name     = "${var.prefix}-m43-r37"
+  upstream = var.upstream
+  ref_0    = helm_release.r11.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r38" {
+  name     = "${var.prefix}-m43-r38"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r29.id
+  ref_1    = helm_release.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r39" {
+  name     = "${var.prefix}-m43-r39"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  ref_1    = kubernetes_config_map.r32.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r40" {
+  name     = "${var.prefix}-m43-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r41" {
+  name     = "${var.prefix}-m43-r41"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r32.id
+  ref_1    = aws_ecr_repository.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r42" {
+  name     = "${var.prefix}-m43-r42"
+  upstream = var.upstream
+  ref_0    = helm_release.r31.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r43" {
+  name     = "${var.prefix}-m43-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r27.id
+  ref_1    = aws_cloudwatch_log_group.r36.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r44" {
+  name     = "${var.prefix}-m43-r44"
+  upstream = var.upstream
+  ref_0    = helm_release.r31.id
+  ref_1    = aws_iam_role.r26.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r45" {
+  name     = "${var.prefix}-m43-r45"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r28.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r46" {
+  name     = "${var.prefix}-m43-r46"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  ref_1    = aws_ecr_repository.r27.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r47" {
+  name     = "${var.prefix}-m43-r47"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r48" {
+  name     = "${var.prefix}-m43-r48"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r20.id
+  ref_1    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r49" {
+  name     = "${var.prefix}-m43-r49"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r37.id
+  ref_1    = aws_ecr_repository.r47.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_s3_bucket.r49.id
+}
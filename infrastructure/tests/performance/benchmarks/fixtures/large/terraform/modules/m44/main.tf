@@ -0,0 +1,407 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m44"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_db_instance" "r0" {
+  name     = "${var.prefix}-m44-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r1" {
+  name     = "${var.prefix}-m44-r1"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r2" {
+  name     = "${var.prefix}-m44-r2"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r0.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r3" {
+  name     = "${var.prefix}-m44-r3"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_db_instance.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r4" {
+  name     = "${var.prefix}-m44-r4"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  ref_1    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r5" {
+  name     = "${var.prefix}-m44-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  ref_1    = aws_db_instance.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r6" {
+  name     = "${var.prefix}-m44-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_db_instance.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r7" {
+  name     = "${var.prefix}-m44-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r5.id
+  ref_1    = aws_security_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r8" {
+  name     = "${var.prefix}-m44-r8"
+  upstream = var.upstream
+  ref_0    = helm_release.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r9" {
+  name     = "${var.prefix}-m44-r9"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r0.id
+  ref_1    = helm_release.r7.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r10" {
+  name     = "${var.prefix}-m44-r10"
+  upstream = var.upstream
+  ref_0    = helm_release.r7.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r11" {
+  name     = "${var.prefix}-m44-r11"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r8.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r12" {
+  name     = "${var.prefix}-m44-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r13" {
+  name     = "${var.prefix}-m44-r13"
+  upstream = var.upstream
+  ref_0    = helm_release.r7.id
+  ref_1    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r14" {
+  name     = "${var.prefix}-m44-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  ref_1    = kubernetes_service.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r15" {
+  name     = "${var.prefix}-m44-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  ref_1    = kubernetes_config_map.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r16" {
+  name     = "${var.prefix}-m44-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r17" {
+  name     = "${var.prefix}-m44-r17"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r15.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r18" {
+  name     = "${var.prefix}-m44-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r5.id
+  ref_1    = kubernetes_service.r13.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r19" {
+  name     = "${var.prefix}-m44-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r12.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r20" {
+  name     = "${var.prefix}-m44-r20"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r21" {
+  name     = "${var.prefix}-m44-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r5.id
+  ref_1    = helm_release.r7.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r22" {
+  name     = "${var.prefix}-m44-r22"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r16.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r23" {
+  name     = "${var.prefix}-m44-r23"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r24" {
+  name     = "${var.prefix}-m44-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r17.id
+  ref_1    = aws_ecr_repository.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r25" {
+  name     = "${var.prefix}-m44-r25"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r17.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r26" {
+  name     = "${var.prefix}-m44-r26"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r24.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r27" {
+  name     = "${var.prefix}-m44-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r28" {
+  name     = "${var.prefix}-m44-r28"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r8.id
+  ref_1    = aws_security_group.r20.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r29" {
+  name     = "${var.prefix}-m44-r29"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r30" {
+  name     = "${var.prefix}-m44-r30"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r31" {
+  name     = "${var.prefix}-m44-r31"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r16.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r32" {
+  name     = "${var.prefix}-m44-r32"
+  upstream = var.upstream
+  ref_0    = aws_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r33" {
+  name     = "${var.prefix}-m44-r33"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r32.id
+  ref_1    = aws_db_instance.r23.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r34" {
+  name     = "${var.prefix}-m44-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r35" {
+  name     = "${var.prefix}-m44-r35"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r36" {
+  name     = "${var.prefix}-m44-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r37" {
+  name     = "${var.prefix}-m44-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  ref_1    = aws_ecr_repository.r25.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r38" {
+  name     = "${var.prefix}-m44-r38"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r30.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r39" {
+  name     = "${var.prefix}-m44-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  ref_1    = aws_db_instance.r35.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m44-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  ref_1    = aws_security_group.r16.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r41" {
+  name     = "${var.prefix}-m44-r41"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r5.id
+  ref_1    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r42" {
+  name     = "${var.prefix}-m44-r42"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r9.id
+  ref_1    = aws_lb_target_group.r41.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r43" {
+  name     = "${var.prefix}-m44-r43"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r40.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r44" {
+  name     = "${var.prefix}-m44-r44"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r30.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r45" {
+  name     = "${var.prefix}-m44-r45"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r35.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r46" {
+  name     = "${var.prefix}-m44-r46"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r34.id
+  ref_1    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r47" {
+  name     = "${var.prefix}-m44-r47"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r26.id
+  ref_1    = aws_db_instance.r33.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r48" {
+  name     = "${var.prefix}-m44-r48"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r31.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r49" {
+  name     = "${var.prefix}-m44-r49"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r27.id
+  ref_1    = aws_db_instance.r24.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_s3_bucket.r49.id
+}
@@ -0,0 +1,406 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m45"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m45-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r1" {
+  name     = "${var.prefix}-m45-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m45-r2"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r3" {
+  name     = "${var.prefix}-m45-r3"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r4" {
+  name     = "${var.prefix}-m45-r4"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r5" {
+  name     = "${var.prefix}-m45-r5"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  ref_1    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r6" {
+  name     = "${var.prefix}-m45-r6"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r7" {
+  name     = "${var.prefix}-m45-r7"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_iam_role.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r8" {
+  name     = "${var.prefix}-m45-r8"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r9" {
+  name     = "${var.prefix}-m45-r9"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  ref_1    = aws_iam_role.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r10" {
+  name     = "${var.prefix}-m45-r10"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r11" {
+  name     = "${var.prefix}-m45-r11"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r5.id
+  ref_1    = aws_lb_target_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r12" {
+  name     = "${var.prefix}-m45-r12"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r13" {
+  name     = "${var.prefix}-m45-r13"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = helm_release.r11.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r14" {
+  name     = "${var.prefix}-m45-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r15" {
+  name     = "${var.prefix}-m45-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  ref_1    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r16" {
+  name     = "${var.prefix}-m45-r16"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r17" {
+  name     = "${var.prefix}-m45-r17"
+  upstream = var.upstream
+  ref_0    = helm_release.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r18" {
+  name     = "${var.prefix}-m45-r18"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  ref_1    = helm_release.r11.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r19" {
+  name     = "${var.prefix}-m45-r19"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r12.id
+  ref_1    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r20" {
+  name     = "${var.prefix}-m45-r20"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r21" {
+  name     = "${var.prefix}-m45-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r20.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r22" {
+  name     = "${var.prefix}-m45-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m45-r23"
+  upstream = var.upstream
+  ref_0    = helm_release.r11.id
+  ref_1    = aws_security_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r24" {
+  name     = "${var.prefix}-m45-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  ref_1    = aws_security_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r25" {
+  name     = "${var.prefix}-m45-r25"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r26" {
+  name     = "${var.prefix}-m45-r26"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r10.id
+  ref_1    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r27" {
+  name     = "${var.prefix}-m45-r27"
+  upstream = var.upstream
+  ref_0    = aws_instance.r24.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r28" {
+  name     = "${var.prefix}-m45-r28"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r27.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r29" {
+  name     = "${var.prefix}-m45-r29"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r30" {
+  name     = "${var.prefix}-m45-r30"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  ref_1    = aws_ecr_repository.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r31" {
+  name     = "${var.prefix}-m45-r31"
+  upstream = var.upstream
+  ref_0    = helm_release.r13.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r32" {
+  name     = "${var.prefix}-m45-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r15.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r33" {
+  name     = "${var.prefix}-m45-r33"
+  upstream = var.upstream
+  ref_0    = helm_release.r30.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r34" {
+  name     = "${var.prefix}-m45-r34"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r15.id
+  ref_1    = aws_s3_bucket.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r35" {
+  name     = "${var.prefix}-m45-r35"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r29.id
+  ref_1    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r36" {
+  name     = "${var.prefix}-m45-r36"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r28.id
+  ref_1    = kubernetes_service.r23.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r37" {
+  name     = "${var.prefix}-m45-r37"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r38" {
+  name     = "${var.prefix}-m45-r38"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r23.id
+  ref_1    = kubernetes_service.r37.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r39" {
+  name     = "${var.prefix}-m45-r39"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r27.id
+  ref_1    = aws_security_group.r33.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r40" {
+  name     = "${var.prefix}-m45-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r23.id
+  ref_1    = aws_ecr_repository.r39.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r41" {
+  name     = "${var.prefix}-m45-r41"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r36.id
+  ref_1    = kubernetes_config_map.r15.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r42" {
+  name     = "${var.prefix}-m45-r42"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r43" {
+  name     = "${var.prefix}-m45-r43"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r44" {
+  name     = "${var.prefix}-m45-r44"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r29.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r45" {
+  name     = "${var.prefix}-m45-r45"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r22.id
+  ref_1    = aws_instance.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r46" {
+  name     = "${var.prefix}-m45-r46"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_instance.r24.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r47" {
+  name     = "${var.prefix}-m45-r47"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r32.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r48" {
+  name     = "${var.prefix}-m45-r48"
+  upstream = var.upstream
+  ref_0    = helm_release.r30.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r49" {
+  name     = "${var.prefix}-m45-r49"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_ecr_repository.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_iam_role.r49.id
+}
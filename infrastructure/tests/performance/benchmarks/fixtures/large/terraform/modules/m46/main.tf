@@ -0,0 +1,408 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m46"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_ecr_repository" "r0" {
+  name     = "${var.prefix}-m46-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r1" {
+  name     = "${var.prefix}-m46-r1"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r2" {
+  name     = "${var.prefix}-m46-r2"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r3" {
+  name     = "${var.prefix}-m46-r3"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r4" {
+  name     = "${var.prefix}-m46-r4"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r5" {
+  name     = "${var.prefix}-m46-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r6" {
+  name     = "${var.prefix}-m46-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r7" {
+  name     = "${var.prefix}-m46-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = helm_release.r6.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r8" {
+  name     = "${var.prefix}-m46-r8"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r9" {
+  name     = "${var.prefix}-m46-r9"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r10" {
+  name     = "${var.prefix}-m46-r10"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r9.id
+  ref_1    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r11" {
+  name     = "${var.prefix}-m46-r11"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r12" {
+  name     = "${var.prefix}-m46-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r13" {
+  name     = "${var.prefix}-m46-r13"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r9.id
+  ref_1    = aws_cloudwatch_log_group.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r14" {
+  name     = "${var.prefix}-m46-r14"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  ref_1    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r15" {
+  name     = "${var.prefix}-m46-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r16" {
+  name     = "${var.prefix}-m46-r16"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r17" {
+  name     = "${var.prefix}-m46-r17"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r18" {
+  name     = "${var.prefix}-m46-r18"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r19" {
+  name     = "${var.prefix}-m46-r19"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r15.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r20" {
+  name     = "${var.prefix}-m46-r20"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r15.id
+  ref_1    = aws_db_instance.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r21" {
+  name     = "${var.prefix}-m46-r21"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r20.id
+  ref_1    = aws_s3_bucket.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r22" {
+  name     = "${var.prefix}-m46-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r23" {
+  name     = "${var.prefix}-m46-r23"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r24" {
+  name     = "${var.prefix}-m46-r24"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r25" {
+  name     = "${var.prefix}-m46-r25"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r26" {
+  name     = "${var.prefix}-m46-r26"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r19.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r27" {
+  name     = "${var.prefix}-m46-r27"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  ref_1    = aws_iam_role.r23.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r28" {
+  name     = "${var.prefix}-m46-r28"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  ref_1    = aws_lb_target_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r29" {
+  name     = "${var.prefix}-m46-r29"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r27.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r30" {
+  name     = "${var.prefix}-m46-r30"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r8.id
+  ref_1    = aws_ecr_repository.r22.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r31" {
+  name     = "${var.prefix}-m46-r31"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r12.id
+  ref_1    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r32" {
+  name     = "${var.prefix}-m46-r32"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r14.id
+  ref_1    = aws_security_group.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r33" {
+  name     = "${var.prefix}-m46-r33"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r16.id
+  ref_1    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r34" {
+  name     = "${var.prefix}-m46-r34"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r35" {
+  name     = "${var.prefix}-m46-r35"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = aws_db_instance.r21.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r36" {
+  name     = "${var.prefix}-m46-r36"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r37" {
+  name     = "${var.prefix}-m46-r37"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r22.id
+  ref_1    = kubernetes_config_map.r27.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r38" {
+  name     = "${var.prefix}-m46-r38"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r22.id
+  ref_1    = aws_db_instance.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r39" {
+  name     = "${var.prefix}-m46-r39"
+  upstream = var.upstream
+  ref_0    = aws_instance.r36.id
+  ref_1    = helm_release.r24.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r40" {
+  name     = "${var.prefix}-m46-r40"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r29.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r41" {
+  name     = "${var.prefix}-m46-r41"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  ref_1    = kubernetes_service.r34.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r42" {
+  name     = "${var.prefix}-m46-r42"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r29.id
+  ref_1    = aws_ecr_repository.r22.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r43" {
+  name     = "${var.prefix}-m46-r43"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r44" {
+  name     = "${var.prefix}-m46-r44"
+  upstream = var.upstream
+  ref_0    = aws_instance.r38.id
+  ref_1    = aws_security_group.r28.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r45" {
+  name     = "${var.prefix}-m46-r45"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r46" {
+  name     = "${var.prefix}-m46-r46"
+  upstream = var.upstream
+  ref_0    = helm_release.r18.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r47" {
+  name     = "${var.prefix}-m46-r47"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r48" {
+  name     = "${var.prefix}-m46-r48"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r49" {
+  name     = "${var.prefix}-m46-r49"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  ref_1    = aws_cloudwatch_log_group.r44.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_db_instance.r49.id
+}
@@ -0,0 +1,405 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m47"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_iam_role" "r0" {
+  name     = "${var.prefix}-m47-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m47-r1"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r2" {
+  name     = "${var.prefix}-m47-r2"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r3" {
+  name     = "${var.prefix}-m47-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r4" {
+  name     = "${var.prefix}-m47-r4"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  ref_1    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r5" {
+  name     = "${var.prefix}-m47-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_lb_target_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r6" {
+  name     = "${var.prefix}-m47-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r7" {
+  name     = "${var.prefix}-m47-r7"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r8" {
+  name     = "${var.prefix}-m47-r8"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r9" {
+  name     = "${var.prefix}-m47-r9"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  ref_1    = aws_iam_role.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r10" {
+  name     = "${var.prefix}-m47-r10"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r11" {
+  name     = "${var.prefix}-m47-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_db_instance.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r12" {
+  name     = "${var.prefix}-m47-r12"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r13" {
+  name     = "${var.prefix}-m47-r13"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r14" {
+  name     = "${var.prefix}-m47-r14"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = helm_release.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r15" {
+  name     = "${var.prefix}-m47-r15"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = aws_ecr_repository.r13.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r16" {
+  name     = "${var.prefix}-m47-r16"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  ref_1    = aws_lb_target_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r17" {
+  name     = "${var.prefix}-m47-r17"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r9.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r18" {
+  name     = "${var.prefix}-m47-r18"
+  upstream = var.upstream
+  ref_0    = aws_instance.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r19" {
+  name     = "${var.prefix}-m47-r19"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r17.id
+  ref_1    = aws_db_instance.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m47-r20"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r16.id
+  ref_1    = aws_ecr_repository.r13.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r21" {
+  name     = "${var.prefix}-m47-r21"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r22" {
+  name     = "${var.prefix}-m47-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r19.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r23" {
+  name     = "${var.prefix}-m47-r23"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r21.id
+  ref_1    = aws_security_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r24" {
+  name     = "${var.prefix}-m47-r24"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r25" {
+  name     = "${var.prefix}-m47-r25"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r21.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r26" {
+  name     = "${var.prefix}-m47-r26"
+  upstream = var.upstream
+  ref_0    = helm_release.r20.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r27" {
+  name     = "${var.prefix}-m47-r27"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r3.id
+  ref_1    = aws_s3_bucket.r26.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r28" {
+  name     = "${var.prefix}-m47-r28"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_db_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r29" {
+  name     = "${var.prefix}-m47-r29"
+  upstream = var.upstream
+  ref_0    = helm_release.r20.id
+  ref_1    = aws_lb_target_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r30" {
+  name     = "${var.prefix}-m47-r30"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r24.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r31" {
+  name     = "${var.prefix}-m47-r31"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r32" {
+  name     = "${var.prefix}-m47-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r15.id
+  ref_1    = aws_ecr_repository.r30.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r33" {
+  name     = "${var.prefix}-m47-r33"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r34" {
+  name     = "${var.prefix}-m47-r34"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r35" {
+  name     = "${var.prefix}-m47-r35"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r36" {
+  name     = "${var.prefix}-m47-r36"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r21.id
+  ref_1    = aws_cloudwatch_log_group.r35.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r37" {
+  name     = "${var.prefix}-m47-r37"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r26.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r38" {
+  name     = "${var.prefix}-m47-r38"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r39" {
+  name     = "${var.prefix}-m47-r39"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r24.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r40" {
+  name     = "${var.prefix}-m47-r40"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r19.id
+  ref_1    = aws_db_instance.r18.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r41" {
+  name     = "${var.prefix}-m47-r41"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r14.id
+  ref_1    = helm_release.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r42" {
+  name     = "${var.prefix}-m47-r42"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r22.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r43" {
+  name     = "${var.prefix}-m47-r43"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r15.id
+  ref_1    = aws_iam_role.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r44" {
+  name     = "${var.prefix}-m47-r44"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r23.id
+  ref_1    = aws_db_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r45" {
+  name     = "${var.prefix}-m47-r45"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r36.id
+  ref_1    = aws_cloudwatch_log_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r46" {
+  name     = "${var.prefix}-m47-r46"
+  upstream = var.upstream
+  ref_0    = helm_release.r27.id
+  ref_1    = aws_security_group.r40.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r47" {
+  name     = "${var.prefix}-m47-r47"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r21.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r48" {
+  name     = "${var.prefix}-m47-r48"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r19.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r49" {
+  name     = "${var.prefix}-m47-r49"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r35.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_config_map.r49.id
+}
@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m5"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_ecr_repository" "r0" {
+  name     = "${var.prefix}-m5-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r1" {
+  name     = "${var.prefix}-m5-r1"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r2" {
+  name     = "${var.prefix}-m5-r2"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r3" {
+  name     = "${var.prefix}-m5-r3"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r4" {
+  name     = "${var.prefix}-m5-r4"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  ref_1    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r5" {
+  name     = "${var.prefix}-m5-r5"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  ref_1    = aws_s3_bucket.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r6" {
+  name     = "${var.prefix}-m5-r6"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r7" {
+  name     = "${var.prefix}-m5-r7"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r8" {
+  name     = "${var.prefix}-m5-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r9" {
+  name     = "${var.prefix}-m5-r9"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  ref_1    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r10" {
+  name     = "${var.prefix}-m5-r10"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r11" {
+  name     = "${var.prefix}-m5-r11"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r12" {
+  name     = "${var.prefix}-m5-r12"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r13" {
+  name     = "${var.prefix}-m5-r13"
+  upstream = var.upstream
+  ref_0    = aws_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r14" {
+  name     = "${var.prefix}-m5-r14"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = kubernetes_config_map.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r15" {
+  name     = "${var.prefix}-m5-r15"
+  upstream = var.upstream
+  ref_0    = aws_instance.r12.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r16" {
+  name     = "${var.prefix}-m5-r16"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r5.id
+  ref_1    = aws_s3_bucket.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m5-r17"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  ref_1    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r18" {
+  name     = "${var.prefix}-m5-r18"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r19" {
+  name     = "${var.prefix}-m5-r19"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r20" {
+  name     = "${var.prefix}-m5-r20"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r21" {
+  name     = "${var.prefix}-m5-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r10.id
+  ref_1    = aws_db_instance.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r22" {
+  name     = "${var.prefix}-m5-r22"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r4.id
+  ref_1    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m5-r23"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r24" {
+  name     = "${var.prefix}-m5-r24"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r25" {
+  name     = "${var.prefix}-m5-r25"
+  upstream = var.upstream
+  ref_0    = aws_instance.r9.id
+  ref_1    = aws_s3_bucket.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r26" {
+  name     = "${var.prefix}-m5-r26"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r18.id
+  ref_1    = kubernetes_config_map.r22.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r27" {
+  name     = "${var.prefix}-m5-r27"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  ref_1    = aws_s3_bucket.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r28" {
+  name     = "${var.prefix}-m5-r28"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r18.id
+  ref_1    = aws_instance.r25.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r29" {
+  name     = "${var.prefix}-m5-r29"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  ref_1    = kubernetes_config_map.r24.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r30" {
+  name     = "${var.prefix}-m5-r30"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = aws_s3_bucket.r5.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r31" {
+  name     = "${var.prefix}-m5-r31"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r30.id
+  ref_1    = kubernetes_config_map.r21.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r32" {
+  name     = "${var.prefix}-m5-r32"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r33" {
+  name     = "${var.prefix}-m5-r33"
+  upstream = var.upstream
+  ref_0    = aws_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r34" {
+  name     = "${var.prefix}-m5-r34"
+  upstream = var.upstream
+  ref_0    = aws_instance.r31.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r35" {
+  name     = "${var.prefix}-m5-r35"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r18.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r36" {
+  name     = "${var.prefix}-m5-r36"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r10.id
+  ref_1    = aws_lb_target_group.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r37" {
+  name     = "${var.prefix}-m5-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r19.id
+  ref_1    = aws_ecr_repository.r7.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r38" {
+  name     = "${var.prefix}-m5-r38"
+  upstream = var.upstream
+  ref_0    = aws_instance.r25.id
+  ref_1    = kubernetes_service.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r39" {
+  name     = "${var.prefix}-m5-r39"
+  upstream = var.upstream
+  ref_0    = aws_instance.r12.id
+  ref_1    = aws_iam_role.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r40" {
+  name     = "${var.prefix}-m5-r40"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r34.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r41" {
+  name     = "${var.prefix}-m5-r41"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r42" {
+  name     = "${var.prefix}-m5-r42"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r43" {
+  name     = "${var.prefix}-m5-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r35.id
+  ref_1    = aws_s3_bucket.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r44" {
+  name     = "${var.prefix}-m5-r44"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r13.id
+  ref_1    = kubernetes_config_map.r21.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r45" {
+  name     = "${var.prefix}-m5-r45"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r40.id
+  ref_1    = aws_ecr_repository.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r46" {
+  name     = "${var.prefix}-m5-r46"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r8.id
+  ref_1    = aws_lb_target_group.r34.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r47" {
+  name     = "${var.prefix}-m5-r47"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r36.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r48" {
+  name     = "${var.prefix}-m5-r48"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = kubernetes_config_map.r10.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r49" {
+  name     = "${var.prefix}-m5-r49"
+  upstream = var.upstream
+  ref_0    = aws_instance.r44.id
+  ref_1    = aws_instance.r6.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_db_instance.r49.id
+}
@@ -0,0 +1,401 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m6"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m6-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r1" {
+  name     = "${var.prefix}-m6-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r2" {
+  name     = "${var.prefix}-m6-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r3" {
+  name     = "${var.prefix}-m6-r3"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m6-r4"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r5" {
+  name     = "${var.prefix}-m6-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  ref_1    = aws_security_group.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r6" {
+  name     = "${var.prefix}-m6-r6"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r7" {
+  name     = "${var.prefix}-m6-r7"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r8" {
+  name     = "${var.prefix}-m6-r8"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m6-r9"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  ref_1    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r10" {
+  name     = "${var.prefix}-m6-r10"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r11" {
+  name     = "${var.prefix}-m6-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = aws_security_group.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r12" {
+  name     = "${var.prefix}-m6-r12"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r13" {
+  name     = "${var.prefix}-m6-r13"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  ref_1    = kubernetes_service.r10.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r14" {
+  name     = "${var.prefix}-m6-r14"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r13.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r15" {
+  name     = "${var.prefix}-m6-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r16" {
+  name     = "${var.prefix}-m6-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r14.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r17" {
+  name     = "${var.prefix}-m6-r17"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = aws_cloudwatch_log_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r18" {
+  name     = "${var.prefix}-m6-r18"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  ref_1    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r19" {
+  name     = "${var.prefix}-m6-r19"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r20" {
+  name     = "${var.prefix}-m6-r20"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r21" {
+  name     = "${var.prefix}-m6-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r22" {
+  name     = "${var.prefix}-m6-r22"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r6.id
+  ref_1    = helm_release.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m6-r23"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  ref_1    = kubernetes_config_map.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m6-r24"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r19.id
+  ref_1    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r25" {
+  name     = "${var.prefix}-m6-r25"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r26" {
+  name     = "${var.prefix}-m6-r26"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r27" {
+  name     = "${var.prefix}-m6-r27"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r28" {
+  name     = "${var.prefix}-m6-r28"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r29" {
+  name     = "${var.prefix}-m6-r29"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r30" {
+  name     = "${var.prefix}-m6-r30"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r27.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r31" {
+  name     = "${var.prefix}-m6-r31"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r25.id
+  ref_1    = helm_release.r17.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r32" {
+  name     = "${var.prefix}-m6-r32"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r13.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r33" {
+  name     = "${var.prefix}-m6-r33"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r34" {
+  name     = "${var.prefix}-m6-r34"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r24.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r35" {
+  name     = "${var.prefix}-m6-r35"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r36" {
+  name     = "${var.prefix}-m6-r36"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r13.id
+  ref_1    = kubernetes_service.r10.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r37" {
+  name     = "${var.prefix}-m6-r37"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r23.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r38" {
+  name     = "${var.prefix}-m6-r38"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r15.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r39" {
+  name     = "${var.prefix}-m6-r39"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = aws_s3_bucket.r25.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r40" {
+  name     = "${var.prefix}-m6-r40"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r18.id
+  ref_1    = aws_lb_target_group.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r41" {
+  name     = "${var.prefix}-m6-r41"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r26.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r42" {
+  name     = "${var.prefix}-m6-r42"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = kubernetes_service.r29.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r43" {
+  name     = "${var.prefix}-m6-r43"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r8.id
+  ref_1    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r44" {
+  name     = "${var.prefix}-m6-r44"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r43.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r45" {
+  name     = "${var.prefix}-m6-r45"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r25.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r46" {
+  name     = "${var.prefix}-m6-r46"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r27.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r47" {
+  name     = "${var.prefix}-m6-r47"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r7.id
+  ref_1    = aws_db_instance.r33.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r48" {
+  name     = "${var.prefix}-m6-r48"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r38.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r49" {
+  name     = "${var.prefix}-m6-r49"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r30.id
+  ref_1    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_db_instance.r49.id
+}
@@ -0,0 +1,399 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m7"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_lb_target_group" "r0" {
+  name     = "${var.prefix}-m7-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r1" {
+  name     = "${var.prefix}-m7-r1"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r2" {
+  name     = "${var.prefix}-m7-r2"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r3" {
+  name     = "${var.prefix}-m7-r3"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r4" {
+  name     = "${var.prefix}-m7-r4"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r5" {
+  name     = "${var.prefix}-m7-r5"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r6" {
+  name     = "${var.prefix}-m7-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = aws_db_instance.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r7" {
+  name     = "${var.prefix}-m7-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r8" {
+  name     = "${var.prefix}-m7-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m7-r9"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r10" {
+  name     = "${var.prefix}-m7-r10"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r11" {
+  name     = "${var.prefix}-m7-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = aws_lb_target_group.r10.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r12" {
+  name     = "${var.prefix}-m7-r12"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r13" {
+  name     = "${var.prefix}-m7-r13"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r14" {
+  name     = "${var.prefix}-m7-r14"
+  upstream = var.upstream
+  ref_0    = helm_release.r12.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r15" {
+  name     = "${var.prefix}-m7-r15"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = aws_s3_bucket.r13.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r16" {
+  name     = "${var.prefix}-m7-r16"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r3.id
+  ref_1    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r17" {
+  name     = "${var.prefix}-m7-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r18" {
+  name     = "${var.prefix}-m7-r18"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  ref_1    = aws_cloudwatch_log_group.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r19" {
+  name     = "${var.prefix}-m7-r19"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r20" {
+  name     = "${var.prefix}-m7-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r5.id
+  ref_1    = aws_db_instance.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r21" {
+  name     = "${var.prefix}-m7-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r14.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r22" {
+  name     = "${var.prefix}-m7-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r3.id
+  ref_1    = aws_s3_bucket.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r23" {
+  name     = "${var.prefix}-m7-r23"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r21.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r24" {
+  name     = "${var.prefix}-m7-r24"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r15.id
+  ref_1    = aws_ecr_repository.r16.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r25" {
+  name     = "${var.prefix}-m7-r25"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r23.id
+  ref_1    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r26" {
+  name     = "${var.prefix}-m7-r26"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r23.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r27" {
+  name     = "${var.prefix}-m7-r27"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r28" {
+  name     = "${var.prefix}-m7-r28"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r29" {
+  name     = "${var.prefix}-m7-r29"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r30" {
+  name     = "${var.prefix}-m7-r30"
+  upstream = var.upstream
+  ref_0    = helm_release.r12.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r31" {
+  name     = "${var.prefix}-m7-r31"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  ref_1    = aws_iam_role.r24.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r32" {
+  name     = "${var.prefix}-m7-r32"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r30.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r33" {
+  name     = "${var.prefix}-m7-r33"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r28.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r34" {
+  name     = "${var.prefix}-m7-r34"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r35" {
+  name     = "${var.prefix}-m7-r35"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r19.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r36" {
+  name     = "${var.prefix}-m7-r36"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r31.id
+  ref_1    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r37" {
+  name     = "${var.prefix}-m7-r37"
+  upstream = var.upstream
+  ref_0    = helm_release.r12.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r38" {
+  name     = "${var.prefix}-m7-r38"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r30.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r39" {
+  name     = "${var.prefix}-m7-r39"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r38.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r40" {
+  name     = "${var.prefix}-m7-r40"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  ref_1    = aws_db_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r41" {
+  name     = "${var.prefix}-m7-r41"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r42" {
+  name     = "${var.prefix}-m7-r42"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r40.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r43" {
+  name     = "${var.prefix}-m7-r43"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r44" {
+  name     = "${var.prefix}-m7-r44"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r42.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r45" {
+  name     = "${var.prefix}-m7-r45"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r46" {
+  name     = "${var.prefix}-m7-r46"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r47" {
+  name     = "${var.prefix}-m7-r47"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r34.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r48" {
+  name     = "${var.prefix}-m7-r48"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r30.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r49" {
+  name     = "${var.prefix}-m7-r49"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  ref_1    = helm_release.r18.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_s3_bucket.r49.id
+}
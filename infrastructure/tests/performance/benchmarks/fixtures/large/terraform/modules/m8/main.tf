@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m8"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_cloudwatch_log_group" "r0" {
+  name     = "${var.prefix}-m8-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r1" {
+  name     = "${var.prefix}-m8-r1"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m8-r2"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m8-r3"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r4" {
+  name     = "${var.prefix}-m8-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r5" {
+  name     = "${var.prefix}-m8-r5"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r6" {
+  name     = "${var.prefix}-m8-r6"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  ref_1    = aws_iam_role.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r7" {
+  name     = "${var.prefix}-m8-r7"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  ref_1    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r8" {
+  name     = "${var.prefix}-m8-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r9" {
+  name     = "${var.prefix}-m8-r9"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r10" {
+  name     = "${var.prefix}-m8-r10"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r11" {
+  name     = "${var.prefix}-m8-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  ref_1    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r12" {
+  name     = "${var.prefix}-m8-r12"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  ref_1    = aws_security_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r13" {
+  name     = "${var.prefix}-m8-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r14" {
+  name     = "${var.prefix}-m8-r14"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r15" {
+  name     = "${var.prefix}-m8-r15"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r16" {
+  name     = "${var.prefix}-m8-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  ref_1    = aws_lb_target_group.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r17" {
+  name     = "${var.prefix}-m8-r17"
+  upstream = var.upstream
+  ref_0    = aws_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r18" {
+  name     = "${var.prefix}-m8-r18"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r19" {
+  name     = "${var.prefix}-m8-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r20" {
+  name     = "${var.prefix}-m8-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r14.id
+  ref_1    = aws_ecr_repository.r6.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r21" {
+  name     = "${var.prefix}-m8-r21"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r19.id
+  ref_1    = aws_cloudwatch_log_group.r18.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r22" {
+  name     = "${var.prefix}-m8-r22"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  ref_1    = aws_db_instance.r19.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r23" {
+  name     = "${var.prefix}-m8-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r24" {
+  name     = "${var.prefix}-m8-r24"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r22.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r25" {
+  name     = "${var.prefix}-m8-r25"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r26" {
+  name     = "${var.prefix}-m8-r26"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  ref_1    = helm_release.r21.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r27" {
+  name     = "${var.prefix}-m8-r27"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r28" {
+  name     = "${var.prefix}-m8-r28"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  ref_1    = helm_release.r24.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r29" {
+  name     = "${var.prefix}-m8-r29"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  ref_1    = helm_release.r10.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r30" {
+  name     = "${var.prefix}-m8-r30"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r31" {
+  name     = "${var.prefix}-m8-r31"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r15.id
+  ref_1    = kubernetes_service.r17.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r32" {
+  name     = "${var.prefix}-m8-r32"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r33" {
+  name     = "${var.prefix}-m8-r33"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r34" {
+  name     = "${var.prefix}-m8-r34"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r30.id
+  ref_1    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r35" {
+  name     = "${var.prefix}-m8-r35"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r36" {
+  name     = "${var.prefix}-m8-r36"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r16.id
+  ref_1    = aws_iam_role.r34.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r37" {
+  name     = "${var.prefix}-m8-r37"
+  upstream = var.upstream
+  ref_0    = helm_release.r21.id
+  ref_1    = aws_lb_target_group.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r38" {
+  name     = "${var.prefix}-m8-r38"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r36.id
+  ref_1    = kubernetes_service.r17.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r39" {
+  name     = "${var.prefix}-m8-r39"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r9.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r40" {
+  name     = "${var.prefix}-m8-r40"
+  upstream = var.upstream
+  ref_0    = helm_release.r31.id
+  ref_1    = aws_s3_bucket.r20.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r41" {
+  name     = "${var.prefix}-m8-r41"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r40.id
+  ref_1    = kubernetes_config_map.r9.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r42" {
+  name     = "${var.prefix}-m8-r42"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r43" {
+  name     = "${var.prefix}-m8-r43"
+  upstream = var.upstream
+  ref_0    = aws_instance.r29.id
+  ref_1    = aws_cloudwatch_log_group.r40.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r44" {
+  name     = "${var.prefix}-m8-r44"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r33.id
+  ref_1    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r45" {
+  name     = "${var.prefix}-m8-r45"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r46" {
+  name     = "${var.prefix}-m8-r46"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  ref_1    = aws_instance.r41.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r47" {
+  name     = "${var.prefix}-m8-r47"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r27.id
+  ref_1    = helm_release.r42.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r48" {
+  name     = "${var.prefix}-m8-r48"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  ref_1    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r49" {
+  name     = "${var.prefix}-m8-r49"
+  upstream = var.upstream
+  ref_0    = aws_instance.r41.id
+  ref_1    = aws_s3_bucket.r37.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_iam_role.r49.id
+}
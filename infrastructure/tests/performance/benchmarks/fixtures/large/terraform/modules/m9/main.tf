@@ -0,0 +1,404 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m9"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_iam_role" "r0" {
+  name     = "${var.prefix}-m9-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r1" {
+  name     = "${var.prefix}-m9-r1"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m9-r2"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r3" {
+  name     = "${var.prefix}-m9-r3"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  ref_1    = aws_security_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m9-r4"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  ref_1    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r5" {
+  name     = "${var.prefix}-m9-r5"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r6" {
+  name     = "${var.prefix}-m9-r6"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  ref_1    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r7" {
+  name     = "${var.prefix}-m9-r7"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r8" {
+  name     = "${var.prefix}-m9-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r9" {
+  name     = "${var.prefix}-m9-r9"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r10" {
+  name     = "${var.prefix}-m9-r10"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r11" {
+  name     = "${var.prefix}-m9-r11"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r12" {
+  name     = "${var.prefix}-m9-r12"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r13" {
+  name     = "${var.prefix}-m9-r13"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  ref_1    = aws_security_group.r10.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r14" {
+  name     = "${var.prefix}-m9-r14"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r15" {
+  name     = "${var.prefix}-m9-r15"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r16" {
+  name     = "${var.prefix}-m9-r16"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r15.id
+  ref_1    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r17" {
+  name     = "${var.prefix}-m9-r17"
+  upstream = var.upstream
+  ref_0    = helm_release.r14.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r18" {
+  name     = "${var.prefix}-m9-r18"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r15.id
+  ref_1    = aws_s3_bucket.r7.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r19" {
+  name     = "${var.prefix}-m9-r19"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r20" {
+  name     = "${var.prefix}-m9-r20"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r21" {
+  name     = "${var.prefix}-m9-r21"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m9-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  ref_1    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r23" {
+  name     = "${var.prefix}-m9-r23"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r24" {
+  name     = "${var.prefix}-m9-r24"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  ref_1    = aws_lb_target_group.r13.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r25" {
+  name     = "${var.prefix}-m9-r25"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  ref_1    = aws_instance.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r26" {
+  name     = "${var.prefix}-m9-r26"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r27" {
+  name     = "${var.prefix}-m9-r27"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r22.id
+  ref_1    = kubernetes_config_map.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r28" {
+  name     = "${var.prefix}-m9-r28"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r27.id
+  ref_1    = aws_cloudwatch_log_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r29" {
+  name     = "${var.prefix}-m9-r29"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r30" {
+  name     = "${var.prefix}-m9-r30"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r10.id
+  ref_1    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r31" {
+  name     = "${var.prefix}-m9-r31"
+  upstream = var.upstream
+  ref_0    = aws_instance.r5.id
+  ref_1    = aws_ecr_repository.r19.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r32" {
+  name     = "${var.prefix}-m9-r32"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r33" {
+  name     = "${var.prefix}-m9-r33"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r31.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r34" {
+  name     = "${var.prefix}-m9-r34"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r20.id
+  ref_1    = kubernetes_service.r33.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r35" {
+  name     = "${var.prefix}-m9-r35"
+  upstream = var.upstream
+  ref_0    = helm_release.r14.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r36" {
+  name     = "${var.prefix}-m9-r36"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r1.id
+  ref_1    = kubernetes_service.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r37" {
+  name     = "${var.prefix}-m9-r37"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r22.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r38" {
+  name     = "${var.prefix}-m9-r38"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r13.id
+  ref_1    = aws_instance.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r39" {
+  name     = "${var.prefix}-m9-r39"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r40" {
+  name     = "${var.prefix}-m9-r40"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r34.id
+  ref_1    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r41" {
+  name     = "${var.prefix}-m9-r41"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r15.id
+  ref_1    = aws_s3_bucket.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r42" {
+  name     = "${var.prefix}-m9-r42"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r31.id
+  ref_1    = aws_security_group.r29.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r43" {
+  name     = "${var.prefix}-m9-r43"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r29.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r44" {
+  name     = "${var.prefix}-m9-r44"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r45" {
+  name     = "${var.prefix}-m9-r45"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r29.id
+  ref_1    = helm_release.r42.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r46" {
+  name     = "${var.prefix}-m9-r46"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r47" {
+  name     = "${var.prefix}-m9-r47"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r48" {
+  name     = "${var.prefix}-m9-r48"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r37.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r49" {
+  name     = "${var.prefix}-m9-r49"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r26.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = helm_release.r49.id
+}
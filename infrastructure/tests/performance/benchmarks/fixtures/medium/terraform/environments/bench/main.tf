@@ -0,0 +1,120 @@
+terraform {
+  required_providers {
+    aws = {
+      source = "hashicorp/aws"
+    }
+  }
+}
+
+provider "aws" {
+  region = var.region
+}
+
+variable "region" {
+  type    = string
+  default = "eu-west-1"
+}
+
+variable "prefix" {
+  type    = string
+  default = "bench"
+}
+
+module "m0" {
+  source   = "../../modules/m0"
+  prefix   = var.prefix
+}
+
+module "m1" {
+  source   = "../../modules/m1"
+  prefix   = var.prefix
+  upstream = module.m0.id
+}
+
+module "m2" {
+  source   = "../../modules/m2"
+  prefix   = var.prefix
+  upstream = module.m0.id
+}
+
+module "m3" {
+  source   = "../../modules/m3"
+  prefix   = var.prefix
+  upstream = module.m0.id
+}
+
+module "m4" {
+  source   = "../../modules/m4"
+  prefix   = var.prefix
+  upstream = module.m0.id
+}
+
+module "m5" {
+  source   = "../../modules/m5"
+  prefix   = var.prefix
+  upstream = module.m3.id
+}
+
+module "m6" {
+  source   = "../../modules/m6"
+  prefix   = var.prefix
+  upstream = module.m3.id
+}
+
+module "m7" {
+  source   = "../../modules/m7"
+  prefix   = var.prefix
+  upstream = module.m4.id
+}
+
+module "m8" {
+  source   = "../../modules/m8"
+  prefix   = var.prefix
+  upstream = module.m2.id
+}
+
+module "m9" {
+  source   = "../../modules/m9"
+  prefix   = var.prefix
+  upstream = module.m8.id
+}
+
+module "m10" {
+  source   = "../../modules/m10"
+  prefix   = var.prefix
+  upstream = module.m7.id
+}
+
+module "m11" {
+  source   = "../../modules/m11"
+  prefix   = var.prefix
+  upstream = module.m9.id
+}
+
+module "m12" {
+  source   = "../../modules/m12"
+  prefix   = var.prefix
+  upstream = module.m3.id
+}
+
+module "m13" {
+  source   = "../../modules/m13"
+  prefix   = var.prefix
+  upstream = module.m4.id
+}
+
+module "m14" {
+  source   = "../../modules/m14"
+  prefix   = var.prefix
+  upstream = module.m7.id
+}
+
+module "m15" {
+  source   = "../../modules/m15"
+  prefix   = var.prefix
+  upstream = module.m3.id
+}
+
+output "last" {
+  value = module.m15.id
+}
@@ -0,0 +1,215 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m0"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m0-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m0-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m0-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r3" {
+  name     = "${var.prefix}-m0-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r4" {
+  name     = "${var.prefix}-m0-r4"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  ref_1    = aws_iam_role.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r5" {
+  name     = "${var.prefix}-m0-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_ecr_repository.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r6" {
+  name     = "${var.prefix}-m0-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r7" {
+  name     = "${var.prefix}-m0-r7"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  ref_1    = helm_release.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r8" {
+  name     = "${var.prefix}-m0-r8"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r6.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m0-r9"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r6.id
+  ref_1    = aws_security_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r10" {
+  name     = "${var.prefix}-m0-r10"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r11" {
+  name     = "${var.prefix}-m0-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r12" {
+  name     = "${var.prefix}-m0-r12"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r13" {
+  name     = "${var.prefix}-m0-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  ref_1    = aws_security_group.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r14" {
+  name     = "${var.prefix}-m0-r14"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = aws_lb_target_group.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r15" {
+  name     = "${var.prefix}-m0-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  ref_1    = aws_security_group.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r16" {
+  name     = "${var.prefix}-m0-r16"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r5.id
+  ref_1    = helm_release.r9.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r17" {
+  name     = "${var.prefix}-m0-r17"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  ref_1    = aws_iam_role.r11.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r18" {
+  name     = "${var.prefix}-m0-r18"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r19" {
+  name     = "${var.prefix}-m0-r19"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r20" {
+  name     = "${var.prefix}-m0-r20"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r21" {
+  name     = "${var.prefix}-m0-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r7.id
+  ref_1    = helm_release.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r22" {
+  name     = "${var.prefix}-m0-r22"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r11.id
+  ref_1    = aws_s3_bucket.r21.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r23" {
+  name     = "${var.prefix}-m0-r23"
+  upstream = var.upstream
+  ref_0    = helm_release.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r24" {
+  name     = "${var.prefix}-m0-r24"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r17.id
+  ref_1    = aws_iam_role.r11.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_config_map.r24.id
+}
@@ -0,0 +1,213 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m1"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_config_map" "r0" {
+  name     = "${var.prefix}-m1-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r1" {
+  name     = "${var.prefix}-m1-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r2" {
+  name     = "${var.prefix}-m1-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r3" {
+  name     = "${var.prefix}-m1-r3"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r4" {
+  name     = "${var.prefix}-m1-r4"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  ref_1    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r5" {
+  name     = "${var.prefix}-m1-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  ref_1    = aws_cloudwatch_log_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r6" {
+  name     = "${var.prefix}-m1-r6"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r4.id
+  ref_1    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r7" {
+  name     = "${var.prefix}-m1-r7"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r8" {
+  name     = "${var.prefix}-m1-r8"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r7.id
+  ref_1    = aws_lb_target_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r9" {
+  name     = "${var.prefix}-m1-r9"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r10" {
+  name     = "${var.prefix}-m1-r10"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r11" {
+  name     = "${var.prefix}-m1-r11"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m1-r12"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r7.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r13" {
+  name     = "${var.prefix}-m1-r13"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r14" {
+  name     = "${var.prefix}-m1-r14"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r10.id
+  ref_1    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r15" {
+  name     = "${var.prefix}-m1-r15"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  ref_1    = kubernetes_service.r11.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r16" {
+  name     = "${var.prefix}-m1-r16"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r17" {
+  name     = "${var.prefix}-m1-r17"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r18" {
+  name     = "${var.prefix}-m1-r18"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r7.id
+  ref_1    = aws_cloudwatch_log_group.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r19" {
+  name     = "${var.prefix}-m1-r19"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r7.id
+  ref_1    = aws_cloudwatch_log_group.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r20" {
+  name     = "${var.prefix}-m1-r20"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  ref_1    = aws_s3_bucket.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r21" {
+  name     = "${var.prefix}-m1-r21"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  ref_1    = aws_db_instance.r14.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r22" {
+  name     = "${var.prefix}-m1-r22"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r15.id
+  ref_1    = kubernetes_config_map.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r23" {
+  name     = "${var.prefix}-m1-r23"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r16.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m1-r24"
+  upstream = var.upstream
+  ref_0    = aws_instance.r19.id
+  ref_1    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_cloudwatch_log_group.r24.id
+}
@@ -0,0 +1,211 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m10"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_cloudwatch_log_group" "r0" {
+  name     = "${var.prefix}-m10-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_instance" "r1" {
+  name     = "${var.prefix}-m10-r1"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r2" {
+  name     = "${var.prefix}-m10-r2"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  ref_1    = aws_instance.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m10-r3"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r4" {
+  name     = "${var.prefix}-m10-r4"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r5" {
+  name     = "${var.prefix}-m10-r5"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r6" {
+  name     = "${var.prefix}-m10-r6"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r5.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r7" {
+  name     = "${var.prefix}-m10-r7"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  ref_1    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r8" {
+  name     = "${var.prefix}-m10-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r9" {
+  name     = "${var.prefix}-m10-r9"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r10" {
+  name     = "${var.prefix}-m10-r10"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r11" {
+  name     = "${var.prefix}-m10-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m10-r12"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r13" {
+  name     = "${var.prefix}-m10-r13"
+  upstream = var.upstream
+  ref_0    = aws_instance.r9.id
+  ref_1    = aws_ecr_repository.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r14" {
+  name     = "${var.prefix}-m10-r14"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r15" {
+  name     = "${var.prefix}-m10-r15"
+  upstream = var.upstream
+  ref_0    = aws_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r16" {
+  name     = "${var.prefix}-m10-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r17" {
+  name     = "${var.prefix}-m10-r17"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r4.id
+  ref_1    = aws_s3_bucket.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r18" {
+  name     = "${var.prefix}-m10-r18"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = aws_s3_bucket.r12.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r19" {
+  name     = "${var.prefix}-m10-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r15.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m10-r20"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r21" {
+  name     = "${var.prefix}-m10-r21"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r22" {
+  name     = "${var.prefix}-m10-r22"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r23" {
+  name     = "${var.prefix}-m10-r23"
+  upstream = var.upstream
+  ref_0    = aws_instance.r15.id
+  ref_1    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r24" {
+  name     = "${var.prefix}-m10-r24"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r7.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_config_map.r24.id
+}
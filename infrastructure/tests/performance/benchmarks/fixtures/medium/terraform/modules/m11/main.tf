@@ -0,0 +1,208 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m11"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_s3_bucket" "r0" {
+  name     = "${var.prefix}-m11-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r1" {
+  name     = "${var.prefix}-m11-r1"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m11-r2"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r3" {
+  name     = "${var.prefix}-m11-r3"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r4" {
+  name     = "${var.prefix}-m11-r4"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r5" {
+  name     = "${var.prefix}-m11-r5"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r6" {
+  name     = "${var.prefix}-m11-r6"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r7" {
+  name     = "${var.prefix}-m11-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r8" {
+  name     = "${var.prefix}-m11-r8"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = kubernetes_service.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r9" {
+  name     = "${var.prefix}-m11-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r10" {
+  name     = "${var.prefix}-m11-r10"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  ref_1    = kubernetes_service.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r11" {
+  name     = "${var.prefix}-m11-r11"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r12" {
+  name     = "${var.prefix}-m11-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r13" {
+  name     = "${var.prefix}-m11-r13"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = aws_lb_target_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r14" {
+  name     = "${var.prefix}-m11-r14"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = kubernetes_config_map.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r15" {
+  name     = "${var.prefix}-m11-r15"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r16" {
+  name     = "${var.prefix}-m11-r16"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r17" {
+  name     = "${var.prefix}-m11-r17"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  ref_1    = aws_iam_role.r15.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r18" {
+  name     = "${var.prefix}-m11-r18"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = kubernetes_service.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r19" {
+  name     = "${var.prefix}-m11-r19"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r18.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r20" {
+  name     = "${var.prefix}-m11-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  ref_1    = aws_ecr_repository.r10.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r21" {
+  name     = "${var.prefix}-m11-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r5.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r22" {
+  name     = "${var.prefix}-m11-r22"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r18.id
+  ref_1    = kubernetes_config_map.r8.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r23" {
+  name     = "${var.prefix}-m11-r23"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r18.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r24" {
+  name     = "${var.prefix}-m11-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_security_group.r24.id
+}
@@ -0,0 +1,211 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m12"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_service" "r0" {
+  name     = "${var.prefix}-m12-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_instance" "r1" {
+  name     = "${var.prefix}-m12-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r2" {
+  name     = "${var.prefix}-m12-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r3" {
+  name     = "${var.prefix}-m12-r3"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r4" {
+  name     = "${var.prefix}-m12-r4"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = helm_release.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r5" {
+  name     = "${var.prefix}-m12-r5"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r4.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r6" {
+  name     = "${var.prefix}-m12-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r7" {
+  name     = "${var.prefix}-m12-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  ref_1    = aws_iam_role.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r8" {
+  name     = "${var.prefix}-m12-r8"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m12-r9"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  ref_1    = aws_s3_bucket.r7.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r10" {
+  name     = "${var.prefix}-m12-r10"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r7.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r11" {
+  name     = "${var.prefix}-m12-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  ref_1    = aws_s3_bucket.r7.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r12" {
+  name     = "${var.prefix}-m12-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r13" {
+  name     = "${var.prefix}-m12-r13"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = aws_cloudwatch_log_group.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r14" {
+  name     = "${var.prefix}-m12-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r13.id
+  ref_1    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r15" {
+  name     = "${var.prefix}-m12-r15"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r16" {
+  name     = "${var.prefix}-m12-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  ref_1    = helm_release.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m12-r17"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r18" {
+  name     = "${var.prefix}-m12-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r19" {
+  name     = "${var.prefix}-m12-r19"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  ref_1    = aws_s3_bucket.r7.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r20" {
+  name     = "${var.prefix}-m12-r20"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r13.id
+  ref_1    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r21" {
+  name     = "${var.prefix}-m12-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r11.id
+  ref_1    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r22" {
+  name     = "${var.prefix}-m12-r22"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r20.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r23" {
+  name     = "${var.prefix}-m12-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r24" {
+  name     = "${var.prefix}-m12-r24"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = helm_release.r24.id
+}
@@ -0,0 +1,214 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m13"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_lb_target_group" "r0" {
+  name     = "${var.prefix}-m13-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r1" {
+  name     = "${var.prefix}-m13-r1"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r2" {
+  name     = "${var.prefix}-m13-r2"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r3" {
+  name     = "${var.prefix}-m13-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r4" {
+  name     = "${var.prefix}-m13-r4"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r5" {
+  name     = "${var.prefix}-m13-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r6" {
+  name     = "${var.prefix}-m13-r6"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r7" {
+  name     = "${var.prefix}-m13-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r3.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r8" {
+  name     = "${var.prefix}-m13-r8"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r4.id
+  ref_1    = aws_lb_target_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r9" {
+  name     = "${var.prefix}-m13-r9"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r6.id
+  ref_1    = aws_iam_role.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r10" {
+  name     = "${var.prefix}-m13-r10"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r5.id
+  ref_1    = aws_iam_role.r8.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r11" {
+  name     = "${var.prefix}-m13-r11"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r12" {
+  name     = "${var.prefix}-m13-r12"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  ref_1    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r13" {
+  name     = "${var.prefix}-m13-r13"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = kubernetes_service.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r14" {
+  name     = "${var.prefix}-m13-r14"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r15" {
+  name     = "${var.prefix}-m13-r15"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_s3_bucket.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r16" {
+  name     = "${var.prefix}-m13-r16"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r9.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r17" {
+  name     = "${var.prefix}-m13-r17"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r18" {
+  name     = "${var.prefix}-m13-r18"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r16.id
+  ref_1    = aws_s3_bucket.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r19" {
+  name     = "${var.prefix}-m13-r19"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r20" {
+  name     = "${var.prefix}-m13-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r17.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r21" {
+  name     = "${var.prefix}-m13-r21"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m13-r22"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r21.id
+  ref_1    = kubernetes_service.r9.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r23" {
+  name     = "${var.prefix}-m13-r23"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r4.id
+  ref_1    = helm_release.r18.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r24" {
+  name     = "${var.prefix}-m13-r24"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r22.id
+  ref_1    = kubernetes_config_map.r19.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_s3_bucket.r24.id
+}
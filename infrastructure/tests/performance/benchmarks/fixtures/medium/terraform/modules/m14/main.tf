@@ -0,0 +1,211 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m14"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_ecr_repository" "r0" {
+  name     = "${var.prefix}-m14-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r1" {
+  name     = "${var.prefix}-m14-r1"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r2" {
+  name     = "${var.prefix}-m14-r2"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r3" {
+  name     = "${var.prefix}-m14-r3"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  ref_1    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r4" {
+  name     = "${var.prefix}-m14-r4"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r5" {
+  name     = "${var.prefix}-m14-r5"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r6" {
+  name     = "${var.prefix}-m14-r6"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r1.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r7" {
+  name     = "${var.prefix}-m14-r7"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r8" {
+  name     = "${var.prefix}-m14-r8"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  ref_1    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r9" {
+  name     = "${var.prefix}-m14-r9"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r7.id
+  ref_1    = aws_db_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r10" {
+  name     = "${var.prefix}-m14-r10"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r11" {
+  name     = "${var.prefix}-m14-r11"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r12" {
+  name     = "${var.prefix}-m14-r12"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  ref_1    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r13" {
+  name     = "${var.prefix}-m14-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r14" {
+  name     = "${var.prefix}-m14-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r11.id
+  ref_1    = aws_iam_role.r10.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r15" {
+  name     = "${var.prefix}-m14-r15"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r11.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r16" {
+  name     = "${var.prefix}-m14-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r13.id
+  ref_1    = aws_ecr_repository.r7.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r17" {
+  name     = "${var.prefix}-m14-r17"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r16.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r18" {
+  name     = "${var.prefix}-m14-r18"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r11.id
+  ref_1    = aws_ecr_repository.r13.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r19" {
+  name     = "${var.prefix}-m14-r19"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r11.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m14-r20"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  ref_1    = aws_lb_target_group.r14.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r21" {
+  name     = "${var.prefix}-m14-r21"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r16.id
+  ref_1    = helm_release.r12.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r22" {
+  name     = "${var.prefix}-m14-r22"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  ref_1    = aws_s3_bucket.r15.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m14-r23"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r2.id
+  ref_1    = aws_db_instance.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r24" {
+  name     = "${var.prefix}-m14-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r13.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_cloudwatch_log_group.r24.id
+}
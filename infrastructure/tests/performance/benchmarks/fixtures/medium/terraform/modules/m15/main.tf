@@ -0,0 +1,215 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m15"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m15-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r1" {
+  name     = "${var.prefix}-m15-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r2" {
+  name     = "${var.prefix}-m15-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r3" {
+  name     = "${var.prefix}-m15-r3"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r4" {
+  name     = "${var.prefix}-m15-r4"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r5" {
+  name     = "${var.prefix}-m15-r5"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r6" {
+  name     = "${var.prefix}-m15-r6"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r7" {
+  name     = "${var.prefix}-m15-r7"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  ref_1    = aws_instance.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r8" {
+  name     = "${var.prefix}-m15-r8"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r9" {
+  name     = "${var.prefix}-m15-r9"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r10" {
+  name     = "${var.prefix}-m15-r10"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r11" {
+  name     = "${var.prefix}-m15-r11"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m15-r12"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r13" {
+  name     = "${var.prefix}-m15-r13"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r10.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r14" {
+  name     = "${var.prefix}-m15-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r7.id
+  ref_1    = aws_instance.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r15" {
+  name     = "${var.prefix}-m15-r15"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r16" {
+  name     = "${var.prefix}-m15-r16"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r17" {
+  name     = "${var.prefix}-m15-r17"
+  upstream = var.upstream
+  ref_0    = aws_instance.r15.id
+  ref_1    = aws_instance.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r18" {
+  name     = "${var.prefix}-m15-r18"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  ref_1    = aws_s3_bucket.r10.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r19" {
+  name     = "${var.prefix}-m15-r19"
+  upstream = var.upstream
+  ref_0    = aws_instance.r2.id
+  ref_1    = aws_instance.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r20" {
+  name     = "${var.prefix}-m15-r20"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r13.id
+  ref_1    = kubernetes_service.r16.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r21" {
+  name     = "${var.prefix}-m15-r21"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r22" {
+  name     = "${var.prefix}-m15-r22"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r20.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r23" {
+  name     = "${var.prefix}-m15-r23"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  ref_1    = aws_db_instance.r9.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r24" {
+  name     = "${var.prefix}-m15-r24"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r11.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_security_group.r24.id
+}
@@ -0,0 +1,210 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m2"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_cloudwatch_log_group" "r0" {
+  name     = "${var.prefix}-m2-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r1" {
+  name     = "${var.prefix}-m2-r1"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r2" {
+  name     = "${var.prefix}-m2-r2"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m2-r3"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r4" {
+  name     = "${var.prefix}-m2-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r5" {
+  name     = "${var.prefix}-m2-r5"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r6" {
+  name     = "${var.prefix}-m2-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r7" {
+  name     = "${var.prefix}-m2-r7"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r8" {
+  name     = "${var.prefix}-m2-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  ref_1    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r9" {
+  name     = "${var.prefix}-m2-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r10" {
+  name     = "${var.prefix}-m2-r10"
+  upstream = var.upstream
+  ref_0    = aws_instance.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r11" {
+  name     = "${var.prefix}-m2-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r12" {
+  name     = "${var.prefix}-m2-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r4.id
+  ref_1    = aws_instance.r8.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r13" {
+  name     = "${var.prefix}-m2-r13"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r14" {
+  name     = "${var.prefix}-m2-r14"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r0.id
+  ref_1    = aws_security_group.r9.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r15" {
+  name     = "${var.prefix}-m2-r15"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  ref_1    = aws_db_instance.r12.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r16" {
+  name     = "${var.prefix}-m2-r16"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r17" {
+  name     = "${var.prefix}-m2-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r18" {
+  name     = "${var.prefix}-m2-r18"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r19" {
+  name     = "${var.prefix}-m2-r19"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  ref_1    = aws_lb_target_group.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r20" {
+  name     = "${var.prefix}-m2-r20"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r21" {
+  name     = "${var.prefix}-m2-r21"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r22" {
+  name     = "${var.prefix}-m2-r22"
+  upstream = var.upstream
+  ref_0    = aws_instance.r14.id
+  ref_1    = kubernetes_service.r20.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m2-r23"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r16.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r24" {
+  name     = "${var.prefix}-m2-r24"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r16.id
+  ref_1    = aws_security_group.r9.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_service.r24.id
+}
@@ -0,0 +1,210 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m3"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_service" "r0" {
+  name     = "${var.prefix}-m3-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r1" {
+  name     = "${var.prefix}-m3-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r2" {
+  name     = "${var.prefix}-m3-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r3" {
+  name     = "${var.prefix}-m3-r3"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r4" {
+  name     = "${var.prefix}-m3-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = kubernetes_config_map.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r5" {
+  name     = "${var.prefix}-m3-r5"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r6" {
+  name     = "${var.prefix}-m3-r6"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r7" {
+  name     = "${var.prefix}-m3-r7"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r8" {
+  name     = "${var.prefix}-m3-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m3-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r10" {
+  name     = "${var.prefix}-m3-r10"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r11" {
+  name     = "${var.prefix}-m3-r11"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = kubernetes_config_map.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r12" {
+  name     = "${var.prefix}-m3-r12"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r13" {
+  name     = "${var.prefix}-m3-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  ref_1    = aws_s3_bucket.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r14" {
+  name     = "${var.prefix}-m3-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r15" {
+  name     = "${var.prefix}-m3-r15"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  ref_1    = kubernetes_service.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r16" {
+  name     = "${var.prefix}-m3-r16"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  ref_1    = aws_s3_bucket.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r17" {
+  name     = "${var.prefix}-m3-r17"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r6.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r18" {
+  name     = "${var.prefix}-m3-r18"
+  upstream = var.upstream
+  ref_0    = helm_release.r17.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r19" {
+  name     = "${var.prefix}-m3-r19"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r9.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r20" {
+  name     = "${var.prefix}-m3-r20"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  ref_1    = aws_instance.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r21" {
+  name     = "${var.prefix}-m3-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r13.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m3-r22"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  ref_1    = aws_cloudwatch_log_group.r14.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m3-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r24" {
+  name     = "${var.prefix}-m3-r24"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r0.id
+  ref_1    = kubernetes_config_map.r20.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_config_map.r24.id
+}
@@ -0,0 +1,212 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m4"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_instance" "r0" {
+  name     = "${var.prefix}-m4-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r1" {
+  name     = "${var.prefix}-m4-r1"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r2" {
+  name     = "${var.prefix}-m4-r2"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r3" {
+  name     = "${var.prefix}-m4-r3"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r1.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r4" {
+  name     = "${var.prefix}-m4-r4"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  ref_1    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r5" {
+  name     = "${var.prefix}-m4-r5"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r6" {
+  name     = "${var.prefix}-m4-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r4.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r7" {
+  name     = "${var.prefix}-m4-r7"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r8" {
+  name     = "${var.prefix}-m4-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  ref_1    = aws_db_instance.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m4-r9"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r10" {
+  name     = "${var.prefix}-m4-r10"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r7.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r11" {
+  name     = "${var.prefix}-m4-r11"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  ref_1    = kubernetes_service.r4.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r12" {
+  name     = "${var.prefix}-m4-r12"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  ref_1    = aws_iam_role.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r13" {
+  name     = "${var.prefix}-m4-r13"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r14" {
+  name     = "${var.prefix}-m4-r14"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  ref_1    = helm_release.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r15" {
+  name     = "${var.prefix}-m4-r15"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r16" {
+  name     = "${var.prefix}-m4-r16"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r11.id
+  ref_1    = aws_s3_bucket.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r17" {
+  name     = "${var.prefix}-m4-r17"
+  upstream = var.upstream
+  ref_0    = aws_instance.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r18" {
+  name     = "${var.prefix}-m4-r18"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r15.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r19" {
+  name     = "${var.prefix}-m4-r19"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r5.id
+  ref_1    = aws_s3_bucket.r14.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r20" {
+  name     = "${var.prefix}-m4-r20"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r21" {
+  name     = "${var.prefix}-m4-r21"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r12.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r22" {
+  name     = "${var.prefix}-m4-r22"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  ref_1    = aws_db_instance.r11.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r23" {
+  name     = "${var.prefix}-m4-r23"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r21.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r24" {
+  name     = "${var.prefix}-m4-r24"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  ref_1    = aws_cloudwatch_log_group.r17.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_s3_bucket.r24.id
+}
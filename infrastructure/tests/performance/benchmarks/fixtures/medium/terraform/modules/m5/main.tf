@@ -0,0 +1,206 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m5"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_lb_target_group" "r0" {
+  name     = "${var.prefix}-m5-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_instance" "r1" {
+  name     = "${var.prefix}-m5-r1"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r2" {
+  name     = "${var.prefix}-m5-r2"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r3" {
+  name     = "${var.prefix}-m5-r3"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r4" {
+  name     = "${var.prefix}-m5-r4"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r5" {
+  name     = "${var.prefix}-m5-r5"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r6" {
+  name     = "${var.prefix}-m5-r6"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r7" {
+  name     = "${var.prefix}-m5-r7"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r8" {
+  name     = "${var.prefix}-m5-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r9" {
+  name     = "${var.prefix}-m5-r9"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r2.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r10" {
+  name     = "${var.prefix}-m5-r10"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r11" {
+  name     = "${var.prefix}-m5-r11"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  ref_1    = aws_lb_target_group.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r12" {
+  name     = "${var.prefix}-m5-r12"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r13" {
+  name     = "${var.prefix}-m5-r13"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r14" {
+  name     = "${var.prefix}-m5-r14"
+  upstream = var.upstream
+  ref_0    = helm_release.r13.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r15" {
+  name     = "${var.prefix}-m5-r15"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r16" {
+  name     = "${var.prefix}-m5-r16"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r17" {
+  name     = "${var.prefix}-m5-r17"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  ref_1    = aws_ecr_repository.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r18" {
+  name     = "${var.prefix}-m5-r18"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r17.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r19" {
+  name     = "${var.prefix}-m5-r19"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r20" {
+  name     = "${var.prefix}-m5-r20"
+  upstream = var.upstream
+  ref_0    = aws_instance.r15.id
+  ref_1    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r21" {
+  name     = "${var.prefix}-m5-r21"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r0.id
+  ref_1    = kubernetes_config_map.r16.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r22" {
+  name     = "${var.prefix}-m5-r22"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r4.id
+  ref_1    = kubernetes_config_map.r18.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m5-r23"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r18.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r24" {
+  name     = "${var.prefix}-m5-r24"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  ref_1    = aws_ecr_repository.r2.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_iam_role.r24.id
+}
@@ -0,0 +1,214 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m6"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "kubernetes_config_map" "r0" {
+  name     = "${var.prefix}-m6-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m6-r1"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r2" {
+  name     = "${var.prefix}-m6-r2"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r3" {
+  name     = "${var.prefix}-m6-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m6-r4"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  ref_1    = kubernetes_config_map.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r5" {
+  name     = "${var.prefix}-m6-r5"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r6" {
+  name     = "${var.prefix}-m6-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  ref_1    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r7" {
+  name     = "${var.prefix}-m6-r7"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  ref_1    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r8" {
+  name     = "${var.prefix}-m6-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  ref_1    = helm_release.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m6-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r10" {
+  name     = "${var.prefix}-m6-r10"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  ref_1    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r11" {
+  name     = "${var.prefix}-m6-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r12" {
+  name     = "${var.prefix}-m6-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r13" {
+  name     = "${var.prefix}-m6-r13"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  ref_1    = aws_ecr_repository.r12.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r14" {
+  name     = "${var.prefix}-m6-r14"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  ref_1    = kubernetes_config_map.r11.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r15" {
+  name     = "${var.prefix}-m6-r15"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r16" {
+  name     = "${var.prefix}-m6-r16"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = kubernetes_config_map.r2.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r17" {
+  name     = "${var.prefix}-m6-r17"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r12.id
+  ref_1    = aws_security_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r18" {
+  name     = "${var.prefix}-m6-r18"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r19" {
+  name     = "${var.prefix}-m6-r19"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r2.id
+  ref_1    = kubernetes_config_map.r16.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m6-r20"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = aws_s3_bucket.r10.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r21" {
+  name     = "${var.prefix}-m6-r21"
+  upstream = var.upstream
+  ref_0    = aws_instance.r19.id
+  ref_1    = aws_s3_bucket.r10.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m6-r22"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r10.id
+  ref_1    = aws_instance.r14.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r23" {
+  name     = "${var.prefix}-m6-r23"
+  upstream = var.upstream
+  ref_0    = helm_release.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r24" {
+  name     = "${var.prefix}-m6-r24"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r18.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_security_group.r24.id
+}
@@ -0,0 +1,208 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m7"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m7-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r1" {
+  name     = "${var.prefix}-m7-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r2" {
+  name     = "${var.prefix}-m7-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r3" {
+  name     = "${var.prefix}-m7-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r4" {
+  name     = "${var.prefix}-m7-r4"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r5" {
+  name     = "${var.prefix}-m7-r5"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r6" {
+  name     = "${var.prefix}-m7-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r7" {
+  name     = "${var.prefix}-m7-r7"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r3.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r8" {
+  name     = "${var.prefix}-m7-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r9" {
+  name     = "${var.prefix}-m7-r9"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r10" {
+  name     = "${var.prefix}-m7-r10"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r11" {
+  name     = "${var.prefix}-m7-r11"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r12" {
+  name     = "${var.prefix}-m7-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r10.id
+  ref_1    = aws_db_instance.r5.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r13" {
+  name     = "${var.prefix}-m7-r13"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  ref_1    = aws_iam_role.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r14" {
+  name     = "${var.prefix}-m7-r14"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  ref_1    = aws_s3_bucket.r2.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r15" {
+  name     = "${var.prefix}-m7-r15"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  ref_1    = aws_s3_bucket.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r16" {
+  name     = "${var.prefix}-m7-r16"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r7.id
+  ref_1    = aws_ecr_repository.r15.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r17" {
+  name     = "${var.prefix}-m7-r17"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r11.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r18" {
+  name     = "${var.prefix}-m7-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r19" {
+  name     = "${var.prefix}-m7-r19"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r9.id
+  ref_1    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r20" {
+  name     = "${var.prefix}-m7-r20"
+  upstream = var.upstream
+  ref_0    = helm_release.r16.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r21" {
+  name     = "${var.prefix}-m7-r21"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r12.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r22" {
+  name     = "${var.prefix}-m7-r22"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = aws_security_group.r11.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r23" {
+  name     = "${var.prefix}-m7-r23"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r19.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r24" {
+  name     = "${var.prefix}-m7-r24"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r14.id
+  ref_1    = helm_release.r10.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_config_map.r24.id
+}
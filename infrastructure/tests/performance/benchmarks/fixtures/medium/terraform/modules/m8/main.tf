@@ -0,0 +1,210 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m8"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_security_group" "r0" {
+  name     = "${var.prefix}-m8-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_instance" "r1" {
+  name     = "${var.prefix}-m8-r1"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r2" {
+  name     = "${var.prefix}-m8-r2"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r3" {
+  name     = "${var.prefix}-m8-r3"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r4" {
+  name     = "${var.prefix}-m8-r4"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r5" {
+  name     = "${var.prefix}-m8-r5"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r6" {
+  name     = "${var.prefix}-m8-r6"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r7" {
+  name     = "${var.prefix}-m8-r7"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r8" {
+  name     = "${var.prefix}-m8-r8"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r5.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r9" {
+  name     = "${var.prefix}-m8-r9"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  ref_1    = aws_ecr_repository.r8.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r10" {
+  name     = "${var.prefix}-m8-r10"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r11" {
+  name     = "${var.prefix}-m8-r11"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r12" {
+  name     = "${var.prefix}-m8-r12"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r4.id
+  ref_1    = aws_instance.r1.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r13" {
+  name     = "${var.prefix}-m8-r13"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r6.id
+  ref_1    = aws_instance.r10.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r14" {
+  name     = "${var.prefix}-m8-r14"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r3.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r15" {
+  name     = "${var.prefix}-m8-r15"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r16" {
+  name     = "${var.prefix}-m8-r16"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r2.id
+  ref_1    = aws_instance.r7.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r17" {
+  name     = "${var.prefix}-m8-r17"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = aws_lb_target_group.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r18" {
+  name     = "${var.prefix}-m8-r18"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r12.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r19" {
+  name     = "${var.prefix}-m8-r19"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r20" {
+  name     = "${var.prefix}-m8-r20"
+  upstream = var.upstream
+  ref_0    = aws_instance.r7.id
+  ref_1    = kubernetes_config_map.r12.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r21" {
+  name     = "${var.prefix}-m8-r21"
+  upstream = var.upstream
+  ref_0    = aws_instance.r10.id
+  ref_1    = kubernetes_config_map.r17.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r22" {
+  name     = "${var.prefix}-m8-r22"
+  upstream = var.upstream
+  ref_0    = helm_release.r18.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r23" {
+  name     = "${var.prefix}-m8-r23"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r13.id
+  ref_1    = kubernetes_config_map.r17.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r24" {
+  name     = "${var.prefix}-m8-r24"
+  upstream = var.upstream
+  ref_0    = helm_release.r9.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_service.r24.id
+}
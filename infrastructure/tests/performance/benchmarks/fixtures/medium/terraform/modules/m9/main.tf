@@ -0,0 +1,209 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m9"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_iam_role" "r0" {
+  name     = "${var.prefix}-m9-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r1" {
+  name     = "${var.prefix}-m9-r1"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r2" {
+  name     = "${var.prefix}-m9-r2"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r3" {
+  name     = "${var.prefix}-m9-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r4" {
+  name     = "${var.prefix}-m9-r4"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r0.id
+  ref_1    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r5" {
+  name     = "${var.prefix}-m9-r5"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  ref_1    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r6" {
+  name     = "${var.prefix}-m9-r6"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r7" {
+  name     = "${var.prefix}-m9-r7"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r8" {
+  name     = "${var.prefix}-m9-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m9-r9"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r10" {
+  name     = "${var.prefix}-m9-r10"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r11" {
+  name     = "${var.prefix}-m9-r11"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r5.id
+  ref_1    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r12" {
+  name     = "${var.prefix}-m9-r12"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r13" {
+  name     = "${var.prefix}-m9-r13"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  ref_1    = aws_ecr_repository.r8.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r14" {
+  name     = "${var.prefix}-m9-r14"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r8.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r15" {
+  name     = "${var.prefix}-m9-r15"
+  upstream = var.upstream
+  ref_0    = aws_instance.r1.id
+  ref_1    = aws_lb_target_group.r9.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r16" {
+  name     = "${var.prefix}-m9-r16"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r17" {
+  name     = "${var.prefix}-m9-r17"
+  upstream = var.upstream
+  ref_0    = helm_release.r13.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r18" {
+  name     = "${var.prefix}-m9-r18"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r10.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r19" {
+  name     = "${var.prefix}-m9-r19"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r16.id
+  ref_1    = aws_lb_target_group.r11.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r20" {
+  name     = "${var.prefix}-m9-r20"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r6.id
+  ref_1    = aws_iam_role.r0.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r21" {
+  name     = "${var.prefix}-m9-r21"
+  upstream = var.upstream
+  ref_0    = kubernetes_config_map.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r22" {
+  name     = "${var.prefix}-m9-r22"
+  upstream = var.upstream
+  ref_0    = helm_release.r17.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r23" {
+  name     = "${var.prefix}-m9-r23"
+  upstream = var.upstream
+  ref_0    = aws_instance.r4.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r24" {
+  name     = "${var.prefix}-m9-r24"
+  upstream = var.upstream
+  ref_0    = helm_release.r13.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_instance.r24.id
+}
@@ -0,0 +1,48 @@
+terraform {
+  required_providers {
+    aws = {
+      source = "hashicorp/aws"
+    }
+  }
+}
+
+provider "aws" {
+  region = var.region
+}
+
+variable "region" {
+  type    = string
+  default = "eu-west-1"
+}
+
+variable "prefix" {
+  type    = string
+  default = "bench"
+}
+
+module "m0" {
+  source   = "../../modules/m0"
+  prefix   = var.prefix
+}
+
+module "m1" {
+  source   = "../../modules/m1"
+  prefix   = var.prefix
+  upstream = module.m0.id
+}
+
+module "m2" {
+  source   = "../../modules/m2"
+  prefix   = var.prefix
+  upstream = module.m0.id
+}
+
+module "m3" {
+  source   = "../../modules/m3"
+  prefix   = var.prefix
+  upstream = module.m2.id
+}
+
+output "last" {
+  value = module.m3.id
+}
@@ -0,0 +1,93 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m0"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m0-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r1" {
+  name     = "${var.prefix}-m0-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r2" {
+  name     = "${var.prefix}-m0-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r3" {
+  name     = "${var.prefix}-m0-r3"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r1.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r4" {
+  name     = "${var.prefix}-m0-r4"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_iam_role" "r5" {
+  name     = "${var.prefix}-m0-r5"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  ref_1    = aws_s3_bucket.r4.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r6" {
+  name     = "${var.prefix}-m0-r6"
+  upstream = var.upstream
+  ref_0    = aws_iam_role.r5.id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r7" {
+  name     = "${var.prefix}-m0-r7"
+  upstream = var.upstream
+  ref_0    = aws_db_instance.r2.id
+  ref_1    = aws_lb_target_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r8" {
+  name     = "${var.prefix}-m0-r8"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m0-r9"
+  upstream = var.upstream
+  ref_0    = aws_lb_target_group.r3.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_lb_target_group.r9.id
+}
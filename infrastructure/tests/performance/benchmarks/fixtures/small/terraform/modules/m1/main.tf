@@ -0,0 +1,95 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m1"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_ecr_repository" "r0" {
+  name     = "${var.prefix}-m1-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "helm_release" "r1" {
+  name     = "${var.prefix}-m1-r1"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r2" {
+  name     = "${var.prefix}-m1-r2"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r0.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r3" {
+  name     = "${var.prefix}-m1-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_ecr_repository" "r4" {
+  name     = "${var.prefix}-m1-r4"
+  upstream = var.upstream
+  ref_0    = helm_release.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r5" {
+  name     = "${var.prefix}-m1-r5"
+  upstream = var.upstream
+  ref_0    = aws_ecr_repository.r3.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r6" {
+  name     = "${var.prefix}-m1-r6"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = aws_cloudwatch_log_group.r5.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r7" {
+  name     = "${var.prefix}-m1-r7"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+resource "aws_db_instance" "r8" {
+  name     = "${var.prefix}-m1-r8"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r9" {
+  name     = "${var.prefix}-m1-r9"
+  upstream = var.upstream
+  ref_0    = aws_instance.r6.id
+  ref_1    = aws_ecr_repository.r4.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = kubernetes_service.r9.id
+}
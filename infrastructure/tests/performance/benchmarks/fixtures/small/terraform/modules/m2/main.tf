@@ -0,0 +1,91 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m2"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "helm_release" "r0" {
+  name     = "${var.prefix}-m2-r0"
+  upstream = var.upstream
+  tags     = local.tags
+}
+
+resource "kubernetes_config_map" "r1" {
+  name     = "${var.prefix}-m2-r1"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r2" {
+  name     = "${var.prefix}-m2-r2"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "aws_instance" "r3" {
+  name     = "${var.prefix}-m2-r3"
+  upstream = var.upstream
+  ref_0    = helm_release.r0.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r4" {
+  name     = "${var.prefix}-m2-r4"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r5" {
+  name     = "${var.prefix}-m2-r5"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r6" {
+  name     = "${var.prefix}-m2-r6"
+  upstream = var.upstream
+  ref_0    = helm_release.r2.id
+  tags     = local.tags
+}
+
+resource "helm_release" "r7" {
+  name     = "${var.prefix}-m2-r7"
+  upstream = var.upstream
+  ref_0    = helm_release.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "helm_release" "r8" {
+  name     = "${var.prefix}-m2-r8"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r6.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r9" {
+  name     = "${var.prefix}-m2-r9"
+  upstream = var.upstream
+  ref_0    = aws_instance.r3.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_security_group.r9.id
+}
@@ -0,0 +1,97 @@
+variable "prefix" {
+  type = string
+}
+
+variable "upstream" {
+  type    = string
+  default = ""
+}
+
+locals {
+  tags = {
+    Module = "m3"
+    Prefix = var.prefix
+  }
+}
+
+data "aws_caller_identity" "current" {}
+
+resource "aws_s3_bucket" "r0" {
+  name     = "${var.prefix}-m3-r0"
+  upstream = var.upstream
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r1" {
+  name     = "${var.prefix}-m3-r1"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "kubernetes_service" "r2" {
+  name     = "${var.prefix}-m3-r2"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  ref_1    = kubernetes_service.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r3" {
+  name     = "${var.prefix}-m3-r3"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r1.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r4" {
+  name     = "${var.prefix}-m3-r4"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_security_group" "r5" {
+  name     = "${var.prefix}-m3-r5"
+  upstream = var.upstream
+  ref_0    = aws_cloudwatch_log_group.r4.id
+  ref_1    = aws_cloudwatch_log_group.r3.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r6" {
+  name     = "${var.prefix}-m3-r6"
+  upstream = var.upstream
+  ref_0    = aws_security_group.r5.id
+  ref_1    = aws_cloudwatch_log_group.r4.id
+  account  = data.aws_caller_identity.current.account_id
+  tags     = local.tags
+}
+
+resource "aws_s3_bucket" "r7" {
+  name     = "${var.prefix}-m3-r7"
+  upstream = var.upstream
+  ref_0    = aws_s3_bucket.r0.id
+  tags     = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "r8" {
+  name     = "${var.prefix}-m3-r8"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r1.id
+  ref_1    = kubernetes_service.r2.id
+  tags     = local.tags
+}
+
+resource "aws_lb_target_group" "r9" {
+  name     = "${var.prefix}-m3-r9"
+  upstream = var.upstream
+  ref_0    = kubernetes_service.r2.id
+  ref_1    = aws_cloudwatch_log_group.r4.id
+  tags     = local.tags
+}
+
+output "id" {
+  value = aws_lb_target_group.r9.id
+}
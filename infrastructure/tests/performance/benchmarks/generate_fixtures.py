@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Synthetic fixtures for the visualization benchmarks
+Writes small/medium/large infrastructure trees (Terraform modules, a Kubernetes base and overlay, and a
+recorded ArgoCD Application List) from a fixed seed, so the checked-in fixtures can be regenerated byte for byte
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+from pathlib import Path
+
+ENVIRONMENT = 'bench'
+SEED = 20240714
+
+# modules x resources per module, Kubernetes apps, ArgoCD Applications
+SIZES = {
+    'small': {"modules": 4, "resources": 10, "apps": 12, "argocd_apps": 20},
+    'medium': {"modules": 16, "resources": 25, "apps": 60, "argocd_apps": 120},
+    'large': {"modules": 48, "resources": 50, "apps": 240, "argocd_apps": 600},
+}
+
+RESOURCE_TYPES = (
+    'aws_instance', 'aws_s3_bucket', 'aws_security_group', 'aws_iam_role', 'aws_lb_target_group',
+    'aws_cloudwatch_log_group', 'aws_ecr_repository', 'aws_db_instance', 'kubernetes_config_map',
+    'kubernetes_service', 'helm_release',
+)
+NAMESPACES = ('ml-platform', 'data-platform', 'monitoring', 'ingestion', 'serving')
+
+
+def module_tf(rng, index, resources):
+    """One module: variables, locals, a dependency chain of resources with random back-references, outputs"""
+    lines = [
+        'variable "prefix" {',
+        '  type = string',
+        '}',
+        '',
+        'variable "upstream" {',
+        '  type    = string',
+        '  default = ""',
+        '}',
+        '',
+        'locals {',
+        '  tags = {',
+        f'    Module = "m{index}"',
+        '    Prefix = var.prefix',
+        '  }',
+        '}',
+        '',
+        'data "aws_caller_identity" "current" {}',
+        '',
+    ]
+    names = []
+    for i in range(resources):
+        resource_type = rng.choice(RESOURCE_TYPES)
+        name = f'r{i}'
+        lines.append(f'resource "{resource_type}" "{name}" {{')
+        lines.append(f'  name     = "${{var.prefix}}-m{index}-{name}"')
+        lines.append('  upstream = var.upstream')
+        if names:
+            refs = rng.sample(names, min(len(names), rng.randint(1, 2)))
+            for n, (ref_type, ref_name) in enumerate(refs):
+                lines.append(f'  ref_{n}    = {ref_type}.{ref_name}.id')
+        if rng.random() < 0.2:
+            lines.append('  account  = data.aws_caller_identity.current.account_id')
+        lines.append('  tags     = local.tags')
+        lines.append('}')
+        lines.append('')
+        names.append((resource_type, name))
+
+    last_type, last_name = names[-1]
+    lines += [
+        'output "id" {',
+        f'  value = {last_type}.{last_name}.id',
+        '}',
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def environment_tf(rng, modules):
+    """Root module instantiating every module; each takes an output of an earlier one"""
+    lines = [
+        'terraform {',
+        '  required_providers {',
+        '    aws = {',
+        '      source = "hashicorp/aws"',
+        '    }',
+        '  }',
+        '}',
+        '',
+        'provider "aws" {',
+        '  region = var.region',
+        '}',
+        '',
+        'variable "region" {',
+        '  type    = string',
+        '  default = "eu-west-1"',
+        '}',
+        '',
+        'variable "prefix" {',
+        '  type    = string',
+        f'  default = "{ENVIRONMENT}"',
+        '}',
+        '',
+    ]
+    for index in range(modules):
+        lines.append(f'module "m{index}" {{')
+        lines.append(f'  source   = "../../modules/m{index}"')
+        lines.append('  prefix   = var.prefix')
+        if index:
+            lines.append(f'  upstream = module.m{rng.randrange(index)}.id')
+        lines.append('}')
+        lines.append('')
+    lines += [
+        'output "last" {',
+        f'  value = module.m{modules - 1}.id',
+        '}',
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def app_yaml(rng, index):
+    """Deployment, Service and ConfigMap of one app; some apps also get an HPA"""
+    namespace = NAMESPACES[index % len(NAMESPACES)]
+    name = f'app-{index}'
+    replicas = rng.randint(1, 4)
+    port = rng.choice((8080, 8000, 9090, 3000))
+    docs = [f'''apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: {name}
+  namespace: {namespace}
+  labels:
+    app: {name}
+    tier: {rng.choice(('api', 'worker', 'frontend'))}
+spec:
+  replicas: {replicas}
+  selector:
+    matchLabels:
+      app: {name}
+  template:
+    metadata:
+      labels:
+        app: {name}
+    spec:
+      containers:
+        - name: {name}
+          image: registry.local/{name}:1.{index % 7}.{rng.randint(0, 20)}
+          ports:
+            - containerPort: {port}
+          env:
+            - name: CONFIG_PATH
+              value: /etc/{name}/config.yaml
+          resources:
+            requests:
+              cpu: {rng.choice(('100m', '250m', '500m'))}
+              memory: {rng.choice(('128Mi', '256Mi', '512Mi'))}
+''', f'''apiVersion: v1
+kind: Service
+metadata:
+  name: {name}
+  namespace: {namespace}
+spec:
+  selector:
+    app: {name}
+  ports:
+    - port: 80
+      targetPort: {port}
+''', f'''apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: {name}-config
+  namespace: {namespace}
+data:
+  config.yaml: |
+    log_level: {rng.choice(('info', 'debug', 'warn'))}
+    workers: {rng.randint(1, 16)}
+''']
+    if rng.random() < 0.3:
+        docs.append(f'''apiVersion: autoscaling/v2
+kind: HorizontalPodAutoscaler
+metadata:
+  name: {name}
+  namespace: {namespace}
+spec:
+  scaleTargetRef:
+    apiVersion: apps/v1
+    kind: Deployment
+    name: {name}
+  minReplicas: {replicas}
+  maxReplicas: {replicas * 3}
+''')
+    return '---\n'.join(docs)
+
+
+def argocd_application(rng, name, wave, owner=None, instance=None):
+    """One Application object as `kubectl get applications -o json` returns it, status included"""
+    metadata = {
+        "name": name,
+        "namespace": "argocd",
+        "annotations": {"argocd.argoproj.io/sync-wave": str(wave)},
+        "labels": {},
+    }
+    if owner:
+        metadata["ownerReferences"] = [{"apiVersion": "argoproj.io/v1alpha1", "kind": "ApplicationSet", "name": owner}]
+    if instance:
+        metadata["labels"]["argocd.argoproj.io/instance"] = instance
+    return {
+        "apiVersion": "argoproj.io/v1alpha1",
+        "kind": "Application",
+        "metadata": metadata,
+        "spec": {
+            "project": rng.choice(('ml-platform', 'data-platform', 'platform-security')),
+            "source": {"repoURL": "https://git.local/platform.git", "path": f"apps/{name}", "targetRevision": "HEAD"},
+            "destination": {"server": "https://kubernetes.default.svc", "namespace": rng.choice(NAMESPACES)},
+            "syncPolicy": {"automated": {"prune": True, "selfHeal": True}} if rng.random() < 0.7 else {},
+        },
+        "status": {
+            "sync": {"status": rng.choice(('Synced', 'Synced', 'Synced', 'OutOfSync', 'Unknown'))},
+            "health": {"status": rng.choice(('Healthy', 'Healthy', 'Progressing', 'Degraded'))},
+            # Live objects carry a per-resource status list; the collector has to skip past it
+            "resources": [
+                {"kind": "Deployment", "name": f"{name}-{i}", "status": "Synced", "health": {"status": "Healthy"}}
+                for i in range(rng.randint(2, 8))
+            ],
+        },
+    }
+
+
+def argocd_list(rng, count):
+    """A recorded Application/ApplicationSet List: app-of-apps roots, ApplicationSets and their apps"""
+    items = []
+    roots = [f'root-{i}' for i in range(max(1, count // 40))]
+    appsets = [f'appset-{i}' for i in range(max(1, count // 30))]
+    for name in roots:
+        items.append(argocd_application(rng, name, 0))
+    for name in appsets:
+        items.append({
+            "apiVersion": "argoproj.io/v1alpha1",
+            "kind": "ApplicationSet",
+            "metadata": {"name": name, "namespace": "argocd", "labels": {"argocd.argoproj.io/instance": rng.choice(roots)}},
+            "spec": {
+                "generators": [{"list": {"elements": [{"env": env} for env in ('dev', 'staging', 'prod')]}}],
+                "template": {
+                    "metadata": {"name": f"{name}-{{{{env}}}}", "annotations": {"argocd.argoproj.io/sync-wave": "3"}},
+                    "spec": {"project": "ml-platform", "destination": {"namespace": "{{env}}"}},
+                },
+            },
+        })
+    for index in range(count - len(roots)):
+        wave = rng.randint(-1, 5)
+        if rng.random() < 0.4:
+            items.append(argocd_application(rng, f'app-{index}', wave, owner=rng.choice(appsets)))
+        else:
+            items.append(argocd_application(rng, f'app-{index}', wave, instance=rng.choice(roots)))
+    return {"apiVersion": "v1", "kind": "List", "metadata": {"resourceVersion": ""}, "items": items}
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(content)
+
+
+def generate(root, size):
+    """Write one fixture tree under root/size"""
+    spec = SIZES[size]
+    rng = random.Random(f'{SEED}-{size}')
+    target = Path(root) / size
+    if target.exists():
+        shutil.rmtree(target)
+
+    for index in range(spec['modules']):
+        write(target / 'terraform' / 'modules' / f'm{index}' / 'main.tf', module_tf(rng, index, spec['resources']))
+    write(target / 'terraform' / 'environments' / ENVIRONMENT / 'main.tf', environment_tf(rng, spec['modules']))
+
+    base = target / 'kubernetes' / 'base'
+    resources = []
+    for index in range(spec['apps']):
+        rel_path = f'{NAMESPACES[index % len(NAMESPACES)]}/app-{index}.yaml'
+        write(base / rel_path, app_yaml(rng, index))
+        resources.append(rel_path)
+    write(base / 'kustomization.yaml', 'apiVersion: kustomize.config.k8s.io/v1beta1\nkind: Kustomization\n'
+          'resources:\n' + ''.join(f'  - {rel_path}\n' for rel_path in resources))
+    write(target / 'kubernetes' / 'overlays' / ENVIRONMENT / 'kustomization.yaml',
+          'apiVersion: kustomize.config.k8s.io/v1beta1\nkind: Kustomization\nresources:\n  - ../../base\n')
+
+    # Separate stream so adding this did not change the Terraform and Kubernetes fixtures
+    argocd_rng = random.Random(f'{SEED}-{size}-argocd')
+    write(target / 'argocd' / 'applications.json', json.dumps(argocd_list(argocd_rng, spec['argocd_apps'])))
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate the synthetic benchmark fixtures")
+    parser.add_argument("sizes", nargs="*", default=list(SIZES), help="Fixture sizes to write")
+    parser.add_argument("--output-dir", default=str(Path(__file__).resolve().parent / 'fixtures'),
+                        help="Fixture root (default: fixtures/ next to this script)")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        if size not in SIZES:
+            print(f"Unknown fixture size: {size} (choose from {', '.join(SIZES)})", file=sys.stderr)
+            sys.exit(1)
+        print(f"Wrote {generate(args.output_dir, size)}")
+
+
+if __name__ == "__main__":
+    main()
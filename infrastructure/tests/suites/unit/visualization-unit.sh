@@ -0,0 +1,61 @@
+#!/bin/bash
+# Python unit tests for the visualization tooling (scripts/visualization)
+# Execution time: < 30 seconds
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+source "$SCRIPT_DIR/../../lib/utils/common.sh"
+
+TESTS_DIR="$SCRIPT_DIR/../../visualization"
+
+# Run the pytest suite; extra arguments are passed through (e.g. -k inventory)
+run_visualization_tests() {
+    print_header "Visualization Unit Tests"
+
+    if ! python3 -c "import pytest" &> /dev/null; then
+        print_error "pytest not found (pip3 install pytest)"
+        return 1
+    fi
+
+    # The repository-wide pytest options add coverage reporting for src/, which
+    # these scripts are not part of
+    if python3 -m pytest -q -o addopts="" "$TESTS_DIR" "$@"; then
+        print_success "Visualization unit tests passed"
+        return 0
+    fi
+    print_error "Visualization unit tests failed"
+    return 1
+}
+
+main() {
+    local command="${1:-run}"
+
+    case "$command" in
+        "run")
+            shift || true
+            run_visualization_tests "$@"
+            ;;
+        *)
+            cat << EOF
+Usage: $0 run [PYTEST_ARGS...]
+
+Commands:
+  run [PYTEST_ARGS...]   Run the visualization unit tests (default)
+
+Examples:
+  $0                     # Run all visualization unit tests
+  $0 run -k inventory    # Run only the inventory tests
+
+Requirements:
+  - python3 with pytest and PyYAML
+EOF
+            exit 1
+            ;;
+    esac
+}
+
+# Only run main if script is executed directly
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    main "$@"
+fi
@@ -85,7 +85,7 @@ get_test_suite_description() {
         "security") echo "Security Scanning (< 2m)" ;;
         "unit") echo "Unit Testing (< 5m)" ;;
         "integration") echo "Integration Testing (15-30m)" ;;
-        "performance") echo "Performance Testing (variable)" ;;
+        "performance") echo "Performance Benchmarks (< 2m)" ;;
         *) echo "Unknown test suite" ;;
     esac
 }
@@ -299,6 +299,14 @@ run_unit_tests() {
             test_names+=("opa-policies")
         fi
 
+        # Python unit tests of the visualization tooling
+        local viz_unit_script="$SCRIPT_DIR/suites/unit/visualization-unit.sh"
+        if validate_script_path "$viz_unit_script"; then
+            "$viz_unit_script" run &
+            pids+=($!)
+            test_names+=("visualization-unit")
+        fi
+
         # Wait for all jobs and collect results
         for i in "${!pids[@]}"; do
             if wait "${pids[i]}"; then
@@ -340,6 +348,18 @@ run_unit_tests() {
                 return 1
             fi
         fi
+
+        local viz_unit_script="$SCRIPT_DIR/suites/unit/visualization-unit.sh"
+        if validate_script_path "$viz_unit_script" && "$viz_unit_script" run; then
+            record_test_result "visualization-unit" 0
+        else
+            record_test_result "visualization-unit" 1
+            failed_tests+=("visualization-unit")
+            if [[ "$FAIL_FAST" == "true" ]]; then
+                print_error "Failing fast due to visualization-unit failure"
+                return 1
+            fi
+        fi
     fi
 
     local test_end_time
@@ -395,16 +415,41 @@ run_integration_tests() {
 run_performance_tests() {
     print_header "Performance Tests"
 
-    print_warning "Performance tests not yet implemented in refactored structure"
-    print_info "See original performance/ directory for K6 and chaos tests"
+    local failed_tests=()
+    local test_start_time
+    test_start_time=$(date +%s)
+
+    # Offline benchmarks of the visualization tooling on the checked-in synthetic
+    # fixtures; results are compared against the stored baseline
+    local benchmark_script="$SCRIPT_DIR/performance/benchmarks/benchmark.py"
+    local results_file="$SCRIPT_DIR/test-results/benchmark-results.json"
+    local threshold="${BENCHMARK_THRESHOLD:-0.30}"
+    local sizes="${BENCHMARK_SIZES:-small medium large}"
+
+    print_info "Running visualization benchmarks (sizes: $sizes, regression threshold: $threshold)"
+    # shellcheck disable=SC2086
+    if validate_script_path "$benchmark_script" && python3 "$benchmark_script" \
+        --sizes $sizes \
+        --repeat "${BENCHMARK_REPEAT:-5}" \
+        --threshold "$threshold" \
+        --min-regression-ms "${BENCHMARK_MIN_REGRESSION_MS:-10}" \
+        --results "$results_file"; then
+        record_test_result "visualization-benchmarks" 0
+    else
+        record_test_result "visualization-benchmarks" 1
+        failed_tests+=("visualization-benchmarks")
+    fi
+    print_info "Benchmark results: $results_file"
 
-    # Placeholder for future performance test integration
-    # This would include:
-    # - K6 load testing
-    # - Chaos engineering tests
-    # - Resource utilization tests
+    # Load and chaos tests need a running cluster; see performance/k6 and performance/chaos
 
-    return 0
+    local test_end_time
+    test_end_time=$(date +%s)
+    local test_duration=$((test_end_time - test_start_time))
+
+    print_info "Performance tests completed in ${test_duration}s"
+
+    [[ ${#failed_tests[@]} -eq 0 ]]
 }
 
 # Run specific test suite
@@ -0,0 +1,14 @@
+"""
+Shared setup for the visualization unit tests
+Puts scripts/visualization on the import path, the way the scripts themselves run
+"""
+
+import sys
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+INFRASTRUCTURE_DIR = TESTS_DIR.parent
+VISUALIZATION_DIR = INFRASTRUCTURE_DIR / 'scripts' / 'visualization'
+CLUSTER_FIXTURES = TESTS_DIR / 'kubernetes' / 'fixtures' / 'cluster'
+
+sys.path.insert(0, str(VISUALIZATION_DIR))
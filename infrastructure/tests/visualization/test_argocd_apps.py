@@ -0,0 +1,100 @@
+"""Tests for argocd_apps: the Application collector and the sync-wave graph"""
+
+import json
+import os
+import stat
+
+import pytest
+
+from argocd_apps import AppGraph, ArgoCDCollector, app_record, node_id
+
+
+def application(name, wave=None, owner=None, instance=None, kind='Application'):
+    metadata = {"name": name, "namespace": "argocd"}
+    if wave is not None:
+        metadata['annotations'] = {"argocd.argoproj.io/sync-wave": str(wave)}
+    if owner:
+        metadata['ownerReferences'] = [{"kind": "ApplicationSet", "name": owner}]
+    if instance:
+        metadata['labels'] = {"argocd.argoproj.io/instance": instance}
+    return {"kind": kind, "metadata": metadata, "spec": {"project": "default"}}
+
+
+def install_kubectl(tmp_path, monkeypatch, script):
+    """Put a kubectl shell script first on PATH; it logs its arguments to kubectl.log"""
+    kubectl = tmp_path / 'bin' / 'kubectl'
+    kubectl.parent.mkdir()
+    kubectl.write_text(f'#!/bin/sh\necho "$@" >> "{tmp_path}/kubectl.log"\n{script}\n')
+    kubectl.chmod(kubectl.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv('PATH', f"{kubectl.parent}{os.pathsep}{os.environ['PATH']}")
+    return tmp_path / 'kubectl.log'
+
+
+def test_kubectl_lists_both_kinds_in_one_call(tmp_path, monkeypatch):
+    listing = json.dumps({"kind": "List", "items": [application('api'), application('apps', kind='ApplicationSet')]})
+    log = install_kubectl(tmp_path, monkeypatch, f"echo '{listing}'")
+
+    collector = ArgoCDCollector()
+    records = collector.collect()
+
+    assert [(r['kind'], r['name']) for r in records] == [('Application', 'api'), ('ApplicationSet', 'apps')]
+    assert collector.calls == 1
+    assert log.read_text().split()[1] == 'applications.argoproj.io,applicationsets.argoproj.io'
+
+
+def test_kubectl_without_applicationset_crd_lists_applications(tmp_path, monkeypatch):
+    listing = json.dumps({"kind": "List", "items": [application('api')]})
+    log = install_kubectl(tmp_path, monkeypatch, f'''
+case "$2" in
+    *applicationsets*)
+        echo 'error: the server doesn'"'"'t have a resource type "applicationsets"' >&2
+        exit 1
+        ;;
+esac
+echo '{listing}'
+''')
+
+    collector = ArgoCDCollector()
+    records = collector.collect()
+
+    assert [r['name'] for r in records] == ['api']
+    assert collector.calls == 2
+    assert [line.split()[1] for line in log.read_text().splitlines()] == [
+        'applications.argoproj.io,applicationsets.argoproj.io', 'applications.argoproj.io'
+    ]
+
+
+def test_kubectl_failures_still_raise(tmp_path, monkeypatch):
+    install_kubectl(tmp_path, monkeypatch, "echo 'error: You must be logged in to the server' >&2; exit 1")
+
+    with pytest.raises(RuntimeError, match='logged in'):
+        ArgoCDCollector().collect()
+
+
+def test_sync_stages_follow_owners_and_waves():
+    records = [app_record(item) for item in [
+        application('root'),
+        application('infra', wave=-1, instance='root'),
+        application('db', wave=0, instance='root'),
+        application('api', wave=1, instance='root'),
+        application('web', wave=1, instance='root'),
+        application('tenants', kind='ApplicationSet'),
+        application('tenant-a', owner='tenants'),
+    ]]
+    graph = AppGraph(records)
+
+    assert graph.stages() == [
+        ['Application/root', 'ApplicationSet/tenants'],
+        ['Application/infra', 'Application/tenant-a'],
+        ['Application/db'],
+        ['Application/api', 'Application/web'],
+    ]
+    assert list(graph.predecessors(node_id('Application', 'api'))) == ['Application/root', 'Application/db']
+    # root -> its 4 children, tenants -> tenant-a, infra -> db, db -> api and web
+    assert graph.edge_count() == 4 + 1 + 1 + 2
+
+
+def test_ownership_cycle_is_treated_as_top_level():
+    graph = AppGraph([app_record(application('a', instance='b')), app_record(application('b', instance='a'))])
+
+    assert sorted(graph.levels().values()) == [0, 1]
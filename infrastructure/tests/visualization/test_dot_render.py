@@ -0,0 +1,40 @@
+"""Tests for dot_render: one Graphviz layout for several output formats"""
+
+import dot_render
+
+
+def record_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dot_render.subprocess, 'run', lambda args, check: calls.append(args))
+    return calls
+
+
+def test_group_outputs_by_render_options():
+    outputs = [('png', 'g.png'), ('svg', 'g.svg'), ('pdf', 'g.pdf')]
+    groups = dot_render.group_outputs(outputs, {'png': ('-Gdpi=300',)})
+
+    assert groups == [
+        (('-Gdpi=300',), [('png', 'g.png')]),
+        ((), [('svg', 'g.svg'), ('pdf', 'g.pdf')]),
+    ]
+
+
+def test_shared_options_render_in_one_call(monkeypatch):
+    calls = record_calls(monkeypatch)
+
+    dot_render.render('g.dot', [('svg', 'g.svg'), ('pdf', 'g.pdf')])
+
+    assert calls == [['dot', '-Tsvg', '-o', 'g.svg', '-Tpdf', '-o', 'g.pdf', 'g.dot']]
+
+
+def test_mixed_options_reuse_one_layout(monkeypatch):
+    calls = record_calls(monkeypatch)
+
+    dot_render.render('g.dot', [('png', 'g.png'), ('svg', 'g.svg')], {'png': ('-Gdpi=300',)})
+
+    layout = calls[0][3]
+    assert calls[0] == ['dot', '-Txdot', '-o', layout, 'g.dot']
+    assert calls[1:] == [
+        ['neato', '-n2', '-Gdpi=300', '-Tpng', '-o', 'g.png', layout],
+        ['neato', '-n2', '-Tsvg', '-o', 'g.svg', layout],
+    ]
@@ -0,0 +1,68 @@
+"""Tests for file_index: the incremental index of the infrastructure tree"""
+
+import threading
+
+from file_index import FileIndex
+
+
+def make_index(tmp_path):
+    root = tmp_path / 'tree'
+    (root / 'terraform' / 'modules' / 'vpc').mkdir(parents=True)
+    (root / 'terraform' / 'main.tf').write_text('resource "aws_vpc" "main" {}\n')
+    (root / 'terraform' / 'modules' / 'vpc' / 'main.tf').write_text('variable "cidr" {}\n')
+    (root / 'docs').mkdir()
+    (root / 'docs' / 'graph.png').write_bytes(b'png')
+    return root, FileIndex(root, cache_dir=tmp_path / 'cache')
+
+
+def test_listings_and_matches_follow_changes(tmp_path):
+    root, index = make_index(tmp_path)
+    index.refresh()
+
+    assert index.listdir('terraform') == [('main.tf', False), ('modules', True)]
+    assert index.match(['terraform/**/*.tf']) == ['terraform/main.tf', 'terraform/modules/vpc/main.tf']
+    digest = index.digest(['terraform/**/*.tf'])
+
+    (root / 'terraform' / 'modules' / 'vpc' / 'main.tf').unlink()
+    (root / 'terraform' / 'outputs.tf').write_text('output "id" {}\n')
+    assert sorted(index.refresh()) == ['terraform/modules/vpc/main.tf', 'terraform/outputs.tf']
+
+    assert index.match(['terraform/**/*.tf']) == ['terraform/main.tf', 'terraform/outputs.tf']
+    assert [path for path, _ in index.entries(['**/*.tf'])] == ['terraform/main.tf', 'terraform/outputs.tf']
+    assert index.digest(['terraform/**/*.tf']) != digest
+    assert [path for path, _ in index.files_under('docs')] == ['docs/graph.png']
+
+
+def test_readers_are_safe_during_refresh(tmp_path):
+    root, index = make_index(tmp_path)
+    index.refresh()
+    errors = []
+    done = threading.Event()
+
+    def churn():
+        try:
+            for i in range(200):
+                path = root / 'docs' / f'diagram-{i % 20}.svg'
+                if path.exists():
+                    path.unlink()
+                else:
+                    path.write_text(f'<svg id="{i}"/>')
+                index.refresh()
+        except Exception as e:  # reported below
+            errors.append(e)
+        finally:
+            done.set()
+
+    writer = threading.Thread(target=churn)
+    writer.start()
+    try:
+        while not done.is_set():
+            index.listdir('docs')
+            index.files_under('')
+            index.match(['docs/*.svg'])
+            index.digest(['docs/*.svg', 'terraform/**/*.tf'])
+            for path, entry in index.entries(['docs/*']):
+                assert entry['sha256']
+    finally:
+        writer.join()
+    assert errors == []
@@ -0,0 +1,60 @@
+"""Tests for graph_diff: revision handling of the Terraform graph diff"""
+
+import io
+import subprocess
+import tarfile
+
+import pytest
+
+from graph_diff import extract_archive, load_revision_graph, parse_side, resolve_revision
+
+
+@pytest.fixture
+def repo(tmp_path):
+    env_dir = tmp_path / 'terraform' / 'environments' / 'local'
+    env_dir.mkdir(parents=True)
+    (env_dir / 'main.tf').write_text('resource "aws_vpc" "main" {\n  cidr_block = "10.0.0.0/16"\n}\n')
+    for cmd in (['init', '-q'], ['add', '.'],
+                ['-c', 'user.name=test', '-c', 'user.email=test@example.com', 'commit', '-q', '-m', 'init']):
+        subprocess.run(['git', *cmd], cwd=tmp_path, check=True)
+    return tmp_path
+
+
+def test_parse_side():
+    assert parse_side('prod') == ('prod', None)
+    assert parse_side('prod@HEAD~3') == ('prod', 'HEAD~3')
+
+
+def test_resolve_revision(repo):
+    head = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=repo, capture_output=True, text=True).stdout.strip()
+
+    assert resolve_revision(repo, 'HEAD') == head
+    with pytest.raises(ValueError, match='Invalid revision'):
+        resolve_revision(repo, f'--output={repo}/pwned.tar')
+    with pytest.raises(ValueError, match='Unknown revision'):
+        resolve_revision(repo, 'no-such-rev')
+    assert not (repo / 'pwned.tar').exists()
+
+
+def test_load_revision_graph(repo, monkeypatch):
+    monkeypatch.setenv('ML_PLATFORM_VIZ_CACHE', str(repo / 'cache'))
+    graph = load_revision_graph(repo / 'terraform', 'local', 'HEAD')
+
+    assert 'aws_vpc.main' in graph['nodes']
+    with pytest.raises(ValueError, match='Unknown revision'):
+        load_revision_graph(repo / 'terraform', 'local', 'no-such-rev')
+
+
+def test_extract_archive_stays_in_directory(tmp_path):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tar:
+        member = tarfile.TarInfo('../escaped.tf')
+        member.size = 0
+        tar.addfile(member, io.BytesIO())
+    buffer.seek(0)
+    (tmp_path / 'scratch').mkdir()
+
+    with pytest.raises(tarfile.TarError):
+        with tarfile.open(fileobj=buffer, mode='r|') as tar:
+            extract_archive(tar, tmp_path / 'scratch')
+    assert not (tmp_path / 'escaped.tf').exists()
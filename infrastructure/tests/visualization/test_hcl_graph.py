@@ -0,0 +1,135 @@
+"""Tests for hcl_graph: the static Terraform dependency graph"""
+
+import io
+import textwrap
+
+from hcl_graph import compose, content_hash, parse_hcl, parse_module, tokenize, write_dot
+
+ROOT_MODULE = '''
+variable "environment" {
+  default = "dev"
+}
+
+locals {
+  name = "ml-${var.environment}"
+  tags = { Name = local.name }
+}
+
+resource "aws_vpc" "main" {
+  cidr_block = "10.0.0.0/16"
+  tags       = local.tags
+}
+
+# Not a dependency on data.aws_ami.ubuntu: it only appears in comments and literal text
+resource "aws_s3_bucket" "data" {
+  bucket = "${local.name}-data"
+  policy = <<-EOT
+    data.aws_ami.ubuntu is text, but ${aws_vpc.main.id} is a reference
+  EOT
+}
+
+data "aws_ami" "ubuntu" {
+  most_recent = true
+}
+
+module "network" {
+  source = "./modules/network"
+  vpc_id = aws_vpc.main.id
+  count  = var.environment == "prod" ? 2 : 1
+}
+
+module "registry" {
+  source = "terraform-aws-modules/ecr/aws"
+}
+
+output "subnet" {
+  value = module.network.subnet_id
+}
+'''
+
+NETWORK_MODULE = '''
+variable "vpc_id" {}
+
+resource "aws_subnet" "private" {
+  vpc_id = var.vpc_id
+}
+
+output "subnet_id" {
+  value = aws_subnet.private.id
+}
+'''
+
+
+def write_modules(tmp_path):
+    root = tmp_path / 'environments' / 'dev'
+    (root / 'modules' / 'network').mkdir(parents=True)
+    (root / 'main.tf').write_text(textwrap.dedent(ROOT_MODULE))
+    (root / 'modules' / 'network' / 'main.tf').write_text(textwrap.dedent(NETWORK_MODULE))
+    return root
+
+
+def test_parse_hcl_blocks_and_attributes():
+    blocks = parse_hcl(textwrap.dedent(ROOT_MODULE))
+
+    assert [(block.type, block.labels) for block in blocks] == [
+        ('variable', ['environment']),
+        ('locals', []),
+        ('resource', ['aws_vpc', 'main']),
+        ('resource', ['aws_s3_bucket', 'data']),
+        ('data', ['aws_ami', 'ubuntu']),
+        ('module', ['network']),
+        ('module', ['registry']),
+        ('output', ['subnet']),
+    ]
+    assert set(blocks[1].attributes) == {'name', 'tags'}
+    assert blocks[2].line == 11
+
+
+def test_content_hash_ignores_layout_and_comments():
+    compact = list(tokenize('cidr_block = "10.0.0.0/16"\n'))
+    spread = list(tokenize('# network\ncidr_block   =\n  "10.0.0.0/16"   // range\n'))
+
+    assert content_hash(compact) == content_hash(spread)
+    assert content_hash(compact) != content_hash(list(tokenize('cidr_block = "10.1.0.0/16"\n')))
+
+
+def test_parse_module_links_references(tmp_path):
+    module = parse_module(write_modules(tmp_path))
+    edges = {tuple(edge) for edge in module['edges']}
+
+    assert {
+        ('local.name', 'var.environment'),
+        ('local.tags', 'local.name'),
+        ('aws_vpc.main', 'local.tags'),
+        ('aws_s3_bucket.data', 'local.name'),
+        ('aws_s3_bucket.data', 'aws_vpc.main'),
+        ('module.network', 'var.environment'),
+        ('output.subnet', 'module.network.output.subnet_id'),
+    } == edges
+    assert module['calls']['network'] == {
+        "source": "./modules/network", "inputs": {"vpc_id": ["aws_vpc.main"]}
+    }
+    assert module['calls']['registry']['source'] == 'terraform-aws-modules/ecr/aws'
+    assert module['providers'] == ['aws']
+
+
+def test_compose_instantiates_local_modules(tmp_path):
+    graph = compose(write_modules(tmp_path), base_dir=tmp_path)
+    edges = set(graph['edges'])
+
+    assert graph['modules'] == {'(root)': 'environments/dev', 'module.network': 'environments/dev/modules/network'}
+    # Inputs feed the child's variables and outputs resolve to the child's output nodes
+    assert ('module.network.var.vpc_id', 'aws_vpc.main') in edges
+    assert ('output.subnet', 'module.network.output.subnet_id') in edges
+    assert ('module.network.aws_subnet.private', 'provider.aws') in edges
+    assert graph['nodes']['module.registry']['external'] == 'terraform-aws-modules/ecr/aws'
+
+
+def test_write_dot_nests_module_clusters(tmp_path):
+    out = io.StringIO()
+    write_dot(compose(write_modules(tmp_path)), out)
+    dot = out.getvalue()
+
+    assert 'subgraph "cluster_module.network" {' in dot
+    assert '"module.network.aws_subnet.private" [label="aws_subnet.private"' in dot
+    assert '"output.subnet" -> "module.network.output.subnet_id";' in dot
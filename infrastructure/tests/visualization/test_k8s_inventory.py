@@ -0,0 +1,68 @@
+"""
+Unit tests for k8s_inventory.py against the recorded cluster fixtures
+"""
+
+import io
+import json
+
+from conftest import CLUSTER_FIXTURES
+from k8s_inventory import InventoryCollector, format_counts, iter_list_items
+
+EXPECTED_COUNTS = {
+    'argocd': {'pods': 1, 'services': 0, 'deployments': 1},
+    'data-platform-security-scanning': {'pods': 2, 'services': 1, 'deployments': 1},
+    'default': {'pods': 10, 'services': 2, 'deployments': 4},
+    'jaeger-system': {'pods': 1, 'services': 1, 'deployments': 1},
+    'kube-system': {'pods': 2, 'services': 1, 'deployments': 2},
+    'ml-platform': {'pods': 3, 'services': 3, 'deployments': 3},
+    'monitoring': {'pods': 1, 'services': 1, 'deployments': 1},
+    'security-scanning': {'pods': 1, 'services': 2, 'deployments': 1},
+}
+
+
+def test_collect_counts_per_namespace():
+    collector = InventoryCollector(source=str(CLUSTER_FIXTURES))
+    assert collector.collect() == EXPECTED_COUNTS
+    # One list per resource type, never one per namespace
+    assert collector.calls == 4
+
+
+def test_collect_totals_per_kind():
+    counts = InventoryCollector(source=str(CLUSTER_FIXTURES)).collect()
+    totals = {kind: sum(namespace[kind] for namespace in counts.values()) for kind in ('pods', 'services', 'deployments')}
+    assert totals == {'pods': 21, 'services': 11, 'deployments': 14}
+
+
+def test_namespaces_without_resources_are_listed():
+    counts = InventoryCollector(source=str(CLUSTER_FIXTURES)).collect()
+    assert counts['argocd']['services'] == 0
+
+
+def test_iter_list_items_across_chunk_boundaries():
+    with open(CLUSTER_FIXTURES / 'pods.json', 'r', encoding='utf-8') as f:
+        content = f.read()
+    expected = json.loads(content)['items']
+
+    for chunk_size in (1, 7, 64, 4096):
+        stream = io.StringIO(content)
+        stream.read = lambda size=-1, read=stream.read: read(min(size, chunk_size) if size > 0 else chunk_size)
+        assert list(iter_list_items(stream)) == expected
+
+
+def test_iter_list_items_null_and_trailing_fields():
+    assert list(iter_list_items(io.StringIO('{"kind": "List", "items": null}'))) == []
+    assert list(iter_list_items(io.StringIO('{"items": [1, 2.5, {"a": []}], "metadata": {}}'))) == [1, 2.5, {"a": []}]
+
+
+def test_record_round_trip(tmp_path):
+    recorded = InventoryCollector(source=str(CLUSTER_FIXTURES), record_dir=tmp_path).collect()
+    for resource_type in ('namespaces', 'pods', 'services', 'deployments'):
+        assert json.loads((tmp_path / f'{resource_type}.json').read_text(encoding='utf-8')) == \
+            json.loads((CLUSTER_FIXTURES / f'{resource_type}.json').read_text(encoding='utf-8'))
+    assert InventoryCollector(source=str(tmp_path)).collect() == recorded
+
+
+def test_format_counts_layout():
+    lines = format_counts(EXPECTED_COUNTS).splitlines()
+    assert lines[0] == 'argocd: Pods(1) Services(0) Deployments(1)'
+    assert len(lines) == len(EXPECTED_COUNTS)
@@ -0,0 +1,169 @@
+"""Tests for manifest_inventory: static kustomize resolution per environment"""
+
+import textwrap
+
+import pytest
+
+from manifest_inventory import ManifestInventory, summarize
+
+
+def write(root, rel_path, text):
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(text).lstrip())
+
+
+@pytest.fixture
+def kubernetes_dir(tmp_path):
+    root = tmp_path / 'kubernetes'
+    write(root, 'base/kustomization.yaml', """
+        namespace: ml-platform
+        resources:
+          - namespace.yaml
+          - app.yaml
+          - monitoring
+          - github.com/example/remote-base
+        configMapGenerator:
+          - name: app-config
+          - name: app-config
+            behavior: merge
+        patches:
+          - target:
+              kind: Service
+              name: metrics.*
+            patch: |-
+              - op: replace
+                path: /metadata/namespace
+                value: monitoring
+    """)
+    write(root, 'base/namespace.yaml', """
+        apiVersion: v1
+        kind: Namespace
+        metadata:
+          name: ml-platform
+    """)
+    write(root, 'base/app.yaml', """
+        apiVersion: apps/v1
+        kind: Deployment
+        metadata:
+          name: api
+        ---
+        apiVersion: v1
+        kind: Service
+        metadata:
+          name: api
+        ---
+        apiVersion: v1
+        kind: Service
+        metadata:
+          name: metrics-api
+        ---
+        apiVersion: rbac.authorization.k8s.io/v1
+        kind: ClusterRole
+        metadata:
+          name: api-reader
+    """)
+    # No kustomization: every YAML file below counts
+    write(root, 'base/monitoring/prometheus.yaml', """
+        apiVersion: apps/v1
+        kind: Deployment
+        metadata:
+          name: prometheus
+          namespace: observability
+    """)
+    write(root, 'overlays/dev/kustomization.yaml', """
+        resources:
+          - ../../base
+          - extra.yaml
+    """)
+    write(root, 'overlays/dev/extra.yaml', """
+        apiVersion: v1
+        kind: ConfigMap
+        metadata:
+          name: dev-flags
+          namespace: ml-platform
+    """)
+    write(root, 'overlays/prod/kustomization.yaml', """
+        namespace: ml-prod
+        resources:
+          - ../../base
+    """)
+    write(root, 'team-apps/kustomization.yaml', """
+        resources:
+          - team.yaml
+    """)
+    write(root, 'team-apps/team.yaml', """
+        apiVersion: apps/v1
+        kind: Deployment
+        metadata:
+          name: notebook
+          namespace: app-ml-team
+    """)
+    return root
+
+
+def make_inventory(kubernetes_dir):
+    return ManifestInventory(kubernetes_dir, cache_dir=kubernetes_dir.parent / 'cache')
+
+
+def namespace_kinds(summary):
+    return {namespace: entry['kinds'] for namespace, entry in summary['namespaces'].items()}
+
+
+def test_overlay_resolves_namespaces_generators_and_patches(kubernetes_dir):
+    inventory = make_inventory(kubernetes_dir)
+    summary = summarize(inventory.environment('dev'))
+
+    assert namespace_kinds(summary) == {
+        'app-ml-team': {'Deployment': 1},
+        # The kustomization namespace overrides the one set in the manifest
+        'ml-platform': {'ConfigMap': 2, 'Deployment': 2, 'Service': 1},
+        'monitoring': {'Service': 1},
+    }
+    assert summary['namespaces']['ml-platform']['declared'] is True
+    assert summary['cluster_scoped'] == {'ClusterRole': 1, 'Namespace': 1}
+    assert inventory.skipped == [('base', 'github.com/example/remote-base', 'remote reference')]
+
+
+def test_overlay_namespace_applies_before_base_patches(kubernetes_dir):
+    summary = summarize(make_inventory(kubernetes_dir).environment('prod'))
+
+    assert namespace_kinds(summary)['ml-prod'] == {'ConfigMap': 1, 'Deployment': 2, 'Service': 2}
+    # The Namespace object keeps its own name; ml-platform is declared but empty in prod
+    assert summary['namespaces']['ml-platform'] == {"declared": True, "resources": 0, "kinds": {}}
+
+
+def test_shared_base_is_built_once(kubernetes_dir):
+    inventory = make_inventory(kubernetes_dir)
+    inventory.environment('dev')
+    files = inventory.stats['files']
+    inventory.environment('prod')
+
+    assert inventory.stats['reused'] == 2  # base and team-apps
+    # Only the prod kustomization itself was read for the second environment
+    assert inventory.stats['files'] == files + 1
+
+
+def test_environment_without_overlay_uses_base(kubernetes_dir):
+    summary = summarize(make_inventory(kubernetes_dir).environment('staging'))
+
+    assert 'ml-platform' in summary['namespaces']
+    assert 'app-ml-team' in summary['namespaces']
+
+
+def test_unreadable_and_cyclic_references_are_skipped(kubernetes_dir):
+    (kubernetes_dir / 'base' / 'monitoring' / 'legacy.yaml').write_bytes(b'kind: ConfigMap\nname: \xff\xfe\n')
+    write(kubernetes_dir, 'overlays/loop/kustomization.yaml', """
+        resources:
+          - ../loop
+          - missing.yaml
+    """)
+    inventory = make_inventory(kubernetes_dir)
+
+    assert inventory.build('overlays/loop') == ()
+    reasons = {reference: reason for _, reference, reason in inventory.skipped}
+    assert reasons['overlays/loop'] == 'reference cycle'
+    assert reasons['missing.yaml'] == 'not found'
+
+    inventory.environment('dev')
+    assert 'base/monitoring/legacy.yaml' in {reference for _, reference, _ in inventory.skipped}
@@ -0,0 +1,48 @@
+"""Tests for resources/read in mcp-wrapper.py"""
+
+import asyncio
+import importlib.util
+
+import pytest
+
+from conftest import INFRASTRUCTURE_DIR, VISUALIZATION_DIR
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setenv('ML_PLATFORM_VIZ_CACHE', str(tmp_path / 'cache'))
+    spec = importlib.util.spec_from_file_location('mcp_wrapper', VISUALIZATION_DIR / 'mcp-wrapper.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MLPlatformMCPServer()
+
+
+def read(server, uri, **params):
+    return server.handle_request({"method": "resources/read", "params": dict(params, uri=uri)})
+
+
+def test_concurrent_file_reads(server):
+    readme = (VISUALIZATION_DIR / 'README.md').read_text(encoding='utf-8')
+
+    async def batch():
+        return await asyncio.gather(
+            read(server, 'file://scripts/visualization/README.md'),
+            read(server, 'file://scripts/visualization/README.md', length=100),
+            read(server, 'file://scripts/visualization'),
+        )
+
+    full, page, listing = asyncio.run(batch())
+
+    assert full['contents'][0]['text'] == readme
+    assert page['contents'][0]['nextOffset'] == page['contents'][0]['length']
+    assert '📄 mcp-wrapper.py' in listing['contents'][0]['text']
+
+
+def test_file_reads_stay_inside_the_infrastructure_directory(server):
+    outside = asyncio.run(read(server, 'file://../requests.jsonl'))
+    missing = asyncio.run(read(server, 'file://no-such-file.md'))
+    bad_page = asyncio.run(read(server, 'file://scripts/visualization/README.md', offset=-1))
+
+    assert 'outside the infrastructure directory' in outside['error']
+    assert missing['error'] == f"Resource not found: {INFRASTRUCTURE_DIR / 'no-such-file.md'}"
+    assert 'offset' in bad_page['error']
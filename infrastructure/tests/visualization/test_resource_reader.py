@@ -0,0 +1,84 @@
+"""Tests for resource_reader: paged, conditional reads of MCP file resources"""
+
+import base64
+
+import pytest
+
+from resource_reader import ResourceReadError, read_file_resource, utf8_boundary
+
+TEXT = 'Nœud → Zürich 🚀 ml-platform\n' * 40
+
+
+def read_pages(path, length):
+    """Every page of a file, following nextOffset"""
+    pages = []
+    offset = 0
+    while offset is not None:
+        page = read_file_resource(path, 'file://test', {"offset": offset, "length": length})
+        pages.append(page)
+        offset = page['nextOffset']
+    return pages
+
+
+@pytest.mark.parametrize('length', [1, 2, 3, 5, 7, 64])
+def test_text_pages_split_on_character_boundaries(tmp_path, length):
+    path = tmp_path / 'notes.md'
+    path.write_text(TEXT, encoding='utf-8')
+
+    pages = read_pages(path, length)
+
+    assert ''.join(page['text'] for page in pages) == TEXT
+    assert sum(page['length'] for page in pages) == len(TEXT.encode('utf-8'))
+    assert pages[-1]['nextOffset'] is None
+
+
+def test_utf8_boundary():
+    rocket = '🚀'.encode('utf-8')
+    assert utf8_boundary(b'ab' + rocket, at_eof=False) == 6
+    assert utf8_boundary(b'ab' + rocket[:3], at_eof=False) == 2
+    assert utf8_boundary(b'ab' + rocket[:1], at_eof=False) == 2
+    assert utf8_boundary(b'ab' + rocket[:3], at_eof=True) == 5
+
+
+def test_binary_files_are_base64_blobs(tmp_path):
+    data = bytes(range(256)) * 4
+    path = tmp_path / 'graph.png'
+    path.write_bytes(data)
+
+    pages = read_pages(path, 300)
+
+    assert all('text' not in page and page['mimeType'] == 'image/png' for page in pages)
+    assert b''.join(base64.b64decode(page['blob']) for page in pages) == data
+
+
+def test_unchanged_content_is_not_sent_again(tmp_path):
+    path = tmp_path / 'graph.svg'
+    path.write_text('<svg/>', encoding='utf-8')
+    first = read_file_resource(path, 'file://graph.svg', {})
+
+    again = read_file_resource(path, 'file://graph.svg', {"ifNoneMatch": first['etag']})
+    assert again['notModified'] is True
+    assert 'text' not in again
+
+    path.write_text('<svg width="10"/>', encoding='utf-8')
+    changed = read_file_resource(path, 'file://graph.svg', {"ifNoneMatch": first['etag']})
+    assert changed['text'] == '<svg width="10"/>'
+
+
+def test_index_hash_gives_a_strong_etag(tmp_path):
+    path = tmp_path / 'graph.svg'
+    path.write_text('<svg/>', encoding='utf-8')
+    stat = path.stat()
+    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": 'ab' * 32}
+
+    assert read_file_resource(path, 'file://graph.svg', {}, entry)['etag'] == f'"{"ab" * 16}"'
+    assert read_file_resource(path, 'file://graph.svg', {}, dict(entry, size=1))['etag'].startswith('W/')
+
+
+@pytest.mark.parametrize('params', [{"offset": -1}, {"length": 0}, {"offset": "start"}, {"ifModifiedSince": "today"}])
+def test_invalid_parameters_are_rejected(tmp_path, params):
+    path = tmp_path / 'notes.md'
+    path.write_text('text', encoding='utf-8')
+
+    with pytest.raises(ResourceReadError):
+        read_file_resource(path, 'file://notes.md', params)
@@ -0,0 +1,50 @@
+"""Tests for script_progress: progress markers from the scripts' log helpers"""
+
+from script_progress import ScriptProgress, parse_marker
+
+
+def make_progress(tmp_path):
+    messages = []
+    progress = ScriptProgress(lambda m: messages.append(m['params']['message']), 'token', tmp_path)
+    return progress, messages
+
+
+def test_parse_marker_strips_colors():
+    assert parse_marker('\x1b[0;34m[INFO]\x1b[0m Generating graph...') == ('INFO', 'Generating graph...')
+    assert parse_marker('docs/diagrams/graph.png') is None
+
+
+def test_stderr_markers_are_reported_as_they_arrive(tmp_path):
+    progress, messages = make_progress(tmp_path)
+    (tmp_path / 'graph.png').write_bytes(b'png')
+
+    progress.feed_stderr('[INFO] Generating Terraform dependency graph...\n')
+    progress.feed_stderr(f'[SUCCESS] Terraform graph generated: {tmp_path}/graph.png\n')
+
+    assert progress.stages == ['Generating Terraform dependency graph']
+    assert progress.files == ['graph.png']
+    assert messages[-1] == 'generated: graph.png'
+
+
+def test_stderr_lines_are_split_by_level(tmp_path):
+    progress, _ = make_progress(tmp_path)
+
+    progress.feed_stderr('[INFO] Parsing HCL for environment: local\n')
+    progress.feed_stderr('[WARN] Rover not found\n')
+    progress.feed_stderr('Traceback (most recent call last):\n')
+    progress.feed_stdout('docs/diagrams/terraform-local-graph.png\n')
+
+    assert list(progress.stdout.lines) == [
+        '[INFO] Parsing HCL for environment: local',
+        'docs/diagrams/terraform-local-graph.png',
+    ]
+    assert list(progress.stderr.lines) == ['[WARN] Rover not found', 'Traceback (most recent call last):']
+
+
+def test_missing_files_are_not_reported(tmp_path):
+    progress, messages = make_progress(tmp_path)
+
+    progress.feed_stderr('[SUCCESS] Documentation generated: docs.md\n')
+
+    assert progress.files == []
+    assert messages == ['success: Documentation generated: docs.md']